@@ -0,0 +1,5 @@
+"""Benchmarks for the performance critical parts of the Kedro-Viz backend.
+
+Each benchmark is a standalone script, run from the ``package`` directory with e.g.
+``python -m benchmarks.bench_reachability``.
+"""
@@ -0,0 +1,78 @@
+"""Benchmark saving the node responses of a build, comparing saving the metadata of
+one node at a time against saving it with the default pool of worker threads.
+
+The synthetic project has 40 datasets whose previews each take 100ms to load,
+e.g. like reading from a remote bucket, as in `kedro viz build --include-previews`.
+
+Usage: python -m benchmarks.bench_build
+"""
+
+import tempfile
+import time
+
+import fsspec
+from kedro.io import AbstractDataset, DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_viz.api.rest.executor import get_max_workers
+from kedro_viz.api.rest.responses.save_responses import save_api_node_response_to_fs
+from kedro_viz.data_access import data_access_manager
+from kedro_viz.server import populate_data
+
+NUM_DATASETS = 40
+PREVIEW_SECONDS = 0.1
+
+
+class SlowPreviewDataset(AbstractDataset):
+    """A dataset whose preview blocks for a while."""
+
+    def load(self):
+        return None
+
+    def save(self, data):
+        pass
+
+    def _describe(self):
+        return {}
+
+    def preview(self) -> dict:
+        time.sleep(PREVIEW_SECONDS)
+        return {"rows": 1}
+
+
+def main():
+    """Save the node responses sequentially and with the worker pool."""
+    catalog = DataCatalog(
+        datasets={
+            f"dataset_{index}": SlowPreviewDataset() for index in range(NUM_DATASETS)
+        }
+    )
+    pipelines = {
+        "__default__": Pipeline(
+            [
+                node(lambda data: data, f"dataset_{index}", f"output_{index}")
+                for index in range(NUM_DATASETS)
+            ]
+        )
+    }
+    populate_data(data_access_manager, catalog, pipelines, {})
+    print(f"{NUM_DATASETS} previews of {PREVIEW_SECONDS * 1e3:.0f}ms each")
+
+    content_hashes = []
+    for name, max_workers in [("sequential", 1), ("pool", get_max_workers())]:
+        with tempfile.TemporaryDirectory() as nodes_path:
+            start = time.perf_counter()
+            content_hashes.append(
+                save_api_node_response_to_fs(
+                    nodes_path, fsspec.filesystem("file"), True, max_workers=max_workers
+                ).values()
+            )
+            total_time = time.perf_counter() - start
+        print(f"{name} ({max_workers} workers): all nodes saved in {total_time:.2f}s")
+
+    # the saved responses don't depend on the number of workers
+    assert list(content_hashes[0]) == list(content_hashes[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Load test the responsiveness of the REST API while slow dataset previews are loaded,
+comparing running the blocking work of the routes with `kedro_viz.api.rest.executor`
+against running it inline in the async route handlers.
+
+The synthetic project has 20 datasets whose previews each take 200ms to load,
+e.g. like reading from a remote bucket. All their metadata is requested at once,
+while the lineage of a node, which doesn't block, is requested every 10ms
+to measure how late the event loop replies to other users meanwhile.
+
+Usage: python -m benchmarks.bench_event_loop
+"""
+
+import asyncio
+import statistics
+import time
+from contextlib import nullcontext
+from typing import List, Tuple
+from unittest import mock
+
+from httpx import ASGITransport, AsyncClient
+from kedro.io import AbstractDataset, DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_viz.api import apps
+from kedro_viz.data_access import data_access_manager
+from kedro_viz.server import populate_data
+from kedro_viz.utils import _hash
+
+NUM_DATASETS = 20
+PREVIEW_SECONDS = 0.2
+PROBE_INTERVAL_SECONDS = 0.01
+
+
+class SlowPreviewDataset(AbstractDataset):
+    """A dataset whose preview blocks for a while."""
+
+    def load(self):
+        return None
+
+    def save(self, data):
+        pass
+
+    def _describe(self):
+        return {}
+
+    def preview(self) -> dict:
+        time.sleep(PREVIEW_SECONDS)
+        return {"rows": 1}
+
+
+async def run_inline(_endpoint, func, *args):
+    """Run the blocking work of a route inline, as before the executor."""
+    return func(*args)
+
+
+async def run_load(app) -> Tuple[float, List[float]]:
+    """Request the metadata of all slow datasets at once while probing the lineage
+    endpoint, returning the total time and the latencies of the probes."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        dataset_ids = [_hash(f"dataset_{index}") for index in range(NUM_DATASETS)]
+        lineage_url = f"/api/pipelines/__default__/lineage/{dataset_ids[0]}"
+        latencies = []
+
+        start = time.perf_counter()
+        requests = asyncio.gather(
+            *(client.get(f"/api/nodes/{dataset_id}") for dataset_id in dataset_ids)
+        )
+        while not requests.done():
+            # the latency of a probe includes how late it was sent after its interval
+            probe_start = time.perf_counter()
+            await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+            response = await client.get(lineage_url)
+            latencies.append(time.perf_counter() - probe_start - PROBE_INTERVAL_SECONDS)
+            assert response.status_code == 200
+        responses = await requests
+        total_time = time.perf_counter() - start
+
+    assert all(response.json()["preview"] == {"rows": 1} for response in responses)
+    return total_time, latencies
+
+
+def main():
+    """Run the load test with and without the executor."""
+    catalog = DataCatalog(
+        datasets={
+            f"dataset_{index}": SlowPreviewDataset() for index in range(NUM_DATASETS)
+        }
+    )
+    pipelines = {
+        "__default__": Pipeline(
+            [
+                node(lambda data: data, f"dataset_{index}", f"output_{index}")
+                for index in range(NUM_DATASETS)
+            ]
+        )
+    }
+    populate_data(data_access_manager, catalog, pipelines, {})
+    app = apps.create_api_app_from_project(mock.MagicMock())
+    print(f"{NUM_DATASETS} previews of {PREVIEW_SECONDS * 1e3:.0f}ms each")
+
+    for name, patcher in [
+        ("inline", mock.patch("kedro_viz.api.rest.router.run_blocking", run_inline)),
+        ("executor", nullcontext()),
+    ]:
+        with patcher:
+            total_time, latencies = asyncio.run(run_load(app))
+        print(
+            f"{name}: all metadata in {total_time:.2f}s, "
+            f"{len(latencies)} lineage probes, "
+            f"median latency {statistics.median(latencies) * 1e3:.1f}ms, "
+            f"max latency {max(latencies) * 1e3:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark populating the repositories with a large pipeline, comparing the IDs allocated
+by `kedro_viz.utils.id_registry` with hashing nodes and datasets on every lookup, i.e.
+the overhead of detecting colliding IDs.
+
+The synthetic project has 200 namespaces of 50 chained nodes each, i.e. 10,000 nodes,
+registered as the default pipeline and as one pipeline per group of 20 namespaces,
+so that every node and dataset is looked up by several registered pipelines.
+
+Usage: python -m benchmarks.bench_id_registry
+"""
+
+import time
+from typing import Dict
+from unittest import mock
+
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_viz.data_access.managers import DataAccessManager
+from kedro_viz.utils import _hash, _hash_input_output, id_registry
+
+NUM_NAMESPACES = 200
+NUM_NODES_PER_NAMESPACE = 50
+NUM_NAMESPACES_PER_PIPELINE = 20
+NUM_REPEATS = 3
+
+
+def identity(x):
+    """Node function of the synthetic pipeline."""
+    return x
+
+
+def make_pipelines() -> Dict[str, Pipeline]:
+    """Create the registered pipelines of the synthetic project."""
+    pipelines = {}
+    for group in range(NUM_NAMESPACES // NUM_NAMESPACES_PER_PIPELINE):
+        nodes = []
+        for namespace in range(
+            group * NUM_NAMESPACES_PER_PIPELINE,
+            (group + 1) * NUM_NAMESPACES_PER_PIPELINE,
+        ):
+            previous_dataset = f"namespace_{namespace}.raw"
+            for position in range(NUM_NODES_PER_NAMESPACE):
+                dataset = f"namespace_{namespace}.dataset_{position}"
+                nodes.append(
+                    node(
+                        identity,
+                        previous_dataset,
+                        dataset,
+                        name=f"node_{position}",
+                        namespace=f"namespace_{namespace}",
+                    )
+                )
+                previous_dataset = dataset
+        pipelines[f"group_{group}"] = Pipeline(nodes)
+    pipelines["__default__"] = sum(pipelines.values(), Pipeline([]))
+    return pipelines
+
+
+def populate(pipelines: Dict[str, Pipeline]) -> DataAccessManager:
+    """Populate a new data access manager with the given pipelines."""
+    data_access_manager = DataAccessManager()
+    data_access_manager.add_catalog(DataCatalog(), pipelines)
+    data_access_manager.add_pipelines(pipelines)
+    return data_access_manager
+
+
+def main():
+    """Time both approaches, taking the best of a few runs,
+    and check they assign the same IDs."""
+    pipelines = make_pipelines()
+    print(f"{len(pipelines['__default__'].nodes)} nodes, {len(pipelines)} pipelines")
+
+    hashing_times, registry_times = [], []
+    for _ in range(NUM_REPEATS):
+        with mock.patch.multiple(
+            id_registry,
+            get_node_id=lambda node: _hash(str(node)),
+            get_dataset_id=_hash_input_output,
+        ):
+            start = time.perf_counter()
+            expected = populate(pipelines)
+            hashing_times.append(time.perf_counter() - start)
+
+        id_registry.clear()
+        start = time.perf_counter()
+        actual = populate(pipelines)
+        registry_times.append(time.perf_counter() - start)
+
+    hashing_time, registry_time = min(hashing_times), min(registry_times)
+    assert actual.nodes.get_node_ids() == expected.nodes.get_node_ids(), (
+        "IDs differ from hashing on every lookup"
+    )
+    default_pipeline = pipelines["__default__"]
+    start = time.perf_counter()
+    for kedro_node in default_pipeline.nodes:
+        _hash(str(kedro_node))
+    for dataset_name in default_pipeline.datasets():
+        _hash_input_output(dataset_name)
+    print(f"hashing all nodes and datasets once: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    for kedro_node in default_pipeline.nodes:
+        id_registry.get_node_id(kedro_node)
+    for dataset_name in default_pipeline.datasets():
+        id_registry.get_dataset_id(dataset_name)
+    print(f"looking up all allocated IDs once: {time.perf_counter() - start:.3f}s")
+
+    print(f"populating, hashing on every lookup: {hashing_time:.3f}s")
+    print(f"populating, ID registry: {registry_time:.3f}s")
+    print(f"relative time: {registry_time / hashing_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark sorting the layers of a deep pipeline with `kedro_viz.services.layers`,
+comparing it with the previous recursive depth-first search over all nodes.
+
+The synthetic graph is a chain of 50,000 nodes where every 1,000th node has a layer,
+i.e. 50 layers. The recursive search fails with the default recursion limit, so the limit
+and the thread stack size are raised for the comparison only.
+
+Usage: python -m benchmarks.bench_layers
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from graphlib import TopologicalSorter
+from typing import Dict, List, Set, Tuple
+
+from kedro_viz.models.flowchart.nodes import DataNode, GraphNode
+from kedro_viz.services.layers import sort_layers
+
+NUM_NODES = 50000
+NODES_PER_LAYER = 1000
+
+
+def make_graph() -> Tuple[Dict[str, DataNode], Dict[str, Set[str]]]:
+    """Create the nodes and the dependencies of the synthetic chain."""
+    nodes = {
+        f"node_{i}": GraphNode.create_data_node(
+            dataset_id=f"node_{i}",
+            dataset_name=f"node_{i}",
+            layer=(
+                f"layer_{NUM_NODES // NODES_PER_LAYER - i // NODES_PER_LAYER:02d}"
+                if i % NODES_PER_LAYER == 0
+                else None
+            ),
+            tags=set(),
+            dataset=None,
+            node_extras=None,
+            modular_pipelines=None,
+        )
+        for i in range(NUM_NODES)
+    }
+    dependencies = defaultdict(set)
+    for i in range(NUM_NODES - 1):
+        dependencies[f"node_{i}"].add(f"node_{i + 1}")
+    return nodes, dependencies
+
+
+def sort_layers_recursively(
+    nodes: Dict[str, DataNode], dependencies: Dict[str, Set[str]]
+) -> List[str]:
+    """Sort the layers with the previous recursive algorithm."""
+    node_layers: Dict[str, Set[str]] = {}
+
+    def find_child_layers(node_id: str) -> Set[str]:
+        if node_id in node_layers:
+            return node_layers[node_id]
+        node_layers[node_id] = set()
+        if nodes[node_id].layer is not None:
+            node_layers[node_id].add(nodes[node_id].layer)
+        for child_node_id in dependencies[node_id]:
+            if nodes[child_node_id].layer is not None:
+                node_layers[node_id].add(nodes[child_node_id].layer)
+            node_layers[node_id].update(find_child_layers(child_node_id))
+        return node_layers[node_id]
+
+    for node_id in sorted(nodes):
+        find_child_layers(node_id)
+
+    layer_dependencies = defaultdict(set)
+    for node_id, child_layers in node_layers.items():
+        node_layer = nodes[node_id].layer
+        if node_layer is not None:
+            layer_dependencies[node_layer]
+            for layer in child_layers:
+                if layer != node_layer:
+                    layer_dependencies[layer].add(node_layer)
+    layer_dependencies = defaultdict(
+        set, {k: layer_dependencies[k] for k in sorted(layer_dependencies)}
+    )
+    sorted_layers = list(TopologicalSorter(layer_dependencies).static_order())
+    return sorted(sorted_layers, key=lambda layer: (sorted_layers.index(layer), layer))
+
+
+def run_with_deep_stack(func, *args):
+    """Run a function in a thread with a stack and a recursion limit deep enough
+    for the recursive algorithm."""
+    result = []
+    recursion_limit = sys.getrecursionlimit()
+    stack_size = threading.stack_size(512 * 1024 * 1024)
+    sys.setrecursionlimit(NUM_NODES * 4)
+    try:
+        thread = threading.Thread(target=lambda: result.append(func(*args)))
+        thread.start()
+        thread.join()
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+        threading.stack_size(stack_size)
+    return result[0]
+
+
+def main():
+    """Time both approaches and check they sort the layers the same way."""
+    nodes, dependencies = make_graph()
+    print(f"{len(nodes)} nodes")
+
+    try:
+        sort_layers_recursively(nodes, dependencies)
+    except RecursionError:
+        print("recursive depth-first search fails with the default recursion limit")
+
+    start = time.perf_counter()
+    expected = run_with_deep_stack(sort_layers_recursively, nodes, dependencies)
+    recursive_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = sort_layers(nodes, dependencies)
+    iterative_time = time.perf_counter() - start
+
+    assert actual == expected, "Layers differ from the recursive algorithm"
+    print(f"{len(actual)} layers")
+    print(f"recursive depth-first search: {recursive_time:.3f}s")
+    print(f"iterative bitmask propagation: {iterative_time:.3f}s")
+    print(f"speedup: {recursive_time / iterative_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Benchmark the lineage queries of a registered pipeline, comparing the reachability
+index of `kedro_viz.services.lineage` with a breadth-first search of the graph.
+
+The synthetic graph has 1,250 namespaces of 20 tasks and 20 datasets each,
+i.e. 50,000 nodes. Every namespace is a chain consuming the last dataset of the
+previous namespace and an intermediate dataset of the namespace at half its number,
+and the first task of every namespace also consumes a shared parameters node.
+
+A random graph of 20,000 nodes and 100,000 edges is also indexed, which is too
+densely connected for the reachability index and is searched on every query instead.
+
+Usage: python -m benchmarks.bench_lineage
+"""
+
+import random
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Set
+
+from kedro_viz.models.flowchart.edge import GraphEdge
+from kedro_viz.services.lineage import LineageIndex
+
+NUM_NAMESPACES = 1250
+NUM_TASKS_PER_NAMESPACE = 20
+NUM_QUERIES = 200
+NUM_RANDOM_NODES = 20000
+NUM_RANDOM_EDGES_PER_NODE = 5
+
+
+def make_edges() -> List[GraphEdge]:
+    """Create the edges of the synthetic graph."""
+    edges = []
+    for namespace in range(NUM_NAMESPACES):
+        inputs = ["params:shared"]
+        if namespace:
+            inputs.append(
+                f"namespace_{namespace - 1}.dataset_{NUM_TASKS_PER_NAMESPACE - 1}"
+            )
+            inputs.append(f"namespace_{namespace // 2}.dataset_{namespace % 10}")
+        for task in range(NUM_TASKS_PER_NAMESPACE):
+            task_id = f"namespace_{namespace}.task_{task}"
+            for input_id in inputs:
+                edges.append(GraphEdge(source=input_id, target=task_id))
+            dataset_id = f"namespace_{namespace}.dataset_{task}"
+            edges.append(GraphEdge(source=task_id, target=dataset_id))
+            inputs = [dataset_id]
+    return edges
+
+
+def make_random_edges() -> List[GraphEdge]:
+    """Create the edges of a random directed acyclic graph."""
+    rng = random.Random(0)
+    edges = []
+    for node in range(NUM_RANDOM_NODES):
+        for _ in range(NUM_RANDOM_EDGES_PER_NODE):
+            other_node = rng.randrange(NUM_RANDOM_NODES)
+            if other_node != node:
+                source, target = sorted([node, other_node])
+                edges.append(
+                    GraphEdge(source=f"node_{source}", target=f"node_{target}")
+                )
+    return edges
+
+
+def search(adjacency: Dict[str, List[str]], node_id: str) -> Set[str]:
+    """Find all nodes reachable from a node with a breadth-first search."""
+    reachable: Set[str] = set()
+    queue = deque([node_id])
+    while queue:
+        for neighbour_id in adjacency[queue.popleft()]:
+            if neighbour_id not in reachable:
+                reachable.add(neighbour_id)
+                queue.append(neighbour_id)
+    reachable.discard(node_id)
+    return reachable
+
+
+def main():
+    """Time building the index and answering lineage queries against
+    breadth-first searches, and check they find the same nodes."""
+    edges = make_edges()
+    successors: Dict[str, List[str]] = defaultdict(list)
+    predecessors: Dict[str, List[str]] = defaultdict(list)
+    for edge in edges:
+        successors[edge.source].append(edge.target)
+        predecessors[edge.target].append(edge.source)
+    node_ids = sorted(set(successors) | set(predecessors))
+    print(f"{len(node_ids)} nodes, {len(edges)} edges")
+
+    start = time.perf_counter()
+    index = LineageIndex(edges)
+    print(f"index built in {time.perf_counter() - start:.3f}s")
+
+    query_node_ids = node_ids[:: len(node_ids) // NUM_QUERIES]
+
+    start = time.perf_counter()
+    for node_id in query_node_ids:
+        assert set(index.get_descendant_ids(node_id)) == search(successors, node_id)
+        assert set(index.get_ancestor_ids(node_id)) == search(predecessors, node_id)
+    print(f"checked {len(query_node_ids)} nodes in {time.perf_counter() - start:.3f}s")
+
+    timings = {}
+    for name, get_lineage in [
+        (
+            "search",
+            lambda node_id: (
+                search(predecessors, node_id),
+                search(successors, node_id),
+            ),
+        ),
+        (
+            "index",
+            lambda node_id: (
+                index.get_ancestor_ids(node_id),
+                index.get_descendant_ids(node_id),
+            ),
+        ),
+    ]:
+        start = time.perf_counter()
+        for node_id in query_node_ids:
+            get_lineage(node_id)
+        timings[name] = (time.perf_counter() - start) / len(query_node_ids)
+        print(f"{name}: {timings[name] * 1e3:.3f}ms per node lineage")
+    print(f"speedup {timings['search'] / timings['index']:.1f}x")
+
+    pairs = [
+        (source_id, target_id)
+        for source_id in query_node_ids
+        for target_id in query_node_ids[:50]
+    ]
+    start = time.perf_counter()
+    for source_id, target_id in pairs:
+        index.is_ancestor(source_id, target_id)
+    print(
+        "is_ancestor: "
+        f"{(time.perf_counter() - start) / len(pairs) * 1e6:.2f}us per query"
+    )
+
+    random_edges = make_random_edges()
+    start = time.perf_counter()
+    random_index = LineageIndex(random_edges)
+    print(
+        f"random graph of {NUM_RANDOM_NODES} nodes, {len(random_edges)} edges: "
+        f"index built in {time.perf_counter() - start:.3f}s"
+    )
+    start = time.perf_counter()
+    for node in range(0, NUM_RANDOM_NODES, NUM_RANDOM_NODES // NUM_QUERIES):
+        random_index.get_ancestor_ids(f"node_{node}")
+        random_index.get_descendant_ids(f"node_{node}")
+    print(
+        f"random graph: {(time.perf_counter() - start) / NUM_QUERIES * 1e3:.3f}ms "
+        "per node lineage"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark populating the modular pipelines tree of a deeply nested pipeline,
+comparing the single pass aggregation of `ModularPipelinesRepository.populate_tree`
+with constructing the sub-pipeline of every modular pipeline.
+
+The synthetic pipeline has 100 top-level namespaces, each nesting 4 levels deep
+with 5 chained nodes per level, i.e. 400 modular pipelines and 2,000 nodes.
+
+Usage: python -m benchmarks.bench_modular_pipelines
+"""
+
+import time
+
+from kedro.pipeline import Pipeline, node
+
+from kedro_viz.data_access.repositories import ModularPipelinesRepository
+
+NUM_NAMESPACES = 100
+DEPTH = 4
+NUM_NODES_PER_LEVEL = 5
+
+
+def identity(x):
+    """Node function of the synthetic pipeline."""
+    return x
+
+
+def make_pipeline() -> Pipeline:
+    """Create the synthetic nested pipeline."""
+    nodes = []
+    for namespace in range(NUM_NAMESPACES):
+        previous_dataset = f"namespace_{namespace}.raw"
+        for level in range(DEPTH):
+            level_namespace = ".".join(
+                [f"namespace_{namespace}"] + [f"level_{i}" for i in range(level)]
+            )
+            for position in range(NUM_NODES_PER_LEVEL):
+                dataset = f"{level_namespace}.dataset_{position}"
+                nodes.append(
+                    node(identity, previous_dataset, dataset, namespace=level_namespace)
+                )
+                previous_dataset = dataset
+    return Pipeline(nodes)
+
+
+class SubPipelineModularPipelinesRepository(ModularPipelinesRepository):
+    """Populate the tree by constructing the sub-pipeline of every modular pipeline."""
+
+    def populate_tree(self, pipeline):
+        namespaces = {node.namespace for node in pipeline.nodes if node.namespace}
+        modular_pipeline_ids = {
+            modular_pipeline_id
+            for ns in namespaces
+            for modular_pipeline_id in self._explode_namespace(ns)
+        }
+
+        for modular_pipeline_id in sorted(modular_pipeline_ids):
+            self.get_or_create_modular_pipeline(modular_pipeline_id)
+
+            sub_pipeline = pipeline.only_nodes_with_namespaces([modular_pipeline_id])
+            rest_of_the_pipeline = pipeline - sub_pipeline
+
+            free_inputs = sub_pipeline.inputs()
+            free_outputs = sub_pipeline.outputs() | (
+                rest_of_the_pipeline.inputs() & sub_pipeline.all_outputs()
+            )
+
+            self._add_inputs(modular_pipeline_id, free_inputs)
+            self._add_outputs(modular_pipeline_id, free_outputs)
+            self._add_children(modular_pipeline_id, sub_pipeline.nodes)
+
+
+def main():
+    """Time both approaches and check they build the same tree."""
+    pipeline = make_pipeline()
+    print(f"{len(pipeline.nodes)} nodes")
+
+    start = time.perf_counter()
+    expected = SubPipelineModularPipelinesRepository()
+    expected.populate_tree(pipeline)
+    sub_pipeline_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = ModularPipelinesRepository()
+    actual.populate_tree(pipeline)
+    single_pass_time = time.perf_counter() - start
+
+    assert actual.tree == expected.tree, "Trees differ from the sub-pipeline approach"
+    print(f"{len(actual.tree) - 1} modular pipelines")
+    print(f"sub-pipeline per modular pipeline: {sub_pipeline_time:.3f}s")
+    print(f"single pass aggregation: {single_pass_time:.3f}s")
+    print(f"speedup: {sub_pipeline_time / single_pass_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark finding the bad modular pipeline inputs of a registered pipeline,
+comparing `kedro_viz.services.reachability` with a search of the descendants
+of every modular pipeline using networkx.
+
+The synthetic graph has 500 namespaces of 20 tasks and 20 datasets each, i.e. 20,000 nodes.
+Every namespace consumes the last dataset of the previous one, and every 50th namespace
+also feeds one of its internal datasets back into the previous namespace,
+which creates a cycle through the modular pipeline nodes.
+
+Usage: python -m benchmarks.bench_reachability
+"""
+
+import time
+from typing import Dict, List, Set, Tuple
+
+from kedro_viz.models.flowchart.edge import GraphEdge
+from kedro_viz.services.reachability import find_bad_modular_pipeline_inputs
+
+NUM_NAMESPACES = 500
+NUM_TASKS_PER_NAMESPACE = 20
+
+
+def make_graph() -> Tuple[List[GraphEdge], Dict[str, Set[str]]]:
+    """Create the edges and the modular pipelines inputs of the synthetic graph."""
+    edges = set()
+    modular_pipelines_inputs: Dict[str, Set[str]] = {}
+
+    for namespace in range(NUM_NAMESPACES):
+        modular_pipeline_id = f"namespace_{namespace}"
+        inputs = {f"namespace_{namespace - 1}.dataset_last"} if namespace else set()
+        outputs = {f"{modular_pipeline_id}.dataset_last"}
+
+        previous_dataset = next(iter(inputs), f"{modular_pipeline_id}.raw")
+        for task in range(NUM_TASKS_PER_NAMESPACE):
+            task_id = f"{modular_pipeline_id}.task_{task}"
+            dataset_id = (
+                f"{modular_pipeline_id}.dataset_last"
+                if task == NUM_TASKS_PER_NAMESPACE - 1
+                else f"{modular_pipeline_id}.dataset_{task}"
+            )
+            edges.add((previous_dataset, task_id))
+            edges.add((task_id, dataset_id))
+            previous_dataset = dataset_id
+
+        if namespace and namespace % 50 == 0:
+            # an internal dataset is also consumed by a disconnected task of
+            # the previous namespace, making it an output of this namespace
+            # and an input of the previous one
+            feedback_dataset = f"{modular_pipeline_id}.dataset_0"
+            feedback_task = f"namespace_{namespace - 1}.feedback_task"
+            edges.add((feedback_dataset, feedback_task))
+            edges.add((feedback_task, f"namespace_{namespace - 1}.feedback"))
+            outputs.add(feedback_dataset)
+            modular_pipelines_inputs[f"namespace_{namespace - 1}"].add(feedback_dataset)
+
+        modular_pipelines_inputs[modular_pipeline_id] = inputs
+        edges.update((modular_pipeline_id, output_id) for output_id in outputs)
+
+    for modular_pipeline_id, inputs in modular_pipelines_inputs.items():
+        edges.update((input_id, modular_pipeline_id) for input_id in inputs)
+
+    return (
+        [GraphEdge(source=source, target=target) for source, target in sorted(edges)],
+        modular_pipelines_inputs,
+    )
+
+
+def find_bad_modular_pipeline_inputs_with_networkx(
+    edges: List[GraphEdge], modular_pipelines_inputs: Dict[str, Set[str]]
+) -> List[GraphEdge]:
+    """Search the descendants of every modular pipeline in turn."""
+    import networkx as nx
+
+    digraph = nx.DiGraph()
+    for edge in edges:
+        digraph.add_edge(edge.source, edge.target)
+
+    bad_input_edges = []
+    for modular_pipeline_id, inputs in modular_pipelines_inputs.items():
+        if not digraph.has_node(modular_pipeline_id):
+            continue
+        descendants = nx.descendants(digraph, modular_pipeline_id)
+        for bad_input in sorted(inputs.intersection(descendants)):
+            digraph.remove_edge(bad_input, modular_pipeline_id)
+            bad_input_edges.append(
+                GraphEdge(source=bad_input, target=modular_pipeline_id)
+            )
+    return bad_input_edges
+
+
+def main():
+    """Time both approaches and check they find the same edges."""
+    edges, modular_pipelines_inputs = make_graph()
+    num_nodes = len({node for edge in edges for node in (edge.source, edge.target)})
+    print(
+        f"{len(modular_pipelines_inputs)} modular pipelines, "
+        f"{num_nodes} nodes, {len(edges)} edges"
+    )
+
+    start = time.perf_counter()
+    expected = find_bad_modular_pipeline_inputs_with_networkx(
+        edges, modular_pipelines_inputs
+    )
+    networkx_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = find_bad_modular_pipeline_inputs(edges, modular_pipelines_inputs)
+    reachability_time = time.perf_counter() - start
+
+    assert actual == expected, "Results differ from the networkx search"
+    print(f"bad input edges found: {len(actual)}")
+    print(f"networkx descendants search (incl. import): {networkx_time:.3f}s")
+    print(f"strongly connected components: {reachability_time:.3f}s")
+    print(f"speedup: {networkx_time / reachability_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
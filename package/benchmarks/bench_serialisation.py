@@ -0,0 +1,183 @@
+"""Benchmark serialising a `GraphAPIResponse`, comparing the single pass serialisation
+of `kedro_viz.api.rest.responses.utils` with converting the response to Python objects
+using `jsonable_encoder` first and encoding them with orjson afterwards.
+
+The synthetic response has 100 namespaces of 50 tasks and 50 datasets each,
+i.e. 10,000 nodes and 9,900 edges, along with a modular pipelines tree.
+
+Usage: python -m benchmarks.bench_serialisation
+"""
+
+import json
+import time
+from typing import Callable
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from kedro_viz.api.rest.responses.pipelines import GraphAPIResponse
+from kedro_viz.api.rest.responses.utils import (
+    EnhancedORJSONResponse,
+    get_encoded_response,
+    get_jsonable_response,
+)
+
+NUM_NAMESPACES = 100
+NUM_TASKS_PER_NAMESPACE = 50
+NUM_REPEATS = 5
+
+
+def make_response() -> GraphAPIResponse:
+    """Create the synthetic pipeline response."""
+    nodes = []
+    edges = []
+    modular_pipelines = {
+        "__root__": {
+            "id": "__root__",
+            "name": "__root__",
+            "inputs": [],
+            "outputs": [],
+            "children": [],
+        }
+    }
+    for namespace in range(NUM_NAMESPACES):
+        modular_pipeline_id = f"namespace_{namespace}"
+        children = []
+        for task in range(NUM_TASKS_PER_NAMESPACE):
+            task_id = f"{modular_pipeline_id}.task_{task}"
+            dataset_id = f"{modular_pipeline_id}.dataset_{task}"
+            nodes.append(
+                {
+                    "id": task_id,
+                    "name": f"task_{task}",
+                    "full_name": task_id,
+                    "tags": ["split", "train"],
+                    "pipelines": ["__default__", "data_science"],
+                    "modular_pipelines": [modular_pipeline_id],
+                    "type": "task",
+                    "parameters": {"test_size": 0.2, "features": ["a", "b", "c"]},
+                }
+            )
+            nodes.append(
+                {
+                    "id": dataset_id,
+                    "name": f"dataset_{task}",
+                    "tags": ["split", "train"],
+                    "pipelines": ["__default__", "data_science"],
+                    "modular_pipelines": [modular_pipeline_id],
+                    "type": "data",
+                    "layer": "primary",
+                    "dataset_type": "pandas.csv_dataset.CSVDataset",
+                    "node_extras": {"stats": {"rows": 1000, "columns": 12}},
+                }
+            )
+            edges.append({"source": task_id, "target": dataset_id})
+            if task:
+                edges.append(
+                    {
+                        "source": f"{modular_pipeline_id}.dataset_{task - 1}",
+                        "target": task_id,
+                    }
+                )
+            children.extend(
+                [{"id": task_id, "type": "task"}, {"id": dataset_id, "type": "data"}]
+            )
+        modular_pipelines[modular_pipeline_id] = {
+            "id": modular_pipeline_id,
+            "name": modular_pipeline_id,
+            "inputs": [],
+            "outputs": [f"{modular_pipeline_id}.dataset_{NUM_TASKS_PER_NAMESPACE - 1}"],
+            "children": children,
+        }
+        modular_pipelines["__root__"]["children"].append(
+            {"id": modular_pipeline_id, "type": "modularPipeline"}
+        )
+
+    return GraphAPIResponse(
+        nodes=nodes,
+        edges=edges,
+        layers=["raw", "primary"],
+        tags=[{"id": "split", "name": "split"}, {"id": "train", "name": "train"}],
+        pipelines=[{"id": "__default__", "name": "__default__"}],
+        modular_pipelines=modular_pipelines,
+        selected_pipeline="__default__",
+    )
+
+
+def encode_with_jsonable_encoder(response: GraphAPIResponse) -> bytes:
+    """Encode the response to compact JSON going through `jsonable_encoder`."""
+    return orjson.dumps(
+        jsonable_encoder(response),
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+def encode_to_human_readable_with_jsonable_encoder(response: GraphAPIResponse) -> bytes:
+    """Encode the response to indented JSON going through `jsonable_encoder`."""
+    return EnhancedORJSONResponse.encode_to_human_readable(jsonable_encoder(response))
+
+
+def decode_encoded_response(response: GraphAPIResponse) -> dict:
+    """Get the response as Python objects by decoding its indented JSON."""
+    return json.loads(
+        encode_to_human_readable_with_jsonable_encoder(response).decode("utf-8")
+    )
+
+
+def time_function(function: Callable, response: GraphAPIResponse) -> float:
+    """Return the best time out of a few calls to the function."""
+    timings = []
+    for _ in range(NUM_REPEATS):
+        start = time.perf_counter()
+        function(response)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Time both approaches and check they produce the same data."""
+    response = make_response()
+    print(f"{len(response.nodes)} nodes, {len(response.edges)} edges")
+
+    comparisons = [
+        (
+            "compact bytes",
+            encode_with_jsonable_encoder,
+            get_encoded_response,
+        ),
+        (
+            "indented bytes",
+            encode_to_human_readable_with_jsonable_encoder,
+            lambda response: get_encoded_response(response, human_readable=True),
+        ),
+        (
+            "python objects",
+            decode_encoded_response,
+            get_jsonable_response,
+        ),
+    ]
+    for name, two_pass_function, single_pass_function in comparisons:
+        expected = two_pass_function(response)
+        actual = single_pass_function(response)
+        if isinstance(expected, bytes):
+            assert json.loads(actual) == json.loads(expected), f"{name} differ"
+        else:
+            assert actual == expected, f"{name} differ"
+
+        two_pass_time = time_function(two_pass_function, response)
+        single_pass_time = time_function(single_pass_function, response)
+        print(
+            f"{name}: jsonable_encoder {two_pass_time:.3f}s, "
+            f"single pass {single_pass_time:.3f}s, "
+            f"speedup {two_pass_time / single_pass_time:.1f}x"
+        )
+
+    print(
+        f"compact size {len(get_encoded_response(response)) / 1e6:.1f} MB, "
+        "indented size "
+        f"{len(get_encoded_response(response, human_readable=True)) / 1e6:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
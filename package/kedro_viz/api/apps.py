@@ -16,6 +16,8 @@ from jinja2 import Environment, FileSystemLoader
 from werkzeug.utils import secure_filename
 
 from kedro_viz import __version__
+from kedro_viz.api.rest.executor import validate_limits
+from kedro_viz.api.rest.responses.nodes import node_metadata_cache
 from kedro_viz.api.rest.responses.utils import EnhancedORJSONResponse
 from kedro_viz.integrations.kedro import telemetry as kedro_telemetry
 
@@ -60,7 +62,14 @@ def create_api_app_from_project(
             in the Kedro project
     Returns:
         The FastAPI app
+
+    Raises:
+        ValueError: If the worker limits or the cache settings
+            set through the environment are invalid.
     """
+    validate_limits()
+    node_metadata_cache.configure_from_env()
+
     app = _create_base_api_app()
     app.include_router(rest_router)
 
@@ -0,0 +1,98 @@
+"""`kedro_viz.api.rest.executor` runs the blocking work of the REST routes,
+e.g. loading dataset previews or reading the run events, in worker threads so that
+the event loop stays responsive while it is in progress.
+
+The work of all routes is bounded by a shared maximum number of worker threads,
+and the work of each group of routes by its own concurrency limit, so that a few
+slow requests of one kind can't take up all the workers. Both can be configured
+through environment variables, e.g.::
+
+    KEDRO_VIZ_MAX_WORKERS=16 KEDRO_VIZ_ENDPOINT_LIMITS="nodes=8,deploy=2" kedro viz run
+"""
+
+import os
+from typing import Callable, Dict, Optional, TypeVar
+
+from anyio import CapacityLimiter, to_thread
+from anyio.lowlevel import RunVar
+
+from kedro_viz.utils import get_max_workers, parse_limit
+
+ENDPOINT_LIMITS_ENV_VAR = "KEDRO_VIZ_ENDPOINT_LIMITS"
+
+DEFAULT_ENDPOINT_LIMITS = {
+    "nodes": 4,
+    "pipelines": 4,
+    "run_status": 2,
+    "metadata": 2,
+    "deploy": 1,
+}
+
+T = TypeVar("T")
+
+# The limiters are created for every event loop, as they can't be shared between loops
+_limiters: RunVar[Dict[Optional[str], CapacityLimiter]] = RunVar("kedro_viz_limiters")
+
+
+def get_endpoint_limits() -> Dict[str, int]:
+    """Get the maximum number of requests of every group of routes whose blocking work
+    runs at once, overriding the defaults with the comma-separated `endpoint=limit`
+    pairs of the `KEDRO_VIZ_ENDPOINT_LIMITS` environment variable.
+
+    Raises:
+        ValueError: If an endpoint isn't supported or a limit isn't a positive integer.
+    """
+    endpoint_limits = dict(DEFAULT_ENDPOINT_LIMITS)
+    value = os.getenv(ENDPOINT_LIMITS_ENV_VAR, "")
+    for endpoint_limit in filter(None, value.split(",")):
+        endpoint, _, limit = endpoint_limit.partition("=")
+        endpoint = endpoint.strip()
+        if endpoint not in DEFAULT_ENDPOINT_LIMITS:
+            raise ValueError(
+                f"Endpoint '{endpoint}' is not supported. "
+                f"Supported endpoints are: {', '.join(DEFAULT_ENDPOINT_LIMITS)}."
+            )
+        endpoint_limits[endpoint] = parse_limit(endpoint, limit.strip())
+    return endpoint_limits
+
+
+def validate_limits():
+    """Check that the `KEDRO_VIZ_MAX_WORKERS` and `KEDRO_VIZ_ENDPOINT_LIMITS`
+    environment variables are valid when Kedro-Viz starts, rather than failing
+    every request once the limiters are first created.
+
+    Raises:
+        ValueError: If an endpoint isn't supported or a limit isn't a positive integer.
+    """
+    get_max_workers()
+    get_endpoint_limits()
+
+
+def _get_limiters() -> Dict[Optional[str], CapacityLimiter]:
+    try:
+        return _limiters.get()
+    except LookupError:
+        limiters: Dict[Optional[str], CapacityLimiter] = {
+            endpoint: CapacityLimiter(limit)
+            for endpoint, limit in get_endpoint_limits().items()
+        }
+        limiters[None] = CapacityLimiter(get_max_workers())
+        _limiters.set(limiters)
+        return limiters
+
+
+async def run_blocking(endpoint: str, func: Callable[..., T], *args) -> T:
+    """Run a blocking function in a worker thread without blocking the event loop,
+    waiting first for both the endpoint and the shared worker limits to allow it.
+
+    Args:
+        endpoint: The group of routes the work is done for, e.g. "nodes".
+        func: The blocking function to run.
+        *args: The positional arguments to call the function with.
+
+    Returns:
+        The return value of the function, whose exceptions are raised as they are.
+    """
+    limiters = _get_limiters()
+    async with limiters[endpoint]:
+        return await to_thread.run_sync(func, *args, limiter=limiters[None])
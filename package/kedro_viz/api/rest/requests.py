@@ -1,6 +1,12 @@
 """`kedro_viz.api.rest.requests` defines REST request types."""
 
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
+
+# The maximum number of node IDs in a single `/api/nodes:batch` request, as the
+# metadata of all the nodes, including their previews, is built before replying
+MAX_NODES_METADATA_BATCH_SIZE = 100
 
 
 class DeployerConfiguration(BaseModel):
@@ -10,3 +16,10 @@ class DeployerConfiguration(BaseModel):
     is_all_previews_enabled: bool = False
     endpoint: str
     bucket_name: str
+
+
+class NodesMetadataBatchRequest(BaseModel):
+    """IDs of the nodes to get the metadata for in a single request,
+    at most `MAX_NODES_METADATA_BATCH_SIZE` of them."""
+
+    node_ids: List[str] = Field(max_length=MAX_NODES_METADATA_BATCH_SIZE)
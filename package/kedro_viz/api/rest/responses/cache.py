@@ -0,0 +1,89 @@
+"""`kedro_viz.api.rest.responses.cache` contains response classes
+and utility functions for the `/cache/stats` REST endpoint"""
+
+from typing import Optional
+
+from pydantic import ConfigDict
+
+from kedro_viz.api.rest.responses.base import BaseAPIResponse
+from kedro_viz.api.rest.responses.nodes import node_metadata_cache
+from kedro_viz.models.flowchart.preview_cache import preview_cache
+
+
+class CacheStatsAPIResponse(BaseAPIResponse):
+    """
+    CacheStatsAPIResponse is a data model for the usage statistics of a cache.
+
+    Attributes:
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups which had to build the value.
+        evictions (int): The number of entries evicted to make room for others.
+        expirations (int): The number of entries dropped once older than the TTL,
+            if the cache has one.
+        coalesced (int): The number of lookups which waited for the same value
+            being built for another lookup, if the cache coalesces them.
+        entries (int): The current number of entries.
+        size (int): The current total size of the entries in bytes.
+        max_size (int): The maximum total size of the entries in bytes.
+        ttl (Optional[float]): The number of seconds an entry stays valid, if limited.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int = 0
+    coalesced: int = 0
+    entries: int
+    size: int
+    max_size: int
+    ttl: Optional[float] = None
+
+
+class CachesStatsAPIResponse(BaseAPIResponse):
+    """
+    CachesStatsAPIResponse is a data model for the usage statistics of the caches
+    of the Kedro visualization API.
+
+    Attributes:
+        node_metadata (CacheStatsAPIResponse): The statistics of the node metadata cache.
+        previews (CacheStatsAPIResponse): The statistics of the on-disk preview cache.
+    """
+
+    node_metadata: CacheStatsAPIResponse
+    previews: CacheStatsAPIResponse
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "node_metadata": {
+                    "hits": 12,
+                    "misses": 4,
+                    "evictions": 0,
+                    "expirations": 0,
+                    "coalesced": 2,
+                    "entries": 4,
+                    "size": 5120,
+                    "max_size": 67108864,
+                    "ttl": None,
+                },
+                "previews": {
+                    "hits": 3,
+                    "misses": 1,
+                    "evictions": 0,
+                    "expirations": 0,
+                    "coalesced": 0,
+                    "entries": 1,
+                    "size": 4096,
+                    "max_size": 268435456,
+                    "ttl": None,
+                },
+            }
+        }
+    )
+
+
+def get_cache_stats_response():
+    """API response for `/api/cache/stats`."""
+    return CachesStatsAPIResponse(
+        node_metadata=node_metadata_cache.get_stats(),
+        previews=preview_cache.get_stats(),
+    )
@@ -0,0 +1,139 @@
+"""`kedro_viz.api.rest.responses.compression` contains utility functions to
+compress the encoded responses of the REST endpoints and to negotiate their
+content encoding with the client"""
+
+import gzip
+import logging
+from typing import Callable, Dict, List, Optional
+
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Compression levels trading off a little compression ratio for speed,
+# as the responses of large projects are tens of megabytes
+GZIP_COMPRESS_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 10
+
+# Responses smaller than this are sent uncompressed, as compressing
+# them does not save enough to be worth the time
+MIN_COMPRESSED_SIZE = 1024
+
+# File extensions of the compressed siblings of the saved responses
+COMPRESSED_FILE_EXTENSIONS = {"br": ".br", "zstd": ".zst", "gzip": ".gz"}
+
+
+def _compress_with_brotli(content: bytes) -> bytes:
+    return brotli.compress(content, quality=BROTLI_QUALITY)
+
+
+def _compress_with_zstd(content: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+
+
+def _compress_with_gzip(content: bytes) -> bytes:
+    # leave out the modification time so that the compressed content is deterministic
+    return gzip.compress(content, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+
+
+def _get_compressors() -> Dict[str, Callable[[bytes], bytes]]:
+    """Returns the compressors of the available content encodings,
+    in order of preference when the client accepts several of them equally."""
+    compressors: Dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        compressors["br"] = _compress_with_brotli
+    if zstandard is not None:
+        compressors["zstd"] = _compress_with_zstd
+    compressors["gzip"] = _compress_with_gzip
+    return compressors
+
+
+def get_supported_content_encodings() -> List[str]:
+    """Returns the content encodings available to compress the responses with.
+    `br` and `zstd` are only available when the `brotli` and `zstandard`
+    packages are installed respectively."""
+    return list(_get_compressors())
+
+
+def compress(content: bytes, content_encoding: str) -> bytes:
+    """Compresses the encoded response with the given content encoding.
+
+    Raises:
+        ValueError: If the content encoding is not available.
+    """
+    compressors = _get_compressors()
+    if content_encoding not in compressors:
+        raise ValueError(
+            f"Content encoding '{content_encoding}' is not supported. "
+            f"Supported content encodings are: {', '.join(compressors)}."
+        )
+    return compressors[content_encoding](content)
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Parses the `Accept-Encoding` request header into the quality value
+    of every listed content coding."""
+    qvalues = {}
+    for coding in accept_encoding.split(","):
+        name, *params = coding.split(";")
+        qvalue = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        if name.strip():
+            qvalues[name.strip().lower()] = qvalue
+    return qvalues
+
+
+def select_content_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Selects the content encoding to compress a response with, given the value
+    of the `Accept-Encoding` request header. It is the available content encoding
+    the client prefers, or None if the response should be sent uncompressed."""
+    if not accept_encoding:
+        return None
+
+    qvalues = _parse_accept_encoding(accept_encoding)
+    default_qvalue = qvalues.get("*", 0.0)
+    selected_content_encoding, selected_qvalue = None, 0.0
+    for content_encoding in get_supported_content_encodings():
+        qvalue = qvalues.get(content_encoding, default_qvalue)
+        if qvalue > selected_qvalue:
+            selected_content_encoding, selected_qvalue = content_encoding, qvalue
+
+    # the client might explicitly prefer the uncompressed response
+    if selected_qvalue < qvalues.get("identity", 0.0):
+        return None
+    return selected_content_encoding
+
+
+def get_compressed_etag(etag: str, content_encoding: str) -> str:
+    """Returns the ETag of the compressed variant of a response, which must
+    differ from the ETag of the uncompressed response it is derived from."""
+    return f'{etag[:-1]}-{content_encoding}"'
+
+
+def get_content_encoded_response(
+    content: bytes, etag: str, content_encoding: Optional[str] = None
+) -> Response:
+    """Returns the JSON response for the encoded response, compressed with the
+    given content encoding if any, along with the matching ETag."""
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if content_encoding is not None:
+        headers["ETag"] = get_compressed_etag(etag, content_encoding)
+        headers["Content-Encoding"] = content_encoding
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -2,20 +2,38 @@
 and utility functions for the `/nodes/*` REST endpoints"""
 
 import logging
-from typing import Dict, List, Optional, Union
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from fastapi.responses import JSONResponse
-from pydantic import ConfigDict
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import ConfigDict, TypeAdapter
 
 from kedro_viz.api.rest.responses.base import BaseAPIResponse
-from kedro_viz.data_access import data_access_manager
+from kedro_viz.api.rest.responses.compression import (
+    MIN_COMPRESSED_SIZE,
+    compress,
+    get_content_encoded_response,
+)
+from kedro_viz.api.rest.responses.utils import get_etag
+from kedro_viz.data_access import DataAccessManager, data_access_manager
 from kedro_viz.models.flowchart.node_metadata import (
     DataNodeMetadata,
     ParametersNodeMetadata,
     TaskNodeMetadata,
     TranscodedDataNodeMetadata,
 )
-from kedro_viz.models.flowchart.nodes import DataNode, TaskNode, TranscodedDataNode
+from kedro_viz.models.flowchart.nodes import (
+    DataNode,
+    GraphNode,
+    TaskNode,
+    TranscodedDataNode,
+)
+from kedro_viz.utils import get_max_workers
 
 logger = logging.getLogger(__name__)
 
@@ -147,9 +165,37 @@ NodeMetadataAPIResponse = Union[
     ParametersNodeMetadataAPIResponse,
 ]
 
+node_metadata_response_adapter: TypeAdapter = TypeAdapter(NodeMetadataAPIResponse)
+
+
+class NodesMetadataBatchAPIResponse(BaseAPIResponse):
+    """
+    NodesMetadataBatchAPIResponse is a data model for the response of the batch node metadata API.
+
+    Attributes:
+        nodes (Dict[str, Union[NodeMetadataAPIResponse, Dict]]): The metadata of every node
+            found, by node ID, which is empty for the nodes without metadata.
+        errors (Dict[str, str]): The error message of every node whose metadata
+            could not be retrieved, by node ID.
+    """
+
+    nodes: Dict[str, Union[NodeMetadataAPIResponse, Dict]]
+    errors: Dict[str, str]
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "nodes": {
+                    "f1f1425b": {"parameters": {"test_size": 0.2}},
+                },
+                "errors": {"unknown": "Invalid node ID"},
+            }
+        }
+    )
+
 
-def get_node_metadata_response(node_id: str):
-    """API response for `/api/nodes/node_id`."""
+def get_node_metadata_response(node_id: str, is_all_previews_enabled: bool = True):
+    """API response for `/api/nodes/node_id`. The previews of data nodes can be
+    disabled for this response only through ``is_all_previews_enabled``."""
     node = data_access_manager.nodes.get_node_by_id(node_id)
     if not node:
         return JSONResponse(status_code=404, content={"message": "Invalid node ID"})
@@ -161,9 +207,395 @@ def get_node_metadata_response(node_id: str):
         return TaskNodeMetadata(task_node=node)
 
     if isinstance(node, DataNode):
-        return DataNodeMetadata(data_node=node)
+        return DataNodeMetadata(
+            data_node=node, is_all_previews_enabled=is_all_previews_enabled
+        )
 
     if isinstance(node, TranscodedDataNode):
         return TranscodedDataNodeMetadata(transcoded_data_node=node)
 
     return ParametersNodeMetadata(parameters_node=node)
+
+
+def _encode_node_metadata_response(response) -> bytes:
+    """Encode a successful node metadata response exactly as FastAPI would
+    for the `NodeMetadataAPIResponse` response model, leaving out the None values."""
+    if isinstance(response, Response):
+        return bytes(response.body)
+    return node_metadata_response_adapter.dump_json(
+        node_metadata_response_adapter.validate_python(
+            response.model_dump(exclude_none=True)
+        ),
+        exclude_none=True,
+    )
+
+
+NODE_METADATA_CACHE_SIZE_ENV_VAR = "KEDRO_VIZ_NODE_METADATA_CACHE_SIZE"
+NODE_METADATA_CACHE_TTL_ENV_VAR = "KEDRO_VIZ_NODE_METADATA_CACHE_TTL"
+DEFAULT_NODE_METADATA_CACHE_SIZE = 64 * 1024 * 1024
+# Dataset previews and statistics change as the underlying data changes, so entries
+# are reloaded every few minutes rather than kept until the next repopulation.
+DEFAULT_NODE_METADATA_CACHE_TTL = 300.0
+
+
+def get_node_metadata_cache_settings() -> Tuple[int, float]:
+    """Get the size and TTL of the node metadata cache, as set by the
+    `KEDRO_VIZ_NODE_METADATA_CACHE_SIZE` and `KEDRO_VIZ_NODE_METADATA_CACHE_TTL`
+    environment variables, if any.
+
+    Raises:
+        ValueError: If the size or TTL isn't a positive number.
+    """
+    max_size_value = os.getenv(NODE_METADATA_CACHE_SIZE_ENV_VAR)
+    ttl_value = os.getenv(NODE_METADATA_CACHE_TTL_ENV_VAR)
+    try:
+        max_size = (
+            DEFAULT_NODE_METADATA_CACHE_SIZE
+            if max_size_value is None
+            else int(max_size_value)
+        )
+        ttl = DEFAULT_NODE_METADATA_CACHE_TTL if ttl_value is None else float(ttl_value)
+    except ValueError:
+        # reported as invalid below
+        max_size, ttl = 0, 0
+    if max_size <= 0 or ttl <= 0:
+        raise ValueError(
+            "The node metadata cache size and TTL must be positive numbers, "
+            f"got '{max_size_value}' and '{ttl_value}'."
+        )
+    return max_size, ttl
+
+
+# The encoded response, its ETag, the time it was cached
+# and its compressed variants by content encoding
+_NodeMetadataCacheEntry = Tuple[bytes, str, float, Dict[str, bytes]]
+
+
+class NodeMetadataCache:
+    """Cache the encoded `/api/nodes/{id}` responses, so that going back and forth
+    between nodes doesn't load the preview of their datasets again every time.
+
+    Entries are keyed by node ID and preview arguments, and evicted least recently used
+    first once their total size would exceed ``max_size`` bytes, or once they are older
+    than ``ttl`` seconds, so that changes to the data show up within 5 minutes by default.
+    The compressed variants of every entry are kept along with it, count towards its size
+    and are evicted with it.
+    Like the `PipelineResponseCache`, all entries are dropped as soon as the data access
+    manager is replaced or repopulated.
+
+    Args:
+        max_size: The maximum total size of the cached responses in bytes.
+        ttl: The number of seconds an entry stays valid, or None to keep entries
+            until they are evicted.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_NODE_METADATA_CACHE_SIZE,
+        ttl: Optional[float] = DEFAULT_NODE_METADATA_CACHE_TTL,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        # the entry of every key, from the least to the most recently used
+        self._entries: "OrderedDict[Tuple[str, bytes], _NodeMetadataCacheEntry]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._populated_from: Optional[Tuple[DataAccessManager, int]] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._coalesced = 0
+        # the future result of every response being built, along with the population
+        # state of the data access manager it is built from, by key
+        self._in_flight_builds: Dict[
+            Tuple[str, bytes],
+            Tuple["Future[Tuple[bytes, str]]", Optional[Tuple[DataAccessManager, int]]],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def configure_from_env(self):
+        """Set the size and TTL of the cache from the environment variables,
+        see ``get_node_metadata_cache_settings``, e.g. when Kedro-Viz starts.
+
+        Raises:
+            ValueError: If the size or TTL isn't a positive number,
+                in which case the cache is left unchanged.
+        """
+        max_size, ttl = get_node_metadata_cache_settings()
+        with self._lock:
+            self.max_size = max_size
+            self.ttl = ttl
+
+    @staticmethod
+    def _get_key(node: GraphNode) -> Tuple[str, bytes]:
+        preview_args = (
+            node.get_preview_args()
+            if isinstance(node, DataNode) and node.viz_metadata
+            else None
+        )
+        return node.id, orjson.dumps(
+            preview_args, option=orjson.OPT_SORT_KEYS, default=repr
+        )
+
+    def _drop_if_repopulated(self):
+        population_state = (data_access_manager, data_access_manager.population_version)
+        if (
+            self._populated_from is None
+            or self._populated_from[0] is not population_state[0]
+            or self._populated_from[1] != population_state[1]
+        ):
+            self._entries.clear()
+            self._size = 0
+            self._populated_from = population_state
+
+    def _pop(self, key: Tuple[str, bytes]):
+        encoded_response, _, _, compressed_responses = self._entries.pop(key)
+        self._size -= len(encoded_response) + sum(
+            map(len, compressed_responses.values())
+        )
+
+    def _discard_in_flight_build(self, key: Tuple[str, bytes], in_flight_build):
+        # unless it was replaced by a build of another population in the meantime
+        if self._in_flight_builds.get(key) is in_flight_build:
+            del self._in_flight_builds[key]
+
+    def get_or_build(
+        self, node: GraphNode, build: Callable[[], Tuple[bytes, str, bool]]
+    ) -> Tuple[bytes, str]:
+        """Return the cached response for the given node along with its ETag,
+        building them with ``build`` and caching them first on a cache miss.
+        Besides the response and its ETag, ``build`` returns whether the response
+        can be cached, which isn't the case when the preview of a dataset timed out,
+        so that the next request tries to load it again.
+
+        Concurrent cache misses for the same node and preview arguments are coalesced:
+        only the first one builds the response, while the others wait for it and
+        share its result, or its exception if the build fails."""
+        key = self._get_key(node)
+        with self._lock:
+            self._drop_if_repopulated()
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self.ttl is None or time.monotonic() - entry[2] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[0], entry[1]
+                self._pop(key)
+                self._expirations += 1
+            population_state = self._populated_from
+            in_flight_build = self._in_flight_builds.get(key)
+            # only share a build of the same population of the data access manager
+            is_coalesced = (
+                in_flight_build is not None and in_flight_build[1] == population_state
+            )
+            if is_coalesced:
+                self._coalesced += 1
+            else:
+                self._misses += 1
+                in_flight_build = (Future(), population_state)
+                self._in_flight_builds[key] = in_flight_build
+
+        future = in_flight_build[0]  # type: ignore[index]
+        if is_coalesced:
+            return future.result()
+
+        try:
+            encoded_response, etag, is_cacheable = build()
+        except BaseException as exc:
+            future.set_exception(exc)
+            with self._lock:
+                self._discard_in_flight_build(key, in_flight_build)
+            raise
+        future.set_result((encoded_response, etag))
+
+        with self._lock:
+            self._discard_in_flight_build(key, in_flight_build)
+            self._drop_if_repopulated()
+            # don't cache a response built before the data access manager changed,
+            # nor one too big to fit
+            if (
+                is_cacheable
+                and self._populated_from == population_state
+                and len(encoded_response) <= self.max_size
+            ):
+                if key in self._entries:
+                    self._pop(key)
+                while self._size + len(encoded_response) > self.max_size:
+                    self._pop(next(iter(self._entries)))
+                    self._evictions += 1
+                self._entries[key] = (encoded_response, etag, time.monotonic(), {})
+                self._size += len(encoded_response)
+        return encoded_response, etag
+
+    def get_or_compress(
+        self, node: GraphNode, encoded_response: bytes, content_encoding: str
+    ) -> bytes:
+        """Return the given response for the node, as returned by ``get_or_build``,
+        compressed with the given content encoding. Each compressed variant of a cached
+        response is built on its first request and kept next to its entry, evicting
+        the least recently used other entries to make room for it."""
+        key = self._get_key(node)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is encoded_response:
+                compressed_response = entry[3].get(content_encoding)
+                if compressed_response is not None:
+                    return compressed_response
+
+        compressed_response = compress(encoded_response, content_encoding)
+        with self._lock:
+            entry = self._entries.get(key)
+            # only keep the variant if its entry was not dropped or replaced meanwhile
+            if (
+                entry is not None
+                and entry[0] is encoded_response
+                and content_encoding not in entry[3]
+            ):
+                entry[3][content_encoding] = compressed_response
+                self._size += len(compressed_response)
+                self._entries.move_to_end(key)
+                while self._size > self.max_size and next(iter(self._entries)) != key:
+                    self._pop(next(iter(self._entries)))
+                    self._evictions += 1
+                if self._size > self.max_size:
+                    # the entry doesn't fit on its own along with its variants
+                    del entry[3][content_encoding]
+                    self._size -= len(compressed_response)
+        return compressed_response
+
+    def invalidate(self):
+        """Drop all cached responses. The responses being built meanwhile are
+        still returned to the requests waiting for them, but not shared any further."""
+        with self._lock:
+            self._entries.clear()
+            self._in_flight_builds.clear()
+            self._size = 0
+            self._populated_from = None
+
+    def get_stats(self) -> Dict[str, Union[int, float, None]]:
+        """Return the number of cache hits, misses, evictions, expirations and
+        coalesced requests so far, along with the current number and size of the entries."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "coalesced": self._coalesced,
+                "entries": len(self._entries),
+                "size": self._size,
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
+
+
+# Created with the default size and TTL, so that importing never fails on invalid
+# environment variables, which are applied when Kedro-Viz starts instead
+node_metadata_cache = NodeMetadataCache()
+
+
+def _build_encoded_node_metadata(node_id: str) -> Tuple[bytes, str, bool]:
+    """Build the encoded metadata of a node known to the data access manager,
+    along with its ETag and whether it can be cached, i.e. unless the preview
+    of the dataset timed out."""
+    response = get_node_metadata_response(node_id)
+    encoded_response = _encode_node_metadata_response(response)
+    is_cacheable = not (
+        isinstance(response, DataNodeMetadata) and response.is_preview_timed_out
+    )
+    return encoded_response, get_etag(encoded_response), is_cacheable
+
+
+def get_encoded_node_metadata(node_id: str) -> Optional[Tuple[bytes, str]]:
+    """Get the encoded metadata of a node along with its ETag from the node
+    metadata cache, building them on a cache miss, or None if the node doesn't exist."""
+    node = data_access_manager.nodes.get_node_by_id(node_id)
+    if not node:
+        return None
+    return node_metadata_cache.get_or_build(
+        node, lambda: _build_encoded_node_metadata(node_id)
+    )
+
+
+def get_encoded_node_metadata_response(
+    node_id: str, content_encoding: Optional[str] = None
+) -> Response:
+    """Encoded API response for `/api/nodes/node_id` along with its ETag,
+    compressed with the given content encoding unless it is too small to benefit.
+    The compressed response is cached next to the uncompressed one."""
+    node = data_access_manager.nodes.get_node_by_id(node_id)
+    if not node:
+        return JSONResponse(status_code=404, content={"message": "Invalid node ID"})
+    encoded_response, etag = node_metadata_cache.get_or_build(
+        node, lambda: _build_encoded_node_metadata(node_id)
+    )
+
+    if content_encoding is None or len(encoded_response) < MIN_COMPRESSED_SIZE:
+        return get_content_encoded_response(encoded_response, etag)
+    return get_content_encoded_response(
+        node_metadata_cache.get_or_compress(node, encoded_response, content_encoding),
+        etag,
+        content_encoding,
+    )
+
+
+def get_encoded_nodes_metadata_batch_response(
+    node_ids: List[str], content_encoding: Optional[str] = None
+) -> Response:
+    """Encoded API response for `/api/nodes:batch`, holding the metadata of all given
+    nodes in a single response. Each node is only looked up once however many times
+    it is requested, and a node whose metadata can't be retrieved is reported in
+    the errors of the response rather than failing the whole batch. The response is
+    compressed with the given content encoding unless it is too small to benefit.
+
+    The metadata of the nodes is built concurrently in at most `KEDRO_VIZ_MAX_WORKERS`
+    threads, the same number as the dataset previews can load in, so a batch of slow
+    previews waits about as long as the slowest one rather than for all of them in
+    turn. Data nodes reading the same file are previewed with a single load."""
+    unique_node_ids = list(dict.fromkeys(node_ids))
+
+    def get_encoded_node_entry(node_id: str) -> Tuple[Optional[bytes], Optional[str]]:
+        try:
+            encoded_node_metadata = get_encoded_node_metadata(node_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Failed to get the metadata of node ID %s. Full exception: %s: %s",
+                node_id,
+                type(exc).__name__,
+                exc,
+            )
+            return None, f"{type(exc).__name__}: {exc}"
+        if encoded_node_metadata is None:
+            return None, "Invalid node ID"
+        return encoded_node_metadata[0], None
+
+    encoded_nodes = []
+    errors: Dict[str, str] = {}
+    if unique_node_ids:
+        with ThreadPoolExecutor(
+            max_workers=min(get_max_workers(), len(unique_node_ids)),
+            thread_name_prefix="kedro-viz-nodes-batch",
+        ) as executor:
+            entries = list(executor.map(get_encoded_node_entry, unique_node_ids))
+
+        for node_id, (encoded_node_metadata, error) in zip(unique_node_ids, entries):
+            if error is not None:
+                errors[node_id] = error
+            else:
+                encoded_nodes.append(
+                    b"%s:%s" % (orjson.dumps(node_id), encoded_node_metadata)
+                )
+
+    encoded_response = b'{"nodes":{%s},"errors":%s}' % (
+        b",".join(encoded_nodes),
+        orjson.dumps(errors),
+    )
+    headers = {"Vary": "Accept-Encoding"}
+    if content_encoding is not None and len(encoded_response) >= MIN_COMPRESSED_SIZE:
+        encoded_response = compress(encoded_response, content_encoding)
+        headers["Content-Encoding"] = content_encoding
+    return Response(
+        content=encoded_response, media_type="application/json", headers=headers
+    )
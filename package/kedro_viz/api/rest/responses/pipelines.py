@@ -1,16 +1,25 @@
 """`kedro_viz.api.rest.responses.pipelines` contains response classes
 and utility functions for the `/main` and `/pipelines/* REST endpoints"""
 
-import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from fastapi.responses import JSONResponse
-from pydantic import ConfigDict
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import ConfigDict, TypeAdapter
 
 from kedro_viz.api.rest.responses.base import BaseAPIResponse
-from kedro_viz.api.rest.responses.utils import get_encoded_response
-from kedro_viz.data_access import data_access_manager
+from kedro_viz.api.rest.responses.compression import (
+    compress,
+    get_content_encoded_response,
+)
+from kedro_viz.api.rest.responses.utils import (
+    get_encoded_response,
+    get_etag,
+    get_jsonable_response,
+)
+from kedro_viz.data_access import DataAccessManager, data_access_manager
 
 logger = logging.getLogger(__name__)
 
@@ -218,6 +227,21 @@ class GraphAPIResponse(BaseAPIResponse):
     selected_pipeline: str
 
 
+class LineageAPIResponse(BaseAPIResponse):
+    """
+    LineageAPIResponse is a data model for the response of the lineage API.
+
+    Attributes:
+        node_id (str): The identifier of the node the lineage is for.
+        ancestors (List[str]): The identifiers of all nodes upstream of the node.
+        descendants (List[str]): The identifiers of all nodes downstream of the node.
+    """
+
+    node_id: str
+    ancestors: List[str]
+    descendants: List[str]
+
+
 def get_pipeline_response(
     pipeline_id: Union[str, None] = None,
 ) -> Union[GraphAPIResponse, JSONResponse]:
@@ -228,8 +252,10 @@ def get_pipeline_response(
     if not data_access_manager.registered_pipelines.has_pipeline(pipeline_id):
         return JSONResponse(status_code=404, content={"message": "Invalid pipeline ID"})
 
+    data_access_manager.materialise_pipeline(pipeline_id)
+
     modular_pipelines_tree = (
-        data_access_manager.create_modular_pipelines_tree_for_registered_pipeline(
+        data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
             pipeline_id
         )
     )
@@ -247,8 +273,328 @@ def get_pipeline_response(
     )
 
 
+def get_subgraph_response(
+    pipeline_id: str, focus_node_id: str, depth: int, direction: str = "both"
+) -> Union[GraphAPIResponse, JSONResponse]:
+    """API response for `/api/pipelines/pipeline_id/subgraph`, i.e. the neighbourhood
+    of the focus node up to the given depth, with the same schema as the response
+    for `/api/pipelines/pipeline_id`."""
+    if not data_access_manager.registered_pipelines.has_pipeline(pipeline_id):
+        return JSONResponse(status_code=404, content={"message": "Invalid pipeline ID"})
+
+    data_access_manager.materialise_pipeline(pipeline_id)
+
+    if (
+        focus_node_id
+        not in data_access_manager.registered_pipelines.get_node_ids_by_pipeline_id(
+            pipeline_id
+        )
+    ):
+        return JSONResponse(status_code=404, content={"message": "Invalid node ID"})
+
+    nodes, edges, modular_pipelines_tree = (
+        data_access_manager.get_subgraph_for_registered_pipeline(
+            pipeline_id, focus_node_id, depth, direction
+        )
+    )
+
+    return GraphAPIResponse(
+        nodes=nodes,
+        edges=edges,
+        tags=data_access_manager.tags.as_list(),
+        layers=data_access_manager.get_sorted_layers_for_registered_pipeline(
+            pipeline_id
+        ),
+        pipelines=data_access_manager.registered_pipelines.as_list(),
+        modular_pipelines=modular_pipelines_tree,
+        selected_pipeline=pipeline_id,
+    )
+
+
+def get_lineage_response(
+    pipeline_id: str, node_id: str
+) -> Union[LineageAPIResponse, JSONResponse]:
+    """API response for `/api/pipelines/pipeline_id/lineage/node_id`."""
+    if not data_access_manager.registered_pipelines.has_pipeline(pipeline_id):
+        return JSONResponse(status_code=404, content={"message": "Invalid pipeline ID"})
+
+    data_access_manager.materialise_pipeline(pipeline_id)
+
+    pipeline_node_ids = (
+        data_access_manager.registered_pipelines.get_node_ids_by_pipeline_id(
+            pipeline_id
+        )
+    )
+    modular_pipelines_tree = (
+        data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
+            pipeline_id
+        )
+    )
+    # modular pipelines are collapsed views of their nodes without a lineage of their own
+    if node_id not in pipeline_node_ids or node_id in modular_pipelines_tree:
+        return JSONResponse(status_code=404, content={"message": "Invalid node ID"})
+
+    ancestors, descendants = data_access_manager.get_lineage_for_registered_pipeline(
+        pipeline_id, node_id
+    )
+    return LineageAPIResponse(
+        node_id=node_id, ancestors=ancestors, descendants=descendants
+    )
+
+
+class PipelineResponseCache:
+    """Cache the encoded `/api/pipelines/{id}` responses for all registered pipelines.
+
+    Building a ``GraphAPIResponse`` and serialising it is expensive for large projects,
+    while its content only changes when the data access manager is repopulated.
+    The cache therefore keeps the final encoded bytes per registered pipeline, along
+    with their ETag and their compressed variants, and drops all of them as soon as the data access manager is
+    replaced or repopulated, which is tracked through its ``population_version``.
+    """
+
+    def __init__(self) -> None:
+        # the encoded response and its ETag per registered pipeline
+        self._responses: Dict[str, Tuple[bytes, str]] = {}
+        # the compressed variants of the cached responses by their ETag and encoding
+        self._compressed_responses: Dict[Tuple[str, str], bytes] = {}
+        self._populated_from: Optional[Tuple[DataAccessManager, int]] = None
+        # Serialise the builds so that the same response is never built twice.
+        self._build_lock = threading.Lock()
+
+    @staticmethod
+    def _get_population_state() -> Tuple[DataAccessManager, int]:
+        return data_access_manager, data_access_manager.population_version
+
+    def _is_valid(self, population_state: Tuple[DataAccessManager, int]) -> bool:
+        return (
+            self._populated_from is not None
+            and self._populated_from[0] is population_state[0]
+            and self._populated_from[1] == population_state[1]
+        )
+
+    def _get_entry(self, pipeline_id: str) -> Optional[Tuple[bytes, str]]:
+        if not self._is_valid(self._get_population_state()):
+            return None
+        return self._responses.get(pipeline_id)
+
+    def get(self, pipeline_id: str) -> Optional[bytes]:
+        """Return the cached response for the given pipeline, if still valid."""
+        entry = self._get_entry(pipeline_id)
+        return entry[0] if entry is not None else None
+
+    def get_or_build(self, pipeline_id: str) -> bytes:
+        """Return the cached response for the given pipeline,
+        building and caching it first on a cache miss."""
+        return self.get_or_build_with_etag(pipeline_id)[0]
+
+    def get_or_build_with_etag(self, pipeline_id: str) -> Tuple[bytes, str]:
+        """Return the cached response for the given pipeline along with its ETag,
+        building and caching both first on a cache miss. The ETag is computed
+        only once per encoded response."""
+        entry = self._get_entry(pipeline_id)
+        if entry is not None:
+            return entry
+
+        with self._build_lock:
+            # another thread might have built the response while we were waiting
+            entry = self._get_entry(pipeline_id)
+            if entry is None:
+                # build the views of a lazily added pipeline before its response
+                data_access_manager.materialise_pipeline(pipeline_id)
+                population_state = self._get_population_state()
+                encoded_response = get_encoded_response(
+                    get_pipeline_response(pipeline_id)
+                )
+                entry = (encoded_response, get_etag(encoded_response))
+                if not self._is_valid(population_state):
+                    self._responses = {}
+                    self._compressed_responses = {}
+                    self._populated_from = population_state
+                self._responses[pipeline_id] = entry
+        return entry
+
+    def get_or_build_compressed(
+        self, pipeline_id: str, content_encoding: str
+    ) -> Tuple[bytes, str]:
+        """Return the cached response for the given pipeline compressed with the
+        given content encoding, along with the ETag of the uncompressed response.
+        Each compressed variant is built on its first request and kept until
+        the cached responses are dropped."""
+        encoded_response, etag = self.get_or_build_with_etag(pipeline_id)
+        variant_key = (etag, content_encoding)
+        compressed_response = self._compressed_responses.get(variant_key)
+        if compressed_response is not None:
+            return compressed_response, etag
+
+        # Compress outside the lock so that compressing a large response doesn't
+        # block building or compressing the responses of other pipelines.
+        compressed_response = compress(encoded_response, content_encoding)
+        with self._build_lock:
+            # another thread might have cached the same variant while we were compressing
+            cached_response = self._compressed_responses.get(variant_key)
+            if cached_response is not None:
+                return cached_response, etag
+            # only keep the variant if its response was not dropped meanwhile
+            if self._responses.get(pipeline_id) == (encoded_response, etag):
+                self._compressed_responses[variant_key] = compressed_response
+        return compressed_response, etag
+
+    def invalidate(self):
+        """Drop all cached responses."""
+        with self._build_lock:
+            self._responses = {}
+            self._compressed_responses = {}
+            self._populated_from = None
+
+    def warm_up(self, pipeline_ids: List[str]):
+        """Build and cache the responses for the given pipelines one after another."""
+        for pipeline_id in pipeline_ids:
+            try:
+                self.get_or_build(pipeline_id)
+            except Exception as exc:  # noqa: BLE001 # pragma: no cover
+                logger.warning(
+                    "Failed to precompute the response for pipeline ID %s. Error: %s",
+                    pipeline_id,
+                    str(exc),
+                )
+
+
+pipeline_response_cache = PipelineResponseCache()
+
+
+def get_encoded_pipeline_response(
+    pipeline_id: Union[str, None] = None,
+    content_encoding: Optional[str] = None,
+) -> Response:
+    """Cached API response for `/api/main` and `/api/pipelines/pipeline_id`,
+    compressed with the given content encoding if any."""
+    if pipeline_id is None:
+        pipeline_id = data_access_manager.get_default_selected_pipeline().id
+
+    if not data_access_manager.registered_pipelines.has_pipeline(pipeline_id):
+        return JSONResponse(status_code=404, content={"message": "Invalid pipeline ID"})
+
+    if content_encoding is None:
+        encoded_response, etag = pipeline_response_cache.get_or_build_with_etag(
+            pipeline_id
+        )
+    else:
+        encoded_response, etag = pipeline_response_cache.get_or_build_compressed(
+            pipeline_id, content_encoding
+        )
+    return get_content_encoded_response(encoded_response, etag, content_encoding)
+
+
+# The maximum number of nodes, edges or modular pipelines
+# on each line of a streamed pipeline response
+STREAM_CHUNK_SIZE = 1000
+
+# Validate and serialise every field of a streamed pipeline response
+# the same way as it would be as part of a `GraphAPIResponse`
+_graph_field_adapters: Dict[str, TypeAdapter] = {
+    field_name: TypeAdapter(field.annotation)  # type: ignore[arg-type]
+    for field_name, field in GraphAPIResponse.model_fields.items()
+}
+
+
+def _encode_graph_fields(**fields: Any) -> bytes:
+    """Encodes the given `GraphAPIResponse` fields as a line of newline-delimited JSON."""
+    encoded_fields = []
+    for field_name, value in fields.items():
+        adapter = _graph_field_adapters[field_name]
+        encoded_fields.append(
+            b'"%s":%s'
+            % (field_name.encode(), adapter.dump_json(adapter.validate_python(value)))
+        )
+    return b"{%s}\n" % b",".join(encoded_fields)
+
+
+def _iter_chunks(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def iter_pipeline_response_chunks(pipeline_id: str) -> Iterator[bytes]:
+    """Yield the API response for `/api/pipelines/pipeline_id` as newline-delimited
+    JSON, built chunk by chunk from the data repositories. Each line is an object
+    with some of the `GraphAPIResponse` fields, i.e. first a line with the selected
+    pipeline, registered pipelines, tags and layers, then lines of nodes, edges and
+    modular pipelines of at most `STREAM_CHUNK_SIZE` items each. Concatenating the
+    lists and merging the modular pipelines of all lines gives the full response.
+
+    The nodes, edges and modular pipelines are iterated straight from the data
+    repositories, so no list of all of them is built before the first chunk."""
+    yield _encode_graph_fields(
+        selected_pipeline=pipeline_id,
+        pipelines=data_access_manager.registered_pipelines.as_list(),
+        tags=data_access_manager.tags.as_list(),
+        layers=data_access_manager.get_sorted_layers_for_registered_pipeline(
+            pipeline_id
+        ),
+    )
+
+    for nodes in _iter_chunks(
+        data_access_manager.iter_nodes_for_registered_pipeline(pipeline_id),
+        STREAM_CHUNK_SIZE,
+    ):
+        yield _encode_graph_fields(nodes=nodes)
+
+    for edges in _iter_chunks(
+        data_access_manager.iter_edges_for_registered_pipeline(pipeline_id),
+        STREAM_CHUNK_SIZE,
+    ):
+        yield _encode_graph_fields(edges=edges)
+
+    for modular_pipelines in _iter_chunks(
+        data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
+            pipeline_id
+        ).items(),
+        STREAM_CHUNK_SIZE,
+    ):
+        yield _encode_graph_fields(modular_pipelines=dict(modular_pipelines))
+
+
+def get_pipeline_stream_response(pipeline_id: str) -> Response:
+    """Streamed API response for `/api/pipelines/pipeline_id/stream`, which holds at
+    most a chunk of the encoded pipeline response in memory at any time and which
+    clients can start processing before the transfer ends."""
+    if not data_access_manager.registered_pipelines.has_pipeline(pipeline_id):
+        return JSONResponse(status_code=404, content={"message": "Invalid pipeline ID"})
+
+    data_access_manager.materialise_pipeline(pipeline_id)
+    return StreamingResponse(
+        iter_pipeline_response_chunks(pipeline_id),
+        media_type="application/x-ndjson",
+    )
+
+
+def warm_up_pipeline_response_cache() -> threading.Thread:
+    """Precompute the encoded responses for all registered pipelines in a background
+    thread, starting with the default selected pipeline shown on first page load.
+    If the registered pipelines were added lazily, only the default selected
+    pipeline is precomputed, leaving the others until they are requested."""
+    pipeline_ids = data_access_manager.registered_pipelines.get_pipeline_ids()
+    if pipeline_ids:
+        default_pipeline_id = data_access_manager.get_default_selected_pipeline().id
+        pipeline_ids.remove(default_pipeline_id)
+        pipeline_ids.insert(0, default_pipeline_id)
+        if data_access_manager.pending_pipelines:
+            pipeline_ids = [default_pipeline_id]
+
+    warm_up_thread = threading.Thread(
+        target=pipeline_response_cache.warm_up,
+        args=(pipeline_ids,),
+        name="kedro-viz-pipeline-response-cache",
+        daemon=True,
+    )
+    warm_up_thread.start()
+    return warm_up_thread
+
+
 def get_kedro_project_json_data(pipeline_name: Optional[str] = None):
-    """Decodes the response for the specified pipeline_name and returns the Kedro project JSON data.
+    """Returns the Kedro project JSON data for the specified pipeline_name,
+    dumped straight from the pipeline response without encoding it to JSON.
     This will be used in VSCode extension to get current Kedro project data."""
     pipeline_response = (
         get_pipeline_response()
@@ -256,16 +602,4 @@ def get_kedro_project_json_data(pipeline_name: Optional[str] = None):
         else get_pipeline_response(pipeline_name)
     )
 
-    encoded_response = get_encoded_response(pipeline_response)
-
-    try:
-        response_str = encoded_response.decode("utf-8")
-        json_data = json.loads(response_str)
-    except UnicodeDecodeError as exc:  # pragma: no cover
-        json_data = None
-        logger.error("Failed to decode response string. Error: %s", str(exc))
-    except json.JSONDecodeError as exc:  # pragma: no cover
-        json_data = None
-        logger.error("Failed to parse JSON data. Error: %s", str(exc))
-
-    return json_data
+    return get_jsonable_response(pipeline_response)
@@ -16,7 +16,7 @@ from kedro_viz.api.rest.responses.utils import (
 )
 from kedro_viz.constants import PIPELINE_EVENT_FULL_PATH
 from kedro_viz.launchers.utils import _find_kedro_project
-from kedro_viz.utils import _hash_input_output
+from kedro_viz.utils import id_registry
 
 logger = logging.getLogger(__name__)
 
@@ -349,7 +349,7 @@ def _process_dataset_error_event(
 
     # Update dataset status if dataset name is provided
     if dataset_name:
-        dataset_id = _hash_input_output(dataset_name)
+        dataset_id = id_registry.get_dataset_id(dataset_name)
         dataset_error_info = DatasetErrorInfo(
             message=error_message,
             error_node=node_name,
@@ -2,40 +2,89 @@
 and utility functions for writing and saving REST endpoint responses to file system"""
 
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from kedro_viz.api.rest.responses.compression import (
+    COMPRESSED_FILE_EXTENSIONS,
+    compress,
+    get_supported_content_encodings,
+)
 from kedro_viz.api.rest.responses.nodes import get_node_metadata_response
 from kedro_viz.api.rest.responses.pipelines import get_pipeline_response
 from kedro_viz.api.rest.responses.run_events import get_run_status_response
-from kedro_viz.api.rest.responses.utils import get_encoded_response
+from kedro_viz.api.rest.responses.utils import (
+    EnhancedORJSONResponse,
+    get_content_hash,
+    get_encoded_response,
+)
 from kedro_viz.data_access import data_access_manager
 from kedro_viz.models.flowchart.node_metadata import DataNodeMetadata
+from kedro_viz.utils import get_max_workers
 
 logger = logging.getLogger(__name__)
 
 
-def save_api_responses_to_fs(path: str, remote_fs: Any, is_all_previews_enabled: bool):
-    """Saves all Kedro Viz API responses to a directory."""
+def save_api_responses_to_fs(
+    path: str,
+    remote_fs: Any,
+    is_all_previews_enabled: bool,
+    content_encodings: Sequence[str] = (),
+    human_readable: bool = False,
+):
+    """Saves all Kedro Viz API responses to a directory, along with siblings
+    of every response compressed with each of the given content encodings,
+    e.g. `main.gz` and `main.br` for `gzip` and `br`, for static hosts to serve.
+    The responses are saved as compact JSON unless human readable output,
+    i.e. indented JSON, is requested."""
     try:
         logger.debug(
             """Saving/Uploading api files to %s""",
             path,
         )
 
-        main_path = f"{path}/api/main"
-        nodes_path = f"{path}/api/nodes"
-        pipelines_path = f"{path}/api/pipelines"
-        run_status_path = f"{path}/api/run-status"
+        unsupported_content_encodings = set(content_encodings).difference(
+            get_supported_content_encodings()
+        )
+        if unsupported_content_encodings:
+            raise ValueError(
+                "Cannot compress the API responses with unsupported content "
+                f"encodings: {', '.join(sorted(unsupported_content_encodings))}."
+            )
+
+        api_path = f"{path}/api"
+        main_path = f"{api_path}/main"
+        nodes_path = f"{api_path}/nodes"
+        pipelines_path = f"{api_path}/pipelines"
+        run_status_path = f"{api_path}/run-status"
+
+        # the saved responses must cover all registered pipelines and their nodes
+        data_access_manager.materialise_all_pipelines()
 
         if "file" in remote_fs.protocol:
             remote_fs.makedirs(path, exist_ok=True)
             remote_fs.makedirs(nodes_path, exist_ok=True)
             remote_fs.makedirs(pipelines_path, exist_ok=True)
 
-        save_api_main_response_to_fs(main_path, remote_fs)
-        save_api_node_response_to_fs(nodes_path, remote_fs, is_all_previews_enabled)
-        save_api_pipeline_response_to_fs(pipelines_path, remote_fs)
-        save_api_run_status_response_to_fs(run_status_path, remote_fs)
+        content_hashes = {
+            **save_api_main_response_to_fs(
+                main_path, remote_fs, content_encodings, human_readable
+            ),
+            **save_api_node_response_to_fs(
+                nodes_path,
+                remote_fs,
+                is_all_previews_enabled,
+                content_encodings,
+                human_readable,
+            ),
+            **save_api_pipeline_response_to_fs(
+                pipelines_path, remote_fs, content_encodings, human_readable
+            ),
+            **save_api_run_status_response_to_fs(
+                run_status_path, remote_fs, content_encodings, human_readable
+            ),
+        }
+        save_api_manifest_to_fs(api_path, content_hashes, remote_fs)
 
     except Exception as exc:  # pragma: no cover
         logger.exception(
@@ -44,23 +93,47 @@ def save_api_responses_to_fs(path: str, remote_fs: Any, is_all_previews_enabled:
         raise exc
 
 
-def save_api_main_response_to_fs(main_path: str, remote_fs: Any):
-    """Saves API /main response to a directory."""
+def save_api_main_response_to_fs(
+    main_path: str,
+    remote_fs: Any,
+    content_encodings: Sequence[str] = (),
+    human_readable: bool = False,
+) -> Dict[str, str]:
+    """Saves API /main response to a directory.
+    Returns the content hash of the saved file by its path."""
     try:
-        write_api_response_to_fs(main_path, get_pipeline_response(), remote_fs)
+        return {
+            main_path: write_api_response_to_fs(
+                main_path,
+                get_pipeline_response(),
+                remote_fs,
+                content_encodings,
+                human_readable,
+            )
+        }
     except Exception as exc:  # pragma: no cover
         logger.exception("Failed to save default response. Error: %s", str(exc))
         raise exc
 
 
-def save_api_pipeline_response_to_fs(pipelines_path: str, remote_fs: Any):
-    """Saves API /pipelines/{pipeline} response to a directory."""
+def save_api_pipeline_response_to_fs(
+    pipelines_path: str,
+    remote_fs: Any,
+    content_encodings: Sequence[str] = (),
+    human_readable: bool = False,
+) -> Dict[str, str]:
+    """Saves API /pipelines/{pipeline} response to a directory.
+    Returns the content hashes of the saved files by their paths."""
+    content_hashes = {}
     for pipeline_id in data_access_manager.registered_pipelines.get_pipeline_ids():
+        pipeline_path = f"{pipelines_path}/{pipeline_id}"
         try:
-            write_api_response_to_fs(
-                f"{pipelines_path}/{pipeline_id}",
+            content_hashes[pipeline_path] = write_api_response_to_fs(
+                pipeline_path,
                 get_pipeline_response(pipeline_id),
                 remote_fs,
+                content_encodings,
+                human_readable,
             )
         except Exception as exc:  # pragma: no cover
             logger.exception(
@@ -69,41 +142,141 @@ def save_api_pipeline_response_to_fs(pipelines_path: str, remote_fs: Any):
                 str(exc),
             )
             raise exc
+    return content_hashes
 
 
 def save_api_node_response_to_fs(
-    nodes_path: str, remote_fs: Any, is_all_previews_enabled: bool
-):
-    """Saves API /nodes/{node} response to a directory."""
-    # Set if preview is enabled/disabled for all data nodes
-    DataNodeMetadata.set_is_all_previews_enabled(is_all_previews_enabled)
+    nodes_path: str,
+    remote_fs: Any,
+    is_all_previews_enabled: bool,
+    content_encodings: Sequence[str] = (),
+    human_readable: bool = False,
+    max_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """Saves API /nodes/{node} response to a directory. The metadata of up to
+    ``max_workers`` nodes, `KEDRO_VIZ_MAX_WORKERS` by default, is built, previewed
+    and written at once, as saving it mostly waits on loading the datasets.
+    Returns the content hashes of the saved files by their paths, in the order
+    of the nodes regardless of the order they are saved in.
 
-    for node_id in data_access_manager.nodes.get_node_ids():
+    Raises:
+        RuntimeError: If any node couldn't be saved, once all other nodes are saved
+            and the error of every failed node is logged.
+    """
+    node_ids = list(data_access_manager.nodes.get_node_ids())
+
+    def save_node_response(node_id: str) -> Tuple[str, bool]:
+        response = get_node_metadata_response(node_id, is_all_previews_enabled)
+        content_hash = write_api_response_to_fs(
+            f"{nodes_path}/{node_id}",
+            response,
+            remote_fs,
+            content_encodings,
+            human_readable,
+        )
+        return content_hash, (
+            isinstance(response, DataNodeMetadata) and response.is_preview_timed_out
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or get_max_workers(),
+        thread_name_prefix="kedro-viz-save-nodes",
+    ) as executor:
+        futures = [executor.submit(save_node_response, node_id) for node_id in node_ids]
+
+    content_hashes = {}
+    failed_node_ids: List[str] = []
+    timed_out_node_ids: List[str] = []
+    for node_id, future in zip(node_ids, futures):
         try:
-            write_api_response_to_fs(
-                f"{nodes_path}/{node_id}",
-                get_node_metadata_response(node_id),
-                remote_fs,
-            )
-        except Exception as exc:  # pragma: no cover
-            logger.exception(
-                "Failed to save node data for node ID %s. Error: %s", node_id, str(exc)
+            content_hash, is_preview_timed_out = future.result()
+            content_hashes[f"{nodes_path}/{node_id}"] = content_hash
+            if is_preview_timed_out:
+                timed_out_node_ids.append(node_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(
+                "Failed to save node data for node ID %s. Error: %s",
+                node_id,
+                str(exc),
+                exc_info=exc,
             )
-            raise exc
+            failed_node_ids.append(node_id)
 
+    if timed_out_node_ids:
+        # unlike a running Kedro-Viz, saved responses never retry the preview
+        logger.warning(
+            "The previews of node IDs %s timed out and are saved without a preview. "
+            "Increase `KEDRO_VIZ_PREVIEW_TIMEOUT` to include them.",
+            ", ".join(timed_out_node_ids),
+        )
+    if failed_node_ids:
+        raise RuntimeError(
+            f"Failed to save node data for node IDs: {', '.join(failed_node_ids)}."
+        )
+    return content_hashes
 
-def save_api_run_status_response_to_fs(run_status_path: str, remote_fs: Any):
-    """Saves API /run-status response to a directory."""
+
+def save_api_run_status_response_to_fs(
+    run_status_path: str,
+    remote_fs: Any,
+    content_encodings: Sequence[str] = (),
+    human_readable: bool = False,
+) -> Dict[str, str]:
+    """Saves API /run-status response to a directory.
+    Returns the content hash of the saved file by its path."""
     try:
-        write_api_response_to_fs(run_status_path, get_run_status_response(), remote_fs)
+        return {
+            run_status_path: write_api_response_to_fs(
+                run_status_path,
+                get_run_status_response(),
+                remote_fs,
+                content_encodings,
+                human_readable,
+            )
+        }
     except Exception as exc:  # pragma: no cover
         logger.exception("Failed to save run status response. Error: %s", str(exc))
         raise exc
 
 
-def write_api_response_to_fs(file_path: str, response: Any, remote_fs: Any):
-    """Get encoded responses and writes it to a file"""
-    encoded_response = get_encoded_response(response)
+def save_api_manifest_to_fs(
+    api_path: str, content_hashes: Dict[str, str], remote_fs: Any
+):
+    """Saves the manifest of the saved API responses to `{api_path}/manifest.json`,
+    mapping the path of every response relative to `api_path` to its content hash,
+    so that static hosts can serve the responses with the quoted hashes as ETags."""
+    manifest = {
+        file_path.removeprefix(f"{api_path}/"): content_hash
+        for file_path, content_hash in sorted(content_hashes.items())
+    }
+    try:
+        with remote_fs.open(f"{api_path}/manifest.json", "wb") as file:
+            file.write(EnhancedORJSONResponse.encode_to_human_readable(manifest))
+    except Exception as exc:  # pragma: no cover
+        logger.exception("Failed to save the API manifest. Error: %s", str(exc))
+        raise exc
+
+
+def write_api_response_to_fs(
+    file_path: str,
+    response: Any,
+    remote_fs: Any,
+    content_encodings: Sequence[str] = (),
+    human_readable: bool = False,
+) -> str:
+    """Get encoded responses and writes it to a file, as well as to a sibling file
+    compressed with each of the given content encodings.
+    Returns the content hash of the written uncompressed file."""
+    encoded_response = get_encoded_response(response, human_readable)
 
     with remote_fs.open(file_path, "wb") as file:
         file.write(encoded_response)
+
+    for content_encoding in content_encodings:
+        compressed_file_path = (
+            f"{file_path}{COMPRESSED_FILE_EXTENSIONS[content_encoding]}"
+        )
+        with remote_fs.open(compressed_file_path, "wb") as file:
+            file.write(compress(encoded_response, content_encoding))
+
+    return get_content_hash(encoded_response)
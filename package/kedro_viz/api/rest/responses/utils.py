@@ -1,6 +1,7 @@
 """`kedro_viz.api.rest.responses.utils` contains utility
 response classes and functions for the REST endpoints"""
 
+import hashlib
 import logging
 from datetime import datetime
 from enum import Enum
@@ -9,6 +10,7 @@ from typing import Any, Dict, Optional, TypeVar
 import orjson
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
@@ -45,14 +47,58 @@ class EnhancedORJSONResponse(ORJSONResponse):
         )
 
 
-def get_encoded_response(response: Any) -> bytes:
-    """Encodes and enhances the default response using human-readable format."""
+def get_jsonable_response(response: Any) -> Any:
+    """Converts the response to JSON compatible Python objects, e.g. for in-process
+    consumers. Pydantic response models are dumped straight to dictionaries
+    in a single pass, rather than being encoded to JSON and decoded again."""
+    if isinstance(response, BaseModel):
+        return response.model_dump(mode="json", by_alias=True)
+    return jsonable_encoder(response)
+
+
+def get_encoded_response(response: Any, human_readable: bool = False) -> bytes:
+    """Encodes the response to compact JSON, i.e. the same bytes the REST API
+    would send over the wire for it, or to indented JSON if human readable output
+    is requested. Pydantic response models are serialised straight to bytes in a
+    single pass, rather than being converted to Python objects first."""
+    if isinstance(response, BaseModel):
+        return response.__pydantic_serializer__.to_json(
+            response, indent=2 if human_readable else None, by_alias=True
+        )
+
     jsonable_response = jsonable_encoder(response)
-    encoded_response = EnhancedORJSONResponse.encode_to_human_readable(
-        jsonable_response
+    if human_readable:
+        return EnhancedORJSONResponse.encode_to_human_readable(jsonable_response)
+    return orjson.dumps(
+        jsonable_response,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
     )
 
-    return encoded_response
+
+def get_content_hash(encoded_response: bytes) -> str:
+    """Hashes the encoded response, e.g. to list it in the build output manifest."""
+    return hashlib.sha256(encoded_response).hexdigest()
+
+
+def get_etag(encoded_response: bytes) -> str:
+    """Returns the strong ETag of the encoded response, i.e. its quoted content hash."""
+    return f'"{get_content_hash(encoded_response)}"'
+
+
+def is_etag_matched(if_none_match: Optional[str], etag: str) -> bool:
+    """Checks whether the value of an `If-None-Match` request header matches the
+    given ETag, using the weak comparison the HTTP spec requires for that header."""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    etag = etag.removeprefix("W/")
+    return any(
+        entity_tag.strip().removeprefix("W/") == etag
+        for entity_tag in if_none_match.split(",")
+    )
 
 
 def convert_status_to_enum(status: Optional[str], default: EnumType) -> EnumType:
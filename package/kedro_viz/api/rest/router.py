@@ -1,28 +1,45 @@
 """`kedro_viz.api.rest.router` defines REST routes and handling logic."""
 
 import logging
+from typing import Literal, Optional
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
-from kedro_viz.api.rest.requests import DeployerConfiguration
+from kedro_viz.api.rest.executor import run_blocking
+from kedro_viz.api.rest.requests import (
+    DeployerConfiguration,
+    NodesMetadataBatchRequest,
+)
 from kedro_viz.api.rest.responses.base import APINotFoundResponse
+from kedro_viz.api.rest.responses.cache import (
+    CachesStatsAPIResponse,
+    get_cache_stats_response,
+)
+from kedro_viz.api.rest.responses.compression import select_content_encoding
 from kedro_viz.api.rest.responses.metadata import (
     MetadataAPIResponse,
     get_metadata_response,
 )
 from kedro_viz.api.rest.responses.nodes import (
     NodeMetadataAPIResponse,
-    get_node_metadata_response,
+    NodesMetadataBatchAPIResponse,
+    get_encoded_node_metadata_response,
+    get_encoded_nodes_metadata_batch_response,
 )
 from kedro_viz.api.rest.responses.pipelines import (
     GraphAPIResponse,
-    get_pipeline_response,
+    LineageAPIResponse,
+    get_encoded_pipeline_response,
+    get_lineage_response,
+    get_pipeline_stream_response,
+    get_subgraph_response,
 )
 from kedro_viz.api.rest.responses.run_events import (
     RunStatusAPIResponse,
     get_run_status_response,
 )
+from kedro_viz.api.rest.responses.utils import is_etag_matched
 from kedro_viz.api.rest.responses.version import (
     VersionAPIResponse,
     get_version_response,
@@ -36,9 +53,35 @@ router = APIRouter(
 )
 
 
+def _get_conditional_response(request: Request, response: Response) -> Response:
+    """Reply with 304 Not Modified instead of the given response when the client
+    already holds its current version, as identified by the response's ETag."""
+    etag = response.headers.get("ETag")
+    if etag and is_etag_matched(request.headers.get("If-None-Match"), etag):
+        headers = {"ETag": etag}
+        if "Vary" in response.headers:
+            headers["Vary"] = response.headers["Vary"]
+        return Response(status_code=304, headers=headers)
+    return response
+
+
+def _get_content_encoding(request: Request) -> Optional[str]:
+    """Select the content encoding to compress the response with, if any,
+    as negotiated through the request's `Accept-Encoding` header."""
+    return select_content_encoding(request.headers.get("Accept-Encoding"))
+
+
 @router.get("/main", response_model=GraphAPIResponse)
-async def main():
-    return get_pipeline_response()
+async def main(request: Request):
+    return _get_conditional_response(
+        request,
+        await run_blocking(
+            "pipelines",
+            get_encoded_pipeline_response,
+            None,
+            _get_content_encoding(request),
+        ),
+    )
 
 
 @router.get(
@@ -46,16 +89,96 @@ async def main():
     response_model=NodeMetadataAPIResponse,
     response_model_exclude_none=True,
 )
-async def get_single_node_metadata(node_id: str):
-    return get_node_metadata_response(node_id)
+async def get_single_node_metadata(request: Request, node_id: str):
+    return _get_conditional_response(
+        request,
+        await run_blocking(
+            "nodes",
+            get_encoded_node_metadata_response,
+            node_id,
+            _get_content_encoding(request),
+        ),
+    )
+
+
+@router.post("/nodes:batch", response_model=NodesMetadataBatchAPIResponse)
+async def get_nodes_metadata_batch(
+    request: Request, batch_request: NodesMetadataBatchRequest
+):
+    """Get the metadata of several nodes at once. The nodes which can't be found
+    or whose metadata can't be retrieved are reported in `errors`. Batches of more
+    than `MAX_NODES_METADATA_BATCH_SIZE` nodes are rejected."""
+    return await run_blocking(
+        "nodes",
+        get_encoded_nodes_metadata_batch_response,
+        batch_request.node_ids,
+        _get_content_encoding(request),
+    )
 
 
 @router.get(
     "/pipelines/{registered_pipeline_id}",
     response_model=GraphAPIResponse,
 )
-async def get_single_pipeline_data(registered_pipeline_id: str):
-    return get_pipeline_response(registered_pipeline_id)
+async def get_single_pipeline_data(request: Request, registered_pipeline_id: str):
+    return _get_conditional_response(
+        request,
+        await run_blocking(
+            "pipelines",
+            get_encoded_pipeline_response,
+            registered_pipeline_id,
+            _get_content_encoding(request),
+        ),
+    )
+
+
+@router.get(
+    "/pipelines/{registered_pipeline_id}/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def stream_single_pipeline_data(registered_pipeline_id: str):
+    """Stream the pipeline data as newline-delimited JSON objects, each holding some
+    of the fields of the `/api/pipelines/{registered_pipeline_id}` response."""
+    return await run_blocking(
+        "pipelines", get_pipeline_stream_response, registered_pipeline_id
+    )
+
+
+@router.get(
+    "/pipelines/{registered_pipeline_id}/subgraph",
+    response_model=GraphAPIResponse,
+)
+async def get_single_pipeline_subgraph(
+    registered_pipeline_id: str,
+    focus: str,
+    depth: int = Query(1, ge=0),
+    direction: Literal["up", "down", "both"] = "both",
+):
+    """Get the neighbourhood of the `focus` node in the pipeline, i.e. the nodes at most
+    `depth` edges upstream, downstream or both ways from it, with the same schema as
+    the `/api/pipelines/{registered_pipeline_id}` response."""
+    return await run_blocking(
+        "pipelines",
+        get_subgraph_response,
+        registered_pipeline_id,
+        focus,
+        depth,
+        direction,
+    )
+
+
+@router.get(
+    "/pipelines/{registered_pipeline_id}/lineage/{node_id}",
+    response_model=LineageAPIResponse,
+)
+async def get_single_node_lineage(registered_pipeline_id: str, node_id: str):
+    """Get the IDs of all nodes upstream and downstream of a task, data or parameters
+    node in the pipeline, from the pipeline's lineage index, which is built the first
+    time a lineage of the pipeline is requested."""
+    return await run_blocking(
+        "pipelines", get_lineage_response, registered_pipeline_id, node_id
+    )
 
 
 @router.get(
@@ -63,7 +186,15 @@ async def get_single_pipeline_data(registered_pipeline_id: str):
     response_model=VersionAPIResponse,
 )
 async def get_version():
-    return get_version_response()
+    return await run_blocking("metadata", get_version_response)
+
+
+@router.get("/cache/stats", response_model=CachesStatsAPIResponse)
+async def get_cache_stats():
+    """Get the number of hits, misses, evictions, expirations and coalesced requests of
+    the node metadata and preview caches so far, along with their current number and
+    size of entries."""
+    return await run_blocking("metadata", get_cache_stats_response)
 
 
 @router.get("/run-status", response_model=RunStatusAPIResponse)
@@ -104,7 +235,7 @@ async def get_last_run_status():
     ```
     """
     try:
-        return get_run_status_response()
+        return await run_blocking("run_status", get_run_status_response)
     except Exception as exc:
         logger.exception("An exception occurred while getting run status: %s", exc)
         return JSONResponse(
@@ -126,7 +257,9 @@ async def deploy_kedro_viz(input_values: DeployerConfiguration):
         deployer = DeployerFactory.create_deployer(
             input_values.platform, input_values.endpoint, input_values.bucket_name
         )
-        deployer.deploy(input_values.is_all_previews_enabled)
+        await run_blocking(
+            "deploy", deployer.deploy, input_values.is_all_previews_enabled
+        )
         response = {
             "message": "Website deployed on "
             f"{input_values.platform and input_values.platform.upper()}",
@@ -160,7 +293,7 @@ async def deploy_kedro_viz(input_values: DeployerConfiguration):
 )
 async def get_metadata():
     try:
-        return get_metadata_response()
+        return await run_blocking("metadata", get_metadata_response)
     except Exception as exc:
         logger.exception("An exception occurred while getting app metadata: %s", exc)
         return JSONResponse(
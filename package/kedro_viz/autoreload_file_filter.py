@@ -10,6 +10,7 @@ from typing import Optional, Set
 from pathspec import GitIgnoreSpec
 from watchfiles import Change, DefaultFilter
 
+from kedro_viz.constants import VIZ_PREVIEW_CACHE_DIR
 from kedro_viz.utils import load_gitignore_patterns
 
 logger = logging.getLogger(__name__)
@@ -39,7 +40,7 @@ class AutoreloadFileFilter(DefaultFilter):
         # Load .gitignore patterns
         self.gitignore_spec = load_gitignore_patterns(self.cwd)
 
-    def __call__(self, change: Change, path: str) -> bool:
+    def __call__(self, change: Change, path: str) -> bool:  # noqa: PLR0911
         """
         Determine whether a file change should be processed.
 
@@ -63,6 +64,11 @@ class AutoreloadFileFilter(DefaultFilter):
             logger.debug("Path not relative to CWD: %s", path)
             return False
 
+        # Exclude the preview cache, which is written by Kedro-Viz itself
+        if relative_path.is_relative_to(VIZ_PREVIEW_CACHE_DIR):
+            logger.debug("Filtered out as a cached preview: %s", relative_path)
+            return False
+
         try:
             if self.gitignore_spec and self.gitignore_spec.match_file(
                 str(relative_path)
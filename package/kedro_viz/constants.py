@@ -29,3 +29,4 @@ VIZ_METADATA_ARGS = {"path": ".viz"}
 VIZ_METADATA_DIR = Path(VIZ_METADATA_ARGS["path"])
 PIPELINE_EVENTS_FILENAME = "kedro_pipeline_events.json"
 PIPELINE_EVENT_FULL_PATH = VIZ_METADATA_DIR / PIPELINE_EVENTS_FILENAME
+VIZ_PREVIEW_CACHE_DIR = VIZ_METADATA_DIR / "previews"
@@ -1,8 +1,10 @@
 """`kedro_viz.data_access.managers` defines data access managers."""
 
 import logging
+import threading
 from collections import defaultdict
-from typing import Dict, List, Optional, Set, Union
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 from kedro.io import DataCatalog
 from kedro.io.core import DatasetError
@@ -24,8 +26,12 @@ from kedro_viz.models.flowchart.nodes import (
     TranscodedDataNode,
 )
 from kedro_viz.models.metadata import NodeExtras
-from kedro_viz.services import layers_services
-from kedro_viz.utils import _strip_transcoding, is_dataset_param
+from kedro_viz.services import (
+    layers_services,
+    lineage_services,
+    reachability_services,
+)
+from kedro_viz.utils import _strip_transcoding, id_registry, is_dataset_param
 
 from .repositories import (
     CatalogRepository,
@@ -39,10 +45,125 @@ from .repositories import (
 logger = logging.getLogger(__name__)
 
 
+class _LazyPipelinesIndex:
+    """Index of the fields of the nodes shared between registered pipelines added
+    lazily, computed over all of them in the order they were registered. A node
+    built when one of them is first requested then ends up the same as if all of
+    them had been added up front, whichever registered pipeline is requested first.
+
+    Args:
+        pipelines: The registered pipelines added lazily, in the order they were registered.
+    """
+
+    def __init__(self, pipelines: Mapping[str, KedroPipeline]):
+        # The Kedro node each task node is created from
+        self.task_nodes: Dict[str, KedroNode] = {}
+        # The dataset name each dataset node is created from, and whether it's a free input
+        self.datasets: Dict[str, Tuple[str, bool]] = {}
+        self.nodes_pipelines: Dict[str, Set[str]] = defaultdict(set)
+        self.nodes_tags: Dict[str, Set[str]] = defaultdict(set)
+        # The names the transcoded datasets are consumed and produced under
+        self.transcoded_inputs: Dict[str, Set[str]] = {}
+        self.transcoded_outputs: Dict[str, str] = {}
+        # The IDs of all nodes, including modular pipeline nodes,
+        # in the order they would be added to the nodes repository
+        self.node_ids: Dict[str, None] = {}
+
+        for registered_pipeline_id, pipeline in pipelines.items():
+            free_inputs = pipeline.inputs()
+            namespaces: Set[str] = set()
+            for node in pipeline.nodes:
+                task_node_id = id_registry.get_node_id(node)
+                self.task_nodes.setdefault(task_node_id, node)
+                self._add_node(task_node_id, registered_pipeline_id)
+                task_node_tags = self.nodes_tags[task_node_id]
+                task_node_tags.update(node.tags)
+
+                for input_ in node.inputs:
+                    dataset_id = self._add_dataset(
+                        input_, registered_pipeline_id, input_ in free_inputs
+                    )
+                    self.nodes_tags[dataset_id].update(task_node_tags)
+                    if dataset_id in self.transcoded_inputs:
+                        self.transcoded_inputs[dataset_id].add(input_)
+
+                for output in node.outputs:
+                    dataset_id = self._add_dataset(output, registered_pipeline_id)
+                    self.nodes_tags[dataset_id].update(task_node_tags)
+                    if dataset_id in self.transcoded_inputs:
+                        self.transcoded_outputs[dataset_id] = output
+
+                if node.namespace:
+                    namespace_parts = node.namespace.split(".")
+                    namespaces.update(
+                        ".".join(namespace_parts[: i + 1])
+                        for i in range(len(namespace_parts))
+                    )
+
+            # modular pipeline nodes are added once all other nodes are
+            self.node_ids.update(dict.fromkeys(sorted(namespaces)))
+
+    def _add_node(self, node_id: str, registered_pipeline_id: str):
+        self.node_ids.setdefault(node_id)
+        self.nodes_pipelines[node_id].add(registered_pipeline_id)
+
+    def _add_dataset(
+        self,
+        dataset_name: str,
+        registered_pipeline_id: str,
+        is_free_input: bool = False,
+    ) -> str:
+        dataset_id = id_registry.get_dataset_id(dataset_name)
+        self._add_node(dataset_id, registered_pipeline_id)
+        if dataset_id not in self.datasets:
+            self.datasets[dataset_id] = (dataset_name, is_free_input)
+            if dataset_name != _strip_transcoding(dataset_name):
+                # created as a transcoded dataset node
+                self.transcoded_inputs[dataset_id] = set()
+        return dataset_id
+
+    def get_tags(self) -> Set[str]:
+        """Return the tags of all task nodes."""
+        return {tag for node_id in self.task_nodes for tag in self.nodes_tags[node_id]}
+
+    def update_node(self, node: GraphNode, catalog: CatalogRepository):
+        """Set the fields of a node which depend on the registered pipelines
+        other than the one it was built for.
+
+        Args:
+            node: The node built for a registered pipeline added lazily.
+            catalog: The catalog repository to look up transcoded datasets in.
+        """
+        if node.id not in self.nodes_pipelines:
+            # modular pipeline nodes are owned by each registered pipeline
+            return
+        node.pipelines.update(self.nodes_pipelines[node.id])
+        node.tags.update(self.nodes_tags[node.id])
+        if isinstance(node, TranscodedDataNode):
+            node.transcoded_versions.update(
+                catalog.get_dataset(input_)
+                for input_ in self.transcoded_inputs.get(node.id, ())
+            )
+            output = self.transcoded_outputs.get(node.id)
+            if output is not None:
+                node.original_name = output
+                node.original_version = catalog.get_dataset(output)
+
+
 class DataAccessManager:
     """Centralised interface for the rest of the application to interact with data repositories."""
 
     def __init__(self):
+        # Incremented every time the repositories are (re)populated so that
+        # consumers caching derived data, e.g. encoded API responses, can tell
+        # when their cached values have become stale.
+        self.population_version = 0
+        # Makes sure a lazily added registered pipeline is only populated
+        # once even if it's requested by several threads at the same time.
+        self._materialise_lock = threading.Lock()
+        # Makes sure the lineage index of a registered pipeline is only built once
+        # even if its lineage is requested by several threads at the same time.
+        self._lineage_index_lock = threading.Lock()
         self._initialize_fields()
 
     def _initialize_fields(self):
@@ -65,9 +186,31 @@ class DataAccessManager:
         )
         self.node_extras: Dict[str, NodeExtras] = {}
 
+        # The fully expanded modular pipelines tree of each registered pipeline,
+        # computed once when the registered pipeline is added and read-only afterwards.
+        self.modular_pipelines_trees: Dict[str, Mapping[str, ModularPipelineNode]] = {}
+
+        # The topologically sorted layers of each registered pipeline,
+        # computed the first time they are requested.
+        self.sorted_layers: Dict[str, List[str]] = {}
+
+        # The index of the ancestors and descendants of every node
+        # of each registered pipeline, built the first time a lineage is requested.
+        self.lineage_indexes: Dict[str, lineage_services.LineageIndex] = {}
+
+        # The registered pipelines added lazily, in the order they were registered,
+        # which are only populated when they are first requested.
+        self.pending_pipelines: Dict[str, KedroPipeline] = {}
+        # The fields of the nodes shared between the registered pipelines added lazily,
+        # built when the first one is requested.
+        self._lazy_pipelines_index: Optional[_LazyPipelinesIndex] = None
+
     def reset_fields(self):
         """Reset all instance variables."""
         self._initialize_fields()
+        # Allocate IDs afresh, as if the project was loaded for the first time
+        id_registry.clear()
+        self.population_version += 1
 
     def resolve_dataset_factory_patterns(
         self,
@@ -102,16 +245,79 @@ class DataAccessManager:
         self.resolve_dataset_factory_patterns(catalog, pipelines)
         self.catalog.set_catalog(catalog)
 
-    def add_pipelines(self, pipelines: Dict[str, KedroPipeline]):
+    def add_pipelines(
+        self,
+        pipelines: Dict[str, KedroPipeline],
+        lazy: bool = False,
+    ):
         """Extract objects from all registered pipelines from a Kedro project
         into the relevant repositories.
 
         Args:
             pipelines: All registered pipelines in a Kedro project.
+            lazy: Whether to defer populating each registered pipeline, i.e. building
+                its nodes, edges and modular pipelines, until it's first requested,
+                see ``materialise_pipeline``. Only the registered pipeline IDs
+                are added up front.
         """
-        for registered_pipeline_id, pipeline in pipelines.items():
-            # Add the registered pipeline and its components to their repositories
+        if lazy:
+            for registered_pipeline_id, pipeline in pipelines.items():
+                self.registered_pipelines.add_pipeline(registered_pipeline_id)
+                self.pending_pipelines[registered_pipeline_id] = pipeline
+        else:
+            # Allocate the IDs of all nodes and datasets up front, so that any colliding
+            # IDs are widened in the same way whichever order pipelines are added in.
+            id_registry.allocate_pipeline_ids(pipelines.values())
+
+            for registered_pipeline_id, pipeline in pipelines.items():
+                # Add the registered pipeline and its components to their repositories
+                self.add_pipeline(registered_pipeline_id, pipeline)
+
+        self.population_version += 1
+
+    def materialise_pipeline(self, registered_pipeline_id: str):
+        """Populate a lazily added registered pipeline if that hasn't happened yet.
+        Concurrent calls for the same registered pipeline wait for the first one
+        instead of populating it again.
+
+        The fields of its nodes shared with other registered pipelines, i.e. their
+        registered pipelines, tags and whether they are free inputs, are taken from
+        an index of all lazily added registered pipelines built on the first call.
+        Nodes are therefore the same whichever registered pipeline is requested first,
+        and the responses of the registered pipelines populated before don't change.
+
+        Args:
+            registered_pipeline_id: The ID of the registered pipeline to materialise.
+        """
+        if registered_pipeline_id not in self.pending_pipelines:
+            return
+
+        with self._materialise_lock:
+            pipeline = self.pending_pipelines.get(registered_pipeline_id)
+            if pipeline is None:
+                # materialised by another thread while waiting for the lock
+                return
+
+            if self._lazy_pipelines_index is None:
+                # Allocate the IDs of all nodes and datasets as when adding all
+                # registered pipelines up front, before any of them is looked up.
+                id_registry.allocate_pipeline_ids(self.pending_pipelines.values())
+                self._lazy_pipelines_index = _LazyPipelinesIndex(self.pending_pipelines)
+                self.nodes.reserve_node_positions(self._lazy_pipelines_index.node_ids)
+                self.tags.add_tags(self._lazy_pipelines_index.get_tags())
+
             self.add_pipeline(registered_pipeline_id, pipeline)
+            for node in self.nodes.get_nodes_by_pipeline_id(registered_pipeline_id):
+                self._lazy_pipelines_index.update_node(node, self.catalog)
+            # only drop the pipeline once it's populated, so that it's never
+            # reported as materialised while it's still being populated
+            del self.pending_pipelines[registered_pipeline_id]
+
+    def materialise_all_pipelines(self):
+        """Materialise all lazily added registered pipelines in the order they were
+        registered, e.g. before saving the responses of all registered pipelines."""
+        for registered_pipeline_id in list(self.pending_pipelines):
+            self.materialise_pipeline(registered_pipeline_id)
 
     def add_node_extras(self, node_extras_mapping: Dict[str, NodeExtras]):
         """Add all node extras at once.
@@ -132,7 +338,11 @@ class DataAccessManager:
         """
         return self.node_extras.get(node_name)
 
-    def add_pipeline(self, registered_pipeline_id: str, pipeline: KedroPipeline):
+    def add_pipeline(
+        self,
+        registered_pipeline_id: str,
+        pipeline: KedroPipeline,
+    ):
         """Iterate through all the nodes and datasets in a "registered" pipeline
         and add them to relevant repositories. Take care of extracting other relevant information
         such as modular pipelines, layers, etc. and add them to relevant repositories.
@@ -148,6 +358,7 @@ class DataAccessManager:
         self.registered_pipelines.add_pipeline(registered_pipeline_id)
         modular_pipelines_repo_obj = self.modular_pipelines[registered_pipeline_id]
         modular_pipelines_repo_obj.populate_tree(pipeline)
+        self.sorted_layers.pop(registered_pipeline_id, None)
 
         free_inputs = pipeline.inputs()
 
@@ -158,8 +369,8 @@ class DataAccessManager:
                 registered_pipeline_id, node, modular_pipelines_repo_obj
             )
 
-            # Add the task node created above to RegisteredPipelinesRepository
-            self.registered_pipelines.add_node(registered_pipeline_id, task_node.id)
+            # Add the task node created above to the registered pipeline
+            self.add_node_to_registered_pipeline(registered_pipeline_id, task_node.id)
 
             # Add node's inputs as DataNode to the graph
             for input_ in node.inputs:
@@ -174,7 +385,7 @@ class DataAccessManager:
                     modular_pipelines_repo_obj,
                     is_free_input,
                 )
-                self.registered_pipelines.add_node(
+                self.add_node_to_registered_pipeline(
                     registered_pipeline_id, input_node.id
                 )
                 if isinstance(input_node, TranscodedDataNode):
@@ -189,13 +400,48 @@ class DataAccessManager:
                     task_node,
                     modular_pipelines_repo_obj,
                 )
-                self.registered_pipelines.add_node(
+                self.add_node_to_registered_pipeline(
                     registered_pipeline_id, output_node.id
                 )
                 if isinstance(output_node, TranscodedDataNode):
                     output_node.original_name = output
                     output_node.original_version = self.catalog.get_dataset(output)
 
+        # Modular pipeline nodes are added to the shared repositories here as well,
+        # so that they don't depend on which registered pipeline is requested first.
+        self.add_modular_pipeline_nodes_for_registered_pipeline(registered_pipeline_id)
+        # All nodes of the registered pipeline are added, so they are sorted once
+        self.nodes.sort_pipeline_nodes(registered_pipeline_id)
+        self.add_registered_pipeline_views(registered_pipeline_id)
+
+    def add_registered_pipeline_views(self, registered_pipeline_id: str):
+        """Build the views derived from the nodes of a registered pipeline, i.e. its
+        expanded modular pipelines tree. They only write data owned by the registered
+        pipeline, so they can be built after the other registered pipelines are added.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID to build the views for.
+        """
+        # All nodes of the registered pipeline are known at this point,
+        # so its modular pipelines can be turned into graph edges once
+        # instead of on every read.
+        self.expand_modular_pipelines_tree_for_registered_pipeline(
+            registered_pipeline_id
+        )
+
+    def add_node_to_registered_pipeline(
+        self, registered_pipeline_id: str, node_id: str
+    ):
+        """Record that a graph node belongs to a registered pipeline, keeping both
+        the registered pipeline's node IDs and its list of nodes up to date.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID the node belongs to.
+            node_id: The ID of a node already added to the nodes repository.
+        """
+        self.registered_pipelines.add_node(registered_pipeline_id, node_id)
+        self.nodes.add_node_to_pipeline(registered_pipeline_id, node_id)
+
     def add_node(
         self,
         registered_pipeline_id: str,
@@ -217,14 +463,21 @@ class DataAccessManager:
             node_id,
             modular_pipeline_ids,
         ) = modular_pipelines_repo_obj.get_node_and_modular_pipeline_mapping(node)
-        task_node: TaskNode = self.nodes.add_node(
-            GraphNode.create_task_node(
+        if self._lazy_pipelines_index is not None:
+            # create the task node from the Kedro node it would be created from
+            # if all registered pipelines were added up front
+            node = self._lazy_pipelines_index.task_nodes.get(node_id, node)
+
+        task_node = self.nodes.get_or_create_node(
+            node_id,
+            lambda: GraphNode.create_task_node(
                 node=node,
                 node_id=node_id,
                 modular_pipelines=modular_pipeline_ids,
                 node_extras=self.get_extras_for_node(node._name or node._func_name),
-            )
+            ),
         )
+        task_node.tags.update(node.tags)
         task_node.add_pipeline(registered_pipeline_id)
         self.tags.add_tags(task_node.tags)
         return task_node
@@ -317,12 +570,6 @@ class DataAccessManager:
         Returns:
             The GraphNode instance representing the dataset that was added to the NodesRepository.
         """
-        try:
-            dataset_obj = self.catalog.get_dataset(dataset_name)
-        except DatasetError:
-            dataset_obj = UnavailableDataset()
-
-        layer = self.catalog.get_layer_for_dataset(dataset_name)
         (
             dataset_id,
             modular_pipeline_ids,
@@ -348,10 +595,49 @@ class DataAccessManager:
                     ROOT_MODULAR_PIPELINE_ID
                 }
 
-        graph_node: Union[DataNode, TranscodedDataNode, ParametersNode]
+        if self._lazy_pipelines_index is not None:
+            # create the dataset node as it would be created
+            # if all registered pipelines were added up front
+            dataset_name, is_free_input = self._lazy_pipelines_index.datasets.get(
+                dataset_id, (dataset_name, is_free_input)
+            )
+
+        graph_node = self.nodes.get_or_create_node(
+            dataset_id,
+            lambda: self.create_dataset_node(
+                dataset_id, dataset_name, modular_pipeline_ids, is_free_input
+            ),
+        )
+        graph_node.add_pipeline(registered_pipeline_id)
+        return graph_node
+
+    def create_dataset_node(
+        self,
+        dataset_id: str,
+        dataset_name: str,
+        modular_pipeline_ids: Optional[Set[str]],
+        is_free_input: bool = False,
+    ) -> Union[DataNode, TranscodedDataNode, ParametersNode]:
+        """Construct the DataNode, TranscodedDataNode or ParametersNode
+        representing a Kedro dataset, looking up the dataset and its layer in the catalog.
+
+        Args:
+            dataset_id: The ID of the graph node.
+            dataset_name: The name of the dataset.
+            modular_pipeline_ids: The modular pipelines the dataset belongs to.
+            is_free_input: Whether the dataset is a free input to the registered pipeline.
+        Returns:
+            The GraphNode instance representing the dataset.
+        """
+        try:
+            dataset_obj = self.catalog.get_dataset(dataset_name)
+        except DatasetError:
+            dataset_obj = UnavailableDataset()
+
+        layer = self.catalog.get_layer_for_dataset(dataset_name)
 
         if is_dataset_param(dataset_name):
-            graph_node = GraphNode.create_parameters_node(
+            return GraphNode.create_parameters_node(
                 dataset_id=dataset_id,
                 dataset_name=dataset_name,
                 layer=layer,
@@ -360,20 +646,17 @@ class DataAccessManager:
                 modular_pipelines=None,
                 node_extras=self.get_extras_for_node(dataset_name),
             )
-        else:
-            graph_node = GraphNode.create_data_node(
-                dataset_id=dataset_id,
-                dataset_name=dataset_name,
-                layer=layer,
-                tags=set(),
-                dataset=dataset_obj,
-                modular_pipelines=modular_pipeline_ids,
-                is_free_input=is_free_input,
-                node_extras=self.get_extras_for_node(_strip_transcoding(dataset_name)),
-            )
-        graph_node = self.nodes.add_node(graph_node)
-        graph_node.add_pipeline(registered_pipeline_id)
-        return graph_node
+
+        return GraphNode.create_data_node(
+            dataset_id=dataset_id,
+            dataset_name=dataset_name,
+            layer=layer,
+            tags=set(),
+            dataset=dataset_obj,
+            modular_pipelines=modular_pipeline_ids,
+            is_free_input=is_free_input,
+            node_extras=self.get_extras_for_node(_strip_transcoding(dataset_name)),
+        )
 
     @staticmethod
     def add_parameters_to_task_node(
@@ -417,10 +700,32 @@ class DataAccessManager:
         Returns:
             List of GraphNode objects in the given registered pipeline.
         """
-        node_ids = self.registered_pipelines.get_node_ids_by_pipeline_id(
-            registered_pipeline_id
+        return list(self.iter_nodes_for_registered_pipeline(registered_pipeline_id))
+
+    def iter_nodes_for_registered_pipeline(
+        self, registered_pipeline_id: str = DEFAULT_REGISTERED_PIPELINE_ID
+    ) -> Iterator[GraphNode]:
+        """Iterate over all nodes for a given registered pipeline, in the same order
+        as ``get_nodes_for_registered_pipeline``, without copying them into a list.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID to get nodes for.
+        Returns:
+            An iterator over the GraphNode objects in the given registered pipeline.
+        """
+        modular_pipelines_tree = (
+            self.get_modular_pipelines_tree_for_registered_pipeline(
+                registered_pipeline_id
+            )
+        )
+        # modular pipeline nodes are owned by each registered pipeline,
+        # so they are taken from the registered pipeline's own tree
+        return (
+            modular_pipelines_tree.get(node.id, node)
+            if node.type == GraphNodeType.MODULAR_PIPELINE
+            else node
+            for node in self.nodes.iter_nodes_by_pipeline_id(registered_pipeline_id)
         )
-        return self.nodes.get_nodes_by_ids(node_ids)
 
     def get_edges_for_registered_pipeline(
         self, registered_pipeline_id: str = DEFAULT_REGISTERED_PIPELINE_ID
@@ -434,6 +739,160 @@ class DataAccessManager:
         """
         return self.edges[registered_pipeline_id].as_list()
 
+    def iter_edges_for_registered_pipeline(
+        self, registered_pipeline_id: str = DEFAULT_REGISTERED_PIPELINE_ID
+    ) -> Iterator[GraphEdge]:
+        """Iterate over all edges for a given registered pipeline, in the same order
+        as ``get_edges_for_registered_pipeline``, without copying them into a list.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID to get edges for.
+        Returns:
+            An iterator over the GraphEdge objects in the given registered pipeline.
+        """
+        return iter(self.edges[registered_pipeline_id])
+
+    def get_subgraph_for_registered_pipeline(
+        self,
+        registered_pipeline_id: str,
+        focus_node_id: str,
+        depth: int,
+        direction: str = "both",
+    ) -> Tuple[List[GraphNode], List[GraphEdge], Dict[str, ModularPipelineNode]]:
+        """Return the neighbourhood of a node in a registered pipeline, i.e. the nodes at
+        most ``depth`` edges away from the node in the fully expanded graph, together with
+        the modular pipelines containing them. The neighbourhood is found through the edge
+        indexes of the registered pipeline, so the cost depends on its size only.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID the node belongs to.
+            focus_node_id: The ID of the node at the centre of the neighbourhood.
+            depth: The maximum number of edges between the node and its neighbours.
+            direction: Whether to follow the edges upstream (``up``),
+                downstream (``down``) or ``both`` ways.
+        Returns:
+            The nodes and edges of the neighbourhood, in the same order as in the
+            registered pipeline, and the modular pipelines tree trimmed down to them.
+        """
+        modular_pipelines_tree = (
+            self.get_modular_pipelines_tree_for_registered_pipeline(
+                registered_pipeline_id
+            )
+        )
+        # modular pipelines are collapsed views of their nodes,
+        # so only the fully expanded graph is traversed
+        node_ids = self.edges[registered_pipeline_id].get_neighbourhood(
+            focus_node_id, depth, direction, skipped_node_ids=modular_pipelines_tree
+        )
+        subgraph_modular_pipelines_tree = self._trim_modular_pipelines_tree(
+            modular_pipelines_tree, node_ids
+        )
+        node_ids.update(subgraph_modular_pipelines_tree)
+
+        nodes = [
+            subgraph_modular_pipelines_tree.get(node.id, node)
+            if node.type == GraphNodeType.MODULAR_PIPELINE
+            else node
+            for node in self.nodes.get_nodes_by_ids(node_ids)
+        ]
+        edges = self.edges[registered_pipeline_id].get_edges_by_node_ids(
+            dict.fromkeys(node.id for node in nodes).keys()
+        )
+        return nodes, edges, subgraph_modular_pipelines_tree
+
+    @staticmethod
+    def _trim_modular_pipelines_tree(
+        modular_pipelines_tree: Mapping[str, ModularPipelineNode],
+        node_ids: Set[str],
+    ) -> Dict[str, ModularPipelineNode]:
+        """Trim a modular pipelines tree down to the modular pipelines which are in
+        the given nodes or contain any of them, keeping only their children which are
+        in the trimmed tree or in the given nodes."""
+        trimmed_tree: Dict[str, ModularPipelineNode] = {}
+
+        def trim(modular_pipeline_id: str) -> bool:
+            children = set()
+            for child in modular_pipelines_tree[modular_pipeline_id].children:
+                if child.type == GraphNodeType.MODULAR_PIPELINE:
+                    # trim every nested modular pipeline, even those in the given nodes
+                    is_child_kept = trim(child.id) or child.id in node_ids
+                else:
+                    is_child_kept = child.id in node_ids
+                if is_child_kept:
+                    children.add(child)
+
+            if not children and modular_pipeline_id not in node_ids:
+                return False
+            trimmed_tree[modular_pipeline_id] = modular_pipelines_tree[
+                modular_pipeline_id
+            ].model_copy(update={"children": children})
+            return True
+
+        if ROOT_MODULAR_PIPELINE_ID in modular_pipelines_tree:
+            trim(ROOT_MODULAR_PIPELINE_ID)
+        # keep the modular pipelines in the same order as in the original tree
+        return {
+            modular_pipeline_id: trimmed_tree[modular_pipeline_id]
+            for modular_pipeline_id in modular_pipelines_tree
+            if modular_pipeline_id in trimmed_tree
+        }
+
+    def _get_lineage_index(
+        self, registered_pipeline_id: str
+    ) -> lineage_services.LineageIndex:
+        """Return the lineage index of a registered pipeline, building it the first time
+        it's requested. Building it can take a while for large pipelines, so it's only
+        built for the registered pipelines whose lineage is requested."""
+        lineage_index = self.lineage_indexes.get(registered_pipeline_id)
+        if lineage_index is not None:
+            return lineage_index
+
+        # the index leaves out the nodes of the expanded modular pipelines tree
+        self.materialise_pipeline(registered_pipeline_id)
+        with self._lineage_index_lock:
+            lineage_index = self.lineage_indexes.get(registered_pipeline_id)
+            if lineage_index is None:
+                # Modular pipelines are collapsed views of their nodes and would connect
+                # all their inputs to all their outputs, so only the fully expanded graph
+                # is indexed.
+                modular_pipelines_tree = (
+                    self.get_modular_pipelines_tree_for_registered_pipeline(
+                        registered_pipeline_id
+                    )
+                )
+                lineage_index = lineage_services.LineageIndex(
+                    edge
+                    for edge in self.edges[registered_pipeline_id]
+                    if edge.source not in modular_pipelines_tree
+                    and edge.target not in modular_pipelines_tree
+                )
+                self.lineage_indexes[registered_pipeline_id] = lineage_index
+        return lineage_index
+
+    def get_lineage_for_registered_pipeline(
+        self, registered_pipeline_id: str, node_id: str
+    ) -> Tuple[List[str], List[str]]:
+        """Return the IDs of all nodes upstream and downstream of a node in a registered
+        pipeline, looked up in the lineage index of the registered pipeline, which is
+        built the first time a lineage of the registered pipeline is requested.
+        Modular pipelines are not part of the lineage of any node.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID the node belongs to.
+            node_id: The ID of the node to get the lineage for.
+        Returns:
+            The IDs of the ancestors and of the descendants of the node,
+            in the order they are stored in the lineage index.
+        """
+        if not self.registered_pipelines.has_pipeline(registered_pipeline_id):
+            return [], []
+
+        lineage_index = self._get_lineage_index(registered_pipeline_id)
+        return (
+            lineage_index.get_ancestor_ids(node_id),
+            lineage_index.get_descendant_ids(node_id),
+        )
+
     def get_node_dependencies_for_registered_pipeline(
         self, registered_pipeline_id: str = DEFAULT_REGISTERED_PIPELINE_ID
     ) -> Dict[str, Set]:
@@ -457,25 +916,79 @@ class DataAccessManager:
         Returns:
             List of layers in a topologically sorted order for the given registered pipeline.
         """
-        return layers_services.sort_layers(
-            self.nodes.as_dict(),
-            self.get_node_dependencies_for_registered_pipeline(registered_pipeline_id),
-        )
+        sorted_layers = self.sorted_layers.get(registered_pipeline_id)
+        if sorted_layers is None:
+            # Only the registered pipeline's own nodes are sorted. The layers don't change
+            # once the registered pipeline has been added, so they are sorted only once.
+            sorted_layers = layers_services.sort_layers(
+                {
+                    node.id: node
+                    for node in self.get_nodes_for_registered_pipeline(
+                        registered_pipeline_id
+                    )
+                },
+                self.get_node_dependencies_for_registered_pipeline(
+                    registered_pipeline_id
+                ),
+            )
+            self.sorted_layers[registered_pipeline_id] = sorted_layers
+        return list(sorted_layers)
 
-    def create_modular_pipelines_tree_for_registered_pipeline(  # noqa: PLR0912
+    def get_modular_pipelines_tree_for_registered_pipeline(
         self, registered_pipeline_id: str = DEFAULT_REGISTERED_PIPELINE_ID
-    ) -> Dict[str, ModularPipelineNode]:
-        """Create the modular pipelines tree for a specific registered pipeline.
-        During the process, expand the compact tree into a full tree
-        and add the modular pipeline nodes to the list of nodes
-        as well as modular pipeline edges to the list of edges in the registered pipeline.
-        N.B. The method is named `create_` to also imply that it has side effect on
-        other repositories in the data access manager.
+    ) -> Mapping[str, ModularPipelineNode]:
+        """Return the expanded modular pipelines tree for a specific registered pipeline.
+        The tree is computed once when the registered pipeline is added, so this is a pure
+        lookup which is safe to call concurrently and in any order.
 
         Args:
             registered_pipeline_id: The registered pipeline ID to get modular pipelines for.
         Returns:
-            The modular pipelines tree represented as a dictionary of nodes with child references.
+            The modular pipelines tree represented as a read-only mapping of nodes
+            with child references.
+        """
+        return self.modular_pipelines_trees.get(
+            registered_pipeline_id, MappingProxyType({})
+        )
+
+    def add_modular_pipeline_nodes_for_registered_pipeline(
+        self, registered_pipeline_id: str
+    ):
+        """Turn the modular pipelines of a registered pipeline into graph nodes
+        of the registered pipeline, except for the artificial root node.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID to add modular pipelines for.
+        """
+        for modular_pipeline_id, modular_pipeline_node in (
+            self.modular_pipelines[registered_pipeline_id].as_dict().items()
+        ):
+            if modular_pipeline_id == ROOT_MODULAR_PIPELINE_ID:
+                continue
+
+            # Each registered pipeline owns its modular pipeline nodes.
+            # The first one is also added to the global list of nodes
+            # so it can be looked up by ID, without ever being modified afterwards.
+            modular_pipeline_node.pipelines = {registered_pipeline_id}
+            if self.nodes.get_node_by_id(modular_pipeline_node.id) is None:
+                self.nodes.add_node(modular_pipeline_node)
+
+            self.add_node_to_registered_pipeline(
+                registered_pipeline_id, modular_pipeline_node.id
+            )
+
+    def expand_modular_pipelines_tree_for_registered_pipeline(
+        self, registered_pipeline_id: str
+    ):
+        """Expand the compact modular pipelines tree of a registered pipeline into a full tree
+        and store it as a read-only view of that registered pipeline.
+        During the process, add the modular pipeline edges and dependencies
+        to the registered pipeline's edges and node dependencies.
+        N.B. This must be called once all nodes of the registered pipeline, including
+        its modular pipeline nodes, have been added, which `add_pipeline` takes care of.
+
+        Args:
+            registered_pipeline_id: The registered pipeline ID to expand modular pipelines for.
         """
 
         edges = self.edges[registered_pipeline_id]
@@ -483,10 +996,15 @@ class DataAccessManager:
         modular_pipelines_tree = self.modular_pipelines[
             registered_pipeline_id
         ].as_dict()
+        pipeline_node_ids = set(
+            self.registered_pipelines.get_node_ids_by_pipeline_id(
+                registered_pipeline_id
+            )
+        )
 
         root_parameters = set()
 
-        # turn all modular pipelines in the tree into a graph node for visualisation,
+        # connect all modular pipelines in the tree to their inputs and outputs,
         # except for the artificial root node
         for (
             modular_pipeline_id,
@@ -495,20 +1013,6 @@ class DataAccessManager:
             if modular_pipeline_id == ROOT_MODULAR_PIPELINE_ID:
                 continue
 
-            # Add the modular pipeline node to the global list of nodes if necessary
-            # and update the list of pipelines it belongs to.
-            # N.B. Ideally we will have different modular pipeline nodes for
-            # different registered pipelines, but that requires a bit of a bigger refactor
-            # so we will just use the same node for now.
-            self.nodes.add_node(modular_pipeline_node)
-            self.nodes.get_node_by_id(modular_pipeline_node.id).pipelines = {
-                registered_pipeline_id
-            }
-
-            self.registered_pipelines.add_node(
-                registered_pipeline_id, modular_pipeline_node.id
-            )
-
             # only keep the modular pipeline's inputs belonging to the current registered pipeline
             for input_id in modular_pipeline_node.inputs:
                 input_node = self.nodes.get_node_by_id(input_id)
@@ -532,44 +1036,32 @@ class DataAccessManager:
         # After adding modular pipeline nodes into the graph,
         # There is a chance that the graph with these nodes contains cycles if
         # users construct their modular pipelines in a few particular ways.
-        # To detect the cycles, we simply search for all reachable
-        # descendants of a modular pipeline node and check if
-        # any of them is an input into this modular pipeline.
-        # If found, we will simply throw away the edge between
-        # the bad input and the modular pipeline.
+        # To break the cycles, we find every input of a modular pipeline
+        # which is also a reachable descendant of that modular pipeline
+        # and simply throw away the edge between the bad input and the modular pipeline.
         # N.B.: when fully expanded, the graph will still be a fully connected valid DAG,
         # so no need to check non modular pipeline nodes.
-        #
-        # We leverage networkx to help with graph traversal
-        import networkx as nx
-
-        digraph = nx.DiGraph()
-        for edge in edges:
-            digraph.add_edge(edge.source, edge.target)
-
-        for modular_pipeline_id, modular_pipeline in modular_pipelines_tree.items():
-            if not digraph.has_node(modular_pipeline_id):
-                continue
-            descendants = nx.descendants(digraph, modular_pipeline_id)
-            bad_inputs = modular_pipeline.inputs.intersection(descendants)
-            for bad_input in bad_inputs:
-                digraph.remove_edge(bad_input, modular_pipeline_id)
-                edges.remove_edge(
-                    GraphEdge(source=bad_input, target=modular_pipeline_id)
-                )
-                node_dependencies[bad_input].remove(modular_pipeline_id)
+        bad_input_edges = reachability_services.find_bad_modular_pipeline_inputs(
+            edges,
+            {
+                modular_pipeline_id: modular_pipeline.inputs
+                for modular_pipeline_id, modular_pipeline in modular_pipelines_tree.items()
+            },
+        )
+        for bad_input_edge in bad_input_edges:
+            edges.remove_edge(bad_input_edge)
+            node_dependencies[bad_input_edge.source].remove(bad_input_edge.target)
 
-        for node_id, node in self.nodes.as_dict().items():
-            if (
-                node.type == GraphNodeType.MODULAR_PIPELINE
-                or not node.belongs_to_pipeline(registered_pipeline_id)
-            ):
+        for node_id in pipeline_node_ids:
+            if node_id in modular_pipelines_tree:
+                # modular pipelines are already placed in the tree
                 continue
+            node = self.nodes.get_node_by_id(node_id)
             if node.modular_pipelines is None or node_id in root_parameters:
                 modular_pipelines_tree[ROOT_MODULAR_PIPELINE_ID].children.add(
-                    ModularPipelineChild(
-                        id=node_id, type=self.nodes.get_node_by_id(node_id).type
-                    )
+                    ModularPipelineChild(id=node_id, type=node.type)
                 )
 
-        return modular_pipelines_tree
+        self.modular_pipelines_trees[registered_pipeline_id] = MappingProxyType(
+            dict(modular_pipelines_tree)
+        )
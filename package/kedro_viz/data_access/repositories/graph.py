@@ -1,16 +1,58 @@
 """`kedro_viz.data_access.repositories.graph` defines interface to
 centralise access to graph objects."""
 
-from typing import Dict, Generator, List, Optional, Set
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    Callable,
+    Container,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
 
 from kedro_viz.models.flowchart.edge import GraphEdge
 from kedro_viz.models.flowchart.nodes import GraphNode
 
+GraphNodeT = TypeVar("GraphNodeT", bound=GraphNode)
+
+# The directions in which a neighbourhood can be traversed,
+# i.e. following the edges upstream, downstream or both ways
+NEIGHBOURHOOD_DIRECTIONS = ("up", "down", "both")
+
 
 class GraphNodesRepository:
     def __init__(self):
         self.nodes_dict: Dict[str, GraphNode] = {}
         self.nodes_list: List[GraphNode] = []
+        # position of every node, used to sort the nodes of each registered pipeline
+        # in the order they were added, unless reserved by `reserve_node_positions`
+        self.nodes_positions: Dict[str, int] = {}
+        # nodes of each registered pipeline by ID, in the order they were added
+        # until sorted by `sort_pipeline_nodes`
+        self.pipelines_nodes: Dict[str, Dict[str, GraphNode]] = defaultdict(dict)
+
+    def _append_node(self, node: GraphNode):
+        # nodes whose positions were reserved by `reserve_node_positions` keep them
+        self.nodes_positions.setdefault(node.id, len(self.nodes_positions))
+        self.nodes_dict[node.id] = node
+        self.nodes_list.append(node)
+
+    def reserve_node_positions(self, node_ids: Iterable[str]):
+        """Reserve the positions of nodes which aren't added yet, in the given order,
+        so that the nodes of each registered pipeline are sorted in that order
+        whichever order they end up being added to the repository in.
+
+        Args:
+            node_ids: The IDs of the nodes in the order they would be added.
+        """
+        for node_id in node_ids:
+            self.nodes_positions.setdefault(node_id, len(self.nodes_positions))
 
     def add_node(self, node: GraphNode) -> GraphNode:
         existing_node = self.nodes_dict.get(node.id)
@@ -18,10 +60,80 @@ class GraphNodesRepository:
             # Update tags or other attributes if the node already exists
             existing_node.tags.update(node.tags)
         else:
-            self.nodes_dict[node.id] = node
-            self.nodes_list.append(node)
+            self._append_node(node)
         return self.nodes_dict[node.id]
 
+    def get_or_create_node(
+        self, node_id: str, create_node: Callable[[], GraphNodeT]
+    ) -> GraphNodeT:
+        """Return the node with the given ID, calling ``create_node`` to construct
+        and add it only if it isn't in the repository yet. Nodes shared by several
+        registered pipelines are therefore only constructed once.
+
+        Args:
+            node_id: The ID of the node.
+            create_node: A callable constructing the node with the given ID.
+
+        Returns:
+            The node with the given ID.
+        """
+        existing_node = self.nodes_dict.get(node_id)
+        if existing_node is not None:
+            return existing_node  # type: ignore[return-value]
+
+        node = create_node()
+        self._append_node(node)
+        return node
+
+    def add_node_to_pipeline(self, pipeline_id: str, node_id: str):
+        """Add a node of the repository to the nodes of a registered pipeline
+        in constant time. Once all its nodes are added, `sort_pipeline_nodes` must be
+        called to put them in the order they were added to the repository.
+
+        Args:
+            pipeline_id: The ID of the registered pipeline.
+            node_id: The ID of a node already in the repository.
+        """
+        self.pipelines_nodes[pipeline_id].setdefault(node_id, self.nodes_dict[node_id])
+
+    def sort_pipeline_nodes(self, pipeline_id: str):
+        """Sort the nodes of a registered pipeline in the order they were added
+        to the repository, once all of them are added.
+
+        Args:
+            pipeline_id: The ID of the registered pipeline.
+        """
+        pipeline_nodes = self.pipelines_nodes[pipeline_id]
+        self.pipelines_nodes[pipeline_id] = {
+            node_id: pipeline_nodes[node_id]
+            for node_id in sorted(pipeline_nodes, key=self.nodes_positions.__getitem__)
+        }
+
+    def get_nodes_by_pipeline_id(self, pipeline_id: str) -> List[GraphNode]:
+        """Return the nodes of a registered pipeline, in the order they were
+        added to the repository.
+
+        Args:
+            pipeline_id: The ID of the registered pipeline.
+
+        Returns:
+            List of nodes of the registered pipeline.
+            Return an empty list if the registered pipeline has no nodes.
+        """
+        return list(self.pipelines_nodes.get(pipeline_id, {}).values())
+
+    def iter_nodes_by_pipeline_id(self, pipeline_id: str) -> Iterator[GraphNode]:
+        """Iterate over the nodes of a registered pipeline, in the order they were
+        added to the repository, without copying them into a list.
+
+        Args:
+            pipeline_id: The ID of the registered pipeline.
+
+        Returns:
+            An iterator over the nodes of the registered pipeline.
+        """
+        return iter(self.pipelines_nodes.get(pipeline_id, {}).values())
+
     def get_node_by_id(self, node_id: str) -> Optional[GraphNode]:
         return self.nodes_dict.get(node_id, None)
 
@@ -35,14 +147,25 @@ class GraphNodesRepository:
         return list(self.nodes_dict.keys())
 
     def get_nodes_by_ids(self, node_ids: Set[str]) -> List[GraphNode]:
-        return [n for n in self.nodes_list if n.id in node_ids]
+        return [
+            self.nodes_dict[node_id]
+            for node_id in sorted(
+                (node_id for node_id in node_ids if node_id in self.nodes_dict),
+                key=self.nodes_positions.__getitem__,
+            )
+        ]
 
 
 class GraphEdgesRepository:
-    """Repository for the set of edges in a registered pipeline."""
+    """Repository for the set of edges in a registered pipeline.
+    Edges are kept in insertion order and indexed by source and by target,
+    so the edges around a node can be looked up without scanning all edges.
+    """
 
     def __init__(self):
-        self.edges_list: Set[GraphEdge] = set()
+        self.edges_list: Dict[GraphEdge, None] = {}
+        self.edges_by_source: Dict[str, Dict[str, GraphEdge]] = defaultdict(dict)
+        self.edges_by_target: Dict[str, Dict[str, GraphEdge]] = defaultdict(dict)
 
     def __iter__(self) -> Generator:
         yield from self.edges_list
@@ -60,7 +183,9 @@ class GraphEdgesRepository:
             >>> edges.as_list()
             []
         """
-        self.edges_list.remove(edge)
+        del self.edges_list[edge]
+        del self.edges_by_source[edge.source][edge.target]
+        del self.edges_by_target[edge.target][edge.source]
 
     def add_edge(self, edge: GraphEdge):
         """Add an edge to this edge repository.
@@ -74,14 +199,103 @@ class GraphEdgesRepository:
             >>> edges.as_list()
             [GraphEdge(source='foo', target='bar')]
         """
-        self.edges_list.add(edge)
+        if edge in self.edges_list:
+            return
+        self.edges_list[edge] = None
+        self.edges_by_source[edge.source][edge.target] = edge
+        self.edges_by_target[edge.target][edge.source] = edge
 
     def as_list(self) -> List[GraphEdge]:
         """Return all edges in the repository as a list."""
         return list(self.edges_list)
 
-    def get_edges_by_node_ids(self, node_ids: Set[str]) -> List[GraphEdge]:
+    def get_successors(self, node_id: str) -> List[str]:
+        """Return the IDs of the targets of all edges coming out of a node.
+
+        Example:
+            >>> edges = GraphEdgesRepository()
+            >>> edges.add_edge(GraphEdge(source="foo", target="bar"))
+            >>> edges.get_successors("foo")
+            ['bar']
+        """
+        return list(self.edges_by_source.get(node_id, {}))
+
+    def get_predecessors(self, node_id: str) -> List[str]:
+        """Return the IDs of the sources of all edges going into a node.
+
+        Example:
+            >>> edges = GraphEdgesRepository()
+            >>> edges.add_edge(GraphEdge(source="foo", target="bar"))
+            >>> edges.get_predecessors("bar")
+            ['foo']
+        """
+        return list(self.edges_by_target.get(node_id, {}))
+
+    def get_neighbourhood(
+        self,
+        node_id: str,
+        depth: int,
+        direction: str = "both",
+        skipped_node_ids: Container[str] = (),
+    ) -> Set[str]:
+        """Return the IDs of the nodes at most ``depth`` edges away from a node,
+        including the node itself. The neighbourhood is traversed breadth first through
+        the source and target indexes, so only the edges around the visited nodes are read.
+
+        Args:
+            node_id: The ID of the node at the centre of the neighbourhood.
+            depth: The maximum number of edges between the node and its neighbours.
+            direction: Whether to follow the edges upstream (``up``),
+                downstream (``down``) or ``both`` ways.
+            skipped_node_ids: The IDs of the nodes to leave out of the neighbourhood,
+                which are therefore not traversed either.
+
+        Raises:
+            ValueError: If the direction is not supported.
+
+        Returns:
+            The set of IDs of the nodes in the neighbourhood.
+
+        Example:
+            >>> edges = GraphEdgesRepository()
+            >>> edges.add_edge(GraphEdge(source="foo", target="bar"))
+            >>> edges.add_edge(GraphEdge(source="bar", target="baz"))
+            >>> sorted(edges.get_neighbourhood("bar", 1, direction="down"))
+            ['bar', 'baz']
+        """
+        if direction not in NEIGHBOURHOOD_DIRECTIONS:
+            raise ValueError(
+                f"Direction '{direction}' is not supported. "
+                f"Supported directions are: {', '.join(NEIGHBOURHOOD_DIRECTIONS)}."
+            )
+
+        adjacency_indexes = []
+        if direction in ("down", "both"):
+            adjacency_indexes.append(self.edges_by_source)
+        if direction in ("up", "both"):
+            adjacency_indexes.append(self.edges_by_target)
+
+        neighbourhood = {node_id}
+        frontier = [node_id]
+        for _ in range(depth):
+            next_frontier = []
+            for frontier_node_id in frontier:
+                for adjacency_index in adjacency_indexes:
+                    for neighbour_id in adjacency_index.get(frontier_node_id, {}):
+                        if (
+                            neighbour_id not in neighbourhood
+                            and neighbour_id not in skipped_node_ids
+                        ):
+                            neighbourhood.add(neighbour_id)
+                            next_frontier.append(neighbour_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return neighbourhood
+
+    def get_edges_by_node_ids(self, node_ids: AbstractSet[str]) -> List[GraphEdge]:
         """Return all edges whose source and target are in a given set of node_ids.
+        Only the edges coming out of the given nodes are visited.
         Args:
             node_ids: The set of node_ids to get edges for.
         Returns:
@@ -95,4 +309,9 @@ class GraphEdgesRepository:
             >>> edges.get_edges_by_node_ids({"doesnt exist"})
             []
         """
-        return [e for e in self.edges_list if {e.source, e.target}.issubset(node_ids)]
+        return [
+            edge
+            for source in node_ids
+            for target, edge in self.edges_by_source.get(source, {}).items()
+            if target in node_ids
+        ]
@@ -1,7 +1,7 @@
 """`kedro_viz.data_access.repositories.modular_pipelines` defines
 repository to centralise access for modular pipelines data."""
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Dict, List, Set, Tuple, Union
 
 from kedro.pipeline import Pipeline as KedroPipeline
@@ -14,7 +14,7 @@ from kedro_viz.models.flowchart.nodes import (
     ModularPipelineChild,
     ModularPipelineNode,
 )
-from kedro_viz.utils import _hash, _hash_input_output, is_dataset_param
+from kedro_viz.utils import _strip_transcoding, id_registry, is_dataset_param
 
 
 class ModularPipelinesRepository:
@@ -44,31 +44,100 @@ class ModularPipelinesRepository:
         Args:
             pipeline (KedroPipeline): The Kedro pipeline to populate the tree from.
         """
-        namespaces = sorted(
-            {node.namespace for node in pipeline.nodes if node.namespace}
-        )
-
-        modular_pipeline_ids = {
-            modular_pipeline_id
-            for ns in namespaces
-            for modular_pipeline_id in self._explode_namespace(ns)
-        }
-
-        for modular_pipeline_id in sorted(modular_pipeline_ids):
+        (
+            modular_pipelines_nodes,
+            modular_pipelines_inputs,
+            modular_pipelines_outputs,
+            dataset_consumers,
+        ) = self._aggregate_nodes_by_modular_pipeline(pipeline)
+
+        for modular_pipeline_id in sorted(modular_pipelines_inputs):
             self.get_or_create_modular_pipeline(modular_pipeline_id)
 
-            sub_pipeline = pipeline.only_nodes_with_namespaces([modular_pipeline_id])
+            all_inputs = modular_pipelines_inputs[modular_pipeline_id]
+            all_outputs = modular_pipelines_outputs[modular_pipeline_id]
 
-            rest_of_the_pipeline = pipeline - sub_pipeline
+            # Datasets both consumed and produced within the modular pipeline.
+            # As in Kedro, transcoded datasets are compared by their original name.
+            intermediates = {_strip_transcoding(_input) for _input in all_inputs} & {
+                _strip_transcoding(output) for output in all_outputs
+            }
 
-            free_inputs = sub_pipeline.inputs()
-            free_outputs = sub_pipeline.outputs() | (
-                rest_of_the_pipeline.inputs() & sub_pipeline.all_outputs()
-            )
+            free_inputs = {
+                _input
+                for _input in all_inputs
+                if _strip_transcoding(_input) not in intermediates
+            }
+            # An output is free if it is not consumed within the modular pipeline,
+            # or if it is also consumed by a node outside of the modular pipeline
+            free_outputs = {
+                output
+                for output in all_outputs
+                if _strip_transcoding(output) not in intermediates
+                or dataset_consumers[output] > all_inputs[output]
+            }
 
             self._add_inputs(modular_pipeline_id, free_inputs)
             self._add_outputs(modular_pipeline_id, free_outputs)
-            self._add_children(modular_pipeline_id, sub_pipeline.nodes)
+            self._add_children(
+                modular_pipeline_id, modular_pipelines_nodes[modular_pipeline_id]
+            )
+
+    def _aggregate_nodes_by_modular_pipeline(
+        self, pipeline: KedroPipeline
+    ) -> Tuple[
+        Dict[str, List[KedroNode]],
+        Dict[str, Counter],
+        Dict[str, Set[str]],
+        Counter,
+    ]:
+        """
+        Walk the nodes of the Kedro pipeline once and roll their inputs and outputs
+        up the namespace hierarchy, so that the free inputs and outputs of every
+        modular pipeline can be derived without constructing its sub-pipeline.
+
+        Args:
+            pipeline (KedroPipeline): The Kedro pipeline to aggregate.
+
+        Returns:
+            A tuple of:
+                - {modular_pipeline_id -> kedro nodes with exactly that namespace}
+                - {modular_pipeline_id -> Counter(input -> number of nodes within
+                  the modular pipeline, including nested ones, consuming it)},
+                  with a key for every modular pipeline in the Kedro pipeline
+                - {modular_pipeline_id -> outputs of the nodes within
+                  the modular pipeline, including nested ones}
+                - Counter(input -> number of nodes in the pipeline consuming it)
+        """
+        modular_pipelines_nodes: Dict[str, List[KedroNode]] = defaultdict(list)
+        modular_pipelines_inputs: Dict[str, Counter] = defaultdict(Counter)
+        modular_pipelines_outputs: Dict[str, Set[str]] = defaultdict(set)
+        dataset_consumers: Counter = Counter()
+        exploded_namespaces: Dict[str, List[str]] = {}
+
+        for node in pipeline.nodes:
+            node_inputs = set(node.inputs)
+            dataset_consumers.update(node_inputs)
+
+            if not node.namespace:
+                continue
+
+            modular_pipelines_nodes[node.namespace].append(node)
+
+            if node.namespace not in exploded_namespaces:
+                exploded_namespaces[node.namespace] = self._explode_namespace(
+                    node.namespace
+                )
+            for modular_pipeline_id in exploded_namespaces[node.namespace]:
+                modular_pipelines_inputs[modular_pipeline_id].update(node_inputs)
+                modular_pipelines_outputs[modular_pipeline_id].update(node.outputs)
+
+        return (
+            modular_pipelines_nodes,
+            modular_pipelines_inputs,
+            modular_pipelines_outputs,
+            dataset_consumers,
+        )
 
     @staticmethod
     def _explode_namespace(nested_namespace: str) -> List[str]:
@@ -133,7 +202,7 @@ class ModularPipelinesRepository:
         hashed_inputs = set()
 
         for _input in inputs:
-            hashed_input = _hash_input_output(_input)
+            hashed_input = id_registry.get_dataset_id(_input)
             hashed_inputs.add(hashed_input)
             if is_dataset_param(_input):
                 self.parameters.add(hashed_input)
@@ -148,7 +217,7 @@ class ModularPipelinesRepository:
             modular_pipeline_id (str): The ID of the modular pipeline to add outputs to.
             outputs (Set[str]): The output datasets to add.
         """
-        hashed_outputs = {_hash_input_output(output) for output in outputs}
+        hashed_outputs = {id_registry.get_dataset_id(output) for output in outputs}
         self.tree[modular_pipeline_id].outputs = hashed_outputs
 
     def _add_children(self, modular_pipeline_id: str, kedro_nodes: List[KedroNode]):
@@ -202,14 +271,15 @@ class ModularPipelinesRepository:
         """
 
         for node in kedro_nodes:
-            node_id = _hash(str(node))
+            node_id = id_registry.get_node_id(node)
             modular_pipeline.children.add(
                 ModularPipelineChild(id=node_id, type=GraphNodeType.TASK)
             )
             modular_pipeline.tags.update(node.tags)
 
             hashed_io_ids = {
-                _hash_input_output(io) for io in set(node.inputs).union(node.outputs)
+                id_registry.get_dataset_id(io)
+                for io in set(node.inputs).union(node.outputs)
             }
 
             # Compute valid input/output IDs that are not part of the modular pipeline
@@ -288,9 +358,9 @@ class ModularPipelinesRepository:
     ) -> Tuple[str, Union[Set[str], None]]:
         """Get the modular pipeline(s) to which the given task node/or dataset belongs."""
         node_id = (
-            _hash(str(node))
+            id_registry.get_node_id(node)
             if isinstance(node, KedroNode)
-            else _hash_input_output(node)
+            else id_registry.get_dataset_id(node)
         )
         return node_id, self.node_mod_pipeline_map.get(node_id)
 
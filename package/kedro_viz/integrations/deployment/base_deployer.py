@@ -7,6 +7,7 @@ import logging
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Sequence
 
 from jinja2 import Environment, FileSystemLoader
 from packaging.version import parse
@@ -33,9 +34,22 @@ class BaseDeployer(abc.ABC):
         self._path = None
         self._fs = None
 
-    def _upload_api_responses(self, is_all_previews_enabled: bool):
-        """Write API responses to the build."""
-        save_api_responses_to_fs(self._path, self._fs, is_all_previews_enabled)
+    def _upload_api_responses(
+        self,
+        is_all_previews_enabled: bool,
+        content_encodings: Sequence[str] = (),
+        human_readable: bool = False,
+    ):
+        """Write API responses to the build, along with their compressed siblings
+        for each of the given content encodings, as compact JSON unless
+        human readable output is requested."""
+        save_api_responses_to_fs(
+            self._path,
+            self._fs,
+            is_all_previews_enabled,
+            content_encodings,
+            human_readable,
+        )
 
     def _ingest_heap_analytics(self):
         """Ingest heap analytics to index file in the build."""
@@ -100,9 +114,16 @@ class BaseDeployer(abc.ABC):
             logger.exception("Upload failed: %s ", exc)
             raise exc
 
-    def deploy(self, is_all_previews_enabled: bool = False):
+    def deploy(
+        self,
+        is_all_previews_enabled: bool = False,
+        content_encodings: Sequence[str] = (),
+        human_readable: bool = False,
+    ):
         """Create and deploy all static files to local/remote file system"""
 
-        self._upload_api_responses(is_all_previews_enabled)
+        self._upload_api_responses(
+            is_all_previews_enabled, content_encodings, human_readable
+        )
         self._upload_static_files(_HTML_DIR)
         self._upload_deploy_viz_metadata_file()
@@ -11,7 +11,7 @@ from kedro.pipeline.node import Node as KedroNode
 
 from kedro_viz.constants import VIZ_METADATA_ARGS
 from kedro_viz.launchers.utils import _find_kedro_project
-from kedro_viz.utils import _hash, _hash_input_output
+from kedro_viz.utils import id_registry
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,11 @@ EVENTS_FILE = "kedro_pipeline_events.json"
 
 def hash_node(node: Any) -> str:
     """Stable ID for KedroNode or I/O reference."""
-    return _hash(str(node)) if isinstance(node, KedroNode) else _hash_input_output(node)
+    return (
+        id_registry.get_node_id(node)
+        if isinstance(node, KedroNode)
+        else id_registry.get_dataset_id(node)
+    )
 
 
 def extract_file_paths(dataset: Any) -> List[str]:
@@ -6,10 +6,10 @@ from time import perf_counter
 from typing import Any, Dict, Optional
 
 from kedro.framework.hooks import hook_impl
+from kedro.framework.project import pipelines as registered_pipelines
 from kedro.pipeline.node import Node as KedroNode
 
 from kedro_viz.integrations.kedro.hooks_utils import (
-    _hash_input_output,
     compute_size,
     generate_timestamp,
     hash_node,
@@ -17,6 +17,7 @@ from kedro_viz.integrations.kedro.hooks_utils import (
     is_sequential_runner,
     write_events,
 )
+from kedro_viz.utils import id_registry
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ def create_dataset_event(
     event: Dict[str, Any] = {
         "event": event_name,
         "dataset": dataset_name,
-        "node_id": _hash_input_output(dataset_name),
+        "node_id": hash_node(dataset_name),
         "status": "Available",
     }
 
@@ -75,6 +76,8 @@ class PipelineRunStatusHook:
             used for tracking execution progress.
         _started_nodes (set[str]): Set of node names that have begun execution,
             used to identify unstarted nodes during pipeline errors.
+        _ids_allocated (bool): Whether the IDs of the registered pipelines
+            have been allocated in the current session.
     """
 
     def __init__(self):
@@ -94,6 +97,7 @@ class PipelineRunStatusHook:
         self._all_nodes: list[KedroNode] = []
         self._started_nodes: set[str] = set()
         self._should_collect_events: bool = False
+        self._ids_allocated: bool = False
 
     def _add_event(self, event: dict[str, Any], flush: bool = False) -> None:
         """Append one event to the events list and optionally flush to disk."""
@@ -112,6 +116,12 @@ class PipelineRunStatusHook:
         self._current_dataset = None
         self._current_operation = None
 
+    @hook_impl
+    def after_context_created(self, context: Any) -> None:  # noqa: ARG002
+        """Triggered when a new session creates its context. The registered pipelines
+        may differ from the previous session's, so their IDs are allocated again."""
+        self._ids_allocated = False
+
     @hook_impl
     def after_catalog_created(self, catalog: Any):
         """
@@ -145,6 +155,16 @@ class PipelineRunStatusHook:
 
         self._should_collect_events = True
         self._all_nodes = list(pipeline.nodes)
+        if not self._ids_allocated:
+            # Allocate the IDs of all registered pipelines, as Kedro-Viz does when
+            # populating the flowchart, so that colliding IDs in the events match
+            # the flowchart even if they collide with nodes outside the pipeline run.
+            # This is done once per session, and IDs already allocated, e.g. by
+            # Kedro-Viz running in the same process, are kept.
+            id_registry.allocate_pipeline_ids(
+                dict(registered_pipelines).values() or [pipeline]
+            )
+            self._ids_allocated = True
         self._started_nodes.clear()
         self._add_event(
             {"event": "before_pipeline_run", "timestamp": generate_timestamp()}
@@ -17,8 +17,27 @@ from kedro_viz.launchers.cli.main import viz
     is_flag=True,
     help="A flag to include preview for all the datasets",
 )
-def build(include_hooks, include_previews):
+@click.option(
+    "--compress",
+    type=click.Choice(["gzip", "br", "zstd"]),
+    multiple=True,
+    help="Also write each API response compressed with the given content encoding "
+    "next to it, e.g. `main.gz` for gzip, for static hosts to serve. Can be "
+    "repeated. `br` and `zstd` require the `brotli` and `zstandard` packages.",
+)
+@click.option(
+    "--human-readable",
+    is_flag=True,
+    help="A flag to write the API responses as indented JSON instead of compact JSON",
+)
+def build(include_hooks, include_previews, compress, human_readable):
     """Create build directory of local Kedro Viz instance with Kedro project data"""
     from kedro_viz.launchers.cli.utils import create_shareableviz_process
 
-    create_shareableviz_process("local", include_previews, include_hooks=include_hooks)
+    create_shareableviz_process(
+        "local",
+        include_previews,
+        include_hooks=include_hooks,
+        content_encodings=compress,
+        human_readable=human_readable,
+    )
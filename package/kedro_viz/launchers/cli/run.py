@@ -84,7 +84,13 @@ _VIZ_PROCESSES: Dict[str, int] = {}
     is_flag=True,
     help="An experimental flag to open Kedro-Viz without Kedro project dependencies",
 )
-def run(  # noqa: PLR0915
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Only build the flowchart of a registered pipeline "
+    "when it is first viewed instead of all of them on startup",
+)
+def run(  # noqa: PLR0912, PLR0913, PLR0915
     host,
     port,
     browser,
@@ -96,6 +102,7 @@ def run(  # noqa: PLR0915
     include_hooks,
     params,
     lite,
+    lazy,
 ):
     """Launch local Kedro Viz instance"""
     # Deferring Imports
@@ -108,6 +115,8 @@ def run(  # noqa: PLR0915
     from packaging.version import parse
 
     from kedro_viz import __version__
+    from kedro_viz.api.rest.executor import validate_limits
+    from kedro_viz.api.rest.responses.nodes import get_node_metadata_cache_settings
     from kedro_viz.integrations.pypi import (
         get_latest_version,
         is_running_outdated_version,
@@ -121,6 +130,7 @@ def run(  # noqa: PLR0915
         _wait_for,
         display_cli_message,
     )
+    from kedro_viz.models.flowchart.preview_cache import get_preview_cache_size
     from kedro_viz.server import run_server
 
     kedro_project_path = None
@@ -139,6 +149,14 @@ def run(  # noqa: PLR0915
             )
             return
 
+        try:
+            validate_limits()
+            get_node_metadata_cache_settings()
+            get_preview_cache_size()
+        except ValueError as exc:
+            display_cli_message(f"ERROR: Failed to start Kedro-Viz : {exc}", "red")
+            return
+
     installed_version = parse(__version__)
     latest_version = get_latest_version()
     if is_running_outdated_version(installed_version, latest_version):
@@ -181,6 +199,7 @@ def run(  # noqa: PLR0915
             "package_name": PACKAGE_NAME,
             "extra_params": params,
             "is_lite": lite,
+            "lazy": lazy,
         }
 
         process_context = multiprocessing.get_context("spawn")
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from time import sleep
-from typing import Union
+from typing import Sequence, Union
 
 from kedro_viz.constants import VIZ_DEPLOY_TIME_LIMIT
 from kedro_viz.launchers.utils import display_cli_message
@@ -14,6 +14,8 @@ def create_shareableviz_process(
     endpoint: Union[str, None] = None,
     bucket_name: Union[str, None] = None,
     include_hooks: bool = False,
+    content_encodings: Sequence[str] = (),
+    human_readable: bool = False,
 ):
     """Creates platform specific deployer process"""
 
@@ -36,6 +38,8 @@ def create_shareableviz_process(
                 PACKAGE_NAME,
                 process_completed,
                 exception_queue,
+                tuple(content_encodings),
+                human_readable,
             ),
         )
 
@@ -110,6 +114,8 @@ def _load_and_deploy_viz(
     package_name,
     process_completed,
     exception_queue,
+    content_encodings=(),
+    human_readable=False,
 ):
     """Loads Kedro Project data, creates a deployer and deploys to a platform"""
     try:
@@ -127,7 +133,7 @@ def _load_and_deploy_viz(
 
         # Start the deployment
         deployer = DeployerFactory.create_deployer(platform, endpoint, bucket_name)
-        deployer.deploy(is_all_previews_enabled)
+        deployer.deploy(is_all_previews_enabled, content_encodings, human_readable)
 
     except (
         (FileNotFoundError, ServiceRequestError)
@@ -1,13 +1,32 @@
 """`kedro_viz.models.flowchart.model_utils` defines utils for Kedro entities in a viz graph."""
 
 import logging
+import threading
+import time
+from concurrent.futures import Future, wait
 from enum import Enum
 from types import FunctionType
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+from kedro_viz.utils import get_max_workers
 
 logger = logging.getLogger(__name__)
 
 
+class PreviewTimeoutError(TimeoutError):
+    """Raised when a dataset preview doesn't finish within its timeout.
+
+    Args:
+        message: The error message.
+        pending_result: The future result of the preview, which still finishes
+            in the background, or None if the preview never started.
+    """
+
+    def __init__(self, message: str, pending_result: Optional[Future] = None):
+        super().__init__(message)
+        self.pending_result = pending_result
+
+
 def _parse_filepath(dataset_description: Dict[str, Any]) -> Optional[str]:
     """
     Extract the file path from a dataset description dictionary.
@@ -33,6 +52,145 @@ def _extract_wrapped_func(func: FunctionType) -> FunctionType:
     return func
 
 
+class _Preview:
+    """A preview running in a thread of the ``_PreviewRunner``, along with
+    the number of requests waiting for it and the threads limit it counts towards."""
+
+    def __init__(self):
+        self.future: Future = Future()
+        self.waiters = 0
+        self.slot: Optional[threading.BoundedSemaphore] = None
+
+
+class _PreviewRunner:
+    """Run dataset previews in a bounded number of daemon threads, waiting for each
+    of them for at most its timeout. A preview which times out is abandoned, as threads
+    can't be killed, and finishes in the background without holding up the exit.
+
+    A preview still running under the same name, e.g. one abandoned by an earlier
+    request, is joined rather than started again, so a hanging dataset only ever takes
+    up a single thread. Previews of other datasets wait for a free thread within their
+    timeout once all threads are taken, and time out otherwise.
+
+    Once no request waits for a preview any more, its thread is moved to a separate
+    bounded number of abandoned threads, so that a few slow datasets can't starve
+    the previews of all other datasets. While the abandoned threads are all taken,
+    a preview which times out keeps its thread until it finishes.
+
+    Args:
+        max_workers: The maximum number of previews running at once,
+            set by the `KEDRO_VIZ_MAX_WORKERS` environment variable by default.
+        max_abandoned: The maximum number of abandoned previews still running,
+            ``max_workers`` by default.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_abandoned: Optional[int] = None
+    ):
+        self._max_workers = max_workers
+        self._max_abandoned = max_abandoned
+        self._workers: Optional[threading.BoundedSemaphore] = None
+        self._abandoned: Optional[threading.BoundedSemaphore] = None
+        # every preview running, by name
+        self._in_flight: Dict[str, _Preview] = {}
+        self._lock = threading.Lock()
+
+    def _get_workers(self) -> threading.BoundedSemaphore:
+        with self._lock:
+            if self._workers is None:
+                max_workers = self._max_workers or get_max_workers()
+                self._workers = threading.BoundedSemaphore(max_workers)
+                self._abandoned = threading.BoundedSemaphore(
+                    self._max_abandoned or max_workers
+                )
+            return self._workers
+
+    def _start(self, func: Callable[[], Any], name: str, preview: _Preview):
+        def run():
+            try:
+                preview.future.set_result(func())
+            except BaseException as exc:  # noqa: BLE001
+                preview.future.set_exception(exc)
+            finally:
+                with self._lock:
+                    preview.slot.release()
+                    preview.slot = None
+                    if self._in_flight.get(name) is preview:
+                        del self._in_flight[name]
+
+        threading.Thread(target=run, name=name, daemon=True).start()
+
+    def _abandon(self, preview: _Preview):
+        # called with the lock held, once no request waits for the preview
+        workers = self._workers
+        if (
+            workers is not None
+            and preview.slot is workers
+            and self._abandoned is not None
+            and self._abandoned.acquire(blocking=False)
+        ):
+            workers.release()
+            preview.slot = self._abandoned
+
+    def run(self, func: Callable[[], Any], timeout: float, name: str) -> Any:
+        """Run a preview, or join the preview running under the same name,
+        and wait for its result for at most `timeout` seconds.
+
+        Raises:
+            PreviewTimeoutError: If the preview doesn't return within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            preview = self._in_flight.get(name)
+            is_running = preview is not None
+            if preview is None:
+                preview = self._in_flight[name] = _Preview()
+            preview.waiters += 1
+
+        try:
+            if not is_running:
+                workers = self._get_workers()
+                if workers.acquire(timeout=max(deadline - time.monotonic(), 0)):
+                    preview.slot = workers
+                    self._start(func, name, preview)
+                else:
+                    with self._lock:
+                        del self._in_flight[name]
+                    # also rejects the calls which joined this one meanwhile
+                    preview.future.set_exception(
+                        PreviewTimeoutError(
+                            f"'{name}' could not start within {timeout} seconds, "
+                            "as all preview threads are taken."
+                        )
+                    )
+
+            done, _ = wait([preview.future], max(deadline - time.monotonic(), 0))
+        finally:
+            with self._lock:
+                preview.waiters -= 1
+                if not preview.waiters:
+                    self._abandon(preview)
+
+        if not done:
+            raise PreviewTimeoutError(
+                f"'{name}' did not finish within {timeout} seconds.", preview.future
+            )
+        return preview.future.result()
+
+
+_preview_runner = _PreviewRunner()
+
+
+def _run_with_timeout(func: Callable[[], Any], timeout: float, name: str) -> Any:
+    """Run a function as a preview of the shared bounded ``_PreviewRunner``
+    and wait for its result for at most `timeout` seconds.
+
+    Raises:
+        PreviewTimeoutError: If the function doesn't return within the timeout.
+    """
+    return _preview_runner.run(func, timeout, name)
+
+
 # =============================================================================
 # Shared base classes and enumerations for model components
 # =============================================================================
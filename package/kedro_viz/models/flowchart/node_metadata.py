@@ -5,24 +5,75 @@ Kedro metadata in a visualization graph.
 
 import inspect
 import logging
+import os
 from abc import ABC
 from pathlib import Path
-from typing import ClassVar, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Union, cast
 
-from kedro.io.core import AbstractDataset
 from kedro.pipeline.node import Node as KedroNode
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from kedro_viz.models.utils import get_dataset_type
 
-from .model_utils import _extract_wrapped_func, _parse_filepath
+from .model_utils import (
+    PreviewTimeoutError,
+    _extract_wrapped_func,
+    _parse_filepath,
+    _run_with_timeout,
+)
 from .nodes import DataNode, ParametersNode, TaskNode, TranscodedDataNode
+from .preview_cache import get_dataset_fingerprint, preview_cache
 
 logger = logging.getLogger(__name__)
 
+PREVIEW_TIMEOUT_ENV_VAR = "KEDRO_VIZ_PREVIEW_TIMEOUT"
+DEFAULT_PREVIEW_TIMEOUT = 60.0
+
+# The preview type of datasets whose preview didn't finish within its timeout
+TIMED_OUT_PREVIEW_TYPE = "TimedOutPreview"
+
+
+def get_preview_timeout() -> float:
+    """Get the number of seconds a dataset is previewed for at most, as set by the
+    `KEDRO_VIZ_PREVIEW_TIMEOUT` environment variable.
+
+    Raises:
+        ValueError: If the timeout isn't a positive number.
+    """
+    value = os.getenv(PREVIEW_TIMEOUT_ENV_VAR)
+    if value is None:
+        return DEFAULT_PREVIEW_TIMEOUT
+    return _parse_preview_timeout(value)
+
+
+def _parse_preview_timeout(value: Any) -> float:
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError):
+        timeout = 0
+    # also rejects NaN
+    if not timeout > 0:
+        raise ValueError(
+            f"The preview timeout must be a positive number, got '{value}'."
+        )
+    return timeout
+
 
 class GraphNodeMetadata(BaseModel, ABC):
-    """Represent a graph node's metadata."""
+    """Represent a graph node's metadata.
+
+    The metadata fields are computed by validators from the node the metadata belongs to,
+    which is the first field of every metadata model. The validators read the node from
+    the fields validated so far, i.e. ``info.data``, rather than from any shared state,
+    so metadata can be built for several nodes concurrently.
+    """
 
 
 class TaskNodeMetadata(GraphNodeMetadata):
@@ -77,19 +128,17 @@ class TaskNodeMetadata(GraphNodeMetadata):
     @classmethod
     def check_task_node_exists(cls, values):
         assert "task_node" in values
-        cls.set_task_and_kedro_node(values["task_node"])
         return values
 
-    @classmethod
-    def set_task_and_kedro_node(cls, task_node):
-        cls.task_node = task_node
-        cls.kedro_node = cast(KedroNode, task_node.kedro_obj)
+    @staticmethod
+    def _get_kedro_node(info: ValidationInfo) -> KedroNode:
+        return cast(KedroNode, info.data["task_node"].kedro_obj)
 
     @field_validator("code")
     @classmethod
-    def set_code(cls, code):
+    def set_code(cls, code, info: ValidationInfo):
         # this is required to handle partial, curry functions
-        func = cls.kedro_node.func
+        func = cls._get_kedro_node(info).func
 
         if inspect.ismethod(func):
             func = func.__func__
@@ -102,9 +151,9 @@ class TaskNodeMetadata(GraphNodeMetadata):
 
     @field_validator("filepath")
     @classmethod
-    def set_filepath(cls, filepath):
+    def set_filepath(cls, filepath, info: ValidationInfo):
         # this is required to handle partial, curry functions
-        func = cls.kedro_node.func
+        func = cls._get_kedro_node(info).func
 
         if inspect.ismethod(func):
             func = func.__func__
@@ -126,29 +175,29 @@ class TaskNodeMetadata(GraphNodeMetadata):
 
     @field_validator("parameters")
     @classmethod
-    def set_parameters(cls, _):
-        return cls.task_node.parameters
+    def set_parameters(cls, _, info: ValidationInfo):
+        return info.data["task_node"].parameters
 
     @field_validator("run_command")
     @classmethod
-    def set_run_command(cls, _):
-        return f"kedro run --to-nodes='{cls.kedro_node.name}'"
+    def set_run_command(cls, _, info: ValidationInfo):
+        return f"kedro run --to-nodes='{cls._get_kedro_node(info).name}'"
 
     @field_validator("inputs")
     @classmethod
-    def set_inputs(cls, _):
-        return cls.kedro_node.inputs
+    def set_inputs(cls, _, info: ValidationInfo):
+        return cls._get_kedro_node(info).inputs
 
     @field_validator("outputs")
     @classmethod
-    def set_outputs(cls, _):
-        return cls.kedro_node.outputs
+    def set_outputs(cls, _, info: ValidationInfo):
+        return cls._get_kedro_node(info).outputs
 
     @field_validator("preview")
     @classmethod
-    def set_preview(cls, _):
+    def set_preview(cls, _, info: ValidationInfo):
         try:
-            task_node_preview_fn = getattr(cls.kedro_node, "preview", None)
+            task_node_preview_fn = getattr(cls._get_kedro_node(info), "preview", None)
 
             # for Kedro versions that do not support preview_fn
             if task_node_preview_fn is None:  # pragma: no cover
@@ -179,13 +228,13 @@ class TaskNodeMetadata(GraphNodeMetadata):
                     "Task node previews are disabled because this Kedro version "
                     "does not provide 'kedro.pipeline.preview_contract'."
                 )
-                cls.set_preview._import_warning_shown = True
+                cls.set_preview._import_warning_shown = True  # type: ignore[attr-defined]
             return None
 
         except Exception as exc:  # noqa: BLE001
             logger.warning(
                 "'%s' could not be previewed. Full exception: %s: %s",
-                cls.task_node.name,
+                info.data["task_node"].name,
                 type(exc).__name__,
                 exc,
             )
@@ -197,11 +246,8 @@ class DataNodeMetadata(GraphNodeMetadata):
 
     Args:
         data_node (DataNode): Data node to which this metadata belongs to.
-
-    Attributes:
-        is_all_previews_enabled (bool): Class-level attribute to determine if
-            previews are enabled for all nodes. This can be configured via CLI
-            or UI to manage the preview settings.
+        is_all_previews_enabled (bool): Whether previews are enabled for all nodes.
+            This can be configured via CLI or UI to manage the preview settings.
 
     Raises:
         AssertionError: If data_node is not supplied during instantiation.
@@ -209,7 +255,7 @@ class DataNodeMetadata(GraphNodeMetadata):
 
     data_node: DataNode = Field(..., exclude=True)
 
-    is_all_previews_enabled: ClassVar[bool] = True
+    is_all_previews_enabled: bool = Field(default=True, exclude=True)
 
     type: Optional[str] = Field(
         default=None, validate_default=True, description="The type of the data node"
@@ -229,7 +275,6 @@ class DataNodeMetadata(GraphNodeMetadata):
 
     preview: Optional[Union[Dict, str]] = Field(
         default=None,
-        validate_default=True,
         description="Preview data for the underlying datanode",
     )
 
@@ -245,84 +290,79 @@ class DataNodeMetadata(GraphNodeMetadata):
         description="The statistics for the data node.",
     )
 
+    # Whether the preview didn't finish within its timeout,
+    # which is reported through the preview type
+    _is_preview_timed_out: bool = PrivateAttr(default=False)
+
+    @property
+    def is_preview_timed_out(self) -> bool:
+        """Whether the preview didn't finish within its timeout, in which case this
+        metadata shouldn't be cached, as the preview can be loaded by a later request."""
+        return self._is_preview_timed_out
+
     @model_validator(mode="before")
     @classmethod
     def check_data_node_exists(cls, values):
         assert "data_node" in values
-        cls.set_data_node_and_dataset(values["data_node"])
+
+        # dataset.release clears the cache before loading to ensure that this issue
+        # does not arise: https://github.com/kedro-org/kedro-viz/pull/573.
+        values["data_node"].kedro_obj.release()
         return values
 
-    @classmethod
-    def set_is_all_previews_enabled(cls, value: bool):
-        cls.is_all_previews_enabled = value
+    @staticmethod
+    def _get_dataset(info: ValidationInfo) -> Any:
+        # typed loosely, as `preview` is an optional method of Kedro datasets
+        return info.data["data_node"].kedro_obj
 
-    @classmethod
-    def set_data_node_and_dataset(cls, data_node):
-        cls.data_node = data_node
-        cls.dataset = cast(AbstractDataset, data_node.kedro_obj)
+    @staticmethod
+    def _is_preview_enabled(data_node: DataNode, is_all_previews_enabled: bool) -> bool:
+        return (
+            data_node.is_preview_enabled()
+            and hasattr(data_node.kedro_obj, "preview")
+            and is_all_previews_enabled
+        )
 
-        # dataset.release clears the cache before loading to ensure that this issue
-        # does not arise: https://github.com/kedro-org/kedro-viz/pull/573.
-        cls.dataset.release()
+    @staticmethod
+    def _get_preview_timeout(data_node: DataNode) -> float:
+        # the timeout set for the dataset takes precedence over the global one
+        preview_timeout = (
+            data_node.get_preview_timeout() if data_node.viz_metadata else None
+        )
+        if preview_timeout is None:
+            return get_preview_timeout()
+        return _parse_preview_timeout(preview_timeout)
 
     @field_validator("type")
     @classmethod
-    def set_type(cls, _):
-        return cls.data_node.dataset_type
+    def set_type(cls, _, info: ValidationInfo):
+        return info.data["data_node"].dataset_type
 
     @field_validator("filepath")
     @classmethod
-    def set_filepath(cls, _):
-        dataset_description = cls.dataset._describe()
+    def set_filepath(cls, _, info: ValidationInfo):
+        dataset_description = cls._get_dataset(info)._describe()
         return _parse_filepath(dataset_description)
 
     @field_validator("run_command")
     @classmethod
-    def set_run_command(cls, _):
-        if not cls.data_node.is_free_input:
-            return f"kedro run --to-outputs={cls.data_node.name}"
+    def set_run_command(cls, _, info: ValidationInfo):
+        data_node = info.data["data_node"]
+        if not data_node.is_free_input:
+            return f"kedro run --to-outputs={data_node.name}"
         return None
 
-    @field_validator("preview")
-    @classmethod
-    def set_preview(cls, _):
-        if (
-            not cls.data_node.is_preview_enabled()
-            or not hasattr(cls.dataset, "preview")
-            or not cls.is_all_previews_enabled
-        ):
-            return None
-
-        try:
-            preview_args = (
-                cls.data_node.get_preview_args() if cls.data_node.viz_metadata else None
-            )
-            if preview_args is None:
-                return cls.dataset.preview()
-            return cls.dataset.preview(**preview_args)
-
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "'%s' could not be previewed. Full exception: %s: %s",
-                cls.data_node.name,
-                type(exc).__name__,
-                exc,
-            )
-            return None
-
     @field_validator("preview_type")
     @classmethod
-    def set_preview_type(cls, _):
-        if (
-            not cls.data_node.is_preview_enabled()
-            or not hasattr(cls.dataset, "preview")
-            or not cls.is_all_previews_enabled
+    def set_preview_type(cls, _, info: ValidationInfo):
+        if not cls._is_preview_enabled(
+            info.data["data_node"], info.data["is_all_previews_enabled"]
         ):
             return None
 
         try:
             preview_type_annotation = inspect.signature(
-                cls.dataset.preview
+                cls._get_dataset(info).preview
             ).return_annotation
             # Attempt to get the name attribute, if it exists.
             # Otherwise, use str to handle the annotation directly.
@@ -334,7 +374,7 @@ class DataNodeMetadata(GraphNodeMetadata):
         except Exception as exc:  # noqa: BLE001 # pragma: no cover
             logger.warning(
                 "'%s' did not have preview type. Full exception: %s: %s",
-                cls.data_node.name,
+                info.data["data_node"].name,
                 type(exc).__name__,
                 exc,
             )
@@ -342,8 +382,61 @@ class DataNodeMetadata(GraphNodeMetadata):
 
     @field_validator("stats")
     @classmethod
-    def set_stats(cls, _):
-        return cls.data_node.node_extras and cls.data_node.node_extras.stats
+    def set_stats(cls, _, info: ValidationInfo):
+        data_node = info.data["data_node"]
+        return data_node.node_extras and data_node.node_extras.stats
+
+    @model_validator(mode="after")
+    def set_preview(self):
+        # loaded once the other fields are set, so that a timeout can be recorded
+        # and reported through the preview type
+        if not self._is_preview_enabled(self.data_node, self.is_all_previews_enabled):
+            return self
+
+        data_node = self.data_node
+        dataset = data_node.kedro_obj
+        try:
+            preview_args = (
+                data_node.get_preview_args() if data_node.viz_metadata else None
+            )
+            preview_timeout = self._get_preview_timeout(data_node)
+            # data nodes previewing the same file in the same way, e.g. in a batch
+            # of node metadata, join a single preview rather than loading it again
+            fingerprint = get_dataset_fingerprint(dataset, preview_args)
+            preview_name = f"preview-{fingerprint or data_node.name}"
+
+            def load_preview():
+                if preview_args is None:
+                    return dataset.preview()
+                return dataset.preview(**preview_args)
+
+            def compute_preview():
+                # a hanging preview is abandoned rather than holding up the response
+                return _run_with_timeout(load_preview, preview_timeout, preview_name)
+
+            # previews of unchanged files are served from disk across restarts,
+            # while timed out previews aren't cached and are tried again next time
+            self.preview = preview_cache.get_or_compute(
+                dataset, preview_args, compute_preview, fingerprint
+            )
+
+        except PreviewTimeoutError:
+            logger.warning(
+                "'%s' could not be previewed within %s seconds.",
+                data_node.name,
+                preview_timeout,
+            )
+            self._is_preview_timed_out = True
+            self.preview_type = TIMED_OUT_PREVIEW_TYPE
+
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "'%s' could not be previewed. Full exception: %s: %s",
+                data_node.name,
+                type(exc).__name__,
+                exc,
+            )
+        return self
 
 
 class TranscodedDataNodeMetadata(GraphNodeMetadata):
@@ -391,41 +484,45 @@ class TranscodedDataNodeMetadata(GraphNodeMetadata):
     @classmethod
     def check_transcoded_data_node_exists(cls, values):
         assert "transcoded_data_node" in values
-        cls.transcoded_data_node = values["transcoded_data_node"]
         return values
 
     @field_validator("filepath")
     @classmethod
-    def set_filepath(cls, _):
-        dataset_description = cls.transcoded_data_node.original_version._describe()
+    def set_filepath(cls, _, info: ValidationInfo):
+        dataset_description = info.data[
+            "transcoded_data_node"
+        ].original_version._describe()
         return _parse_filepath(dataset_description)
 
     @field_validator("run_command")
     @classmethod
-    def set_run_command(cls, _):
-        if not cls.transcoded_data_node.is_free_input:
-            return f"kedro run --to-outputs={cls.transcoded_data_node.original_name}"
+    def set_run_command(cls, _, info: ValidationInfo):
+        transcoded_data_node = info.data["transcoded_data_node"]
+        if not transcoded_data_node.is_free_input:
+            return f"kedro run --to-outputs={transcoded_data_node.original_name}"
         return None
 
     @field_validator("original_type")
     @classmethod
-    def set_original_type(cls, _):
-        return get_dataset_type(cls.transcoded_data_node.original_version)
+    def set_original_type(cls, _, info: ValidationInfo):
+        return get_dataset_type(info.data["transcoded_data_node"].original_version)
 
     @field_validator("transcoded_types")
     @classmethod
-    def set_transcoded_types(cls, _):
+    def set_transcoded_types(cls, _, info: ValidationInfo):
         return [
             get_dataset_type(transcoded_version)
-            for transcoded_version in cls.transcoded_data_node.transcoded_versions
+            for transcoded_version in info.data[
+                "transcoded_data_node"
+            ].transcoded_versions
         ]
 
     @field_validator("stats")
     @classmethod
-    def set_stats(cls, _):
+    def set_stats(cls, _, info: ValidationInfo):
+        transcoded_data_node = info.data["transcoded_data_node"]
         return (
-            cls.transcoded_data_node.node_extras
-            and cls.transcoded_data_node.node_extras.stats
+            transcoded_data_node.node_extras and transcoded_data_node.node_extras.stats
         )
 
 
@@ -451,14 +548,12 @@ class ParametersNodeMetadata(GraphNodeMetadata):
     @classmethod
     def check_parameters_node_exists(cls, values):
         assert "parameters_node" in values
-        cls.parameters_node = values["parameters_node"]
         return values
 
     @field_validator("parameters")
     @classmethod
-    def set_parameters(cls, _):
-        if cls.parameters_node.is_single_parameter():
-            return {
-                cls.parameters_node.parameter_name: cls.parameters_node.parameter_value
-            }
-        return cls.parameters_node.parameter_value
+    def set_parameters(cls, _, info: ValidationInfo):
+        parameters_node = info.data["parameters_node"]
+        if parameters_node.is_single_parameter():
+            return {parameters_node.parameter_name: parameters_node.parameter_value}
+        return parameters_node.parameter_value
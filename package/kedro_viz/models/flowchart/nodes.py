@@ -337,6 +337,10 @@ class DataNode(GraphNode):
         """Gets the preview arguments for a dataset"""
         return self.viz_metadata.get("preview_args", None)
 
+    def get_preview_timeout(self):
+        """Gets the number of seconds a dataset is previewed for at most, if set"""
+        return self.viz_metadata.get("preview_timeout", None)
+
     def is_preview_enabled(self):
         """Checks if the dataset has a preview enabled at the node level."""
         return (
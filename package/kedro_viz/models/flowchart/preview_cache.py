@@ -0,0 +1,332 @@
+"""`kedro_viz.models.flowchart.preview_cache` persists the previews of datasets
+on disk, so that they are not loaded again after a restart of Kedro-Viz
+as long as the underlying data hasn't changed."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from kedro.io.core import AbstractVersionedDataset, get_filepath_str
+
+from kedro_viz.constants import VIZ_PREVIEW_CACHE_DIR
+from kedro_viz.models.flowchart.model_utils import PreviewTimeoutError
+from kedro_viz.models.utils import get_dataset_type
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_CACHE_SIZE_ENV_VAR = "KEDRO_VIZ_PREVIEW_CACHE_SIZE"
+PREVIEW_CACHE_DIR_ENV_VAR = "KEDRO_VIZ_PREVIEW_CACHE_DIR"
+DEFAULT_PREVIEW_CACHE_SIZE = 256 * 1024 * 1024
+
+# The fields of `fsspec` file info which change when a file is modified, depending on
+# the file system, e.g. the modification time of local files or the ETag of S3 objects
+_FILE_VERSION_FIELDS = (
+    "mtime",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "ETag",
+    "etag",
+    "VersionId",
+    "generation",
+)
+
+
+def get_preview_cache_size() -> int:
+    """Get the maximum total size of the preview cache in bytes, as set by the
+    `KEDRO_VIZ_PREVIEW_CACHE_SIZE` environment variable, if any, 0 disabling the cache.
+
+    Raises:
+        ValueError: If the size isn't a non-negative integer.
+    """
+    max_size_value = os.getenv(PREVIEW_CACHE_SIZE_ENV_VAR)
+    try:
+        max_size = (
+            DEFAULT_PREVIEW_CACHE_SIZE
+            if max_size_value is None
+            else int(max_size_value)
+        )
+    except ValueError:
+        # reported as invalid below
+        max_size = -1
+    if max_size < 0:
+        raise ValueError(
+            "The preview cache size must be a non-negative integer, "
+            f"got '{max_size_value}'."
+        )
+    return max_size
+
+
+def get_dataset_fingerprint(
+    dataset: Any, preview_args: Optional[Dict[str, Any]]
+) -> Optional[str]:
+    """Get a fingerprint of the preview of a file-based dataset, which changes whenever
+    the dataset type, filepath, preview arguments or the underlying file change.
+
+    Args:
+        dataset: The dataset to preview.
+        preview_args: The arguments the dataset is previewed with, if any.
+
+    Returns:
+        The fingerprint as a hexadecimal string, or None if the dataset doesn't load from
+        a single file whose modification time, ETag or version can be looked up.
+    """
+    filepath = getattr(dataset, "_filepath", None)
+    protocol = getattr(dataset, "_protocol", None)
+    fs = getattr(dataset, "_fs", None)
+    if not isinstance(filepath, PurePath) or not isinstance(protocol, str) or not fs:
+        return None
+
+    try:
+        if isinstance(dataset, AbstractVersionedDataset):
+            # resolve the version to load, as the filepath is a directory of versions
+            filepath = dataset._get_load_path()
+        load_path = get_filepath_str(filepath, protocol)
+        file_info = fs.info(load_path)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("'%s' could not be fingerprinted: %s", filepath, exc)
+        return None
+
+    file_version = {
+        field: str(file_info[field])
+        for field in _FILE_VERSION_FIELDS
+        if file_info.get(field) is not None
+    }
+    if file_info.get("type") != "file" or not file_version:
+        return None
+
+    fingerprint = orjson.dumps(
+        {
+            "type": get_dataset_type(dataset),
+            "filepath": load_path,
+            "preview_args": preview_args,
+            "size": file_info.get("size"),
+            "version": file_version,
+        },
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=repr,
+    )
+    return hashlib.sha256(fingerprint).hexdigest()
+
+
+class PreviewCache:
+    """Persist the previews of file-based datasets as JSON files in a directory,
+    keyed by the fingerprint of each dataset and its preview arguments.
+
+    A cached preview is only served while its dataset type, filepath, preview arguments
+    and the modification time, size or version of its file are unchanged, as any change
+    leads to a different fingerprint. The stale entries are never read again and are
+    evicted least recently used first, once the total size of the cache directory would
+    exceed ``max_size`` bytes. The size and last use of every entry are indexed in memory
+    when the directory is set, so that evicting doesn't scan the directory on every write.
+    The cache is disabled until a directory is set, which is done when populating the
+    data of a Kedro project, see ``configure_from_env``. The directory is created with a ``.gitignore`` file,
+    so that the cached data is never committed to the project's repository.
+
+    Args:
+        directory: The directory to store the previews in, if any.
+        max_size: The maximum total size of the cached previews in bytes.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_size: int = DEFAULT_PREVIEW_CACHE_SIZE,
+    ) -> None:
+        self.max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self.set_directory(directory)
+
+    def configure_from_env(self, project_path: Path):
+        """Set the size and directory of the cache for a Kedro project from the
+        `KEDRO_VIZ_PREVIEW_CACHE_SIZE` and `KEDRO_VIZ_PREVIEW_CACHE_DIR` environment
+        variables, if any, e.g. when Kedro-Viz starts. The previews are cached in
+        ``.viz/previews`` in the project by default, and a relative directory is
+        resolved against the project. A size of 0 disables the cache.
+
+        Args:
+            project_path: The path to the Kedro project.
+
+        Raises:
+            ValueError: If the size isn't a non-negative integer,
+                in which case the cache is left unchanged.
+        """
+        max_size = get_preview_cache_size()
+        directory = Path(os.getenv(PREVIEW_CACHE_DIR_ENV_VAR) or VIZ_PREVIEW_CACHE_DIR)
+        with self._lock:
+            self.max_size = max_size
+        self.set_directory(project_path / directory if max_size else None)
+
+    def set_directory(self, directory: Optional[Path]):
+        """Set the directory to store the previews in, or None to disable the cache,
+        and index the previews already cached in it from the least to the most recently
+        used, as recorded by their modification times."""
+        entries: List[Tuple[float, int, Path]] = []
+        if directory is not None and directory.is_dir():
+            for entry_path in directory.glob("*.json"):
+                try:
+                    entry_stat = entry_path.stat()
+                except FileNotFoundError:  # pragma: no cover
+                    continue
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_path))
+
+        with self._lock:
+            self.directory = directory
+            # the size of every cached preview by path,
+            # from the least to the most recently used
+            self._entries: "OrderedDict[Path, int]" = OrderedDict(
+                (entry_path, entry_size)
+                for _, entry_size, entry_path in sorted(
+                    entries, key=lambda entry: entry[0]
+                )
+            )
+            self._size = sum(self._entries.values())
+
+    def _read(self, path: Path) -> Tuple[bool, Any]:
+        try:
+            preview = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            # forget the entry if it was deleted from the directory meanwhile
+            with self._lock:
+                self._size -= self._entries.pop(path, 0)
+            return False, None
+        except (OSError, orjson.JSONDecodeError) as exc:
+            logger.warning("Failed to read the cached preview %s: %s", path, exc)
+            return False, None
+        try:
+            # mark the entry as recently used, also for the index built after a restart
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass
+        with self._lock:
+            if path in self._entries:
+                self._entries.move_to_end(path)
+        return True, preview
+
+    def _create_directory(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / ".gitignore").write_text(
+            "# Cached dataset previews, created automatically by Kedro-Viz\n*\n"
+        )
+
+    def _write(self, directory: Path, path: Path, preview: Any):
+        try:
+            encoded_preview = orjson.dumps(
+                preview, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            logger.debug("The preview for %s is not JSON serialisable", path.stem)
+            return
+        if len(encoded_preview) > self.max_size:
+            return
+
+        try:
+            if not directory.is_dir():
+                self._create_directory(directory)
+            # write to a temporary file first, so that readers never see a partial entry
+            with tempfile.NamedTemporaryFile(
+                dir=directory, suffix=".tmp", delete=False
+            ) as temporary_file:
+                temporary_file.write(encoded_preview)
+            os.replace(temporary_file.name, path)
+        except OSError as exc:
+            logger.warning("Failed to cache the preview %s: %s", path, exc)
+            return
+
+        with self._lock:
+            self._size += len(encoded_preview) - self._entries.pop(path, 0)
+            self._entries[path] = len(encoded_preview)
+            # the new entry is the most recently used one and fits in the cache,
+            # so it's never evicted itself
+            evicted_paths = []
+            while self._size > self.max_size:
+                evicted_path, evicted_size = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+                evicted_paths.append(evicted_path)
+        for evicted_path in evicted_paths:
+            try:
+                evicted_path.unlink(missing_ok=True)
+            except OSError as exc:  # pragma: no cover
+                logger.warning(
+                    "Failed to evict the cached preview %s: %s", evicted_path, exc
+                )
+
+    def _write_late(self, directory: Path, path: Path, future: Future):
+        if future.exception() is not None:
+            return
+        with self._lock:
+            # cached already by another request which timed out on the same preview
+            if path in self._entries:
+                return
+        self._write(directory, path, future.result())
+
+    def get_or_compute(
+        self,
+        dataset: Any,
+        preview_args: Optional[Dict[str, Any]],
+        compute: Callable[[], Any],
+        fingerprint: Optional[str] = None,
+    ) -> Any:
+        """Return the cached preview of the dataset with the given preview arguments,
+        computing it with ``compute`` and caching it first on a cache miss.
+        The preview is computed without being cached if the cache is disabled
+        or the dataset can't be fingerprinted. A preview which times out is cached
+        once it finishes in the background, for the next request to be served from disk.
+        The fingerprint of the dataset is looked up unless it's given."""
+        directory = self.directory
+        if directory is None:
+            return compute()
+        if fingerprint is None:
+            fingerprint = get_dataset_fingerprint(dataset, preview_args)
+        if fingerprint is None:
+            return compute()
+
+        path = directory / f"{fingerprint}.json"
+        is_cached, preview = self._read(path)
+        with self._lock:
+            if is_cached:
+                self._hits += 1
+            else:
+                self._misses += 1
+        if is_cached:
+            return preview
+
+        try:
+            preview = compute()
+        except PreviewTimeoutError as exc:
+            if exc.pending_result is not None:
+                exc.pending_result.add_done_callback(
+                    lambda future: self._write_late(directory, path, future)
+                )
+            raise
+        self._write(directory, path, preview)
+        return preview
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return the number of cache hits, misses and evictions so far,
+        along with the current number and total size of the cached previews."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "size": self._size,
+                "max_size": self.max_size,
+            }
+
+
+# Disabled until Kedro-Viz starts, when it's configured for the Kedro project,
+# so that importing never fails on invalid environment variables
+preview_cache = PreviewCache()
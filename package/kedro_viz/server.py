@@ -12,6 +12,7 @@ from kedro_viz.constants import DEFAULT_HOST, DEFAULT_PORT
 from kedro_viz.data_access import DataAccessManager, data_access_manager
 from kedro_viz.integrations.kedro import data_loader as kedro_data_loader
 from kedro_viz.launchers.utils import _check_viz_up, _wait_for, display_cli_message
+from kedro_viz.models.flowchart.preview_cache import preview_cache
 from kedro_viz.models.metadata import NodeExtras
 
 DEV_PORT = 4142
@@ -22,9 +23,14 @@ def populate_data(
     catalog: DataCatalog,
     pipelines: Dict[str, Pipeline],
     node_extras_dict: Dict[str, NodeExtras],
+    lazy: bool = False,
 ):
     """Populate data repositories. Should be called once on application start
     if creating an api app from project.
+
+    Args:
+        lazy: Whether to defer populating each registered pipeline
+            until it's first requested.
     """
 
     data_access_manager.add_catalog(catalog, pipelines)
@@ -33,7 +39,7 @@ def populate_data(
     # need stats information and they are created during add_pipelines
     data_access_manager.add_node_extras(node_extras_dict)
 
-    data_access_manager.add_pipelines(pipelines)
+    data_access_manager.add_pipelines(pipelines, lazy)
 
 
 def load_and_populate_data(
@@ -44,8 +50,16 @@ def load_and_populate_data(
     pipeline_name: Optional[str] = None,
     extra_params: Optional[Dict[str, Any]] = None,
     is_lite: bool = False,
+    lazy: bool = False,
 ):
-    """Loads underlying Kedro project data and populates Kedro Viz Repositories"""
+    """Loads underlying Kedro project data and populates Kedro Viz Repositories
+
+    Raises:
+        ValueError: If the preview cache settings set through the environment are invalid.
+    """
+
+    # Persists the dataset previews of the project across restarts, unless disabled
+    preview_cache.configure_from_env(path)
 
     # Loads data from underlying Kedro Project
     catalog, pipelines, node_extras_dict = kedro_data_loader.load_data(
@@ -59,10 +73,10 @@ def load_and_populate_data(
     )
 
     # Creates data repositories which are used by Kedro Viz Backend APIs
-    populate_data(data_access_manager, catalog, pipelines, node_extras_dict)
+    populate_data(data_access_manager, catalog, pipelines, node_extras_dict, lazy)
 
 
-def run_server(
+def run_server(  # noqa: PLR0913
     host: str = DEFAULT_HOST,
     port: int = DEFAULT_PORT,
     load_file: Optional[str] = None,
@@ -75,6 +89,7 @@ def run_server(
     package_name: Optional[str] = None,
     extra_params: Optional[Dict[str, Any]] = None,
     is_lite: bool = False,
+    lazy: bool = False,
 ):
     """Run a uvicorn server with a FastAPI app that either launches API response data from a file
     or from reading data from a real Kedro project.
@@ -98,6 +113,9 @@ def run_server(
             take precedence over) the parameters retrieved from the project
             configuration.
         is_lite: A flag to run Kedro-Viz in lite mode.
+        lazy: Whether to populate the data repositories for each registered pipeline
+            only when it's first requested. All registered pipelines are still
+            populated before saving the responses when ``save_file`` is provided.
     """
     # Importing below dependencies inside `run_server` to avoid ImportError
     # when calling `load_and_populate_data` from VSCode
@@ -106,12 +124,25 @@ def run_server(
     import uvicorn
 
     from kedro_viz.api import apps
+    from kedro_viz.api.rest.executor import validate_limits
+    from kedro_viz.api.rest.responses.nodes import node_metadata_cache
+    from kedro_viz.api.rest.responses.pipelines import warm_up_pipeline_response_cache
 
     path = Path(project_path) if project_path else Path.cwd()
 
     if load_file is None:
+        # fail before loading the project rather than on every request
+        validate_limits()
+        node_metadata_cache.configure_from_env()
         load_and_populate_data(
-            path, env, include_hooks, package_name, pipeline_name, extra_params, is_lite
+            path,
+            env,
+            include_hooks,
+            package_name,
+            pipeline_name,
+            extra_params,
+            is_lite,
+            lazy,
         )
         # [TODO: As we can do this with `kedro viz build`,
         # we need to shift this feature outside of kedro viz run]
@@ -122,6 +153,10 @@ def run_server(
 
             save_api_responses_to_fs(save_file, fsspec.filesystem("file"), True)
 
+        # Precompute the pipeline responses while the server starts up so that
+        # switching between registered pipelines is served from the cache
+        warm_up_pipeline_response_cache()
+
         app = apps.create_api_app_from_project(path, autoreload)
     else:
         app = apps.create_api_app_from_file(f"{path}/{load_file}/api")
@@ -1,3 +1,5 @@
 """`kedro_viz.services` provides an additional business logic layer for the API."""
 
 from . import layers as layers_services
+from . import lineage as lineage_services
+from . import reachability as reachability_services
@@ -1,17 +1,62 @@
 """`kedro_viz.services.layers` defines layers-related logic."""
 
 import logging
-from collections import defaultdict
 from graphlib import CycleError, TopologicalSorter
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Mapping, Set
 
 from kedro_viz.models.flowchart.nodes import GraphNode
 
 logger = logging.getLogger(__name__)
 
 
+def _find_child_layers(
+    node_ids: Iterable[str],
+    node_layer_bits: Mapping[str, int],
+    dependencies: Mapping[str, Iterable[str]],
+) -> Dict[str, int]:
+    """For every node reachable from the given node_ids, find the bitmask of all layers
+    that depend on it with an iterative depth-first search, so each node is visited only once
+    and deep pipelines don't hit the recursion limit. The bitmask of a node is complete
+    once all its children have been visited, i.e. in reverse topological order.
+
+    Args:
+        node_ids: The IDs of the nodes to start searching from.
+        node_layer_bits: A dictionary of {node_id -> bit} for the nodes with a layer.
+        dependencies: A dictionary of {node_id -> set(child_ids)}.
+
+    Returns:
+        A dictionary of {node_id -> bitmask of the layers depending on it}.
+    """
+    node_child_layers: Dict[str, int] = {}
+    for root_node_id in node_ids:
+        if root_node_id in node_child_layers:
+            continue
+
+        # each entry is a node and an iterator over its children still to visit
+        node_child_layers[root_node_id] = node_layer_bits.get(root_node_id, 0)
+        stack = [(root_node_id, iter(dependencies.get(root_node_id, ())))]
+        while stack:
+            node_id, child_node_ids = stack[-1]
+            for child_node_id in child_node_ids:
+                if child_node_id not in node_child_layers:
+                    node_child_layers[child_node_id] = node_layer_bits.get(
+                        child_node_id, 0
+                    )
+                    stack.append(
+                        (child_node_id, iter(dependencies.get(child_node_id, ())))
+                    )
+                    break
+                node_child_layers[node_id] |= node_child_layers[child_node_id]
+            else:
+                stack.pop()
+                if stack:
+                    node_child_layers[stack[-1][0]] |= node_child_layers[node_id]
+
+    return node_child_layers
+
+
 def sort_layers(
-    nodes: Dict[str, GraphNode], dependencies: Dict[str, Set[str]]
+    nodes: Mapping[str, GraphNode], dependencies: Mapping[str, Set[str]]
 ) -> List[str]:
     """Given a DAG represented by a dictionary of nodes, some of which have a `layer` attribute,
     along with their dependencies, return the list of all layers sorted according to
@@ -27,13 +72,15 @@ def sort_layers(
 
     In theory, this is a problem of finding the
     [transitive closure](https://en.wikipedia.org/wiki/Transitive_closure) in a graph of layers
-    and then toposort them. The algorithm below follows a repeated depth-first search approach:
-        * For every node, find all layers that depends on it in a depth-first search.
-        * While traversing, build up a dictionary of {node_id -> layers} for the node
-        that have already been visited.
-        * Turn the final {node_id -> layers} into a {layer -> layers} to represent the layers'
-        dependencies. Note: the key is a layer and the values are the parents of that layer,
-        just because that's the format TopologicalSorter requires.
+    and then toposort them. The algorithm below works without recursion as follows:
+        * Give every layer a bit, so that a set of layers is a single integer bitmask.
+        * For every node, find all layers that depend on it in an iterative depth-first search.
+        A node's layers are the union of its own layer and the layers of its children,
+        so they are propagated from the children once all of them have been visited,
+        i.e. in reverse topological order, and each node is visited only once.
+        * Turn these {node -> layers} bitmasks into a {layer -> layers} dictionary
+        to represent the layers' dependencies. Note: the key is a layer and the values
+        are the parents of that layer, just because that's the format TopologicalSorter requires.
         * Takes layers dictionary to ``graphlib.TopologicalSorter`` and return the sorted values.
         * Raise CycleError if the layers cannot be sorted topologically,
         i.e. there are cycles among the layers.
@@ -49,79 +96,47 @@ def sort_layers(
     Raises:
         CycleError: When the layers have cyclic dependencies.
     """
-    node_layers: Dict[str, Set[str]] = {}  # map node_id to the layers that depend on it
-
-    def find_child_layers(node_id: str) -> Set[str]:
-        """For the given node_id, find all layers that depend on it in a depth-first manner.
-        Build up the node_layers dependency dictionary while traversing so each node is visited
-        only once.
-        Note: Python's default recursive depth limit is 1000, which means this algorithm won't
-        work for pipeline with more than 1000 nodes. However, we can rewrite this using stack if
-        we run into this limit in practice.
-        """
-        if node_id in node_layers:
-            return node_layers[node_id]
-
-        node_layers[node_id] = set()
-
-        # The layer of the current node can also be considered as depending on that node.
-        # This is to cater for the edge case where all nodes are completely disjoint from each other
-        # and no dependency graph for layers can be constructed,
-        # yet the layers still need to be displayed.
-        node_layer = getattr(nodes[node_id], "layer", None)
-        if node_layer is not None:
-            node_layers[node_id].add(node_layer)
-
-        # for each child node of the given node_id,
-        # mark its layer and all layers that depend on it as child layers of the given node_id.
-        for child_node_id in dependencies[node_id]:
-            child_node = nodes[child_node_id]
-            child_layer = getattr(child_node, "layer", None)
-            if child_layer is not None:
-                node_layers[node_id].add(child_layer)
-            node_layers[node_id].update(find_child_layers(child_node_id))
-
-        return node_layers[node_id]
-
-    # populate node_layers dependencies
-    for node_id in sorted(nodes):  # Sort nodes
-        find_child_layers(node_id)
-
-    # compute the layer dependencies dictionary based on the node_layers dependencies,
-    # represented as {layer -> set(parent_layers)}
-    layer_dependencies = defaultdict(set)
-    all_layers = set()  # keep track of all layers encountered
-    for node_id, child_layers in node_layers.items():
-        node_layer = getattr(nodes[node_id], "layer", None)
-        if node_layer is not None:
-            all_layers.add(node_layer)
-            for layer in child_layers:
-                all_layers.add(layer)
-                # Avoid adding the node's layer as a parent of itself
-                if layer != node_layer:
-                    layer_dependencies[layer].add(node_layer)
-
-    # Add empty dependencies for all layers to ensure they appear in the sorting
-    for layer in all_layers:
-        if layer not in layer_dependencies:
-            layer_dependencies[layer] = set()
-
-    # Sort `layer_dependencies` keys for consistent ordering of layers with the same dependencies
-    layer_dependencies = defaultdict(
-        set, {k: layer_dependencies[k] for k in sorted(layer_dependencies)}
+    # Give every layer a bit, so that a set of layers is a single integer bitmask.
+    # The layer of a node is also considered as depending on that node.
+    # This is to cater for the edge case where all nodes are completely disjoint from each other
+    # and no dependency graph for layers can be constructed,
+    # yet the layers still need to be displayed.
+    node_layers: Dict[str, str] = {}  # map node_id to its layer
+    for node_id, node in nodes.items():
+        layer = getattr(node, "layer", None)
+        if layer is not None:
+            node_layers[node_id] = layer
+    layers = sorted(set(node_layers.values()))
+    layer_bits = {layer: 1 << index for index, layer in enumerate(layers)}
+
+    node_child_layers = _find_child_layers(
+        nodes,
+        {node_id: layer_bits[layer] for node_id, layer in node_layers.items()},
+        dependencies,
     )
 
+    # compute the layer dependencies dictionary based on the layers depending on
+    # each node with a layer, represented as {layer -> set(parent_layers)}
+    layer_child_layers = dict.fromkeys(layers, 0)
+    for node_id, layer in node_layers.items():
+        layer_child_layers[layer] |= node_child_layers[node_id]
+
+    # The parents of each layer are listed alphabetically, and the layers are
+    # added to the sorter alphabetically, for a consistent ordering of layers
+    # with the same dependencies.
+    layer_dependencies: Dict[str, List[str]] = {layer: [] for layer in layers}
+    for layer, child_layers in layer_child_layers.items():
+        # Avoid adding the node's layer as a parent of itself
+        remaining_child_layers = child_layers & ~layer_bits[layer]
+        while remaining_child_layers:
+            lowest_bit = remaining_child_layers & -remaining_child_layers
+            remaining_child_layers ^= lowest_bit
+            layer_dependencies[layers[lowest_bit.bit_length() - 1]].append(layer)
+
     # Use graphlib.TopologicalSorter to sort the layer dependencies.
     try:
         sorter = TopologicalSorter(layer_dependencies)
-        sorted_layers = list(sorter.static_order())
-        # Ensure the order is stable and respects the original input order
-        # `sorted_layers.index(layer)` ensures the order from topological sorting is preserved.
-        # `layer` ensures that if two layers have the same dependency level,
-        # they are sorted alphabetically.
-        return sorted(
-            sorted_layers, key=lambda layer: (sorted_layers.index(layer), layer)
-        )
+        return list(sorter.static_order())
     except CycleError as e:
         logger.warning(
             "Layers visualisation is disabled as circular dependency detected among layers. "
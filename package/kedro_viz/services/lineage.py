@@ -0,0 +1,310 @@
+"""`kedro_viz.services.lineage` defines lineage-related logic, i.e. finding
+the nodes upstream and downstream of a node in a registered pipeline."""
+
+import logging
+from bisect import bisect_right
+from collections import deque
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple, Union
+
+from kedro_viz.models.flowchart.edge import GraphEdge
+
+from .reachability import IndexedGraph
+
+logger = logging.getLogger(__name__)
+
+# An inclusive range of post-order numbers
+Interval = Tuple[int, int]
+
+# The average number of intervals per node above which a lineage index gives up
+# on its reachability indexes and searches the graph on every query instead.
+# Densely connected graphs, e.g. random ones, can't be covered by a few intervals
+# per node, and their indexes would take far longer to build and far more memory
+# than searching the graph for the few lineages that are ever requested.
+MAX_INTERVALS_PER_NODE = 16
+
+
+class IndexTooLargeError(Exception):
+    """Raised when a reachability index would need more intervals than allowed."""
+
+
+def _merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """Merge sorted intervals which overlap or are adjacent into disjoint intervals.
+
+    Example:
+        >>> _merge_intervals([(0, 2), (1, 3), (4, 4), (6, 7)])
+        [(0, 4), (6, 7)]
+    """
+    merged_intervals: List[Interval] = []
+    for start, end in intervals:
+        if merged_intervals and start <= merged_intervals[-1][1] + 1:
+            if end > merged_intervals[-1][1]:
+                merged_intervals[-1] = (merged_intervals[-1][0], end)
+        else:
+            merged_intervals.append((start, end))
+    return merged_intervals
+
+
+class ReachabilityIndex:
+    """Index the nodes reachable from every node of a directed graph as a compressed
+    transitive closure, following the interval labelling of Agrawal et al.:
+        * Every strongly connected component of the graph is given a post-order number
+        in a depth-first spanning forest of the components, so the components below
+        a component in the spanning forest have consecutive numbers.
+        * The components reachable from a component are then stored as the few disjoint
+        intervals of post-order numbers covering its own spanning subtree and everything
+        reachable from its other successors, computed in reverse topological order.
+
+    Checking whether a node is reachable from another is a binary search over
+    the intervals of the latter, and listing the reachable nodes only costs
+    as much as the number of nodes listed.
+
+    Args:
+        graph: The graph to index.
+        max_intervals: The number of intervals the index may store, if bounded.
+
+    Raises:
+        IndexTooLargeError: When the index would need more than ``max_intervals``.
+
+    Example:
+        >>> graph = IndexedGraph(
+        ...     [GraphEdge(source="a", target="b"), GraphEdge(source="b", target="c")]
+        ... )
+        >>> index = ReachabilityIndex(graph)
+        >>> index.get_reachable_node_ids("a")
+        ['c', 'b']
+        >>> index.is_reachable("c", "a")
+        False
+    """
+
+    def __init__(self, graph: IndexedGraph, max_intervals: Optional[int] = None):
+        self._node_indexes = graph.node_indexes
+        # components are numbered in reverse topological order
+        self._components = graph.find_strongly_connected_components()
+        num_components = max(self._components, default=-1) + 1
+
+        component_successors: List[List[int]] = [[] for _ in range(num_components)]
+        for node, successors in enumerate(graph.successors):
+            for successor in successors:
+                if self._components[node] != self._components[successor]:
+                    component_successors[self._components[node]].append(
+                        self._components[successor]
+                    )
+
+        # the post-order number of every component and the lowest post-order number
+        # in its spanning subtree, which is the next number to give out on visiting it
+        self._post_order = [-1] * num_components
+        subtree_start = [-1] * num_components
+        counter = 0
+        # visit the components in topological order, so the spanning forest
+        # is rooted at the components nobody reaches
+        for root in reversed(range(num_components)):
+            if subtree_start[root] != -1:
+                continue
+
+            subtree_start[root] = counter
+            stack = [(root, iter(component_successors[root]))]
+            while stack:
+                component, successors_to_visit = stack[-1]
+                for successor in successors_to_visit:
+                    if subtree_start[successor] == -1:
+                        subtree_start[successor] = counter
+                        stack.append((successor, iter(component_successors[successor])))
+                        break
+                else:
+                    stack.pop()
+                    self._post_order[component] = counter
+                    counter += 1
+
+        # the nodes sorted by the post-order number of their component, along with
+        # the position of the first node of every post-order number, so that the nodes
+        # of an interval are a single slice of the list
+        self._node_ids_by_post_order = sorted(
+            graph.node_ids,
+            key=lambda node_id: self._post_order[
+                self._components[self._node_indexes[node_id]]
+            ],
+        )
+        self._post_order_positions = [0] * (num_components + 1)
+        for component in self._components:
+            self._post_order_positions[self._post_order[component] + 1] += 1
+        self._post_order_positions = list(accumulate(self._post_order_positions))
+
+        self._intervals = self._find_intervals(
+            component_successors, subtree_start, max_intervals
+        )
+
+    def _find_intervals(
+        self,
+        component_successors: List[List[int]],
+        subtree_start: List[int],
+        max_intervals: Optional[int],
+    ) -> List[List[Interval]]:
+        # every component only reaches components with a smaller number,
+        # whose intervals are therefore complete by the time it is visited
+        all_intervals: List[List[Interval]] = []
+        num_intervals = 0
+        for component, successors in enumerate(component_successors):
+            intervals = [(subtree_start[component], self._post_order[component])]
+            for successor in successors:
+                intervals.extend(all_intervals[successor])
+                # checked before merging as well, so that a single component
+                # can't take more than the allowed intervals to merge
+                if max_intervals is not None and (
+                    num_intervals + len(intervals) > max_intervals
+                ):
+                    raise IndexTooLargeError(
+                        f"The reachability index needs more than {max_intervals} intervals."
+                    )
+            merged_intervals = _merge_intervals(sorted(intervals))
+            num_intervals += len(merged_intervals)
+            all_intervals.append(merged_intervals)
+        return all_intervals
+
+    def is_reachable(self, source_node_id: str, target_node_id: str) -> bool:
+        """Check whether there is a path from a node to another, or whether both
+        are the same node. Nodes without any edges can't reach any other node."""
+        source = self._node_indexes.get(source_node_id)
+        target = self._node_indexes.get(target_node_id)
+        if source is None or target is None:
+            return source_node_id == target_node_id
+
+        intervals = self._intervals[self._components[source]]
+        target_post_order = self._post_order[self._components[target]]
+        position = bisect_right(intervals, (target_post_order, len(self._post_order)))
+        return position > 0 and intervals[position - 1][1] >= target_post_order
+
+    def get_reachable_node_ids(self, node_id: str) -> List[str]:
+        """Return the IDs of all nodes reachable from a node, except for the node itself,
+        in post-order of the spanning forest. Nodes without any edges reach no other node.
+        """
+        node = self._node_indexes.get(node_id)
+        if node is None:
+            return []
+
+        reachable_node_ids: List[str] = []
+        for start, end in self._intervals[self._components[node]]:
+            reachable_node_ids.extend(
+                self._node_ids_by_post_order[
+                    self._post_order_positions[start] : self._post_order_positions[
+                        end + 1
+                    ]
+                ]
+            )
+        # a node always reaches its own component
+        reachable_node_ids.remove(node_id)
+        return reachable_node_ids
+
+
+class ReachabilitySearch:
+    """Find the nodes reachable from a node of a directed graph with a breadth-first
+    search on every query, for graphs whose ``ReachabilityIndex`` would be too large.
+    It answers the same queries as ``ReachabilityIndex``, in breadth-first order.
+
+    Args:
+        graph: The graph to search.
+
+    Example:
+        >>> graph = IndexedGraph(
+        ...     [GraphEdge(source="a", target="b"), GraphEdge(source="b", target="c")]
+        ... )
+        >>> search = ReachabilitySearch(graph)
+        >>> search.get_reachable_node_ids("a")
+        ['b', 'c']
+        >>> search.is_reachable("c", "a")
+        False
+    """
+
+    def __init__(self, graph: IndexedGraph):
+        self._graph = graph
+
+    def _search(self, node: int) -> List[int]:
+        # the node itself is only visited as the start of the search
+        visited = {node}
+        reachable_nodes: List[int] = []
+        queue = deque([node])
+        while queue:
+            for successor in self._graph.successors[queue.popleft()]:
+                if successor not in visited:
+                    visited.add(successor)
+                    reachable_nodes.append(successor)
+                    queue.append(successor)
+        return reachable_nodes
+
+    def is_reachable(self, source_node_id: str, target_node_id: str) -> bool:
+        """Check whether there is a path from a node to another, or whether both
+        are the same node. Nodes without any edges can't reach any other node."""
+        source = self._graph.node_indexes.get(source_node_id)
+        target = self._graph.node_indexes.get(target_node_id)
+        if source is None or target is None or source == target:
+            return source_node_id == target_node_id
+        return target in self._search(source)
+
+    def get_reachable_node_ids(self, node_id: str) -> List[str]:
+        """Return the IDs of all nodes reachable from a node, except for the node itself,
+        in breadth-first order. Nodes without any edges reach no other node."""
+        node = self._graph.node_indexes.get(node_id)
+        if node is None:
+            return []
+        return [
+            self._graph.node_ids[reachable_node]
+            for reachable_node in self._search(node)
+        ]
+
+
+class LineageIndex:
+    """Index the ancestors and the descendants of every node of a registered pipeline,
+    with a reachability index for each direction built once from the pipeline's edges.
+    If the indexes would need more than ``max_intervals_per_node`` intervals per node
+    on average, the lineage is searched in the graph on every query instead.
+
+    Args:
+        edges: The edges of the registered pipeline.
+        max_intervals_per_node: The average number of intervals per node
+            the reachability indexes may store.
+
+    Example:
+        >>> index = LineageIndex(
+        ...     [GraphEdge(source="a", target="b"), GraphEdge(source="b", target="c")]
+        ... )
+        >>> index.get_ancestor_ids("c")
+        ['a', 'b']
+        >>> index.get_descendant_ids("b")
+        ['c']
+    """
+
+    def __init__(
+        self,
+        edges: Iterable[GraphEdge],
+        max_intervals_per_node: int = MAX_INTERVALS_PER_NODE,
+    ):
+        graph = IndexedGraph(edges)
+        reversed_graph = graph.reverse()
+        max_intervals = max_intervals_per_node * len(graph.node_ids)
+        self._descendants_index: Union[ReachabilityIndex, ReachabilitySearch]
+        self._ancestors_index: Union[ReachabilityIndex, ReachabilitySearch]
+        try:
+            self._descendants_index = ReachabilityIndex(graph, max_intervals)
+            self._ancestors_index = ReachabilityIndex(reversed_graph, max_intervals)
+        except IndexTooLargeError:
+            logger.info(
+                "The lineage of %d nodes is too densely connected to index, "
+                "it will be searched on every request instead.",
+                len(graph.node_ids),
+            )
+            self._descendants_index = ReachabilitySearch(graph)
+            self._ancestors_index = ReachabilitySearch(reversed_graph)
+
+    def get_ancestor_ids(self, node_id: str) -> List[str]:
+        """Return the IDs of all nodes upstream of a node."""
+        return self._ancestors_index.get_reachable_node_ids(node_id)
+
+    def get_descendant_ids(self, node_id: str) -> List[str]:
+        """Return the IDs of all nodes downstream of a node."""
+        return self._descendants_index.get_reachable_node_ids(node_id)
+
+    def is_ancestor(self, node_id: str, descendant_node_id: str) -> bool:
+        """Check whether a node is upstream of another node."""
+        return node_id != descendant_node_id and self._descendants_index.is_reachable(
+            node_id, descendant_node_id
+        )
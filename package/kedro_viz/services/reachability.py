@@ -0,0 +1,200 @@
+"""`kedro_viz.services.reachability` defines reachability-related logic
+on the graph of a registered pipeline."""
+
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+from kedro_viz.models.flowchart.edge import GraphEdge
+
+
+class IndexedGraph:
+    """Represent a directed graph whose nodes are mapped to consecutive integers,
+    so that graph algorithms can work on plain lists instead of dictionaries of strings.
+
+    Args:
+        edges: The edges of the graph.
+
+    Example:
+        >>> graph = IndexedGraph([GraphEdge(source="a", target="b")])
+        >>> graph.node_ids
+        ['a', 'b']
+        >>> graph.successors
+        [[1], []]
+    """
+
+    def __init__(self, edges: Iterable[GraphEdge]):
+        self.node_ids: List[str] = []
+        self.node_indexes: Dict[str, int] = {}
+        self.successors: List[List[int]] = []
+
+        for edge in edges:
+            source = self._get_or_add_node(edge.source)
+            target = self._get_or_add_node(edge.target)
+            self.successors[source].append(target)
+
+    def _get_or_add_node(self, node_id: str) -> int:
+        index = self.node_indexes.get(node_id)
+        if index is None:
+            index = len(self.node_ids)
+            self.node_indexes[node_id] = index
+            self.node_ids.append(node_id)
+            self.successors.append([])
+        return index
+
+    def reverse(self) -> "IndexedGraph":
+        """Return the graph with all its edges reversed, whose nodes
+        are mapped to the same integers as in this graph.
+
+        Example:
+            >>> graph = IndexedGraph([GraphEdge(source="a", target="b")])
+            >>> graph.reverse().successors
+            [[], [0]]
+        """
+        reversed_graph = IndexedGraph([])
+        reversed_graph.node_ids = self.node_ids
+        reversed_graph.node_indexes = self.node_indexes
+        reversed_graph.successors = [[] for _ in self.node_ids]
+        for node, successors in enumerate(self.successors):
+            for successor in successors:
+                reversed_graph.successors[successor].append(node)
+        return reversed_graph
+
+    def find_strongly_connected_components(self) -> List[int]:
+        """Find the strongly connected components of the graph with an iterative
+        version of Tarjan's algorithm, which visits every node and edge exactly once.
+
+        Returns:
+            The component number of every node, indexed by the node's index.
+            Components are numbered in reverse topological order, i.e. a component
+            can only reach components with a smaller number.
+        """
+        num_nodes = len(self.node_ids)
+        visit_order = [-1] * num_nodes
+        lowest_reachable = [0] * num_nodes
+        components = [-1] * num_nodes
+        on_stack = [False] * num_nodes
+        stack: List[int] = []
+        visit_counter = 0
+        component_counter = 0
+
+        for root in range(num_nodes):
+            if visit_order[root] != -1:
+                continue
+
+            # each entry is a node and the position of its next successor to visit
+            work: List[Tuple[int, int]] = [(root, 0)]
+            while work:
+                node, position = work[-1]
+                if position == 0:
+                    visit_order[node] = lowest_reachable[node] = visit_counter
+                    visit_counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+
+                successors = self.successors[node]
+                while position < len(successors):
+                    successor = successors[position]
+                    position += 1
+                    if visit_order[successor] == -1:
+                        work[-1] = (node, position)
+                        work.append((successor, 0))
+                        break
+                    if on_stack[successor]:
+                        lowest_reachable[node] = min(
+                            lowest_reachable[node], visit_order[successor]
+                        )
+                else:
+                    work.pop()
+                    if lowest_reachable[node] == visit_order[node]:
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            components[member] = component_counter
+                            if member == node:
+                                break
+                        component_counter += 1
+                    if work:
+                        parent = work[-1][0]
+                        lowest_reachable[parent] = min(
+                            lowest_reachable[parent], lowest_reachable[node]
+                        )
+
+        return components
+
+
+def find_bad_modular_pipeline_inputs(
+    edges: Iterable[GraphEdge], modular_pipelines_inputs: Mapping[str, Set[str]]
+) -> List[GraphEdge]:
+    """Given the edges of a registered pipeline including its modular pipeline nodes,
+    find the edges from a modular pipeline's input into the modular pipeline
+    that create a cycle, i.e. where the input is also a descendant of the modular pipeline.
+
+    Modular pipelines are checked in the order of ``modular_pipelines_inputs``
+    and the bad input edges of a modular pipeline are discarded before checking the next one,
+    so that the same set of edges is returned as when searching the descendants of each
+    modular pipeline in turn. Instead of doing that search for every modular pipeline,
+    the algorithm below works as follows:
+        * Find the strongly connected components of the graph in a single pass.
+        An input edge into a modular pipeline can only close a cycle if both ends
+        are in the same component, and any path between them stays within that component.
+        * Only for the modular pipelines in a component with more than one node,
+        search their descendants within the component and discard their bad input edges.
+        Components are usually a handful of nodes, when there are any at all.
+
+    Args:
+        edges: The edges of the registered pipeline.
+        modular_pipelines_inputs: A dictionary of {modular_pipeline_id -> set(input_ids)}.
+
+    Returns:
+        The list of bad input edges to remove from the graph, in the order they are found.
+
+    Example:
+        >>> edges = [
+        ...     GraphEdge(source="a", target="pipeline"),
+        ...     GraphEdge(source="pipeline", target="b"),
+        ...     GraphEdge(source="b", target="a"),
+        ... ]
+        >>> find_bad_modular_pipeline_inputs(edges, {"pipeline": {"a"}})
+        [GraphEdge(source='a', target='pipeline')]
+    """
+    graph = IndexedGraph(edges)
+    components = graph.find_strongly_connected_components()
+
+    component_sizes: Dict[int, int] = {}
+    for component in components:
+        component_sizes[component] = component_sizes.get(component, 0) + 1
+
+    removed_edges: Set[Tuple[int, int]] = set()
+    bad_input_edges: List[GraphEdge] = []
+
+    for modular_pipeline_id, inputs in modular_pipelines_inputs.items():
+        modular_pipeline = graph.node_indexes.get(modular_pipeline_id)
+        if modular_pipeline is None:
+            continue
+        component = components[modular_pipeline]
+        if component_sizes[component] == 1:
+            continue
+
+        # depth-first search of the descendants within the component,
+        # ignoring the edges discarded for previous modular pipelines
+        descendants: Set[int] = set()
+        stack = [modular_pipeline]
+        while stack:
+            node = stack.pop()
+            for successor in graph.successors[node]:
+                if (
+                    components[successor] == component
+                    and successor not in descendants
+                    and (node, successor) not in removed_edges
+                ):
+                    descendants.add(successor)
+                    stack.append(successor)
+
+        for input_id in sorted(inputs):
+            input_node = graph.node_indexes.get(input_id)
+            if input_node is not None and input_node in descendants:
+                removed_edges.add((input_node, modular_pipeline))
+                bad_input_edges.append(
+                    GraphEdge(source=input_id, target=modular_pipeline_id)
+                )
+
+    return bad_input_edges
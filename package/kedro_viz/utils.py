@@ -1,20 +1,28 @@
 """Transcoding related utility functions."""
 
 import hashlib
+import logging
+import os
 import sys
 import threading
 import time
 from itertools import cycle
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from pathspec import GitIgnoreSpec
 
 TRANSCODING_SEPARATOR = "@"
+ID_LENGTH = 8
 
+MAX_WORKERS_ENV_VAR = "KEDRO_VIZ_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 8
 
-def _hash(value: str):
-    return hashlib.sha1(value.encode("UTF-8")).hexdigest()[:8]
+logger = logging.getLogger(__name__)
+
+
+def _hash(value: str, length: int = ID_LENGTH):
+    return hashlib.sha1(value.encode("UTF-8")).hexdigest()[:length]
 
 
 def _hash_input_output(item: str) -> str:
@@ -26,6 +34,121 @@ def _hash_input_output(item: str) -> str:
     )
 
 
+class IdRegistry:
+    """Central registry for the IDs of Kedro nodes and datasets.
+    The ID of a node is the hash of its string representation and the ID of
+    a dataset is the hash of its name without the transcoding part.
+
+    IDs are truncated hashes, so two different nodes or datasets can end up with
+    the same ID in very large projects. The registry keeps track of the string each
+    ID was allocated for and, on a collision, widens the ID of the string allocated
+    last to the shortest longer prefix of its hash that isn't taken yet.
+    IDs of projects without collisions are unaffected. Allocating the IDs of all nodes
+    and datasets up front with ``allocate_ids`` makes the widened IDs independent
+    of the order in which nodes and datasets are looked up.
+
+    The IDs are kept by the string they were allocated for until ``clear`` is called,
+    so they grow with the number of distinct nodes and datasets, and no reference
+    to any Kedro node is kept.
+
+    Example:
+        >>> registry = IdRegistry()
+        >>> registry.get_dataset_id("model_inputs@pandas")
+        '0ecea0de'
+        >>> registry.get_dataset_id("model_inputs") is registry.get_dataset_id("model_inputs")
+        True
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # The string every ID was allocated for, used to detect collisions,
+        # and the other way round.
+        self._id_owners: Dict[str, str] = {}
+        self._ids: Dict[str, str] = {}
+
+    def _allocate_id(self, value: str) -> str:
+        allocated_id = self._ids.get(value)
+        if allocated_id is not None:
+            return allocated_id
+
+        allocated_id = colliding_id = _hash(value)
+        with self._lock:
+            length = len(allocated_id)
+            owner = self._id_owners.get(allocated_id)
+            # Widen the ID until it's either free or already allocated for this value.
+            # This terminates as different values have different full SHA-1 hashes,
+            # and finds the same ID every time as allocated IDs are never released.
+            while owner is not None and owner != value:
+                length += 1
+                allocated_id = _hash(value, length)
+                owner = self._id_owners.get(allocated_id)
+            if owner is not None:
+                return self._ids[value]
+
+            if allocated_id != colliding_id:
+                logger.info(
+                    "The ID %s of %s collides with the ID of %s and was widened to %s.",
+                    colliding_id,
+                    value,
+                    self._id_owners[colliding_id],
+                    allocated_id,
+                )
+            self._id_owners[allocated_id] = value
+            self._ids[value] = allocated_id
+            return allocated_id
+
+    def allocate_ids(self, nodes: Iterable[Any], dataset_names: Iterable[str]):
+        """Allocate the IDs of the given Kedro nodes and datasets in sorted order,
+        so that any colliding ID is widened in the same way regardless of the order
+        in which they are looked up afterwards.
+
+        Args:
+            nodes: The Kedro nodes to allocate IDs for.
+            dataset_names: The names of the datasets to allocate IDs for.
+        """
+        values = {str(node) for node in nodes}
+        values.update(
+            _strip_transcoding(dataset_name) for dataset_name in dataset_names
+        )
+        with self._lock:
+            for value in sorted(values):
+                self._allocate_id(value)
+
+    def allocate_pipeline_ids(self, pipelines: Iterable[Any]):
+        """Allocate the IDs of all nodes and datasets of the given Kedro pipelines,
+        e.g. of all registered pipelines of a project, with ``allocate_ids``.
+
+        Args:
+            pipelines: The Kedro pipelines to allocate IDs for.
+        """
+        pipelines = list(pipelines)
+        self.allocate_ids(
+            (node for pipeline in pipelines for node in pipeline.nodes),
+            {
+                dataset_name
+                for pipeline in pipelines
+                for dataset_name in pipeline.datasets()
+            },
+        )
+
+    def get_node_id(self, node: Any) -> str:
+        """Return the ID of a Kedro node."""
+        return self._allocate_id(str(node))
+
+    def get_dataset_id(self, dataset_name: str) -> str:
+        """Return the ID of a dataset, which is shared by all its transcoded versions."""
+        return self._allocate_id(_strip_transcoding(dataset_name))
+
+    def clear(self):
+        """Forget all allocated IDs."""
+        with self._lock:
+            self._id_owners.clear()
+            self._ids.clear()
+
+
+id_registry = IdRegistry()
+
+
 def _transcode_split(element: str) -> Tuple[str, str]:
     """Split the name by the transcoding separator.
     If the transcoding part is missing, empty string will be put in.
@@ -61,6 +184,37 @@ def _strip_transcoding(element: str) -> str:
     return _transcode_split(element)[0]
 
 
+def parse_limit(name: str, value: str) -> int:
+    """Parse the value of a limit, e.g. the maximum number of worker threads.
+
+    Raises:
+        ValueError: If the value isn't a positive integer.
+    """
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        raise ValueError(
+            f"The limit of '{name}' must be a positive integer, got '{value}'."
+        )
+    return limit
+
+
+def get_max_workers() -> int:
+    """Get the maximum number of worker threads running blocking work at once,
+    e.g. for the REST routes or dataset previews, as set by the
+    `KEDRO_VIZ_MAX_WORKERS` environment variable.
+
+    Raises:
+        ValueError: If the limit isn't a positive integer.
+    """
+    value = os.getenv(MAX_WORKERS_ENV_VAR)
+    if value is None:
+        return DEFAULT_MAX_WORKERS
+    return parse_limit(MAX_WORKERS_ENV_VAR, value)
+
+
 def is_dataset_param(dataset_name: str) -> bool:
     """Return whether a dataset is a parameter"""
     return dataset_name.lower().startswith("params:") or dataset_name == "parameters"
@@ -18,10 +18,27 @@ from kedro_viz.data_access.repositories.modular_pipelines import (
     ModularPipelinesRepository,
 )
 from kedro_viz.integrations.kedro.hooks import DatasetStatsHook
-from kedro_viz.models.flowchart.node_metadata import DataNodeMetadata
+from kedro_viz.models.flowchart import model_utils
 from kedro_viz.models.flowchart.nodes import GraphNode
 from kedro_viz.models.metadata import NodeExtras
 from kedro_viz.server import populate_data
+from kedro_viz.utils import id_registry
+
+
+@pytest.fixture(autouse=True)
+def clear_id_registry():
+    # IDs are memoised globally, so make sure tests patching the hash function
+    # don't share IDs with other tests
+    id_registry.clear()
+    yield
+    id_registry.clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_preview_runner(mocker):
+    # previews still running are joined by name, so make sure previews abandoned
+    # by a test aren't joined by the previews of the same datasets in other tests
+    mocker.patch.object(model_utils, "_preview_runner", model_utils._PreviewRunner())
 
 
 @pytest.fixture
@@ -554,10 +571,6 @@ def example_api_for_edge_case_pipelines(
 
     # For readability we are not hashing the node id
     mocker.patch("kedro_viz.utils._hash", side_effect=lambda value: value)
-    mocker.patch(
-        "kedro_viz.data_access.repositories.modular_pipelines._hash",
-        side_effect=lambda value: value,
-    )
 
     populate_data(
         data_access_manager,
@@ -587,10 +600,6 @@ def example_api_for_pipelines_with_additional_tags(
 
     # For readability we are not hashing the node id
     mocker.patch("kedro_viz.utils._hash", side_effect=lambda value: value)
-    mocker.patch(
-        "kedro_viz.data_access.repositories.modular_pipelines._hash",
-        side_effect=lambda value: value,
-    )
 
     populate_data(
         data_access_manager,
@@ -758,11 +767,6 @@ def pipeline_with_data_sets_mock():
     return pipeline
 
 
-@pytest.fixture(autouse=True)
-def reset_is_all_previews_enabled():
-    DataNodeMetadata.is_all_previews_enabled = True
-
-
 @pytest.fixture
 def example_modular_pipelines_repo_obj():
     modular_pipelines_repo_obj = ModularPipelinesRepository()
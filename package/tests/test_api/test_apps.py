@@ -114,3 +114,23 @@ class TestRegisteredPipelineEndpoint:
 
         if response.status_code == 200:
             assert response.json()["selected_pipeline"] == pipeline_id
+
+
+class TestCreateAPIAppFromProject:
+    def test_invalid_limits_fail_on_creation(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", "-1")
+
+        with pytest.raises(
+            ValueError,
+            match="The limit of 'KEDRO_VIZ_MAX_WORKERS' must be a positive integer",
+        ):
+            apps.create_api_app_from_project(mock.MagicMock())
+
+    def test_invalid_cache_settings_fail_on_creation(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_NODE_METADATA_CACHE_TTL", "soon")
+
+        with pytest.raises(
+            ValueError,
+            match="The node metadata cache size and TTL must be positive numbers",
+        ):
+            apps.create_api_app_from_project(mock.MagicMock())
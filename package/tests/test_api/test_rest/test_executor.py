@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kedro_viz.api.rest.executor import (
+    DEFAULT_ENDPOINT_LIMITS,
+    get_endpoint_limits,
+    run_blocking,
+    validate_limits,
+)
+from kedro_viz.utils import DEFAULT_MAX_WORKERS, get_max_workers
+
+
+class TestExecutorConfiguration:
+    def test_get_max_workers_default(self, monkeypatch):
+        monkeypatch.delenv("KEDRO_VIZ_MAX_WORKERS", raising=False)
+        assert get_max_workers() == DEFAULT_MAX_WORKERS
+
+    def test_get_max_workers_from_env(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", "16")
+        assert get_max_workers() == 16
+
+    @pytest.mark.parametrize("value", ["0", "-1", "many"])
+    def test_get_max_workers_invalid(self, value, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", value)
+        with pytest.raises(
+            ValueError,
+            match=f"The limit of 'KEDRO_VIZ_MAX_WORKERS' must be a positive integer, "
+            f"got '{value}'.",
+        ):
+            get_max_workers()
+
+    def test_get_endpoint_limits_default(self, monkeypatch):
+        monkeypatch.delenv("KEDRO_VIZ_ENDPOINT_LIMITS", raising=False)
+        assert get_endpoint_limits() == DEFAULT_ENDPOINT_LIMITS
+
+    def test_get_endpoint_limits_from_env(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_ENDPOINT_LIMITS", " nodes = 8,deploy=2,")
+        assert get_endpoint_limits() == {
+            **DEFAULT_ENDPOINT_LIMITS,
+            "nodes": 8,
+            "deploy": 2,
+        }
+
+    def test_get_endpoint_limits_unsupported_endpoint(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_ENDPOINT_LIMITS", "lineage=2")
+        with pytest.raises(
+            ValueError,
+            match="Endpoint 'lineage' is not supported. Supported endpoints are: "
+            "nodes, pipelines, run_status, metadata, deploy.",
+        ):
+            get_endpoint_limits()
+
+    def test_get_endpoint_limits_invalid_limit(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_ENDPOINT_LIMITS", "nodes")
+        with pytest.raises(
+            ValueError,
+            match="The limit of 'nodes' must be a positive integer, got ''.",
+        ):
+            get_endpoint_limits()
+
+    @pytest.mark.parametrize(
+        "env_var, value",
+        [("KEDRO_VIZ_MAX_WORKERS", "0"), ("KEDRO_VIZ_ENDPOINT_LIMITS", "lineage=2")],
+    )
+    def test_validate_limits_invalid(self, env_var, value, monkeypatch):
+        monkeypatch.setenv(env_var, value)
+        with pytest.raises(ValueError):
+            validate_limits()
+
+    def test_validate_limits(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", "16")
+        monkeypatch.setenv("KEDRO_VIZ_ENDPOINT_LIMITS", "nodes=8")
+        validate_limits()
+
+
+class TestRunBlocking:
+    async def test_run_blocking_in_worker_thread(self):
+        thread, value = await run_blocking(
+            "nodes", lambda value: (threading.current_thread(), value), 1
+        )
+        assert thread is not threading.current_thread()
+        assert value == 1
+
+    async def test_run_blocking_raises_exceptions(self):
+        def fail():
+            raise KeyError("missing")
+
+        with pytest.raises(KeyError, match="missing"):
+            await run_blocking("nodes", fail)
+
+    async def test_run_blocking_keeps_event_loop_responsive(self):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await run_blocking("deploy", time.sleep, 0.2)
+        ticker.cancel()
+        assert ticks > 5
+
+    @pytest.mark.parametrize(
+        "endpoint_limits, max_workers, expected_concurrency",
+        [("nodes=2", "8", 2), ("nodes=8", "3", 3)],
+    )
+    async def test_run_blocking_limits_concurrency(
+        self, endpoint_limits, max_workers, expected_concurrency, monkeypatch
+    ):
+        # the limiters are created on first use in the event loop of this test
+        monkeypatch.setenv("KEDRO_VIZ_ENDPOINT_LIMITS", endpoint_limits)
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", max_workers)
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def work():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(run_blocking("nodes", work) for _ in range(8)))
+        assert max_running == expected_concurrency
+
+    async def test_run_blocking_endpoints_are_limited_separately(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_ENDPOINT_LIMITS", "deploy=1")
+        release = threading.Event()
+
+        deploy = asyncio.ensure_future(run_blocking("deploy", release.wait))
+        # the deploy limit doesn't hold up the other endpoints
+        assert await run_blocking("nodes", lambda: "done") == "done"
+        assert not deploy.done()
+        release.set()
+        assert await deploy is True
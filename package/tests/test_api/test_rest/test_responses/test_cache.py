@@ -0,0 +1,43 @@
+from kedro_viz.api.rest.responses.nodes import NodeMetadataCache
+from kedro_viz.models.flowchart.preview_cache import PreviewCache
+
+
+def test_cache_stats(client, mocker):
+    cache = NodeMetadataCache(max_size=1024 * 1024, ttl=60)
+    mocker.patch("kedro_viz.api.rest.responses.nodes.node_metadata_cache", new=cache)
+    mocker.patch("kedro_viz.api.rest.responses.cache.node_metadata_cache", new=cache)
+    mocker.patch(
+        "kedro_viz.api.rest.responses.cache.preview_cache",
+        new=PreviewCache(max_size=1024),
+    )
+    node_response = client.get("/api/nodes/f1f1425b")
+    client.get("/api/nodes/f1f1425b")
+    client.get("/api/nodes/unknown")
+
+    response = client.get("/api/cache/stats")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "node_metadata": {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+            "coalesced": 0,
+            "entries": 1,
+            "size": len(node_response.content),
+            "max_size": 1024 * 1024,
+            "ttl": 60.0,
+        },
+        "previews": {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "coalesced": 0,
+            "entries": 0,
+            "size": 0,
+            "max_size": 1024,
+            "ttl": None,
+        },
+    }
@@ -0,0 +1,122 @@
+import gzip
+
+import pytest
+
+from kedro_viz.api.rest.responses import compression
+from kedro_viz.api.rest.responses.compression import (
+    compress,
+    get_compressed_etag,
+    get_content_encoded_response,
+    get_supported_content_encodings,
+    select_content_encoding,
+)
+
+
+@pytest.fixture
+def without_optional_compressors(mocker):
+    mocker.patch.object(compression, "brotli", None)
+    mocker.patch.object(compression, "zstandard", None)
+
+
+@pytest.fixture
+def with_optional_compressors(mocker):
+    brotli = mocker.patch.object(compression, "brotli")
+    brotli.compress.return_value = b"brotli"
+    zstandard = mocker.patch.object(compression, "zstandard")
+    zstandard.ZstdCompressor.return_value.compress.return_value = b"zstd"
+    return brotli, zstandard
+
+
+class TestSupportedContentEncodings:
+    def test_only_gzip_without_optional_compressors(self, without_optional_compressors):
+        assert get_supported_content_encodings() == ["gzip"]
+
+    def test_optional_compressors_are_preferred(self, with_optional_compressors):
+        assert get_supported_content_encodings() == ["br", "zstd", "gzip"]
+
+
+class TestCompress:
+    def test_compress_with_gzip(self):
+        content = b'{"nodes": []}' * 100
+        compressed_content = compress(content, "gzip")
+
+        assert gzip.decompress(compressed_content) == content
+        assert len(compressed_content) < len(content)
+        # the compressed content does not depend on the time it was compressed at
+        assert compress(content, "gzip") == compressed_content
+
+    def test_compress_with_optional_compressors(self, with_optional_compressors):
+        brotli, zstandard = with_optional_compressors
+
+        assert compress(b"content", "br") == b"brotli"
+        brotli.compress.assert_called_once_with(
+            b"content", quality=compression.BROTLI_QUALITY
+        )
+        assert compress(b"content", "zstd") == b"zstd"
+        zstandard.ZstdCompressor.assert_called_once_with(level=compression.ZSTD_LEVEL)
+
+    def test_compress_with_unsupported_content_encoding(
+        self, without_optional_compressors
+    ):
+        with pytest.raises(
+            ValueError,
+            match="Content encoding 'br' is not supported. "
+            "Supported content encodings are: gzip.",
+        ):
+            compress(b"content", "br")
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("GZIP", "gzip"),
+        ("gzip, deflate, br, zstd", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("gzip, br;q=0", "gzip"),
+        ("zstd;q=0.8, br;q=0.8", "br"),
+        ("*", "br"),
+        ("*;q=0.5, br;q=0", "zstd"),
+        ("gzip;q=0", None),
+        ("gzip;q=invalid", None),
+        ("gzip;q=0.5, identity", None),
+        ("deflate", None),
+        ("gzip;level=1", "gzip"),
+        (" , gzip", "gzip"),
+    ],
+)
+def test_select_content_encoding(accept_encoding, expected, with_optional_compressors):
+    assert select_content_encoding(accept_encoding) == expected
+
+
+def test_select_content_encoding_without_optional_compressors(
+    without_optional_compressors,
+):
+    assert select_content_encoding("gzip, deflate, br, zstd") == "gzip"
+    assert select_content_encoding("br") is None
+
+
+def test_get_compressed_etag():
+    assert get_compressed_etag('"abc"', "gzip") == '"abc-gzip"'
+
+
+class TestGetContentEncodedResponse:
+    def test_uncompressed_response(self):
+        response = get_content_encoded_response(b"{}", '"abc"')
+
+        assert response.body == b"{}"
+        assert response.media_type == "application/json"
+        assert response.headers["ETag"] == '"abc"'
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert "Content-Encoding" not in response.headers
+
+    def test_compressed_response(self):
+        response = get_content_encoded_response(b"compressed", '"abc"', "gzip")
+
+        assert response.body == b"compressed"
+        assert response.headers["ETag"] == '"abc-gzip"'
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["Content-Encoding"] == "gzip"
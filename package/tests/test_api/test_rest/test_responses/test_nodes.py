@@ -1,9 +1,26 @@
+import gzip
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
+import pytest
 from fastapi.testclient import TestClient
 
-from kedro_viz.models.flowchart.nodes import TaskNode
+import kedro_viz.api.rest.responses.nodes
+from kedro_viz.api.rest.requests import MAX_NODES_METADATA_BATCH_SIZE
+from kedro_viz.api.rest.responses.compression import get_compressed_etag
+from kedro_viz.api.rest.responses.nodes import (
+    NodeMetadataCache,
+    get_encoded_node_metadata_response,
+    get_node_metadata_response,
+)
+from kedro_viz.api.rest.responses.utils import get_etag
+from kedro_viz.models.flowchart.nodes import DataNode, TaskNode
 from tests.test_api.test_rest.test_responses.assert_helpers import (
     assert_example_transcoded_data,
 )
@@ -65,6 +82,21 @@ class TestNodeMetadataEndpoint:
             "stats": {"columns": 12, "rows": 29768},
         }
 
+    def test_data_node_metadata_without_previews(self, client):
+        response = get_node_metadata_response("0ecea0de", is_all_previews_enabled=False)
+
+        assert response.preview_type is None
+        # the previews are only disabled for that response
+        assert client.get("/api/nodes/0ecea0de").json()["preview_type"] == (
+            "TablePreview"
+        )
+
+    def test_node_metadata_response_for_unknown_node(self, client):
+        response = get_node_metadata_response("unknown")
+
+        assert response.status_code == 404
+        assert response.body == b'{"message":"Invalid node ID"}'
+
     def test_data_node_metadata_for_free_input(self, client):
         response = client.get("/api/nodes/13399a82")
         assert response.json() == {
@@ -89,3 +121,563 @@ class TestNodeMetadataEndpoint:
         with mock.patch.object(TaskNode, "has_metadata", return_value=False):
             response = client.get("/api/nodes/782e4a43")
         assert response.json() == {}
+
+
+class TestNodeMetadataETag:
+    @pytest.mark.parametrize("node_id", ["782e4a43", "0ecea0de", "f1f1425b"])
+    def test_response_has_content_hash_etag(self, client, node_id):
+        response = client.get(
+            f"/api/nodes/{node_id}", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == get_etag(response.content)
+
+    def test_not_modified_when_etag_matches(self, client):
+        etag = client.get("/api/nodes/782e4a43").headers["ETag"]
+        response = client.get(
+            "/api/nodes/782e4a43", headers={"If-None-Match": f'W/{etag}, "other"'}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    def test_full_response_when_etag_differs(self, client):
+        response = client.get(
+            "/api/nodes/782e4a43", headers={"If-None-Match": '"outdated"'}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["inputs"]
+
+    def test_no_metadata_has_etag(self, client):
+        with mock.patch.object(TaskNode, "has_metadata", return_value=False):
+            response = client.get("/api/nodes/782e4a43")
+
+        assert response.json() == {}
+        assert response.headers["ETag"] == get_etag(b"{}")
+
+    def test_node_not_exist_has_no_etag(self, client):
+        response = client.get("/api/nodes/foo", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+
+class TestNodeMetadataCompression:
+    def test_large_response_is_compressed(self, client, mocker):
+        mocker.patch("kedro_viz.api.rest.responses.nodes.MIN_COMPRESSED_SIZE", new=10)
+        uncompressed_response = client.get(
+            "/api/nodes/782e4a43", headers={"Accept-Encoding": "identity"}
+        )
+        response = client.get(
+            "/api/nodes/782e4a43", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["ETag"] == get_compressed_etag(
+            uncompressed_response.headers["ETag"], "gzip"
+        )
+        assert response.json() == uncompressed_response.json()
+
+    def test_compressed_response_is_served_from_cache(self, client, mocker):
+        mocker.patch("kedro_viz.api.rest.responses.nodes.MIN_COMPRESSED_SIZE", new=10)
+        mocker.patch(
+            "kedro_viz.api.rest.responses.nodes.node_metadata_cache",
+            new=NodeMetadataCache(),
+        )
+        compress = mocker.spy(kedro_viz.api.rest.responses.nodes, "compress")
+        response = client.get(
+            "/api/nodes/782e4a43", headers={"Accept-Encoding": "gzip"}
+        )
+        cached_response = client.get(
+            "/api/nodes/782e4a43", headers={"Accept-Encoding": "gzip"}
+        )
+
+        compress.assert_called_once()
+        assert cached_response.content == response.content
+        assert cached_response.headers["ETag"] == response.headers["ETag"]
+
+    def test_small_response_is_not_compressed(self, client):
+        response = client.get(
+            "/api/nodes/f1f1425b", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["ETag"] == get_etag(response.content)
+
+
+def _build(encoded_response, is_cacheable=True):
+    return mock.Mock(
+        return_value=(encoded_response, get_etag(encoded_response), is_cacheable)
+    )
+
+
+def _node(node_id, preview_args=None):
+    return mock.Mock(
+        spec=DataNode,
+        id=node_id,
+        viz_metadata={"preview_args": preview_args} if preview_args else None,
+        get_preview_args=mock.Mock(return_value=preview_args),
+    )
+
+
+class TestNodeMetadataCache:
+    def test_cache_hit(self):
+        cache = NodeMetadataCache()
+        build = _build(b"{}")
+
+        assert cache.get_or_build(_node("a"), build) == (b"{}", get_etag(b"{}"))
+        assert cache.get_or_build(_node("a"), build) == (b"{}", get_etag(b"{}"))
+        build.assert_called_once()
+        assert cache.get_stats() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+            "coalesced": 0,
+            "entries": 1,
+            "size": 2,
+            "max_size": 64 * 1024 * 1024,
+            "ttl": 300.0,
+        }
+
+    def test_cache_is_keyed_by_preview_args(self):
+        cache = NodeMetadataCache()
+        cache.get_or_build(_node("a", {"nrows": 5}), _build(b"[5]"))
+
+        assert cache.get_or_build(_node("a", {"nrows": 10}), _build(b"[10]"))[0] == (
+            b"[10]"
+        )
+        assert cache.get_or_build(_node("a", {"nrows": 5}), _build(b"[]"))[0] == (
+            b"[5]"
+        )
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = NodeMetadataCache(max_size=6)
+        cache.get_or_build(_node("a"), _build(b"aa"))
+        cache.get_or_build(_node("b"), _build(b"bb"))
+        cache.get_or_build(_node("a"), _build(b"--"))
+        cache.get_or_build(_node("c"), _build(b"cccc"))
+
+        assert cache.get_or_build(_node("a"), _build(b"--"))[0] == b"aa"
+        assert cache.get_or_build(_node("b"), _build(b"--"))[0] == b"--"
+        stats = cache.get_stats()
+        assert stats["evictions"] == 2
+        assert stats["size"] == 4
+
+    def test_too_large_entries_are_not_cached(self):
+        cache = NodeMetadataCache(max_size=1)
+        cache.get_or_build(_node("a"), _build(b"aa"))
+
+        assert cache.get_or_build(_node("a"), _build(b"--"))[0] == b"--"
+        assert cache.get_stats()["entries"] == 0
+
+    def test_compressed_variants_are_cached_with_their_entry(self, mocker):
+        cache = NodeMetadataCache()
+        compress = mocker.spy(kedro_viz.api.rest.responses.nodes, "compress")
+        encoded_response, _ = cache.get_or_build(_node("a"), _build(b"a" * 100))
+
+        compressed_response = cache.get_or_compress(
+            _node("a"), encoded_response, "gzip"
+        )
+
+        assert gzip.decompress(compressed_response) == encoded_response
+        assert (
+            cache.get_or_compress(_node("a"), encoded_response, "gzip")
+            is compressed_response
+        )
+        compress.assert_called_once()
+        assert cache.get_stats()["size"] == 100 + len(compressed_response)
+        cache.invalidate()
+        cache.get_or_build(_node("a"), _build(b"a" * 100))
+        assert cache.get_stats()["size"] == 100
+
+    def test_compressed_variants_evict_other_entries(self):
+        cache = NodeMetadataCache(max_size=150)
+        encoded_response, _ = cache.get_or_build(_node("a"), _build(b"a" * 100))
+        cache.get_or_build(_node("b"), _build(b"b" * 50))
+
+        compressed_response = cache.get_or_compress(
+            _node("a"), encoded_response, "gzip"
+        )
+
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["size"] == 100 + len(compressed_response)
+        assert cache.get_or_build(_node("b"), _build(b"--"))[0] == b"--"
+
+    def test_compressed_variants_too_large_are_not_cached(self, mocker):
+        cache = NodeMetadataCache(max_size=100)
+        compress = mocker.spy(kedro_viz.api.rest.responses.nodes, "compress")
+        encoded_response, _ = cache.get_or_build(_node("a"), _build(b"a" * 100))
+
+        cache.get_or_compress(_node("a"), encoded_response, "gzip")
+        cache.get_or_compress(_node("a"), encoded_response, "gzip")
+
+        assert compress.call_count == 2
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_stats()["size"] == 100
+
+    def test_compressed_variants_of_uncached_responses_are_not_cached(self):
+        cache = NodeMetadataCache()
+        encoded_response, _ = cache.get_or_build(
+            _node("a"), _build(b"a" * 100, is_cacheable=False)
+        )
+
+        compressed_response = cache.get_or_compress(
+            _node("a"), encoded_response, "gzip"
+        )
+
+        assert gzip.decompress(compressed_response) == encoded_response
+        assert cache.get_stats()["size"] == 0
+
+    def test_uncacheable_responses_are_not_cached(self):
+        cache = NodeMetadataCache()
+
+        assert cache.get_or_build(_node("a"), _build(b"aa", is_cacheable=False)) == (
+            b"aa",
+            get_etag(b"aa"),
+        )
+        assert cache.get_or_build(_node("a"), _build(b"bb"))[0] == b"bb"
+        assert cache.get_or_build(_node("a"), _build(b"--"))[0] == b"bb"
+
+    def test_expired_entries_are_rebuilt(self, mocker):
+        monotonic = mocker.patch(
+            "kedro_viz.api.rest.responses.nodes.time.monotonic", return_value=0
+        )
+        cache = NodeMetadataCache(ttl=10)
+        cache.get_or_build(_node("a"), _build(b"aa"))
+        monotonic.return_value = 9
+        assert cache.get_or_build(_node("a"), _build(b"--"))[0] == b"aa"
+        monotonic.return_value = 10
+        assert cache.get_or_build(_node("a"), _build(b"bb"))[0] == b"bb"
+
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_cache_is_dropped_when_repopulated(self, mocker):
+        cache = NodeMetadataCache()
+        cache.get_or_build(_node("a"), _build(b"aa"))
+        mocker.patch.object(
+            kedro_viz.api.rest.responses.nodes.data_access_manager,
+            "population_version",
+            -1,
+        )
+
+        assert cache.get_or_build(_node("a"), _build(b"bb"))[0] == b"bb"
+
+    def test_response_built_while_repopulating_is_not_cached(self, mocker):
+        cache = NodeMetadataCache()
+
+        def build():
+            mocker.patch.object(
+                kedro_viz.api.rest.responses.nodes.data_access_manager,
+                "population_version",
+                -1,
+            )
+            return b"aa", get_etag(b"aa"), True
+
+        assert cache.get_or_build(_node("a"), build)[0] == b"aa"
+        assert cache.get_stats()["entries"] == 0
+
+    def test_concurrent_builds_keep_one_entry(self):
+        cache = NodeMetadataCache()
+
+        def build():
+            # a request for the node after invalidating the cache finishes first
+            cache.invalidate()
+            cache.get_or_build(_node("a"), _build(b"aa"))
+            return b"bb", get_etag(b"bb"), True
+
+        cache.get_or_build(_node("a"), build)
+
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_stats()["size"] == 2
+        assert cache.get_or_build(_node("a"), _build(b"--"))[0] == b"bb"
+
+    def test_concurrent_requests_are_coalesced(self):
+        cache = NodeMetadataCache()
+        num_requests = 8
+        release = threading.Event()
+        build = mock.Mock(
+            side_effect=lambda: release.wait() and (b"aa", get_etag(b"aa"), True)
+        )
+
+        with ThreadPoolExecutor(num_requests) as executor:
+            futures = [
+                executor.submit(cache.get_or_build, _node("a"), build)
+                for _ in range(num_requests)
+            ]
+            while cache.get_stats()["coalesced"] < num_requests - 1:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        build.assert_called_once()
+        assert results == [(b"aa", get_etag(b"aa"))] * num_requests
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_or_build(_node("a"), _build(b"--"))[0] == b"aa"
+
+    def test_coalesced_requests_share_build_error(self):
+        cache = NodeMetadataCache()
+        release = threading.Event()
+
+        def build():
+            release.wait()
+            raise OSError("could not load preview")
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = [
+                executor.submit(cache.get_or_build, _node("a"), build) for _ in range(2)
+            ]
+            while cache.get_stats()["coalesced"] < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(OSError, match="could not load preview"):
+                    future.result()
+
+        # the failed build is not shared with later requests
+        assert cache.get_or_build(_node("a"), _build(b"aa"))[0] == b"aa"
+
+    def test_builds_of_other_populations_are_not_shared(self, mocker):
+        cache = NodeMetadataCache()
+
+        def build():
+            # the data access manager is repopulated while building
+            mocker.patch.object(
+                kedro_viz.api.rest.responses.nodes.data_access_manager,
+                "population_version",
+                -1,
+            )
+            return *cache.get_or_build(_node("a"), _build(b"bb")), True
+
+        assert cache.get_or_build(_node("a"), build)[0] == b"bb"
+        assert cache.get_stats()["coalesced"] == 0
+        assert cache.get_stats()["misses"] == 2
+
+    def test_invalidate(self):
+        cache = NodeMetadataCache()
+        cache.get_or_build(_node("a"), _build(b"aa"))
+        cache.invalidate()
+
+        assert cache.get_or_build(_node("a"), _build(b"bb"))[0] == b"bb"
+
+    @pytest.mark.parametrize(
+        "size, ttl, expected_size, expected_ttl",
+        [(None, None, 64 * 1024 * 1024, 300.0), ("1024", "30", 1024, 30.0)],
+    )
+    def test_configure_from_env(
+        self, size, ttl, expected_size, expected_ttl, monkeypatch
+    ):
+        for env_var, value in [
+            ("KEDRO_VIZ_NODE_METADATA_CACHE_SIZE", size),
+            ("KEDRO_VIZ_NODE_METADATA_CACHE_TTL", ttl),
+        ]:
+            if value is None:
+                monkeypatch.delenv(env_var, raising=False)
+            else:
+                monkeypatch.setenv(env_var, value)
+        cache = NodeMetadataCache(max_size=1, ttl=1)
+        cache.configure_from_env()
+
+        assert (cache.max_size, cache.ttl) == (expected_size, expected_ttl)
+
+    @pytest.mark.parametrize("size, ttl", [("0", "30"), ("big", "30"), ("1024", "-1")])
+    def test_configure_from_env_invalid(self, size, ttl, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_NODE_METADATA_CACHE_SIZE", size)
+        monkeypatch.setenv("KEDRO_VIZ_NODE_METADATA_CACHE_TTL", ttl)
+        cache = NodeMetadataCache()
+        with pytest.raises(
+            ValueError,
+            match="The node metadata cache size and TTL must be positive numbers, "
+            f"got '{size}' and '{ttl}'.",
+        ):
+            cache.configure_from_env()
+        assert (cache.max_size, cache.ttl) == (64 * 1024 * 1024, 300.0)
+
+    def test_invalid_env_does_not_fail_import(self):
+        env = {**os.environ, "KEDRO_VIZ_NODE_METADATA_CACHE_SIZE": "big"}
+        result = subprocess.run(
+            [sys.executable, "-c", "import kedro_viz.api.rest.router"],
+            env=env,
+            capture_output=True,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_node_metadata_is_served_from_cache(self, client, mocker):
+        mocker.patch(
+            "kedro_viz.api.rest.responses.nodes.node_metadata_cache",
+            new=NodeMetadataCache(),
+        )
+        get_node_metadata_response = mocker.spy(
+            kedro_viz.api.rest.responses.nodes, "get_node_metadata_response"
+        )
+        response = client.get("/api/nodes/13399a82")
+        cached_response = client.get("/api/nodes/13399a82")
+        client.post("/api/nodes:batch", json={"node_ids": ["13399a82"]})
+
+        assert cached_response.content == response.content
+        assert cached_response.headers["ETag"] == response.headers["ETag"]
+        get_node_metadata_response.assert_called_once_with("13399a82")
+
+    def test_concurrent_node_metadata_requests_share_preview(self, client, mocker):
+        cache = NodeMetadataCache()
+        mocker.patch(
+            "kedro_viz.api.rest.responses.nodes.node_metadata_cache", new=cache
+        )
+        release = threading.Event()
+        preview = mocker.patch(
+            "kedro_datasets.pandas.CSVDataset.preview",
+            side_effect=lambda **kwargs: release.wait() and {"data": [[1]]},
+        )
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [
+                executor.submit(get_encoded_node_metadata_response, "13399a82")
+                for _ in range(4)
+            ]
+            while cache.get_stats()["coalesced"] < 3:
+                time.sleep(0.001)
+            release.set()
+            responses = [future.result() for future in futures]
+
+        preview.assert_called_once()
+        assert {response.body for response in responses} == {responses[0].body}
+
+    def test_timed_out_preview_is_loaded_again(self, client, mocker, monkeypatch):
+        cache = NodeMetadataCache()
+        mocker.patch(
+            "kedro_viz.api.rest.responses.nodes.node_metadata_cache", new=cache
+        )
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_TIMEOUT", "0.05")
+        release = threading.Event()
+        mocker.patch(
+            "kedro_datasets.pandas.CSVDataset.preview",
+            side_effect=lambda **kwargs: release.wait(5) and {"data": [[1]]},
+        )
+
+        timed_out_response = client.get("/api/nodes/13399a82")
+        assert timed_out_response.json()["preview_type"] == "TimedOutPreview"
+        assert cache.get_stats()["entries"] == 0
+        release.set()
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_TIMEOUT", "5")
+
+        response = client.get("/api/nodes/13399a82")
+        cached_response = client.get("/api/nodes/13399a82")
+
+        assert response.json()["preview"] == {"data": [[1]]}
+        assert cached_response.content == response.content
+        assert cache.get_stats()["misses"] == 2
+        assert cache.get_stats()["hits"] == 1
+
+
+class TestNodesMetadataBatchEndpoint:
+    def test_batch_matches_single_node_metadata(self, client):
+        node_ids = ["782e4a43", "0ecea0de", "f1f1425b", "uk"]
+        response = client.post("/api/nodes:batch", json={"node_ids": node_ids})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "nodes": {
+                node_id: client.get(f"/api/nodes/{node_id}").json()
+                for node_id in node_ids
+            },
+            "errors": {},
+        }
+        assert list(response.json()["nodes"]) == node_ids
+
+    def test_unknown_nodes_are_reported_inline(self, client):
+        response = client.post(
+            "/api/nodes:batch", json={"node_ids": ["foo", "f1f1425b"]}
+        )
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert list(response_data["nodes"]) == ["f1f1425b"]
+        assert response_data["errors"] == {"foo": "Invalid node ID"}
+
+    def test_failed_nodes_are_reported_inline(self, client, mocker):
+        mocker.patch(
+            "kedro_viz.api.rest.responses.nodes.TaskNodeMetadata",
+            side_effect=OSError("could not get source code"),
+        )
+        response = client.post(
+            "/api/nodes:batch", json={"node_ids": ["782e4a43", "f1f1425b"]}
+        )
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert list(response_data["nodes"]) == ["f1f1425b"]
+        assert response_data["errors"] == {
+            "782e4a43": "OSError: could not get source code"
+        }
+
+    def test_duplicate_nodes_are_looked_up_once(self, client, mocker):
+        get_encoded_node_metadata = mocker.spy(
+            kedro_viz.api.rest.responses.nodes, "get_encoded_node_metadata"
+        )
+        response = client.post(
+            "/api/nodes:batch",
+            json={"node_ids": ["f1f1425b", "f1f1425b", "foo", "foo"]},
+        )
+
+        assert list(response.json()["nodes"]) == ["f1f1425b"]
+        assert get_encoded_node_metadata.call_count == 2
+
+    def test_empty_batch(self, client):
+        response = client.post("/api/nodes:batch", json={"node_ids": []})
+
+        assert response.json() == {"nodes": {}, "errors": {}}
+
+    def test_large_batch_is_compressed(self, client, mocker):
+        mocker.patch("kedro_viz.api.rest.responses.nodes.MIN_COMPRESSED_SIZE", new=10)
+        body = {"node_ids": ["782e4a43", "f1f1425b"]}
+        uncompressed_response = client.post(
+            "/api/nodes:batch", json=body, headers={"Accept-Encoding": "identity"}
+        )
+        response = client.post(
+            "/api/nodes:batch", json=body, headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "Content-Encoding" not in uncompressed_response.headers
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.json() == uncompressed_response.json()
+
+    def test_batch_is_built_concurrently(self, client, mocker):
+        # each node waits for the other one, which only returns if both are built at once
+        barrier = threading.Barrier(2, timeout=5)
+        get_encoded_node_metadata = (
+            kedro_viz.api.rest.responses.nodes.get_encoded_node_metadata
+        )
+
+        def get_encoded_node_metadata_together(node_id):
+            barrier.wait()
+            return get_encoded_node_metadata(node_id)
+
+        mocker.patch(
+            "kedro_viz.api.rest.responses.nodes.get_encoded_node_metadata",
+            side_effect=get_encoded_node_metadata_together,
+        )
+        response = client.post(
+            "/api/nodes:batch", json={"node_ids": ["782e4a43", "f1f1425b"]}
+        )
+
+        assert list(response.json()["nodes"]) == ["782e4a43", "f1f1425b"]
+        assert response.json()["errors"] == {}
+
+    def test_batch_too_large(self, client):
+        response = client.post(
+            "/api/nodes:batch",
+            json={"node_ids": ["f1f1425b"] * (MAX_NODES_METADATA_BATCH_SIZE + 1)},
+        )
+
+        assert response.status_code == 422
+
+    def test_invalid_batch_request(self, client):
+        response = client.post("/api/nodes:batch", json={"ids": ["f1f1425b"]})
+
+        assert response.status_code == 422
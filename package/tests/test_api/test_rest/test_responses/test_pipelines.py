@@ -1,10 +1,25 @@
-import json
+import gzip
 from pathlib import Path
+from unittest import mock
 
+import orjson
+import pytest
 from fastapi.testclient import TestClient
 
+import kedro_viz.api.rest.responses.pipelines
 from kedro_viz.api import apps
-from kedro_viz.api.rest.responses.pipelines import get_kedro_project_json_data
+from kedro_viz.api.rest.responses.compression import get_compressed_etag
+from kedro_viz.api.rest.responses.pipelines import (
+    PipelineResponseCache,
+    get_kedro_project_json_data,
+    get_pipeline_response,
+    iter_pipeline_response_chunks,
+    pipeline_response_cache,
+    warm_up_pipeline_response_cache,
+)
+from kedro_viz.api.rest.responses.utils import get_etag
+from kedro_viz.data_access import DataAccessManager
+from kedro_viz.server import populate_data
 from tests.test_api.test_rest.test_responses.assert_helpers import (
     assert_dict_list_equal,
     assert_example_data,
@@ -62,25 +77,30 @@ class TestMainEndpoint:
         )
 
     def test_get_kedro_project_json_data(self, mocker):
-        expected_json_data = {"key": "value"}
-        encoded_response = json.dumps(expected_json_data).encode("utf-8")
-
         mock_get_default_response = mocker.patch(
             "kedro_viz.api.rest.responses.pipelines.get_pipeline_response",
             return_value={"key": "value"},
         )
-        mock_get_encoded_response = mocker.patch(
-            "kedro_viz.api.rest.responses.pipelines.get_encoded_response",
-            return_value=encoded_response,
+        mock_get_jsonable_response = mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.get_jsonable_response",
+            return_value={"key": "value"},
         )
 
         json_data = get_kedro_project_json_data()
 
         mock_get_default_response.assert_called_once()
-        mock_get_encoded_response.assert_called_once_with(
+        mock_get_jsonable_response.assert_called_once_with(
             mock_get_default_response.return_value
         )
-        assert json_data == expected_json_data
+        assert json_data == {"key": "value"}
+
+    def test_get_kedro_project_json_data_matches_main_endpoint(self, client):
+        response = client.get("/api/main")
+
+        assert get_kedro_project_json_data() == response.json()
+        assert get_kedro_project_json_data("data_science") == (
+            client.get("/api/pipelines/data_science").json()
+        )
 
 
 class TestSinglePipelineEndpoint:
@@ -222,13 +242,9 @@ class TestSinglePipelineEndpoint:
             expected_modular_pipelines,
         )
 
-        # Extract and sort the layers field
-        response_data_layers_sorted = sorted(response_data["layers"])
-        expected_layers_sorted = sorted(["model_inputs", "raw"])
-        assert response_data_layers_sorted == expected_layers_sorted
-
-        # Remove the layers field from response_data for further comparison
-        response_data.pop("layers")
+        # Only the layers of the data_science pipeline's own nodes are included,
+        # not the `raw` layer of the data_processing pipeline
+        assert response_data.pop("layers") == ["model_inputs"]
 
         # Expected response without the layers field
         expected_response_without_layers = {
@@ -250,6 +266,673 @@ class TestSinglePipelineEndpoint:
         assert response.status_code == 404
 
 
+class TestGetPipelineResponse:
+    def test_get_default_pipeline_response(self, example_api):
+        response = get_pipeline_response()
+        assert response.selected_pipeline == "__default__"
+
+    def test_get_non_existing_pipeline_response(self, example_api):
+        response = get_pipeline_response("foo")
+        assert response.status_code == 404
+
+
+class TestPipelineResponseCache:
+    def test_response_is_served_from_cache(self, client, mocker):
+        pipeline_response_spy = mocker.spy(
+            kedro_viz.api.rest.responses.pipelines, "get_pipeline_response"
+        )
+        first_response = client.get("/api/pipelines/data_science")
+        second_response = client.get("/api/pipelines/data_science")
+
+        assert first_response.status_code == 200
+        assert first_response.content == second_response.content
+        pipeline_response_spy.assert_called_once_with("data_science")
+
+    def test_main_and_default_pipeline_share_cache_entry(self, client, mocker):
+        pipeline_response_spy = mocker.spy(
+            kedro_viz.api.rest.responses.pipelines, "get_pipeline_response"
+        )
+        main_response = client.get("/api/main")
+        default_response = client.get("/api/pipelines/__default__")
+
+        assert main_response.json() == default_response.json()
+        pipeline_response_spy.assert_called_once_with("__default__")
+
+    def test_cache_invalidated_on_repopulate(
+        self, data_access_manager, example_pipelines, example_catalog, mocker
+    ):
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.data_access_manager",
+            new=data_access_manager,
+        )
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+        cache = PipelineResponseCache()
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.get_pipeline_response",
+            side_effect=[{"version": 1}, {"version": 2}],
+        )
+
+        assert cache.get_or_build("data_science") == b'{"version":1}'
+        assert cache.get_or_build("data_science") == b'{"version":1}'
+
+        data_access_manager.add_pipelines(example_pipelines)
+
+        assert cache.get("data_science") is None
+        assert cache.get_or_build("data_science") == b'{"version":2}'
+
+    def test_cache_invalidated_for_new_data_access_manager(self, mocker):
+        cache = PipelineResponseCache()
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.get_pipeline_response",
+            return_value={"key": "value"},
+        )
+        cache.get_or_build("__default__")
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.data_access_manager",
+            new=DataAccessManager(),
+        )
+        assert cache.get("__default__") is None
+
+    def test_warm_up_pipeline_response_cache(self, example_api):
+        warm_up_pipeline_response_cache().join()
+
+        for pipeline_id in ["__default__", "data_science", "data_processing"]:
+            assert pipeline_response_cache.get(pipeline_id) is not None
+
+        pipeline_response_cache.invalidate()
+        assert pipeline_response_cache.get("__default__") is None
+
+
+class TestPipelineETag:
+    @pytest.mark.parametrize("endpoint", ["/api/main", "/api/pipelines/data_science"])
+    def test_response_has_content_hash_etag(self, client, endpoint):
+        response = client.get(endpoint, headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == get_etag(response.content)
+
+    @pytest.mark.parametrize("endpoint", ["/api/main", "/api/pipelines/data_science"])
+    def test_not_modified_when_etag_matches(self, client, endpoint):
+        etag = client.get(endpoint).headers["ETag"]
+        response = client.get(endpoint, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_full_response_when_etag_differs(self, client):
+        etag = client.get("/api/pipelines/data_science").headers["ETag"]
+        response = client.get(
+            "/api/pipelines/data_processing", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_etag_computed_once_per_cached_response(self, client, mocker):
+        get_etag_spy = mocker.spy(kedro_viz.api.rest.responses.pipelines, "get_etag")
+        first_response = client.get("/api/pipelines/data_science")
+        second_response = client.get(
+            "/api/pipelines/data_science",
+            headers={"If-None-Match": first_response.headers["ETag"]},
+        )
+
+        assert second_response.status_code == 304
+        get_etag_spy.assert_called_once()
+
+    def test_etag_changes_on_repopulate(
+        self, data_access_manager, example_pipelines, example_catalog, mocker
+    ):
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.data_access_manager",
+            new=data_access_manager,
+        )
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+        cache = PipelineResponseCache()
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.get_pipeline_response",
+            side_effect=[{"version": 1}, {"version": 2}],
+        )
+
+        first_response, first_etag = cache.get_or_build_with_etag("data_science")
+        data_access_manager.add_pipelines(example_pipelines)
+        second_response, second_etag = cache.get_or_build_with_etag("data_science")
+
+        assert first_etag == get_etag(first_response)
+        assert second_etag == get_etag(second_response)
+        assert first_etag != second_etag
+
+    def test_non_existing_pipeline_has_no_etag(self, client):
+        response = client.get("/api/pipelines/foo", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+
+class TestPipelineCompression:
+    @pytest.mark.parametrize("endpoint", ["/api/main", "/api/pipelines/data_science"])
+    def test_response_is_compressed(self, client, endpoint):
+        uncompressed_response = client.get(
+            endpoint, headers={"Accept-Encoding": "identity"}
+        )
+        response = client.get(endpoint, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["ETag"] == get_compressed_etag(
+            uncompressed_response.headers["ETag"], "gzip"
+        )
+        # the test client decompresses the response
+        assert response.content == uncompressed_response.content
+
+    def test_uncompressed_response(self, client):
+        response = client.get(
+            "/api/pipelines/data_science", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Vary"] == "Accept-Encoding"
+
+    def test_not_modified_when_compressed_etag_matches(self, client):
+        etag = client.get(
+            "/api/pipelines/data_science", headers={"Accept-Encoding": "gzip"}
+        ).headers["ETag"]
+        response = client.get(
+            "/api/pipelines/data_science",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.headers["Vary"] == "Accept-Encoding"
+
+    def test_compressed_variant_is_cached(self, client, mocker):
+        compress_spy = mocker.spy(kedro_viz.api.rest.responses.pipelines, "compress")
+        first_response = client.get(
+            "/api/pipelines/data_science", headers={"Accept-Encoding": "gzip"}
+        )
+        second_response = client.get(
+            "/api/pipelines/data_science", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert first_response.content == second_response.content
+        compress_spy.assert_called_once()
+
+    def test_compressed_variants_dropped_on_repopulate(
+        self, data_access_manager, example_pipelines, example_catalog, mocker
+    ):
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.data_access_manager",
+            new=data_access_manager,
+        )
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+        cache = PipelineResponseCache()
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.get_pipeline_response",
+            side_effect=[{"version": 1}, {"version": 2}],
+        )
+
+        first_response, first_etag = cache.get_or_build_compressed(
+            "data_science", "gzip"
+        )
+        assert gzip.decompress(first_response) == b'{"version":1}'
+        assert first_etag == get_etag(b'{"version":1}')
+
+        data_access_manager.add_pipelines(example_pipelines)
+        second_response, _ = cache.get_or_build_compressed("data_science", "gzip")
+        assert gzip.decompress(second_response) == b'{"version":2}'
+
+        cache.invalidate()
+        assert cache._compressed_responses == {}
+
+    def test_compressed_variant_not_kept_for_dropped_response(self, mocker):
+        cache = PipelineResponseCache()
+        mocker.patch.object(
+            cache, "get_or_build_with_etag", return_value=(b"{}", '"etag"')
+        )
+
+        compressed_response, etag = cache.get_or_build_compressed(
+            "data_science", "gzip"
+        )
+
+        assert gzip.decompress(compressed_response) == b"{}"
+        assert etag == '"etag"'
+        assert cache._compressed_responses == {}
+
+    def test_compresses_without_holding_the_build_lock(self, mocker):
+        cache = PipelineResponseCache()
+        cache._responses = {"data_science": (b"{}", '"etag"')}
+        mocker.patch.object(
+            cache, "get_or_build_with_etag", return_value=(b"{}", '"etag"')
+        )
+
+        def compress(encoded_response, content_encoding):
+            assert not cache._build_lock.locked()
+            return b"compressed"
+
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.compress", side_effect=compress
+        )
+
+        assert cache.get_or_build_compressed("data_science", "gzip") == (
+            b"compressed",
+            '"etag"',
+        )
+        assert cache._compressed_responses == {('"etag"', "gzip"): b"compressed"}
+
+    def test_compressed_variant_cached_while_compressing_is_kept(self, mocker):
+        cache = PipelineResponseCache()
+        cache._responses = {"data_science": (b"{}", '"etag"')}
+        mocker.patch.object(
+            cache, "get_or_build_with_etag", return_value=(b"{}", '"etag"')
+        )
+
+        def compress(encoded_response, content_encoding):
+            # another request caches the same variant in the meantime
+            cache._compressed_responses[('"etag"', content_encoding)] = b"first"
+            return b"second"
+
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.compress", side_effect=compress
+        )
+
+        assert cache.get_or_build_compressed("data_science", "gzip") == (
+            b"first",
+            '"etag"',
+        )
+        assert cache._compressed_responses == {('"etag"', "gzip"): b"first"}
+
+
+class TestSubgraphEndpoint:
+    def test_get_subgraph(self, client):
+        response = client.get(
+            "/api/pipelines/__default__/subgraph",
+            params={"focus": "0ecea0de", "depth": 1},
+        )
+        assert response.status_code == 200
+        response_data = response.json()
+
+        assert [node["id"] for node in response_data["nodes"]] == [
+            "782e4a43",
+            "0ecea0de",
+            "f2b25286",
+            "uk",
+            "uk.data_processing",
+            "uk.data_science",
+        ]
+        assert_dict_list_equal(
+            response_data["edges"],
+            [
+                {"source": "782e4a43", "target": "0ecea0de"},
+                {"source": "0ecea0de", "target": "f2b25286"},
+                {"source": "0ecea0de", "target": "uk.data_science"},
+                {"source": "uk.data_processing", "target": "0ecea0de"},
+            ],
+            sort_keys=("source", "target"),
+        )
+        assert_modular_pipelines_tree_equal(
+            response_data["modular_pipelines"],
+            {
+                "__root__": {
+                    "id": "__root__",
+                    "name": "__root__",
+                    "inputs": [],
+                    "outputs": [],
+                    "children": [{"id": "uk", "type": "modularPipeline"}],
+                },
+                "uk": {
+                    "id": "uk",
+                    "name": "uk",
+                    "inputs": ["f0ebef01", "13399a82", "f1f1425b"],
+                    "outputs": ["d5a8b994"],
+                    "children": [
+                        {"id": "uk.data_processing", "type": "modularPipeline"},
+                        {"id": "uk.data_science", "type": "modularPipeline"},
+                        {"id": "0ecea0de", "type": "data"},
+                    ],
+                },
+                "uk.data_processing": {
+                    "id": "uk.data_processing",
+                    "name": "uk.data_processing",
+                    "inputs": ["f0ebef01", "13399a82"],
+                    "outputs": ["0ecea0de"],
+                    "children": [{"id": "782e4a43", "type": "task"}],
+                },
+                "uk.data_science": {
+                    "id": "uk.data_science",
+                    "name": "uk.data_science",
+                    "inputs": ["0ecea0de", "f1f1425b"],
+                    "outputs": ["d5a8b994"],
+                    "children": [{"id": "f2b25286", "type": "task"}],
+                },
+            },
+        )
+        assert response_data["selected_pipeline"] == "__default__"
+        assert response_data["layers"] == ["raw", "model_inputs"]
+
+    @pytest.mark.parametrize(
+        "direction, depth, expected_node_ids",
+        [
+            ("down", 1, ["0ecea0de", "f2b25286", "uk", "uk.data_science"]),
+            ("down", 2, ["0ecea0de", "f2b25286", "d5a8b994", "uk", "uk.data_science"]),
+            (
+                "up",
+                2,
+                [
+                    "782e4a43",
+                    "13399a82",
+                    "f0ebef01",
+                    "0ecea0de",
+                    "uk",
+                    "uk.data_processing",
+                ],
+            ),
+            ("both", 0, ["0ecea0de", "uk"]),
+        ],
+    )
+    def test_get_subgraph_by_direction(
+        self, client, direction, depth, expected_node_ids
+    ):
+        response = client.get(
+            "/api/pipelines/__default__/subgraph",
+            params={"focus": "0ecea0de", "depth": depth, "direction": direction},
+        )
+
+        assert [node["id"] for node in response.json()["nodes"]] == expected_node_ids
+
+    def test_get_subgraph_of_modular_pipeline(self, client):
+        response = client.get(
+            "/api/pipelines/__default__/subgraph",
+            params={"focus": "uk.data_science", "direction": "down"},
+        )
+        response_data = response.json()
+
+        assert [node["id"] for node in response_data["nodes"]] == [
+            "d5a8b994",
+            "uk",
+            "uk.data_science",
+        ]
+        assert_dict_list_equal(
+            response_data["edges"],
+            [
+                {"source": "uk", "target": "d5a8b994"},
+                {"source": "uk.data_science", "target": "d5a8b994"},
+            ],
+            sort_keys=("source", "target"),
+        )
+        modular_pipelines_tree = response_data["modular_pipelines"]
+        assert_dict_list_equal(
+            modular_pipelines_tree["__root__"]["children"],
+            [
+                {"id": "d5a8b994", "type": "data"},
+                {"id": "uk", "type": "modularPipeline"},
+            ],
+            sort_keys=("id",),
+        )
+        assert modular_pipelines_tree["uk"]["children"] == [
+            {"id": "uk.data_science", "type": "modularPipeline"}
+        ]
+        assert modular_pipelines_tree["uk.data_science"]["children"] == []
+
+    def test_subgraph_matches_pipeline_for_large_depth(self, client):
+        pipeline_response = client.get("/api/pipelines/data_science").json()
+        response = client.get(
+            "/api/pipelines/data_science/subgraph",
+            params={"focus": "0ecea0de", "depth": 10},
+        )
+        response_data = response.json()
+
+        assert_nodes_equal(response_data["nodes"], pipeline_response["nodes"])
+        assert_dict_list_equal(
+            response_data["edges"],
+            pipeline_response["edges"],
+            sort_keys=("source", "target"),
+        )
+        assert_modular_pipelines_tree_equal(
+            response_data["modular_pipelines"], pipeline_response["modular_pipelines"]
+        )
+
+    @pytest.mark.parametrize(
+        "pipeline_id, focus, expected_message",
+        [
+            ("foo", "0ecea0de", "Invalid pipeline ID"),
+            ("data_science", "foo", "Invalid node ID"),
+            # the node isn't part of the registered pipeline
+            ("data_science", "782e4a43", "Invalid node ID"),
+        ],
+    )
+    def test_subgraph_not_found(self, client, pipeline_id, focus, expected_message):
+        response = client.get(
+            f"/api/pipelines/{pipeline_id}/subgraph", params={"focus": focus}
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"message": expected_message}
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {},
+            {"focus": "0ecea0de", "depth": -1},
+            {"focus": "0ecea0de", "direction": "sideways"},
+        ],
+    )
+    def test_subgraph_invalid_query(self, client, params):
+        response = client.get("/api/pipelines/__default__/subgraph", params=params)
+
+        assert response.status_code == 422
+
+
+class TestLineageEndpoint:
+    def test_get_lineage(self, client):
+        response = client.get("/api/pipelines/__default__/lineage/0ecea0de")
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["node_id"] == "0ecea0de"
+        assert sorted(response_data["ancestors"]) == [
+            "13399a82",
+            "782e4a43",
+            "f0ebef01",
+        ]
+        assert sorted(response_data["descendants"]) == ["d5a8b994", "f2b25286"]
+
+    def test_lineage_is_scoped_to_pipeline(self, client):
+        response = client.get("/api/pipelines/data_science/lineage/0ecea0de")
+
+        response_data = response.json()
+        assert response_data["ancestors"] == []
+        assert sorted(response_data["descendants"]) == ["d5a8b994", "f2b25286"]
+
+    def test_lineage_materialises_lazy_pipeline(self, client, mocker):
+        materialise_spy = mocker.spy(
+            kedro_viz.api.rest.responses.pipelines.data_access_manager,
+            "materialise_pipeline",
+        )
+        client.get("/api/pipelines/data_science/lineage/0ecea0de")
+
+        materialise_spy.assert_called_with("data_science")
+
+    @pytest.mark.parametrize(
+        "pipeline_id, node_id, expected_message",
+        [
+            ("foo", "0ecea0de", "Invalid pipeline ID"),
+            ("data_science", "foo", "Invalid node ID"),
+            # the node isn't part of the registered pipeline
+            ("data_science", "782e4a43", "Invalid node ID"),
+            # modular pipelines don't have a lineage of their own
+            ("__default__", "uk.data_science", "Invalid node ID"),
+        ],
+    )
+    def test_lineage_not_found(self, client, pipeline_id, node_id, expected_message):
+        response = client.get(f"/api/pipelines/{pipeline_id}/lineage/{node_id}")
+
+        assert response.status_code == 404
+        assert response.json() == {"message": expected_message}
+
+
+class TestPipelineStream:
+    @staticmethod
+    def merge_stream_lines(content):
+        merged_response = {}
+        for line in content.splitlines():
+            for field_name, value in orjson.loads(line).items():
+                if isinstance(value, list) and field_name in merged_response:
+                    merged_response[field_name].extend(value)
+                elif isinstance(value, dict) and field_name in merged_response:
+                    merged_response[field_name].update(value)
+                else:
+                    merged_response[field_name] = value
+        return merged_response
+
+    def test_stream_matches_pipeline_response(self, client):
+        expected_response = client.get("/api/pipelines/data_science").json()
+        response = client.get("/api/pipelines/data_science/stream")
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        assert self.merge_stream_lines(response.content) == expected_response
+
+    def test_stream_is_chunked(self, client, mocker):
+        mocker.patch("kedro_viz.api.rest.responses.pipelines.STREAM_CHUNK_SIZE", 2)
+        expected_response = client.get("/api/pipelines/__default__").json()
+        response = client.get("/api/pipelines/__default__/stream")
+
+        lines = [orjson.loads(line) for line in response.content.splitlines()]
+        assert set(lines[0]) == {"selected_pipeline", "pipelines", "tags", "layers"}
+        for line in lines[1:]:
+            assert len(line) == 1
+            assert all(len(value) <= 2 for value in line.values())
+        assert [next(iter(line)) for line in lines[1:]] == sorted(
+            (next(iter(line)) for line in lines[1:]),
+            key=["nodes", "edges", "modular_pipelines"].index,
+        )
+        assert self.merge_stream_lines(response.content) == expected_response
+
+    def test_stream_iterates_repositories_lazily(self, example_api, mocker):
+        mocker.patch("kedro_viz.api.rest.responses.pipelines.STREAM_CHUNK_SIZE", 2)
+        data_access_manager = kedro_viz.api.rest.responses.pipelines.data_access_manager
+        # the layers are sorted from the list of nodes once and cached
+        data_access_manager.get_sorted_layers_for_registered_pipeline("__default__")
+        get_nodes = mocker.spy(data_access_manager, "get_nodes_for_registered_pipeline")
+        get_edges = mocker.spy(data_access_manager, "get_edges_for_registered_pipeline")
+        iter_nodes_by_pipeline_id = data_access_manager.nodes.iter_nodes_by_pipeline_id
+        read_nodes = []
+
+        def iter_nodes(pipeline_id):
+            for node in iter_nodes_by_pipeline_id(pipeline_id):
+                read_nodes.append(node)
+                yield node
+
+        mocker.patch.object(
+            data_access_manager.nodes,
+            "iter_nodes_by_pipeline_id",
+            side_effect=iter_nodes,
+        )
+
+        chunks = iter_pipeline_response_chunks("__default__")
+        next(chunks)
+        next(chunks)
+        # only the nodes of the first chunk have been read so far
+        assert len(read_nodes) == 2
+
+        list(chunks)
+        assert len(read_nodes) == len(
+            data_access_manager.nodes.get_nodes_by_pipeline_id("__default__")
+        )
+        get_nodes.assert_not_called()
+        get_edges.assert_not_called()
+
+    def test_stream_materialises_lazy_pipeline(self, client, mocker):
+        materialise_spy = mocker.spy(
+            kedro_viz.api.rest.responses.pipelines.data_access_manager,
+            "materialise_pipeline",
+        )
+        client.get("/api/pipelines/data_science/stream")
+
+        materialise_spy.assert_called_with("data_science")
+
+    def test_stream_invalid_pipeline(self, client):
+        response = client.get("/api/pipelines/foo/stream")
+
+        assert response.status_code == 404
+        assert response.json() == {"message": "Invalid pipeline ID"}
+
+
+class TestLazyPipelines:
+    @pytest.fixture
+    def lazy_client(
+        self,
+        data_access_manager,
+        example_pipelines,
+        example_catalog,
+        example_node_extras_dict,
+        mocker,
+    ):
+        populate_data(
+            data_access_manager,
+            example_catalog,
+            example_pipelines,
+            example_node_extras_dict,
+            lazy=True,
+        )
+        mocker.patch(
+            "kedro_viz.api.rest.responses.pipelines.data_access_manager",
+            new=data_access_manager,
+        )
+        yield TestClient(apps.create_api_app_from_project(mock.MagicMock()))
+
+    def test_pipeline_materialised_on_first_request(
+        self, lazy_client, data_access_manager
+    ):
+        assert not data_access_manager.nodes.as_list()
+
+        response = lazy_client.get("/api/pipelines/data_science")
+
+        assert response.status_code == 200
+        assert {node["name"] for node in response.json()["nodes"]} == {
+            "train_model",
+            "model_inputs",
+            "parameters",
+            "uk.data_science.model",
+            "uk",
+            "uk.data_science",
+        }
+        # all registered pipelines are listed, but only the requested one is populated
+        assert [pipeline["id"] for pipeline in response.json()["pipelines"]] == [
+            "__default__",
+            "data_science",
+            "data_processing",
+        ]
+        assert list(data_access_manager.pending_pipelines) == [
+            "__default__",
+            "data_processing",
+        ]
+
+    def test_get_pipeline_response_materialises_pipeline(
+        self, lazy_client, data_access_manager
+    ):
+        response = get_pipeline_response("data_processing")
+
+        assert response.selected_pipeline == "data_processing"
+        assert "data_processing" not in data_access_manager.pending_pipelines
+
+    def test_warm_up_only_default_pipeline(self, lazy_client, data_access_manager):
+        warm_up_pipeline_response_cache().join()
+
+        assert pipeline_response_cache.get("__default__") is not None
+        assert pipeline_response_cache.get("data_science") is None
+        assert list(data_access_manager.pending_pipelines) == [
+            "data_science",
+            "data_processing",
+        ]
+        pipeline_response_cache.invalidate()
+
+
 class TestAPIAppFromFile:
     def test_api_app_from_json_file_main_api(self):
         filepath = str(Path(__file__).parent.parent.parent)
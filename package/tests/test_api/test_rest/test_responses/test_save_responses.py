@@ -1,16 +1,24 @@
+import gzip
+import json
+import threading
+import time
 from unittest import mock
 from unittest.mock import Mock, call, patch
 
+import fsspec
 import pytest
 
 from kedro_viz.api.rest.responses.save_responses import (
     save_api_main_response_to_fs,
+    save_api_manifest_to_fs,
     save_api_node_response_to_fs,
     save_api_pipeline_response_to_fs,
     save_api_responses_to_fs,
     save_api_run_status_response_to_fs,
     write_api_response_to_fs,
 )
+from kedro_viz.api.rest.responses.utils import get_content_hash
+from kedro_viz.models.flowchart.node_metadata import DataNodeMetadata
 
 
 class TestSaveAPIResponse:
@@ -26,38 +34,68 @@ class TestSaveAPIResponse:
         self, file_path, protocol, is_all_previews_enabled, mocker
     ):
         mock_api_main_response_to_fs = mocker.patch(
-            "kedro_viz.api.rest.responses.save_responses.save_api_main_response_to_fs"
+            "kedro_viz.api.rest.responses.save_responses.save_api_main_response_to_fs",
+            return_value={f"{file_path}/api/main": "main_hash"},
         )
         mock_api_node_response_to_fs = mocker.patch(
-            "kedro_viz.api.rest.responses.save_responses.save_api_node_response_to_fs"
+            "kedro_viz.api.rest.responses.save_responses.save_api_node_response_to_fs",
+            return_value={f"{file_path}/api/nodes/01f456": "node_hash"},
         )
         mock_api_pipeline_response_to_fs = mocker.patch(
-            "kedro_viz.api.rest.responses.save_responses.save_api_pipeline_response_to_fs"
+            "kedro_viz.api.rest.responses.save_responses.save_api_pipeline_response_to_fs",
+            return_value={f"{file_path}/api/pipelines/__default__": "pipeline_hash"},
         )
         mock_api_run_status_response_to_fs = mocker.patch(
-            "kedro_viz.api.rest.responses.save_responses.save_api_run_status_response_to_fs"
+            "kedro_viz.api.rest.responses.save_responses.save_api_run_status_response_to_fs",
+            return_value={f"{file_path}/api/run-status": "run_status_hash"},
+        )
+        mock_api_manifest_to_fs = mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.save_api_manifest_to_fs"
+        )
+
+        mock_data_access_manager = mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager"
         )
 
         mock_filesystem = mocker.patch("fsspec.filesystem")
         mock_filesystem.return_value.protocol = protocol
 
         save_api_responses_to_fs(
-            file_path, mock_filesystem.return_value, is_all_previews_enabled
+            file_path,
+            mock_filesystem.return_value,
+            is_all_previews_enabled,
+            ["gzip"],
+            human_readable=True,
         )
 
+        # lazily added registered pipelines are all saved
+        mock_data_access_manager.materialise_all_pipelines.assert_called_once()
+
         mock_api_main_response_to_fs.assert_called_once_with(
-            f"{file_path}/api/main", mock_filesystem.return_value
+            f"{file_path}/api/main", mock_filesystem.return_value, ["gzip"], True
         )
         mock_api_node_response_to_fs.assert_called_once_with(
             f"{file_path}/api/nodes",
             mock_filesystem.return_value,
             is_all_previews_enabled,
+            ["gzip"],
+            True,
         )
         mock_api_pipeline_response_to_fs.assert_called_once_with(
-            f"{file_path}/api/pipelines", mock_filesystem.return_value
+            f"{file_path}/api/pipelines", mock_filesystem.return_value, ["gzip"], True
         )
         mock_api_run_status_response_to_fs.assert_called_once_with(
-            f"{file_path}/api/run-status", mock_filesystem.return_value
+            f"{file_path}/api/run-status", mock_filesystem.return_value, ["gzip"], True
+        )
+        mock_api_manifest_to_fs.assert_called_once_with(
+            f"{file_path}/api",
+            {
+                f"{file_path}/api/main": "main_hash",
+                f"{file_path}/api/nodes/01f456": "node_hash",
+                f"{file_path}/api/pipelines/__default__": "pipeline_hash",
+                f"{file_path}/api/run-status": "run_status_hash",
+            },
+            mock_filesystem.return_value,
         )
 
     def test_save_api_main_response_to_fs(self, mocker):
@@ -69,16 +107,18 @@ class TestSaveAPIResponse:
             return_value=expected_default_response,
         )
         mock_write_api_response_to_fs = mocker.patch(
-            "kedro_viz.api.rest.responses.save_responses.write_api_response_to_fs"
+            "kedro_viz.api.rest.responses.save_responses.write_api_response_to_fs",
+            return_value="main_hash",
         )
 
         remote_fs = Mock()
 
-        save_api_main_response_to_fs(main_path, remote_fs)
+        content_hashes = save_api_main_response_to_fs(main_path, remote_fs)
 
+        assert content_hashes == {main_path: "main_hash"}
         mock_get_default_response.assert_called_once()
         mock_write_api_response_to_fs.assert_called_once_with(
-            main_path, mock_get_default_response.return_value, remote_fs
+            main_path, mock_get_default_response.return_value, remote_fs, (), False
         )
 
     def test_save_api_pipeline_response_to_fs(self, mocker):
@@ -102,8 +142,12 @@ class TestSaveAPIResponse:
 
         remote_fs = Mock()
 
-        save_api_pipeline_response_to_fs(pipelines_path, remote_fs)
+        content_hashes = save_api_pipeline_response_to_fs(pipelines_path, remote_fs)
 
+        assert content_hashes == {
+            f"{pipelines_path}/{pipelineId}": mock_write_api_response_to_fs.return_value
+            for pipelineId in pipelineIds
+        }
         assert mock_write_api_response_to_fs.call_count == len(pipelineIds)
         assert mock_get_selected_pipeline_response.call_count == len(pipelineIds)
 
@@ -112,6 +156,8 @@ class TestSaveAPIResponse:
                 f"{pipelines_path}/{pipelineId}",
                 mock_get_selected_pipeline_response.return_value,
                 remote_fs,
+                (),
+                False,
             )
             for pipelineId in pipelineIds
         ]
@@ -135,21 +181,167 @@ class TestSaveAPIResponse:
         )
         remote_fs = mock.Mock()
 
-        save_api_node_response_to_fs(nodes_path, remote_fs, False)
+        content_hashes = save_api_node_response_to_fs(nodes_path, remote_fs, False)
 
+        assert content_hashes == {
+            f"{nodes_path}/{nodeId}": mock_write_api_response_to_fs.return_value
+            for nodeId in nodeIds
+        }
         assert mock_write_api_response_to_fs.call_count == len(nodeIds)
-        assert mock_get_node_metadata_response.call_count == len(nodeIds)
+        mock_get_node_metadata_response.assert_has_calls(
+            [mock.call(nodeId, False) for nodeId in nodeIds], any_order=True
+        )
 
         expected_calls = [
             mock.call(
                 f"{nodes_path}/{nodeId}",
                 mock_get_node_metadata_response.return_value,
                 remote_fs,
+                (),
+                False,
             )
             for nodeId in nodeIds
         ]
         mock_write_api_response_to_fs.assert_has_calls(expected_calls, any_order=True)
 
+    def test_save_api_node_response_to_fs_in_parallel(self, mocker):
+        node_ids = [f"node_{index}" for index in range(4)]
+        # every node waits for the others while building its metadata,
+        # so all of them are saved at the same time
+        barrier = threading.Barrier(len(node_ids), timeout=5)
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.get_node_metadata_response",
+            side_effect=lambda node_id, _: {"id": node_id, "ready": barrier.wait()},
+        )
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager.nodes.get_node_ids",
+            return_value=node_ids,
+        )
+
+        content_hashes = save_api_node_response_to_fs(
+            "/nodes", mock.MagicMock(), False, max_workers=len(node_ids)
+        )
+
+        assert len(content_hashes) == len(node_ids)
+
+    def test_save_api_node_response_to_fs_is_bounded(self, mocker, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", "2")
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def get_node_metadata_response(node_id, _):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return {"id": node_id}
+
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.get_node_metadata_response",
+            side_effect=get_node_metadata_response,
+        )
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager.nodes.get_node_ids",
+            return_value=[f"node_{index}" for index in range(6)],
+        )
+
+        save_api_node_response_to_fs("/nodes", mock.MagicMock(), False)
+
+        assert max_running == 2
+
+    def test_save_api_node_response_to_fs_is_deterministic(self, tmp_path, mocker):
+        node_ids = [f"node_{index}" for index in range(8)]
+
+        def get_node_metadata_response(node_id, _):
+            # the first nodes are saved last
+            time.sleep(0.005 * (len(node_ids) - node_ids.index(node_id)))
+            return {"id": node_id}
+
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.get_node_metadata_response",
+            side_effect=get_node_metadata_response,
+        )
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager.nodes.get_node_ids",
+            return_value=node_ids,
+        )
+        nodes_path = str(tmp_path)
+
+        content_hashes = save_api_node_response_to_fs(
+            nodes_path, fsspec.filesystem("file"), False, max_workers=8
+        )
+
+        assert list(content_hashes) == [
+            f"{nodes_path}/{node_id}" for node_id in node_ids
+        ]
+        for node_id in node_ids:
+            saved_response = (tmp_path / node_id).read_bytes()
+            assert json.loads(saved_response) == {"id": node_id}
+            assert content_hashes[f"{nodes_path}/{node_id}"] == get_content_hash(
+                saved_response
+            )
+
+    def test_save_api_node_response_to_fs_reports_errors_per_node(self, mocker, caplog):
+        node_ids = ["01f456", "01f457", "01f458"]
+
+        def get_node_metadata_response(node_id, _):
+            if node_id != "01f457":
+                raise KeyError(f"broken {node_id}")
+            return {"id": node_id}
+
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.get_node_metadata_response",
+            side_effect=get_node_metadata_response,
+        )
+        mock_write_api_response_to_fs = mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.write_api_response_to_fs"
+        )
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager.nodes.get_node_ids",
+            return_value=node_ids,
+        )
+
+        with pytest.raises(
+            RuntimeError,
+            match="Failed to save node data for node IDs: 01f456, 01f458.",
+        ):
+            save_api_node_response_to_fs("/nodes", mock.Mock(), False)
+
+        # the other nodes are saved regardless
+        mock_write_api_response_to_fs.assert_called_once_with(
+            "/nodes/01f457", {"id": "01f457"}, mock.ANY, (), False
+        )
+        assert "Failed to save node data for node ID 01f456" in caplog.text
+        assert "broken 01f458" in caplog.text
+
+    def test_save_api_node_response_to_fs_reports_timed_out_previews(
+        self, mocker, caplog
+    ):
+        timed_out_metadata = mock.Mock(spec=DataNodeMetadata, is_preview_timed_out=True)
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.get_node_metadata_response",
+            side_effect=lambda node_id, _: (
+                timed_out_metadata if node_id == "01f457" else {"id": node_id}
+            ),
+        )
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.write_api_response_to_fs"
+        )
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager.nodes.get_node_ids",
+            return_value=["01f456", "01f457"],
+        )
+
+        content_hashes = save_api_node_response_to_fs("/nodes", mock.Mock(), True)
+
+        # the timed out previews are saved nonetheless
+        assert list(content_hashes) == ["/nodes/01f456", "/nodes/01f457"]
+        assert "The previews of node IDs 01f457 timed out" in caplog.text
+
     def test_save_api_run_status_response_to_fs(self, mocker):
         expected_run_status_response = {"nodes": {}, "datasets": {}, "pipeline": {}}
         run_status_path = "/run-status"
@@ -164,33 +356,100 @@ class TestSaveAPIResponse:
 
         remote_fs = Mock()
 
-        save_api_run_status_response_to_fs(run_status_path, remote_fs)
+        content_hashes = save_api_run_status_response_to_fs(run_status_path, remote_fs)
 
+        assert content_hashes == {
+            run_status_path: mock_write_api_response_to_fs.return_value
+        }
         mock_get_run_status_response.assert_called_once()
         mock_write_api_response_to_fs.assert_called_once_with(
-            run_status_path, mock_get_run_status_response.return_value, remote_fs
+            run_status_path,
+            mock_get_run_status_response.return_value,
+            remote_fs,
+            (),
+            False,
         )
 
-    @pytest.mark.parametrize(
-        "file_path, response, encoded_response",
-        [
-            (
-                "test_output.json",
-                {"key1": "value1", "key2": "value2"},
-                b'{"key1": "value1", "key2": "value2"}',
-            ),
-        ],
-    )
-    def test_write_api_response_to_fs(
-        self, file_path, response, encoded_response, mocker
-    ):
-        mock_encode_to_human_readable = mocker.patch(
-            "kedro_viz.api.rest.responses.utils.EnhancedORJSONResponse.encode_to_human_readable",
+    @pytest.mark.parametrize("human_readable", [True, False])
+    def test_write_api_response_to_fs(self, human_readable, mocker):
+        file_path = "test_output.json"
+        response = {"key1": "value1", "key2": "value2"}
+        encoded_response = b'{"key1":"value1","key2":"value2"}'
+        mock_get_encoded_response = mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.get_encoded_response",
             return_value=encoded_response,
         )
         with patch("fsspec.filesystem") as mock_filesystem:
             mockremote_fs = mock_filesystem.return_value
             mockremote_fs.open.return_value.__enter__.return_value = Mock()
-            write_api_response_to_fs(file_path, response, mockremote_fs)
+            content_hash = write_api_response_to_fs(
+                file_path, response, mockremote_fs, human_readable=human_readable
+            )
             mockremote_fs.open.assert_called_once_with(file_path, "wb")
-            mock_encode_to_human_readable.assert_called_once()
+            mock_get_encoded_response.assert_called_once_with(response, human_readable)
+            assert content_hash == get_content_hash(encoded_response)
+
+    def test_write_api_response_to_fs_with_compressed_siblings(self, tmp_path):
+        file_path = f"{tmp_path}/main"
+
+        content_hash = write_api_response_to_fs(
+            file_path, {"key": "value"}, fsspec.filesystem("file"), ["gzip"]
+        )
+
+        encoded_response = (tmp_path / "main").read_bytes()
+        assert content_hash == get_content_hash(encoded_response)
+        assert gzip.decompress((tmp_path / "main.gz").read_bytes()) == encoded_response
+
+    def test_save_api_responses_to_fs_with_unsupported_content_encoding(self, mocker):
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.get_supported_content_encodings",
+            return_value=["gzip"],
+        )
+        mock_data_access_manager = mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager"
+        )
+
+        with pytest.raises(ValueError, match="unsupported content encodings: br"):
+            save_api_responses_to_fs("shareableviz", Mock(), False, ["gzip", "br"])
+
+        mock_data_access_manager.materialise_all_pipelines.assert_not_called()
+
+    def test_save_api_manifest_to_fs(self, tmp_path):
+        remote_fs = fsspec.filesystem("file")
+        api_path = f"{tmp_path}/api"
+        remote_fs.makedirs(api_path, exist_ok=True)
+
+        save_api_manifest_to_fs(
+            api_path,
+            {
+                f"{api_path}/run-status": "run_status_hash",
+                f"{api_path}/main": "main_hash",
+                f"{api_path}/nodes/01f456": "node_hash",
+            },
+            remote_fs,
+        )
+
+        with open(f"{api_path}/manifest.json", encoding="utf-8") as file:
+            manifest = json.load(file)
+        assert list(manifest.items()) == [
+            ("main", "main_hash"),
+            ("nodes/01f456", "node_hash"),
+            ("run-status", "run_status_hash"),
+        ]
+
+    def test_manifest_matches_saved_responses(
+        self, example_api, data_access_manager, tmp_path, mocker
+    ):
+        mocker.patch(
+            "kedro_viz.api.rest.responses.save_responses.data_access_manager",
+            new=data_access_manager,
+        )
+        save_api_responses_to_fs(str(tmp_path), fsspec.filesystem("file"), False)
+
+        with open(tmp_path / "api" / "manifest.json", encoding="utf-8") as file:
+            manifest = json.load(file)
+        assert {"main", "run-status", "pipelines/__default__"} <= manifest.keys()
+        assert any(relative_path.startswith("nodes/") for relative_path in manifest)
+        for relative_path, content_hash in manifest.items():
+            saved_response = (tmp_path / "api" / relative_path).read_bytes()
+            assert get_content_hash(saved_response) == content_hash
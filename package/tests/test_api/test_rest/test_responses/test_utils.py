@@ -3,12 +3,20 @@ from unittest.mock import patch
 
 import pytest
 
+from kedro_viz.api.rest.responses.pipelines import (
+    NamedEntityAPIResponse,
+    NodeExtrasAPIResponse,
+)
 from kedro_viz.api.rest.responses.run_events import RunEventStatus
 from kedro_viz.api.rest.responses.utils import (
     EnhancedORJSONResponse,
     calculate_pipeline_duration,
     convert_status_to_enum,
+    get_content_hash,
     get_encoded_response,
+    get_etag,
+    get_jsonable_response,
+    is_etag_matched,
 )
 
 
@@ -28,25 +36,91 @@ class TestEnhancedORJSONResponse:
         assert result == expected
 
 
-def test_get_encoded_response(mocker):
-    mock_jsonable_encoder = mocker.patch(
-        "kedro_viz.api.rest.responses.utils.jsonable_encoder"
+class TestGetEncodedResponse:
+    def test_compact_model_response(self):
+        response = NamedEntityAPIResponse(id="data_science", name="Data Science")
+
+        assert get_encoded_response(response) == (
+            b'{"id":"data_science","name":"Data Science"}'
+        )
+
+    def test_human_readable_model_response(self):
+        response = NamedEntityAPIResponse(id="data_science", name="Data Science")
+
+        assert get_encoded_response(response, human_readable=True) == (
+            b'{\n  "id": "data_science",\n  "name": "Data Science"\n}'
+        )
+
+    def test_model_response_is_not_converted_to_python_objects(self, mocker):
+        mock_jsonable_encoder = mocker.patch(
+            "kedro_viz.api.rest.responses.utils.jsonable_encoder"
+        )
+        response = NodeExtrasAPIResponse(
+            stats={"rows": 10, "mean": float("nan")}, styles=None
+        )
+
+        assert get_encoded_response(response) == (
+            b'{"stats":{"rows":10,"mean":null},"styles":null}'
+        )
+        mock_jsonable_encoder.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "human_readable, expected",
+        [
+            (False, b'{"key":"value","1":[1,2]}'),
+            (True, b'{\n  "key": "value",\n  "1": [\n    1,\n    2\n  ]\n}'),
+        ],
     )
-    mock_encode_to_human_readable = mocker.patch(
-        "kedro_viz.api.rest.responses.utils.EnhancedORJSONResponse.encode_to_human_readable"
+    def test_other_response(self, human_readable, expected):
+        response = {"key": "value", 1: (1, 2)}
+
+        assert get_encoded_response(response, human_readable) == expected
+
+
+class TestGetJsonableResponse:
+    def test_model_response(self, mocker):
+        mock_jsonable_encoder = mocker.patch(
+            "kedro_viz.api.rest.responses.utils.jsonable_encoder"
+        )
+        response = NodeExtrasAPIResponse(stats={"rows": 10}, styles=None)
+
+        assert get_jsonable_response(response) == {
+            "stats": {"rows": 10},
+            "styles": None,
+        }
+        mock_jsonable_encoder.assert_not_called()
+
+    def test_other_response(self):
+        assert get_jsonable_response({"key": (1, 2)}) == {"key": [1, 2]}
+
+
+def test_get_content_hash():
+    assert get_content_hash(b"{}") == (
+        "44136fa355b3678a1146ad16f7e8649e94fb4fc21fe77e8310c060f61caaff8a"
     )
+    assert get_content_hash(b"{}") != get_content_hash(b"[]")
 
-    mock_response = {"key": "value"}
-    mock_jsonable_encoder.return_value = mock_response
-    mock_encoded_response = b"encoded-response"
-    mock_encode_to_human_readable.return_value = mock_encoded_response
 
-    result = get_encoded_response(mock_response)
+def test_get_etag():
+    assert get_etag(b"{}") == f'"{get_content_hash(b"{}")}"'
 
-    # Assertions
-    mock_jsonable_encoder.assert_called_once_with(mock_response)
-    mock_encode_to_human_readable.assert_called_once_with(mock_response)
-    assert result == mock_encoded_response
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ("", False),
+        ("*", True),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ('"other",W/"abc"', True),
+        ('"other"', False),
+        ("abc", False),
+    ],
+)
+def test_is_etag_matched(if_none_match, expected):
+    assert is_etag_matched(if_none_match, '"abc"') is expected
 
 
 @pytest.mark.parametrize(
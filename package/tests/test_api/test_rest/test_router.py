@@ -1,7 +1,9 @@
 import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi.responses import Response
 
 
 # Mock the Deployer class
@@ -132,3 +134,55 @@ def test_version(client):
     assert isinstance(json_response["installed"], str)
     assert isinstance(json_response["is_outdated"], bool)
     assert isinstance(json_response["latest"], str)
+
+
+@pytest.mark.parametrize(
+    "response_function, slow_url, fast_url",
+    [
+        (
+            "get_encoded_node_metadata_response",
+            "/api/nodes/13399a82",
+            "/api/pipelines/__default__/lineage/13399a82",
+        ),
+        (
+            "get_lineage_response",
+            "/api/pipelines/__default__/lineage/13399a82",
+            "/api/nodes/13399a82",
+        ),
+        (
+            "get_pipeline_stream_response",
+            "/api/pipelines/__default__/stream",
+            "/api/nodes/13399a82",
+        ),
+        (
+            "get_cache_stats_response",
+            "/api/cache/stats",
+            "/api/nodes/13399a82",
+        ),
+    ],
+)
+async def test_slow_responses_do_not_block_other_requests(
+    example_api, mocker, response_function, slow_url, fast_url
+):
+    from httpx import ASGITransport, AsyncClient
+
+    release = threading.Event()
+
+    def get_slow_response(*args):
+        release.wait(timeout=5)
+        return Response(content=b"{}", media_type="application/json")
+
+    mocker.patch(
+        f"kedro_viz.api.rest.router.{response_function}",
+        side_effect=get_slow_response,
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=example_api), base_url="http://test"
+    ) as async_client:
+        slow_request = asyncio.ensure_future(async_client.get(slow_url))
+        response = await async_client.get(fast_url)
+        assert response.status_code == 200
+        assert not slow_request.done()
+
+        release.set()
+        assert (await slow_request).status_code == 200
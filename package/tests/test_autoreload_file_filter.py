@@ -139,3 +139,15 @@ def test_filtered_out_by_default_filter(file_filter, tmp_path, mocker):
 
     result = file_filter(Change.modified, str(filtered_file))
     assert not result, "File should be filtered out by DefaultFilter"
+
+
+def test_cached_preview(file_filter, tmp_path):
+    """
+    Test that a preview cached by Kedro-Viz does not pass the filter.
+    """
+    cached_preview = tmp_path / ".viz" / "previews" / "0123abcd.json"
+    cached_preview.parent.mkdir(parents=True)
+    cached_preview.touch()
+
+    result = file_filter(Change.added, str(cached_preview))
+    assert not result, "Cached previews should not pass the filter"
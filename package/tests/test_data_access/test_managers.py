@@ -1,4 +1,7 @@
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from unittest.mock import MagicMock
 
@@ -9,7 +12,9 @@ from kedro.io.core import DatasetError
 from kedro.pipeline import Pipeline, node, pipeline
 from kedro_datasets.pandas import CSVDataset
 
+from kedro_viz import utils
 from kedro_viz.constants import DEFAULT_REGISTERED_PIPELINE_ID, ROOT_MODULAR_PIPELINE_ID
+from kedro_viz.data_access import managers
 from kedro_viz.data_access.managers import DataAccessManager
 from kedro_viz.data_access.repositories.catalog import CatalogRepository
 from kedro_viz.data_access.repositories.graph import GraphNodesRepository
@@ -25,6 +30,7 @@ from kedro_viz.models.flowchart.edge import GraphEdge
 from kedro_viz.models.flowchart.named_entities import Tag
 from kedro_viz.models.flowchart.nodes import (
     DataNode,
+    GraphNode,
     ParametersNode,
     TaskNode,
     TranscodedDataNode,
@@ -504,6 +510,9 @@ class TestAddPipelines:
             "model_inputs",
             "parameters",
             "params:uk.data_processing.train_test_split",
+            "uk",
+            "uk.data_processing",
+            "uk.data_science",
         }
         assert data_access_manager.tags.as_list() == [Tag(id="split"), Tag(id="train")]
         assert sorted(
@@ -519,7 +528,7 @@ class TestAddPipelines:
             ]
         )
         assert sorted(
-            data_access_manager.create_modular_pipelines_tree_for_registered_pipeline().keys()
+            data_access_manager.get_modular_pipelines_tree_for_registered_pipeline().keys()
         ) == sorted(
             [
                 ROOT_MODULAR_PIPELINE_ID,
@@ -529,6 +538,279 @@ class TestAddPipelines:
             ]
         )
 
+    def test_add_pipelines_constructs_shared_nodes_once(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+        mocker,
+    ):
+        create_task_node = mocker.spy(GraphNode, "create_task_node")
+        create_dataset_node = mocker.spy(data_access_manager, "create_dataset_node")
+        get_dataset = mocker.spy(data_access_manager.catalog, "get_dataset")
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+
+        # __default__ is the sum of the other registered pipelines,
+        # so each node is only constructed for the first one
+        assert create_task_node.call_count == 2
+        assert create_dataset_node.call_count == 5
+        assert get_dataset.call_count == 5
+
+        # while later registered pipelines still append their ID
+        train_model = next(
+            node
+            for node in data_access_manager.nodes.as_list()
+            if node.name == "train_model"
+        )
+        assert train_model.pipelines == {DEFAULT_REGISTERED_PIPELINE_ID, "data_science"}
+        model_inputs = next(
+            node
+            for node in data_access_manager.nodes.as_list()
+            if node.name == "model_inputs"
+        )
+        assert model_inputs.pipelines == {
+            DEFAULT_REGISTERED_PIPELINE_ID,
+            "data_science",
+            "data_processing",
+        }
+
+    def test_add_pipelines_lazily(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines, lazy=True)
+
+        # only the registered pipeline IDs are added up front ...
+        assert data_access_manager.registered_pipelines.get_pipeline_ids() == [
+            DEFAULT_REGISTERED_PIPELINE_ID,
+            "data_science",
+            "data_processing",
+        ]
+        assert list(data_access_manager.pending_pipelines) == list(example_pipelines)
+        assert not data_access_manager.nodes.as_list()
+        assert not data_access_manager.edges
+        assert not data_access_manager.modular_pipelines_trees
+        assert not data_access_manager.lineage_indexes
+
+        # ... and each registered pipeline is populated once it's materialised
+        version = data_access_manager.population_version
+        data_access_manager.materialise_pipeline("data_science")
+        assert {
+            node.name
+            for node in data_access_manager.nodes.get_nodes_by_pipeline_id(
+                "data_science"
+            )
+        } == {
+            "train_model",
+            "model_inputs",
+            "parameters",
+            "uk.data_science.model",
+            "uk",
+            "uk.data_science",
+        }
+        assert list(data_access_manager.modular_pipelines_trees) == ["data_science"]
+        assert list(data_access_manager.pending_pipelines) == [
+            DEFAULT_REGISTERED_PIPELINE_ID,
+            "data_processing",
+        ]
+        # all tags are known as soon as the first registered pipeline is materialised
+        assert {tag.id for tag in data_access_manager.tags.as_list()} == {
+            "split",
+            "train",
+        }
+        # the nodes of the other registered pipelines are still to be built
+        assert not data_access_manager.nodes.get_nodes_by_pipeline_id("data_processing")
+        # nodes already built don't change, so cached responses remain valid
+        assert data_access_manager.population_version == version
+
+        # materialising again is a no-op
+        data_access_manager.materialise_pipeline("data_science")
+        assert list(data_access_manager.modular_pipelines_trees) == ["data_science"]
+
+    def test_materialise_all_pipelines_matches_eager_population(
+        self,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+    ):
+        eager_manager = DataAccessManager()
+        eager_manager.add_catalog(example_catalog, example_pipelines)
+        eager_manager.add_pipelines(example_pipelines)
+
+        lazy_manager = DataAccessManager()
+        lazy_manager.add_catalog(example_catalog, example_pipelines)
+        lazy_manager.add_pipelines(example_pipelines, lazy=True)
+        lazy_manager.materialise_all_pipelines()
+
+        assert not lazy_manager.pending_pipelines
+        assert lazy_manager.nodes.as_list() == eager_manager.nodes.as_list()
+        assert lazy_manager.tags.as_list() == eager_manager.tags.as_list()
+        for registered_pipeline_id in example_pipelines:
+            assert set(
+                lazy_manager.get_edges_for_registered_pipeline(registered_pipeline_id)
+            ) == set(
+                eager_manager.get_edges_for_registered_pipeline(registered_pipeline_id)
+            )
+            assert dict(
+                lazy_manager.get_modular_pipelines_tree_for_registered_pipeline(
+                    registered_pipeline_id
+                )
+            ) == dict(
+                eager_manager.get_modular_pipelines_tree_for_registered_pipeline(
+                    registered_pipeline_id
+                )
+            )
+
+    @pytest.mark.parametrize(
+        "registered_pipeline_ids",
+        [
+            ["data_science", "data_processing", DEFAULT_REGISTERED_PIPELINE_ID],
+            ["data_processing", DEFAULT_REGISTERED_PIPELINE_ID, "data_science"],
+        ],
+    )
+    def test_graph_does_not_depend_on_materialisation_order(
+        self,
+        registered_pipeline_ids,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+    ):
+        eager_manager = DataAccessManager()
+        eager_manager.add_catalog(example_catalog, example_pipelines)
+        eager_manager.add_pipelines(example_pipelines)
+
+        lazy_manager = DataAccessManager()
+        lazy_manager.add_catalog(example_catalog, example_pipelines)
+        lazy_manager.add_pipelines(example_pipelines, lazy=True)
+
+        def get_nodes_fields(manager, registered_pipeline_id):
+            return [
+                (
+                    node.id,
+                    node.tags,
+                    node.pipelines,
+                    getattr(node, "is_free_input", None),
+                )
+                for node in manager.get_nodes_for_registered_pipeline(
+                    registered_pipeline_id
+                )
+            ]
+
+        # every registered pipeline is the same as if all were added up front
+        # as soon as it's materialised, and stays the same afterwards
+        for materialised_count, registered_pipeline_id in enumerate(
+            registered_pipeline_ids, start=1
+        ):
+            lazy_manager.materialise_pipeline(registered_pipeline_id)
+            for materialised_pipeline_id in registered_pipeline_ids[
+                :materialised_count
+            ]:
+                assert get_nodes_fields(
+                    lazy_manager, materialised_pipeline_id
+                ) == get_nodes_fields(eager_manager, materialised_pipeline_id)
+            assert lazy_manager.tags.as_list() == eager_manager.tags.as_list()
+
+    @pytest.mark.parametrize(
+        "registered_pipeline_ids",
+        [
+            ["data_science", DEFAULT_REGISTERED_PIPELINE_ID],
+            [DEFAULT_REGISTERED_PIPELINE_ID, "data_science"],
+        ],
+    )
+    def test_transcoded_data_does_not_depend_on_materialisation_order(
+        self,
+        registered_pipeline_ids,
+        example_transcoded_catalog: DataCatalog,
+    ):
+        def process_data(raw_data):
+            pass
+
+        def train_model(model_inputs):
+            pass
+
+        data_science_pipeline = pipeline(
+            [node(train_model, inputs="model_inputs@pandas", outputs="model")]
+        )
+        pipelines = {
+            DEFAULT_REGISTERED_PIPELINE_ID: pipeline(
+                [node(process_data, inputs="raw_data", outputs="model_inputs@pandas2")]
+            )
+            + data_science_pipeline,
+            "data_science": data_science_pipeline,
+        }
+
+        eager_manager = DataAccessManager()
+        eager_manager.add_catalog(example_transcoded_catalog, pipelines)
+        eager_manager.add_pipelines(pipelines)
+
+        lazy_manager = DataAccessManager()
+        lazy_manager.add_catalog(example_transcoded_catalog, pipelines)
+        lazy_manager.add_pipelines(pipelines, lazy=True)
+
+        def get_transcoded_fields(manager):
+            return [
+                (
+                    node.id,
+                    node.original_name,
+                    node.original_version,
+                    node.transcoded_versions,
+                    node.is_free_input,
+                )
+                for node in manager.nodes.as_list()
+                if isinstance(node, TranscodedDataNode)
+            ]
+
+        for registered_pipeline_id in registered_pipeline_ids:
+            lazy_manager.materialise_pipeline(registered_pipeline_id)
+            assert get_transcoded_fields(lazy_manager) == get_transcoded_fields(
+                eager_manager
+            )
+
+    def test_materialise_pipeline_is_single_flight(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+        mocker,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines, lazy=True)
+
+        all_threads_started = threading.Barrier(4)
+        add_pipeline = data_access_manager.add_pipeline
+
+        def slow_add_pipeline(*args):
+            # give the other threads time to request the same pipeline
+            time.sleep(0.1)
+            add_pipeline(*args)
+
+        add_pipeline_mock = mocker.patch.object(
+            data_access_manager,
+            "add_pipeline",
+            side_effect=slow_add_pipeline,
+        )
+
+        def request_pipeline():
+            all_threads_started.wait()
+            data_access_manager.materialise_pipeline("data_science")
+            # every caller sees the pipeline fully materialised
+            assert (
+                data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
+                    "data_science"
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(request_pipeline) for _ in range(4)]
+            for future in futures:
+                future.result()
+
+        add_pipeline_mock.assert_called_once_with(
+            "data_science", example_pipelines["data_science"]
+        )
+
     def test_add_pipelines_with_transcoded_data(
         self,
         data_access_manager: DataAccessManager,
@@ -562,12 +844,228 @@ class TestAddPipelines:
         data_access_manager.add_catalog(DataCatalog(), registered_pipelines)
         data_access_manager.add_pipelines(registered_pipelines)
         modular_pipeline_tree = (
-            data_access_manager.create_modular_pipelines_tree_for_registered_pipeline(
+            data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
                 DEFAULT_REGISTERED_PIPELINE_ID
             )
         )
         assert len(modular_pipeline_tree["__root__"].children) == 3
 
+    def test_modular_pipelines_tree_is_computed_once_on_add(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+        edges_before = set(
+            data_access_manager.get_edges_for_registered_pipeline("data_science")
+        )
+        nodes_before = data_access_manager.nodes.get_node_ids()
+
+        modular_pipelines_tree = (
+            data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
+                "data_science"
+            )
+        )
+
+        assert (
+            data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
+                "data_science"
+            )
+            is modular_pipelines_tree
+        )
+        assert edges_before == set(
+            data_access_manager.get_edges_for_registered_pipeline("data_science")
+        )
+        assert nodes_before == data_access_manager.nodes.get_node_ids()
+        with pytest.raises(TypeError):
+            modular_pipelines_tree["uk"] = None  # type: ignore[index]
+
+    def test_add_pipelines_with_colliding_ids(
+        self, data_access_manager: DataAccessManager, mocker
+    ):
+        real_hash = utils._hash
+        # the datasets `x` and `y` collide on their first 8 characters
+        mocker.patch(
+            "kedro_viz.utils._hash",
+            side_effect=lambda value, length=8: (
+                "0" * length
+                if value in {"x", "y"} and length == 8
+                else real_hash(value, length)
+            ),
+        )
+        kedro_pipeline = pipeline([node(identity, "x", "y", name="identity_node")])
+        task_node_id = real_hash(str(kedro_pipeline.nodes[0]))
+
+        data_access_manager.add_catalog(DataCatalog(), {"__default__": kedro_pipeline})
+        data_access_manager.add_pipelines({"__default__": kedro_pipeline})
+
+        data_nodes = [
+            node
+            for node in data_access_manager.nodes.as_list()
+            if isinstance(node, DataNode)
+        ]
+        assert [(node.name, node.id) for node in data_nodes] == [
+            ("x", "00000000"),
+            ("y", real_hash("y", 9)),
+        ]
+        assert data_access_manager.get_edges_for_registered_pipeline() == [
+            GraphEdge(source="00000000", target=task_node_id),
+            GraphEdge(source=task_node_id, target=real_hash("y", 9)),
+        ]
+
+    def test_sorted_layers_are_scoped_and_cached_per_registered_pipeline(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+        mocker,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+        sort_layers = mocker.spy(managers.layers_services, "sort_layers")
+
+        for _ in range(2):
+            assert data_access_manager.get_sorted_layers_for_registered_pipeline(
+                "__default__"
+            ) == ["raw", "model_inputs"]
+            assert data_access_manager.get_sorted_layers_for_registered_pipeline(
+                "data_science"
+            ) == ["model_inputs"]
+        assert sort_layers.call_count == 2
+
+        # the layers are sorted again when the registered pipeline is added again
+        data_access_manager.add_pipeline(
+            "data_science", example_pipelines["data_science"]
+        )
+        data_access_manager.get_sorted_layers_for_registered_pipeline("data_science")
+        assert sort_layers.call_count == 3
+
+    def test_lineage_index_is_built_on_first_request(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+
+        assert not data_access_manager.lineage_indexes
+        ancestors, descendants = (
+            data_access_manager.get_lineage_for_registered_pipeline(
+                DEFAULT_REGISTERED_PIPELINE_ID, "0ecea0de"
+            )
+        )
+        assert list(data_access_manager.lineage_indexes) == [
+            DEFAULT_REGISTERED_PIPELINE_ID
+        ]
+        # modular pipelines are left out of the lineage
+        assert sorted(ancestors) == ["13399a82", "782e4a43", "f0ebef01"]
+        assert sorted(descendants) == ["d5a8b994", "f2b25286"]
+
+        # the lineage is scoped to the registered pipeline
+        ancestors, descendants = (
+            data_access_manager.get_lineage_for_registered_pipeline(
+                "data_science", "0ecea0de"
+            )
+        )
+        assert ancestors == []
+        assert sorted(descendants) == ["d5a8b994", "f2b25286"]
+
+    def test_lineage_index_is_single_flight(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+        mocker,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+
+        all_threads_started = threading.Barrier(4)
+        lineage_index_class = managers.lineage_services.LineageIndex
+
+        def slow_lineage_index(edges):
+            # give the other threads time to request the same lineage
+            time.sleep(0.1)
+            return lineage_index_class(edges)
+
+        lineage_index_mock = mocker.patch.object(
+            managers.lineage_services, "LineageIndex", side_effect=slow_lineage_index
+        )
+
+        def request_lineage():
+            all_threads_started.wait()
+            _, descendants = data_access_manager.get_lineage_for_registered_pipeline(
+                "data_science", "0ecea0de"
+            )
+            assert sorted(descendants) == ["d5a8b994", "f2b25286"]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(request_lineage) for _ in range(4)]
+            for future in futures:
+                future.result()
+        # later requests look up the same index
+        data_access_manager.get_lineage_for_registered_pipeline(
+            "data_science", "0ecea0de"
+        )
+
+        lineage_index_mock.assert_called_once()
+
+    def test_lineage_materialises_lazy_pipeline(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines, lazy=True)
+
+        _, descendants = data_access_manager.get_lineage_for_registered_pipeline(
+            "data_science", "0ecea0de"
+        )
+        assert "data_science" not in data_access_manager.pending_pipelines
+        # modular pipelines are left out of the lineage
+        assert sorted(descendants) == ["d5a8b994", "f2b25286"]
+
+    def test_lineage_of_unknown_registered_pipeline(
+        self, data_access_manager: DataAccessManager
+    ):
+        assert data_access_manager.get_lineage_for_registered_pipeline(
+            "unknown", "node"
+        ) == ([], [])
+
+    def test_modular_pipeline_nodes_are_owned_by_registered_pipeline(
+        self,
+        data_access_manager: DataAccessManager,
+        example_pipelines: Dict[str, Pipeline],
+        example_catalog: DataCatalog,
+    ):
+        data_access_manager.add_catalog(example_catalog, example_pipelines)
+        data_access_manager.add_pipelines(example_pipelines)
+
+        for registered_pipeline_id in ["data_science", DEFAULT_REGISTERED_PIPELINE_ID]:
+            uk_node = next(
+                node
+                for node in data_access_manager.get_nodes_for_registered_pipeline(
+                    registered_pipeline_id
+                )
+                if node.id == "uk"
+            )
+            assert uk_node.pipelines == {registered_pipeline_id}
+
+        default_tree = (
+            data_access_manager.get_modular_pipelines_tree_for_registered_pipeline()
+        )
+        data_science_tree = (
+            data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
+                "data_science"
+            )
+        )
+        assert default_tree["uk"].tags == {"split", "train"}
+        assert data_science_tree["uk"].tags == {"train"}
+
     def test_get_default_selected_pipelines_without_default(
         self,
         data_access_manager: DataAccessManager,
@@ -631,7 +1129,7 @@ class TestAddPipelines:
         }
         data_access_manager.add_catalog(DataCatalog(), registered_pipelines)
         data_access_manager.add_pipelines(registered_pipelines)
-        data_access_manager.create_modular_pipelines_tree_for_registered_pipeline(
+        data_access_manager.get_modular_pipelines_tree_for_registered_pipeline(
             DEFAULT_REGISTERED_PIPELINE_ID
         )
         edges = data_access_manager.get_edges_for_registered_pipeline(
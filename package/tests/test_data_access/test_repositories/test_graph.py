@@ -1,3 +1,4 @@
+import pytest
 from kedro.pipeline import node
 
 from kedro_viz.data_access.repositories import (
@@ -18,6 +19,39 @@ class TestGraphNodeRepository:
         repo.add_node(task_node)
         assert repo.get_node_by_id(task_node.id) is task_node
 
+    def test_as_dict(self, identity):
+        repo = GraphNodesRepository()
+        task_node = GraphNode.create_task_node(
+            node(identity, inputs="x", outputs=None), "identity_node", None
+        )
+        repo.add_node(task_node)
+        assert repo.as_dict() == {task_node.id: task_node}
+
+    def test_add_existing_node_merges_tags(self, identity):
+        repo = GraphNodesRepository()
+        kedro_node = node(identity, inputs="x", outputs=None, tags=["a"])
+        task_node = GraphNode.create_task_node(kedro_node, "identity_node", None)
+        duplicate_task_node = GraphNode.create_task_node(
+            kedro_node.tag(["b"]), "identity_node", None
+        )
+        repo.add_node(task_node)
+        assert repo.add_node(duplicate_task_node) is task_node
+        assert task_node.tags == {"a", "b"}
+        assert repo.as_list() == [task_node]
+
+    def test_get_or_create_node(self, identity, mocker):
+        repo = GraphNodesRepository()
+        task_node = GraphNode.create_task_node(
+            node(identity, inputs="x", outputs=None), "identity_node", None
+        )
+        create_node = mocker.Mock(return_value=task_node)
+
+        assert repo.get_or_create_node("identity_node", create_node) is task_node
+        assert repo.get_or_create_node("identity_node", create_node) is task_node
+        create_node.assert_called_once()
+        assert repo.get_node_by_id("identity_node") is task_node
+        assert repo.as_list() == [task_node]
+
     def test_filter_by_ids(self, identity):
         repo = GraphNodesRepository()
         task_node_ids = []
@@ -37,6 +71,38 @@ class TestGraphNodeRepository:
         assert task_nodes[-1] not in filtered
         assert repo.get_nodes_by_ids({"not exist"}) == []
 
+    def test_get_nodes_by_pipeline_id(self, identity):
+        repo = GraphNodesRepository()
+        task_nodes = [
+            repo.add_node(
+                GraphNode.create_task_node(
+                    node(identity, inputs="x", outputs=None, name=f"identity_{i}"),
+                    f"identity_{i}",
+                    None,
+                )
+            )
+            for i in range(4)
+        ]
+        # nodes are sorted in repository order whatever the order they are added in
+        for i in [3, 1, 3, 0]:
+            repo.add_node_to_pipeline("pipeline", f"identity_{i}")
+        repo.add_node_to_pipeline("other_pipeline", "identity_2")
+        assert repo.get_nodes_by_pipeline_id("pipeline") == [
+            task_nodes[3],
+            task_nodes[1],
+            task_nodes[0],
+        ]
+        repo.sort_pipeline_nodes("pipeline")
+        repo.sort_pipeline_nodes("other_pipeline")
+
+        assert repo.get_nodes_by_pipeline_id("pipeline") == [
+            task_nodes[0],
+            task_nodes[1],
+            task_nodes[3],
+        ]
+        assert repo.get_nodes_by_pipeline_id("other_pipeline") == [task_nodes[2]]
+        assert repo.get_nodes_by_pipeline_id("not exist") == []
+
     def test_get_node_ids(self, identity):
         repo = GraphNodesRepository()
         task_node = GraphNode.create_task_node(
@@ -59,3 +125,61 @@ class TestGraphEdgesRepository:
             ab,
             da,
         }
+
+    def test_adjacency(self):
+        ab = GraphEdge(source="a", target="b")
+        ac = GraphEdge(source="a", target="c")
+        cb = GraphEdge(source="c", target="b")
+        repo = GraphEdgesRepository()
+        for edge in [ab, ac, cb, ab]:
+            repo.add_edge(edge)
+
+        assert repo.as_list() == [ab, ac, cb]
+        assert repo.get_successors("a") == ["b", "c"]
+        assert repo.get_predecessors("b") == ["a", "c"]
+        assert repo.get_successors("b") == []
+
+        repo.remove_edge(ac)
+        assert list(repo) == [ab, cb]
+        assert repo.get_successors("a") == ["b"]
+        assert repo.get_predecessors("c") == []
+
+    @pytest.mark.parametrize(
+        "depth, direction, expected",
+        [
+            (0, "both", {"c"}),
+            (1, "down", {"c", "d"}),
+            (2, "down", {"c", "d", "e"}),
+            (1, "up", {"b", "c"}),
+            (5, "up", {"a", "b", "c"}),
+            (1, "both", {"b", "c", "d"}),
+            (2, "both", {"a", "b", "c", "d", "e", "x"}),
+        ],
+    )
+    def test_get_neighbourhood(self, depth, direction, expected):
+        repo = GraphEdgesRepository()
+        for source, target in [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e")]:
+            repo.add_edge(GraphEdge(source=source, target=target))
+        repo.add_edge(GraphEdge(source="x", target="d"))
+
+        assert repo.get_neighbourhood("c", depth, direction) == expected
+
+    def test_get_neighbourhood_skips_nodes(self):
+        repo = GraphEdgesRepository()
+        for source, target in [("a", "b"), ("b", "c"), ("a", "m"), ("m", "c")]:
+            repo.add_edge(GraphEdge(source=source, target=target))
+
+        assert repo.get_neighbourhood("a", 1, skipped_node_ids={"m"}) == {"a", "b"}
+        assert repo.get_neighbourhood("m", 1, skipped_node_ids={"m"}) == {
+            "a",
+            "c",
+            "m",
+        }
+
+    def test_get_neighbourhood_unsupported_direction(self):
+        with pytest.raises(
+            ValueError,
+            match="Direction 'sideways' is not supported. "
+            "Supported directions are: up, down, both.",
+        ):
+            GraphEdgesRepository().get_neighbourhood("a", 1, "sideways")
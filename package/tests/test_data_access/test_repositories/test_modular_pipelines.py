@@ -2,12 +2,14 @@ from unittest import mock
 
 import pytest
 from kedro.pipeline import Pipeline as KedroPipeline
+from kedro.pipeline import node
 from kedro.pipeline.node import Node as KedroNode
 
 from kedro_viz.constants import ROOT_MODULAR_PIPELINE_ID
 from kedro_viz.data_access.repositories import ModularPipelinesRepository
 from kedro_viz.models.flowchart.model_utils import GraphNodeType
 from kedro_viz.models.flowchart.nodes import ModularPipelineChild, ModularPipelineNode
+from kedro_viz.utils import _hash_input_output
 
 
 @pytest.fixture
@@ -33,15 +35,50 @@ def mock_kedro_nodes():
     ]
 
 
+def identity(x):
+    return x
+
+
+class SubPipelineModularPipelinesRepository(ModularPipelinesRepository):
+    """Populate the tree by constructing the sub-pipeline of every modular pipeline,
+    as a reference for the single pass aggregation."""
+
+    def populate_tree(self, pipeline):
+        namespaces = {node.namespace for node in pipeline.nodes if node.namespace}
+        modular_pipeline_ids = {
+            modular_pipeline_id
+            for ns in namespaces
+            for modular_pipeline_id in self._explode_namespace(ns)
+        }
+
+        for modular_pipeline_id in sorted(modular_pipeline_ids):
+            self.get_or_create_modular_pipeline(modular_pipeline_id)
+
+            sub_pipeline = pipeline.only_nodes_with_namespaces([modular_pipeline_id])
+            rest_of_the_pipeline = pipeline - sub_pipeline
+
+            free_inputs = sub_pipeline.inputs()
+            free_outputs = sub_pipeline.outputs() | (
+                rest_of_the_pipeline.inputs() & sub_pipeline.all_outputs()
+            )
+
+            self._add_inputs(modular_pipeline_id, free_inputs)
+            self._add_outputs(modular_pipeline_id, free_outputs)
+            self._add_children(modular_pipeline_id, sub_pipeline.nodes)
+
+
 @pytest.fixture
-def mock_pipeline():
-    pipeline = mock.MagicMock(spec=KedroPipeline)
-    pipeline.nodes = [
-        mock.MagicMock(namespace="namespace1"),
-        mock.MagicMock(namespace="namespace2"),
-        mock.MagicMock(namespace="namespace3.sub_namespace"),
-    ]
-    return pipeline
+def example_transcoded_nested_namespace_pipeline():
+    return KedroPipeline(
+        [
+            node(identity, "raw@pandas", "cleaned@spark", namespace="uk.cleaning"),
+            node(identity, "cleaned@pandas", "features", namespace="uk.features"),
+            node(identity, "features", "model", namespace="uk.features.training"),
+            node(identity, "cleaned@spark", "summary@pandas", namespace="uk"),
+            node(identity, "params:split", "split", namespace="uk.cleaning"),
+            node(identity, "summary@spark", "report"),
+        ]
+    )
 
 
 @pytest.fixture
@@ -60,56 +97,59 @@ class TestModularPipelinesRepository:
     def test_init_should_create_a_tree_with_default_root(self, mock_modular_pipelines):
         assert ROOT_MODULAR_PIPELINE_ID in mock_modular_pipelines.tree
 
-    def test_populate_tree(self, mocker, mock_modular_pipelines, mock_pipeline):
-        mocker.patch.object(mock_modular_pipelines, "get_or_create_modular_pipeline")
-        mocker.patch.object(mock_modular_pipelines, "_add_inputs")
-        mocker.patch.object(mock_modular_pipelines, "_add_outputs")
-        mocker.patch.object(mock_modular_pipelines, "_add_children")
-
-        sub_pipeline_mock = mock.MagicMock()
-        sub_pipeline_mock.inputs.return_value = {"input1", "input2"}
-        sub_pipeline_mock.outputs.return_value = {"output1"}
-        sub_pipeline_mock.all_outputs.return_value = {"output1", "output2"}
-        sub_pipeline_mock.nodes = ["node1", "node2"]
-
-        mocker.patch.object(
-            mock_pipeline, "only_nodes_with_namespaces", return_value=sub_pipeline_mock
+    @pytest.mark.parametrize(
+        "pipeline_fixture",
+        [
+            "example_pipeline_with_dataset_as_input_and_output",
+            "example_pipeline_with_dataset_as_input_to_outer_namespace",
+            "example_pipeline_with_node_namespaces",
+            "example_pipeline_with_dataset_as_input_to_nested_namespace",
+            "example_nested_namespace_pipeline_with_internal_datasets",
+            "example_transcoded_nested_namespace_pipeline",
+        ],
+    )
+    def test_populate_tree(self, pipeline_fixture, request):
+        pipeline = request.getfixturevalue(pipeline_fixture)
+        modular_pipelines = ModularPipelinesRepository()
+        expected_modular_pipelines = SubPipelineModularPipelinesRepository()
+
+        modular_pipelines.populate_tree(pipeline)
+        expected_modular_pipelines.populate_tree(pipeline)
+
+        assert modular_pipelines.tree.keys() == expected_modular_pipelines.tree.keys()
+        for modular_pipeline_id, expected in expected_modular_pipelines.tree.items():
+            modular_pipeline = modular_pipelines.tree[modular_pipeline_id]
+            assert modular_pipeline.inputs == expected.inputs
+            assert modular_pipeline.outputs == expected.outputs
+            assert modular_pipeline.children == expected.children
+            assert modular_pipeline.tags == expected.tags
+        assert modular_pipelines.parameters == expected_modular_pipelines.parameters
+        assert (
+            modular_pipelines.node_mod_pipeline_map
+            == expected_modular_pipelines.node_mod_pipeline_map
         )
-        rest_of_the_pipeline_mock = mock_pipeline - sub_pipeline_mock
-        rest_of_the_pipeline_mock.inputs.return_value = {"output2"}
-
-        mock_modular_pipelines.populate_tree(mock_pipeline)
 
-        modular_pipeline_ids = {
-            "namespace1",
-            "namespace2",
-            "namespace3",
-            "namespace3.sub_namespace",
-        }
-
-        assert mock_modular_pipelines.get_or_create_modular_pipeline.call_count == len(
-            modular_pipeline_ids
+    def test_populate_tree_with_dataset_consumed_inside_and_outside(self):
+        pipeline = KedroPipeline(
+            [
+                node(identity, "raw", "intermediate", namespace="outer.inner"),
+                node(identity, "intermediate", "model", namespace="outer.inner"),
+                node(identity, "intermediate", "report", namespace="outer"),
+            ]
         )
-        for modular_pipeline_id in sorted(modular_pipeline_ids):
-            mock_modular_pipelines.get_or_create_modular_pipeline.assert_any_call(
-                modular_pipeline_id
-            )
-            mock_modular_pipelines._add_inputs.assert_any_call(
-                modular_pipeline_id, {"input1", "input2"}
-            )
-            mock_modular_pipelines._add_outputs.assert_any_call(
-                modular_pipeline_id, {"output1", "output2"}
-            )
-            mock_modular_pipelines._add_children.assert_any_call(
-                modular_pipeline_id, ["node1", "node2"]
-            )
+        modular_pipelines = ModularPipelinesRepository()
+        modular_pipelines.populate_tree(pipeline)
 
-        mock_pipeline.only_nodes_with_namespaces.assert_any_call(["namespace1"])
-        mock_pipeline.only_nodes_with_namespaces.assert_any_call(["namespace2"])
-        mock_pipeline.only_nodes_with_namespaces.assert_any_call(["namespace3"])
-        mock_pipeline.only_nodes_with_namespaces.assert_any_call(
-            ["namespace3.sub_namespace"]
-        )
+        # consumed outside of outer.inner, hence a free output of it
+        assert modular_pipelines.tree["outer.inner"].outputs == {
+            _hash_input_output("intermediate"),
+            _hash_input_output("model"),
+        }
+        # only consumed within outer, hence not an output of it
+        assert modular_pipelines.tree["outer"].outputs == {
+            _hash_input_output("model"),
+            _hash_input_output("report"),
+        }
 
     def test_get_or_create_modular_pipeline(self, mock_modular_pipelines):
         mock_modular_pipelines.get_or_create_modular_pipeline("data_science")
@@ -131,10 +171,7 @@ class TestModularPipelinesRepository:
 
         mock_modular_pipelines.tree = {modular_pipeline_id: mock.MagicMock()}
 
-        mocker.patch(
-            "kedro_viz.data_access.repositories.modular_pipelines._hash_input_output",
-            side_effect=lambda value: value,
-        )
+        mocker.patch("kedro_viz.utils._hash", side_effect=lambda value: value)
 
         mock_modular_pipelines._add_inputs(modular_pipeline_id, inputs)
 
@@ -147,10 +184,7 @@ class TestModularPipelinesRepository:
 
         mock_modular_pipelines.tree = {modular_pipeline_id: mock.MagicMock()}
 
-        mocker.patch(
-            "kedro_viz.data_access.repositories.modular_pipelines._hash_input_output",
-            side_effect=lambda value: value,
-        )
+        mocker.patch("kedro_viz.utils._hash", side_effect=lambda value: value)
 
         mock_modular_pipelines._add_inputs(modular_pipeline_id, outputs)
 
@@ -221,14 +255,7 @@ class TestModularPipelinesRepository:
         )
         modular_pipeline_inputs_outputs = {"input1", "output1", "input3", "output3"}
 
-        mocker.patch(
-            "kedro_viz.data_access.repositories.modular_pipelines._hash",
-            side_effect=lambda value: value,
-        )
-        mocker.patch(
-            "kedro_viz.data_access.repositories.modular_pipelines._hash_input_output",
-            side_effect=lambda value: value,
-        )
+        mocker.patch("kedro_viz.utils._hash", side_effect=lambda value: value)
 
         mock_modular_pipelines._add_nodes_and_datasets_as_children(
             modular_pipeline_node, mock_kedro_nodes, modular_pipeline_inputs_outputs
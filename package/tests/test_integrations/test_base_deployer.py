@@ -14,10 +14,10 @@ class TestBaseDeployer:
             "kedro_viz.integrations.deployment.base_deployer.save_api_responses_to_fs"
         )
         build = ConcreteBaseDeployer()
-        build._upload_api_responses(False)
+        build._upload_api_responses(False, ("gzip",), True)
 
         save_api_responses_to_fs_mock.assert_called_once_with(
-            build._path, build._fs, False
+            build._path, build._fs, False, ("gzip",), True
         )
 
     def test_upload_static_files(self, mocker):
@@ -70,10 +70,10 @@ class TestBaseDeployer:
         mocker.patch.object(build, "_upload_api_responses")
         mocker.patch.object(build, "_upload_deploy_viz_metadata_file")
 
-        build.deploy()
+        build.deploy(human_readable=True)
 
         build._upload_static_files.assert_called_once_with(_HTML_DIR)
-        build._upload_api_responses.assert_called_once()
+        build._upload_api_responses.assert_called_once_with(False, (), True)
         build._upload_deploy_viz_metadata_file.assert_called_once()
 
 
@@ -9,10 +9,12 @@ from kedro.io import DataCatalog, MemoryDataset
 from kedro.pipeline import Pipeline, node
 from kedro.pipeline.node import Node as KedroNode
 
+from kedro_viz.data_access.managers import DataAccessManager
 from kedro_viz.integrations.kedro.run_hooks import (
     PipelineRunStatusHook,
     create_dataset_event,
 )
+from kedro_viz.utils import _hash, id_registry
 
 
 @pytest.fixture()
@@ -51,11 +53,131 @@ class TestCatalogCreation:
 
 
 class TestPipelineRunLifecycle:
-    def test_before_pipeline_run_default(self, hooks, example_pipelines):
+    def test_before_pipeline_run_default(self, hooks, example_pipelines, mocker):
+        mocker.patch(
+            "kedro_viz.integrations.kedro.run_hooks.registered_pipelines",
+            new=example_pipelines,
+        )
+        id_registry = mocker.patch("kedro_viz.integrations.kedro.run_hooks.id_registry")
         default_pipeline = example_pipelines["__default__"]
         hooks.before_pipeline_run({"pipeline_name": None}, default_pipeline)
         assert hooks._all_nodes == list(default_pipeline.nodes)
         assert hooks._events and hooks._events[0]["event"] == "before_pipeline_run"
+        # the IDs of all registered pipelines are allocated, as in the flowchart
+        assert list(id_registry.allocate_pipeline_ids.call_args.args[0]) == list(
+            example_pipelines.values()
+        )
+        id_registry.clear.assert_not_called()
+
+    def test_before_pipeline_run_allocates_ids_once_per_session(
+        self, hooks, example_pipelines, mocker
+    ):
+        mocker.patch(
+            "kedro_viz.integrations.kedro.run_hooks.registered_pipelines",
+            new=example_pipelines,
+        )
+        id_registry = mocker.patch("kedro_viz.integrations.kedro.run_hooks.id_registry")
+        default_pipeline = example_pipelines["__default__"]
+
+        hooks.before_pipeline_run({"pipeline_name": None}, default_pipeline)
+        hooks.before_pipeline_run({"pipeline_name": None}, default_pipeline)
+        assert id_registry.allocate_pipeline_ids.call_count == 1
+
+        hooks.after_context_created(mocker.Mock())
+        hooks.before_pipeline_run({"pipeline_name": None}, default_pipeline)
+        assert id_registry.allocate_pipeline_ids.call_count == 2
+
+    def test_before_pipeline_run_without_registered_pipelines(
+        self, hooks, example_pipelines, mocker
+    ):
+        mocker.patch(
+            "kedro_viz.integrations.kedro.run_hooks.registered_pipelines", new={}
+        )
+        id_registry = mocker.patch("kedro_viz.integrations.kedro.run_hooks.id_registry")
+        default_pipeline = example_pipelines["__default__"]
+        hooks.before_pipeline_run({"pipeline_name": None}, default_pipeline)
+
+        id_registry.allocate_pipeline_ids.assert_called_once_with([default_pipeline])
+
+    def test_event_ids_match_flowchart_on_collision_outside_pipeline_run(
+        self, hooks, mocker
+    ):
+        def identity(x):
+            return x
+
+        pipeline_run = Pipeline(
+            [node(identity, inputs="raw_data", outputs="model_inputs", name="run")]
+        )
+        other_pipeline = Pipeline(
+            [node(identity, inputs="model", outputs="another_model", name="other")]
+        )
+        pipelines = {"__default__": pipeline_run, "other": other_pipeline}
+        mocker.patch(
+            "kedro_viz.integrations.kedro.run_hooks.registered_pipelines",
+            new=pipelines,
+        )
+        # `another_model`, outside the pipeline run, is allocated first
+        # and collides with `model_inputs`, which is widened in the flowchart
+        mocker.patch(
+            "kedro_viz.utils._hash",
+            side_effect=lambda value, length=8: (
+                "0" * length
+                if length == 8 and value in ("another_model", "model_inputs")
+                else _hash(value, length)
+            ),
+        )
+
+        id_registry.clear()
+        data_access_manager = DataAccessManager()
+        data_access_manager.add_catalog(DataCatalog(), pipelines)
+        data_access_manager.add_pipelines(pipelines)
+        flowchart_ids = {
+            graph_node.name: graph_node.id
+            for graph_node in data_access_manager.nodes.as_list()
+        }
+        assert flowchart_ids["model_inputs"] != "00000000"
+
+        # the run happens in a fresh process
+        id_registry.clear()
+        hooks.before_pipeline_run({"pipeline_name": None}, pipeline_run)
+        event = create_dataset_event("after_dataset_saved", "model_inputs")
+
+        assert event["node_id"] == flowchart_ids["model_inputs"]
+        id_registry.clear()
+
+    def test_before_pipeline_run_keeps_allocated_ids(
+        self, hooks, example_pipelines, mocker
+    ):
+        # every node and dataset of the registered pipelines collides with the others
+        mocker.patch(
+            "kedro_viz.utils._hash",
+            side_effect=lambda value, length=8: (
+                "0" * length if length == 8 else _hash(value, length)
+            ),
+        )
+
+        def get_ids():
+            return [
+                id_registry.get_node_id(node)
+                for pipeline in example_pipelines.values()
+                for node in pipeline.nodes
+            ] + [
+                id_registry.get_dataset_id(dataset_name)
+                for pipeline in example_pipelines.values()
+                for dataset_name in sorted(pipeline.datasets())
+            ]
+
+        # allocated by Kedro-Viz running in the same process
+        id_registry.clear()
+        id_registry.allocate_pipeline_ids(example_pipelines.values())
+        flowchart_ids = get_ids()
+
+        hooks.before_pipeline_run(
+            {"pipeline_name": None}, example_pipelines["data_processing"]
+        )
+
+        assert get_ids() == flowchart_ids
+        id_registry.clear()
 
     def test_before_pipeline_run_named_pipeline_skips(self, hooks, example_pipelines):
         default_pipeline = example_pipelines["__default__"]
@@ -26,6 +26,14 @@ class TestCliBuildViz:
                 ["viz", "build", "--include-previews"],
                 {"platform": "local", "preview": True},
             ),
+            (
+                ["viz", "build", "--compress", "gzip", "--compress", "br"],
+                {"platform": "local", "content_encodings": ("gzip", "br")},
+            ),
+            (
+                ["viz", "build", "--human-readable"],
+                {"platform": "local", "human_readable": True},
+            ),
         ],
     )
     def test_successful_build_with_existing_static_files(
@@ -46,4 +54,6 @@ class TestCliBuildViz:
             build_args.get("platform"),
             build_args.get("preview", False),
             include_hooks=build_args.get("include_hooks", False),
+            content_encodings=build_args.get("content_encodings", ()),
+            human_readable=build_args.get("human_readable", False),
         )
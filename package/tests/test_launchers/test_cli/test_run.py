@@ -56,6 +56,7 @@ class TestCliRunViz:
                     "package_name": None,
                     "extra_params": {},
                     "is_lite": False,
+                    "lazy": False,
                 },
             ),
             (
@@ -73,6 +74,7 @@ class TestCliRunViz:
                     "package_name": None,
                     "extra_params": {},
                     "is_lite": False,
+                    "lazy": False,
                 },
             ),
             (
@@ -95,6 +97,7 @@ class TestCliRunViz:
                     "package_name": None,
                     "extra_params": {},
                     "is_lite": False,
+                    "lazy": False,
                 },
             ),
             (
@@ -128,6 +131,7 @@ class TestCliRunViz:
                     "package_name": None,
                     "extra_params": {"extra_param": "param"},
                     "is_lite": False,
+                    "lazy": False,
                 },
             ),
             (
@@ -161,6 +165,7 @@ class TestCliRunViz:
                     "package_name": None,
                     "extra_params": {"extra_param": "param"},
                     "is_lite": False,
+                    "lazy": False,
                 },
             ),
             (
@@ -178,6 +183,7 @@ class TestCliRunViz:
                     "package_name": None,
                     "extra_params": {},
                     "is_lite": False,
+                    "lazy": False,
                 },
             ),
             (
@@ -195,6 +201,25 @@ class TestCliRunViz:
                     "package_name": None,
                     "extra_params": {},
                     "is_lite": True,
+                    "lazy": False,
+                },
+            ),
+            (
+                ["viz", "run", "--lazy"],
+                {
+                    "host": "127.0.0.1",
+                    "port": 4141,
+                    "load_file": None,
+                    "save_file": None,
+                    "pipeline_name": None,
+                    "env": None,
+                    "project_path": "testPath",
+                    "autoreload": False,
+                    "include_hooks": False,
+                    "package_name": None,
+                    "extra_params": {},
+                    "is_lite": False,
+                    "lazy": True,
                 },
             ),
         ],
@@ -259,6 +284,77 @@ class TestCliRunViz:
 
         mock_click_echo.assert_has_calls(mock_click_echo_calls)
 
+    def test_kedro_viz_command_should_log_invalid_limits(
+        self, mocker, mock_project_path, mock_click_echo, monkeypatch
+    ):
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", "many")
+        mock_process = mocker.patch("multiprocessing.get_context")
+        mocker.patch(
+            "kedro_viz.launchers.utils._find_kedro_project",
+            return_value=mock_project_path,
+        )
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            runner.invoke(main.viz_cli, ["viz", "run"])
+
+        mock_click_echo.assert_has_calls(
+            [
+                call(
+                    "\x1b[31mERROR: Failed to start Kedro-Viz : The limit of "
+                    "'KEDRO_VIZ_MAX_WORKERS' must be a positive integer, "
+                    "got 'many'.\x1b[0m"
+                )
+            ]
+        )
+        mock_process.assert_not_called()
+
+    def test_kedro_viz_command_should_log_invalid_cache_settings(
+        self, mocker, mock_project_path, mock_click_echo, monkeypatch
+    ):
+        monkeypatch.setenv("KEDRO_VIZ_NODE_METADATA_CACHE_SIZE", "big")
+        mock_process = mocker.patch("multiprocessing.get_context")
+        mocker.patch(
+            "kedro_viz.launchers.utils._find_kedro_project",
+            return_value=mock_project_path,
+        )
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            runner.invoke(main.viz_cli, ["viz", "run"])
+
+        mock_click_echo.assert_has_calls(
+            [
+                call(
+                    "\x1b[31mERROR: Failed to start Kedro-Viz : The node metadata "
+                    "cache size and TTL must be positive numbers, "
+                    "got 'big' and 'None'.\x1b[0m"
+                )
+            ]
+        )
+        mock_process.assert_not_called()
+
+    def test_kedro_viz_command_should_log_invalid_preview_cache_size(
+        self, mocker, mock_project_path, mock_click_echo, monkeypatch
+    ):
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_CACHE_SIZE", "big")
+        mock_process = mocker.patch("multiprocessing.get_context")
+        mocker.patch(
+            "kedro_viz.launchers.utils._find_kedro_project",
+            return_value=mock_project_path,
+        )
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            runner.invoke(main.viz_cli, ["viz", "run"])
+
+        mock_click_echo.assert_has_calls(
+            [
+                call(
+                    "\x1b[31mERROR: Failed to start Kedro-Viz : The preview cache "
+                    "size must be a non-negative integer, got 'big'.\x1b[0m"
+                )
+            ]
+        )
+        mock_process.assert_not_called()
+
     def test_kedro_viz_command_logs_hooks_message(
         self, mocker, mock_project_path, mock_click_echo
     ):
@@ -426,6 +522,7 @@ class TestCliRunViz:
                 "package_name": None,
                 "extra_params": {},
                 "is_lite": False,
+                "lazy": False,
             },
             "watch_filter": mocker.ANY,
         }
@@ -149,6 +149,8 @@ class TestCliUtils:
                 None,
                 mock_process_completed.return_value,
                 mock_exception_queue.return_value,
+                (),
+                False,
             ),
         )
         mock_viz_deploy_process.return_value.start.assert_called_once()
@@ -236,6 +238,8 @@ class TestCliUtils:
             package_name,
             mock_process_completed,
             mock_exception_queue,
+            ("gzip",),
+            True,
         )
 
         mock_load_and_populate_data.assert_called_once_with(
@@ -244,7 +248,9 @@ class TestCliUtils:
         mock_DeployerFactory.create_deployer.assert_called_once_with(
             platform, endpoint, bucket_name
         )
-        deployer_mock.deploy.assert_called_once_with(is_all_previews_enabled)
+        deployer_mock.deploy.assert_called_once_with(
+            is_all_previews_enabled, ("gzip",), True
+        )
         mock_click_echo.echo.assert_not_called()
 
     def test_viz_deploy_progress_timer(self, capsys):
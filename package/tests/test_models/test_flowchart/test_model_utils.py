@@ -0,0 +1,108 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kedro_viz.models.flowchart.model_utils import PreviewTimeoutError, _PreviewRunner
+
+
+class TestPreviewRunner:
+    def test_run(self):
+        assert _PreviewRunner().run(lambda: "preview", 5, "preview-a") == "preview"
+
+    def test_exception_is_raised(self):
+        def fail():
+            raise TimeoutError("Connection timed out")
+
+        # only the runner's own timeout is a preview timeout
+        with pytest.raises(TimeoutError, match="Connection timed out") as exc_info:
+            _PreviewRunner().run(fail, 5, "preview-a")
+        assert not isinstance(exc_info.value, PreviewTimeoutError)
+
+    def test_running_preview_is_joined(self):
+        runner = _PreviewRunner(max_workers=2)
+        release = threading.Event()
+        calls = []
+
+        def slow_preview():
+            calls.append("preview-a")
+            release.wait(5)
+            return "preview"
+
+        with pytest.raises(
+            PreviewTimeoutError, match="'preview-a' did not finish within 0.05 seconds."
+        ):
+            runner.run(slow_preview, 0.05, "preview-a")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # a later request waits for the abandoned preview instead of starting again
+            joined_preview = executor.submit(runner.run, slow_preview, 5, "preview-a")
+            with pytest.raises(PreviewTimeoutError):
+                runner.run(slow_preview, 0.05, "preview-a")
+            release.set()
+
+            assert joined_preview.result() == "preview"
+        assert calls == ["preview-a"]
+
+    def test_timed_out_preview_frees_its_thread(self):
+        runner = _PreviewRunner(max_workers=1)
+        release = threading.Event()
+
+        with pytest.raises(PreviewTimeoutError):
+            runner.run(lambda: release.wait(5), 0.05, "preview-a")
+        # the abandoned preview doesn't starve the previews of other datasets
+        assert runner.run(lambda: "preview", 0.5, "preview-b") == "preview"
+        release.set()
+
+    def test_joined_preview_keeps_its_thread(self):
+        runner = _PreviewRunner(max_workers=1, max_abandoned=1)
+        release = threading.Event()
+
+        def slow_preview():
+            release.wait(5)
+            return "preview"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            joined_preview = executor.submit(runner.run, slow_preview, 5, "preview-a")
+            with pytest.raises(PreviewTimeoutError):
+                runner.run(slow_preview, 0.05, "preview-a")
+            # the preview isn't abandoned while another request still waits for it
+            with pytest.raises(PreviewTimeoutError, match="could not start"):
+                runner.run(lambda: "preview", 0.05, "preview-b")
+            release.set()
+
+            assert joined_preview.result() == "preview"
+
+    def test_preview_is_rejected_when_all_threads_are_taken(self):
+        runner = _PreviewRunner(max_workers=1, max_abandoned=1)
+        release = threading.Event()
+        other_preview_calls = []
+
+        # the first preview is abandoned, the second one keeps its thread
+        # as the abandoned threads are all taken
+        for name in ["preview-a", "preview-b"]:
+            with pytest.raises(PreviewTimeoutError):
+                runner.run(lambda: release.wait(5), 0.05, name)
+        with pytest.raises(
+            PreviewTimeoutError,
+            match="'preview-c' could not start within 0.05 seconds, "
+            "as all preview threads are taken.",
+        ):
+            runner.run(lambda: other_preview_calls.append(1), 0.05, "preview-c")
+        assert not other_preview_calls
+        release.set()
+
+        # the thread is free again once the abandoned preview finishes
+        assert runner.run(lambda: "preview", 5, "preview-c") == "preview"
+
+    def test_max_workers_from_env(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_MAX_WORKERS", "3")
+        runner = _PreviewRunner()
+        release = threading.Event()
+
+        # as many previews are abandoned as there are threads
+        for name in ["a", "b", "c", "d", "e", "f"]:
+            with pytest.raises(PreviewTimeoutError):
+                runner.run(lambda: release.wait(5), 0.01, name)
+        with pytest.raises(PreviewTimeoutError, match="could not start"):
+            runner.run(lambda: None, 0.01, "g")
+        release.set()
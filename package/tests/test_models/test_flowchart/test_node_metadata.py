@@ -1,3 +1,6 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial, wraps
 from pathlib import Path
 from textwrap import dedent
@@ -7,7 +10,9 @@ from kedro.io import MemoryDataset
 from kedro.pipeline.node import node
 from kedro_datasets.pandas import CSVDataset, ParquetDataset
 
+from kedro_viz.models.flowchart import model_utils
 from kedro_viz.models.flowchart.node_metadata import (
+    TIMED_OUT_PREVIEW_TYPE,
     DataNodeMetadata,
     ParametersNodeMetadata,
     TaskNodeMetadata,
@@ -277,6 +282,20 @@ class TestGraphNodeMetadata:
         )
         assert data_node.get_preview_args() == {"nrows": 3}
 
+    def test_get_preview_timeout(self):
+        metadata = {"kedro-viz": {"preview_timeout": 5}}
+        dataset = CSVDataset(filepath="test.csv", metadata=metadata)
+        data_node = GraphNode.create_data_node(
+            dataset_id="dataset",
+            dataset_name="dataset",
+            tags=set(),
+            layer=None,
+            dataset=dataset,
+            node_extras=None,
+            modular_pipelines=set(),
+        )
+        assert data_node.get_preview_timeout() == 5
+
     def test_is_preview_enabled(self):
         metadata = {"kedro-viz": {"preview": False}}
         dataset = CSVDataset(filepath="test.csv", metadata=metadata)
@@ -292,11 +311,51 @@ class TestGraphNodeMetadata:
         assert data_node.is_preview_enabled() is False
 
     def test_is_all_previews_enabled(self, example_data_node):
-        DataNodeMetadata.set_is_all_previews_enabled(False)
-        preview_node_metadata = DataNodeMetadata(data_node=example_data_node)
+        preview_node_metadata = DataNodeMetadata(
+            data_node=example_data_node, is_all_previews_enabled=False
+        )
 
         assert preview_node_metadata.preview is None
         assert preview_node_metadata.preview_type is None
+        assert "is_all_previews_enabled" not in preview_node_metadata.model_dump()
+
+        # disabling the previews of a metadata instance doesn't affect the others
+        assert DataNodeMetadata(data_node=example_data_node).preview is not None
+
+    def test_data_node_metadata_is_built_concurrently(self):
+        num_nodes = 8
+        # every thread waits for the others right after starting to build its metadata,
+        # so all of them build their metadata at the same time
+        barrier = threading.Barrier(num_nodes, timeout=5)
+        data_nodes = []
+        for index in range(num_nodes):
+            dataset = MemoryDataset(data=index)
+            dataset.release = barrier.wait
+            data_nodes.append(
+                GraphNode.create_data_node(
+                    dataset_id=f"dataset_{index}",
+                    dataset_name=f"dataset_{index}",
+                    layer=None,
+                    tags=set(),
+                    dataset=dataset,
+                    node_extras=NodeExtras(stats={"index": index}),
+                    modular_pipelines=set(),
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=num_nodes) as executor:
+            data_nodes_metadata = list(
+                executor.map(
+                    lambda data_node: DataNodeMetadata(data_node=data_node), data_nodes
+                )
+            )
+
+        for index, data_node_metadata in enumerate(data_nodes_metadata):
+            assert (
+                data_node_metadata.run_command
+                == f"kedro run --to-outputs=dataset_{index}"
+            )
+            assert data_node_metadata.stats == {"index": index}
 
     def test_preview_data_node_metadata(self, example_data_node):
         expected_preview_data = {
@@ -357,6 +416,136 @@ class TestGraphNodeMetadata:
         preview_node_metadata = DataNodeMetadata(data_node=example_data_node)
         assert preview_node_metadata.preview is None
 
+    def test_preview_timeout(self, example_data_node, mocker, monkeypatch, caplog):
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_TIMEOUT", "0.05")
+        release = threading.Event()
+        preview = mocker.patch(
+            "kedro_datasets.pandas.CSVDataset.preview",
+            side_effect=lambda **_: release.wait(5),
+        )
+
+        start = time.perf_counter()
+        preview_node_metadata = DataNodeMetadata(data_node=example_data_node)
+        # the hanging preview is abandoned rather than waited for
+        assert time.perf_counter() - start < 1
+        # and joined rather than started again while it's still running
+        assert DataNodeMetadata(data_node=example_data_node).is_preview_timed_out
+        release.set()
+
+        preview.assert_called_once()
+        assert preview_node_metadata.is_preview_timed_out
+        assert preview_node_metadata.preview is None
+        assert preview_node_metadata.preview_type == TIMED_OUT_PREVIEW_TYPE
+        assert preview_node_metadata.model_dump()["preview"] is None
+        assert (
+            f"'{example_data_node.name}' could not be previewed within 0.05 seconds"
+            in caplog.text
+        )
+
+    def test_preview_timeout_from_dataset_metadata(self, example_csv_filepath, mocker):
+        metadata = {"kedro-viz": {"preview_timeout": 0.05}}
+        release = threading.Event()
+        mocker.patch(
+            "kedro_datasets.pandas.CSVDataset.preview",
+            side_effect=lambda: release.wait(5),
+        )
+        data_node = GraphNode.create_data_node(
+            dataset_id="dataset",
+            dataset_name="dataset",
+            tags=set(),
+            layer=None,
+            dataset=CSVDataset(filepath=example_csv_filepath, metadata=metadata),
+            node_extras=None,
+            modular_pipelines=set(),
+        )
+
+        preview_node_metadata = DataNodeMetadata(data_node=data_node)
+        release.set()
+
+        assert preview_node_metadata.preview_type == TIMED_OUT_PREVIEW_TYPE
+
+    def test_previews_of_the_same_file_are_loaded_once(
+        self, example_csv_filepath, mocker
+    ):
+        started, release = threading.Event(), threading.Event()
+
+        def preview():
+            started.set()
+            release.wait(5)
+            return {"data": [[1]]}
+
+        dataset_preview = mocker.patch(
+            "kedro_datasets.pandas.CSVDataset.preview", side_effect=preview
+        )
+        data_nodes = [
+            GraphNode.create_data_node(
+                dataset_id=dataset_name,
+                dataset_name=dataset_name,
+                tags=set(),
+                layer=None,
+                dataset=CSVDataset(filepath=str(example_csv_filepath)),
+                node_extras=None,
+                modular_pipelines=set(),
+            )
+            for dataset_name in ["first", "second"]
+        ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(DataNodeMetadata, data_node=data_nodes[0])
+            assert started.wait(5)
+            second = executor.submit(DataNodeMetadata, data_node=data_nodes[1])
+            # wait for the second data node to join the preview of the first one
+            deadline = time.monotonic() + 5
+            while (
+                sum(
+                    preview.waiters
+                    for preview in model_utils._preview_runner._in_flight.values()
+                )
+                < 2
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+            release.set()
+
+        assert first.result().preview == second.result().preview == {"data": [[1]]}
+        dataset_preview.assert_called_once()
+
+    def test_preview_within_timeout(self, example_data_node, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_TIMEOUT", "30")
+        preview_node_metadata = DataNodeMetadata(data_node=example_data_node)
+
+        assert preview_node_metadata.preview["index"] == [0, 1, 2]
+        assert preview_node_metadata.preview_type == "TablePreview"
+        assert not preview_node_metadata.is_preview_timed_out
+
+    def test_preview_raising_timeout_error_is_not_timed_out(
+        self, example_data_node, mocker, caplog
+    ):
+        mocker.patch(
+            "kedro_datasets.pandas.CSVDataset.preview",
+            side_effect=TimeoutError("Connection timed out"),
+        )
+
+        preview_node_metadata = DataNodeMetadata(data_node=example_data_node)
+
+        assert preview_node_metadata.preview is None
+        assert preview_node_metadata.preview_type != TIMED_OUT_PREVIEW_TYPE
+        assert "TimeoutError: Connection timed out" in caplog.text
+
+    @pytest.mark.parametrize("timeout", ["0", "-1", "nan", "soon"])
+    def test_preview_invalid_timeout(
+        self, timeout, example_data_node, monkeypatch, caplog
+    ):
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_TIMEOUT", timeout)
+
+        preview_node_metadata = DataNodeMetadata(data_node=example_data_node)
+
+        assert preview_node_metadata.preview is None
+        assert (
+            f"The preview timeout must be a positive number, got '{timeout}'."
+            in caplog.text
+        )
+
     def test_transcoded_data_node_metadata(self):
         dataset = CSVDataset(filepath="/tmp/dataset.csv")
         transcoded_data_node = GraphNode.create_data_node(
@@ -0,0 +1,382 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from kedro.io import MemoryDataset, Version
+from kedro_datasets.pandas import CSVDataset
+
+from kedro_viz.models.flowchart.node_metadata import (
+    TIMED_OUT_PREVIEW_TYPE,
+    DataNodeMetadata,
+)
+from kedro_viz.models.flowchart.preview_cache import (
+    DEFAULT_PREVIEW_CACHE_SIZE,
+    PreviewCache,
+    get_dataset_fingerprint,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    yield tmp_path / ".viz" / "previews"
+
+
+class TestDatasetFingerprint:
+    def test_fingerprint_is_stable(self, example_csv_filepath):
+        fingerprint = get_dataset_fingerprint(
+            CSVDataset(filepath=str(example_csv_filepath)), {"nrows": 3}
+        )
+
+        assert len(fingerprint) == 64
+        assert fingerprint == get_dataset_fingerprint(
+            CSVDataset(filepath=str(example_csv_filepath)), {"nrows": 3}
+        )
+
+    def test_fingerprint_depends_on_preview_args(self, example_csv_filepath):
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+
+        assert get_dataset_fingerprint(dataset, {"nrows": 3}) != (
+            get_dataset_fingerprint(dataset, {"nrows": 5})
+        )
+        assert get_dataset_fingerprint(dataset, {"nrows": 3}) != (
+            get_dataset_fingerprint(dataset, None)
+        )
+
+    def test_fingerprint_changes_with_file(self, example_csv_filepath):
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        fingerprint = get_dataset_fingerprint(dataset, None)
+        with example_csv_filepath.open("a") as csv_file:
+            csv_file.write("1,2,3\n")
+
+        assert get_dataset_fingerprint(dataset, None) != fingerprint
+
+    def test_fingerprint_of_versioned_dataset(self, tmp_path, example_data_frame):
+        filepath = str(tmp_path / "versioned.csv")
+        CSVDataset(filepath=filepath, version=Version(None, "2024-01-01")).save(
+            example_data_frame
+        )
+        dataset = CSVDataset(filepath=filepath, version=Version(None, None))
+        fingerprint = get_dataset_fingerprint(dataset, None)
+        CSVDataset(filepath=filepath, version=Version(None, "2024-01-02")).save(
+            example_data_frame
+        )
+
+        assert fingerprint is not None
+        # the latest version is loaded by a new dataset
+        assert get_dataset_fingerprint(
+            CSVDataset(filepath=filepath, version=Version(None, None)), None
+        ) not in (None, fingerprint)
+
+    @pytest.mark.parametrize(
+        "dataset",
+        [
+            MemoryDataset(),
+            CSVDataset(filepath="missing.csv"),
+            mock.MagicMock(),
+        ],
+    )
+    def test_no_fingerprint(self, dataset):
+        assert get_dataset_fingerprint(dataset, None) is None
+
+    def test_no_fingerprint_for_directory(self, tmp_path):
+        assert get_dataset_fingerprint(CSVDataset(filepath=str(tmp_path)), None) is None
+
+
+class TestPreviewCache:
+    def test_disabled_cache(self, example_csv_filepath):
+        cache = PreviewCache()
+        compute = mock.Mock(return_value={"data": [1]})
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+
+        assert cache.get_or_compute(dataset, None, compute) == {"data": [1]}
+        assert cache.get_or_compute(dataset, None, compute) == {"data": [1]}
+        assert compute.call_count == 2
+
+    def test_preview_is_served_across_restarts(self, example_csv_filepath, cache_dir):
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        compute = mock.Mock(return_value={"data": [1], "index": (0,)})
+        PreviewCache(cache_dir).get_or_compute(dataset, None, compute)
+
+        cache = PreviewCache(cache_dir)
+        assert cache.get_or_compute(dataset, None, compute) == {
+            "data": [1],
+            "index": [0],
+        }
+        compute.assert_called_once()
+        assert cache.get_stats() == {
+            "hits": 1,
+            "misses": 0,
+            "evictions": 0,
+            "entries": 1,
+            "size": len(b'{"data":[1],"index":[0]}'),
+            "max_size": DEFAULT_PREVIEW_CACHE_SIZE,
+        }
+
+    def test_changed_file_is_previewed_again(self, example_csv_filepath, cache_dir):
+        cache = PreviewCache(cache_dir)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        cache.get_or_compute(dataset, None, lambda: "old")
+        with example_csv_filepath.open("a") as csv_file:
+            csv_file.write("1,2,3\n")
+
+        assert cache.get_or_compute(dataset, None, lambda: "new") == "new"
+        assert cache.get_stats()["misses"] == 2
+
+    def test_unserialisable_preview_is_not_cached(
+        self, example_csv_filepath, cache_dir
+    ):
+        cache = PreviewCache(cache_dir)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        preview = object()
+
+        assert cache.get_or_compute(dataset, None, lambda: preview) is preview
+        assert cache.get_stats()["entries"] == 0
+
+    def test_least_recently_used_previews_are_evicted(self, tmp_path, cache_dir):
+        cache = PreviewCache(cache_dir, max_size=10)
+        datasets = []
+        for name in ["a", "b", "c"]:
+            filepath = tmp_path / f"{name}.csv"
+            filepath.write_text(name)
+            datasets.append(CSVDataset(filepath=str(filepath)))
+
+        cache.get_or_compute(datasets[0], None, lambda: "aaa")
+        cache.get_or_compute(datasets[1], None, lambda: "bbb")
+        # reading the first preview makes it the most recently used one
+        cache.get_or_compute(datasets[0], None, lambda: "---")
+        cache.get_or_compute(datasets[2], None, lambda: "ccc")
+
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["size"] == 10
+        assert cache.get_or_compute(datasets[0], None, lambda: "---") == "aaa"
+        assert cache.get_or_compute(datasets[2], None, lambda: "---") == "ccc"
+        assert cache.get_or_compute(datasets[1], None, lambda: "bbb") == "bbb"
+
+    def test_previews_are_indexed_by_last_use_on_restart(self, tmp_path, cache_dir):
+        datasets = []
+        for name in ["a", "b", "c"]:
+            filepath = tmp_path / f"{name}.csv"
+            filepath.write_text(name)
+            datasets.append(CSVDataset(filepath=str(filepath)))
+        cache = PreviewCache(cache_dir, max_size=10)
+        cache.get_or_compute(datasets[0], None, lambda: "aaa")
+        cache.get_or_compute(datasets[1], None, lambda: "bbb")
+        # one of the previews was last used long before the other one
+        for entry_path, used_at in zip(sorted(cache_dir.glob("*.json")), [0, 2**32]):
+            os.utime(entry_path, (used_at, used_at))
+        least_recently_used_entry = sorted(cache_dir.glob("*.json"))[0]
+
+        cache = PreviewCache(cache_dir, max_size=10)
+        assert cache.get_stats()["entries"] == 2
+        assert cache.get_stats()["size"] == 10
+        cache.get_or_compute(datasets[2], None, lambda: "ccc")
+
+        assert not least_recently_used_entry.exists()
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_or_compute(datasets[2], None, lambda: "---") == "ccc"
+
+    def test_directory_is_not_scanned_on_write(
+        self, example_csv_filepath, cache_dir, mocker
+    ):
+        cache = PreviewCache(cache_dir, max_size=5)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        glob = mocker.spy(Path, "glob")
+        for preview_args in [{"nrows": 1}, {"nrows": 2}, {"nrows": 3}]:
+            cache.get_or_compute(dataset, preview_args, lambda: "aaa")
+
+        glob.assert_not_called()
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_stats()["evictions"] == 2
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_deleted_preview_is_forgotten(self, example_csv_filepath, cache_dir):
+        cache = PreviewCache(cache_dir)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        cache.get_or_compute(dataset, None, lambda: "old")
+        next(cache_dir.glob("*.json")).unlink()
+
+        assert cache.get_or_compute(dataset, None, lambda: "new") == "new"
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_stats()["size"] == len(b'"new"')
+
+    def test_directory_is_ignored_by_git(self, example_csv_filepath, cache_dir):
+        cache = PreviewCache(cache_dir)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        cache.get_or_compute(dataset, None, lambda: "preview")
+
+        assert (cache_dir / ".gitignore").read_text().splitlines()[-1] == "*"
+        assert cache.get_stats()["entries"] == 1
+
+    def test_too_large_preview_is_not_cached(self, example_csv_filepath, cache_dir):
+        cache = PreviewCache(cache_dir, max_size=2)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        cache.get_or_compute(dataset, None, lambda: "large")
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_corrupt_preview_is_recomputed(
+        self, example_csv_filepath, cache_dir, caplog
+    ):
+        cache = PreviewCache(cache_dir)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+        cache.get_or_compute(dataset, None, lambda: "old")
+        next(cache_dir.glob("*.json")).write_bytes(b"{")
+
+        assert cache.get_or_compute(dataset, None, lambda: "new") == "new"
+        assert "Failed to read the cached preview" in caplog.text
+
+    def test_preview_is_computed_when_cache_cannot_be_written(
+        self, example_csv_filepath, cache_dir, caplog
+    ):
+        cache_dir.parent.mkdir(parents=True)
+        cache_dir.write_text("not a directory")
+        cache = PreviewCache(cache_dir)
+        dataset = CSVDataset(filepath=str(example_csv_filepath))
+
+        assert cache.get_or_compute(dataset, None, lambda: "preview") == "preview"
+        assert "Failed to cache the preview" in caplog.text
+
+    def test_set_directory(self, cache_dir):
+        cache = PreviewCache()
+        cache.set_directory(cache_dir)
+
+        assert cache.directory == cache_dir
+
+    @pytest.mark.parametrize(
+        "size, directory, expected_size, expected_directory",
+        [
+            (None, None, DEFAULT_PREVIEW_CACHE_SIZE, Path(".viz/previews")),
+            ("1024", "cache/previews", 1024, Path("cache/previews")),
+            ("0", "cache/previews", 0, None),
+        ],
+    )
+    def test_configure_from_env(
+        self,
+        size,
+        directory,
+        expected_size,
+        expected_directory,
+        tmp_path,
+        monkeypatch,
+    ):
+        for env_var, value in [
+            ("KEDRO_VIZ_PREVIEW_CACHE_SIZE", size),
+            ("KEDRO_VIZ_PREVIEW_CACHE_DIR", directory),
+        ]:
+            if value is None:
+                monkeypatch.delenv(env_var, raising=False)
+            else:
+                monkeypatch.setenv(env_var, value)
+        cache = PreviewCache()
+        cache.configure_from_env(tmp_path)
+
+        assert cache.max_size == expected_size
+        assert cache.directory == (expected_directory and tmp_path / expected_directory)
+
+    def test_configure_from_env_outside_project(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_CACHE_DIR", str(tmp_path / "previews"))
+        cache = PreviewCache()
+        cache.configure_from_env(tmp_path / "project")
+
+        assert cache.directory == tmp_path / "previews"
+
+    @pytest.mark.parametrize("size", ["-1", "big"])
+    def test_configure_from_env_invalid(self, size, tmp_path, monkeypatch):
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_CACHE_SIZE", size)
+        cache = PreviewCache()
+        with pytest.raises(
+            ValueError,
+            match="The preview cache size must be a non-negative integer, "
+            f"got '{size}'.",
+        ):
+            cache.configure_from_env(tmp_path)
+        assert cache.max_size == DEFAULT_PREVIEW_CACHE_SIZE
+        assert cache.directory is None
+
+    def test_invalid_env_does_not_fail_import(self):
+        env = {**os.environ, "KEDRO_VIZ_PREVIEW_CACHE_SIZE": "big"}
+        result = subprocess.run(
+            [sys.executable, "-c", "import kedro_viz.server"],
+            env=env,
+            capture_output=True,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_data_node_metadata_preview_is_cached(
+        self, example_data_node, cache_dir, mocker
+    ):
+        mocker.patch(
+            "kedro_viz.models.flowchart.node_metadata.preview_cache",
+            new=PreviewCache(cache_dir),
+        )
+        preview = mocker.spy(CSVDataset, "preview")
+        expected_preview = DataNodeMetadata(data_node=example_data_node).preview
+
+        assert DataNodeMetadata(data_node=example_data_node).preview == (
+            expected_preview
+        )
+        preview.assert_called_once_with(example_data_node.kedro_obj, nrows=3)
+
+    def test_timed_out_preview_is_cached_once_finished(
+        self, example_data_node, cache_dir, mocker, monkeypatch
+    ):
+        cache = PreviewCache(cache_dir)
+        mocker.patch(
+            "kedro_viz.models.flowchart.node_metadata.preview_cache", new=cache
+        )
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_TIMEOUT", "0.05")
+        release = threading.Event()
+        preview = mocker.patch.object(
+            CSVDataset,
+            "preview",
+            side_effect=lambda **_: release.wait(5) and {"data": [1]},
+        )
+
+        timed_out_metadata = DataNodeMetadata(data_node=example_data_node)
+        # joins the same preview, which is still only cached once
+        DataNodeMetadata(data_node=example_data_node)
+        assert timed_out_metadata.preview_type == TIMED_OUT_PREVIEW_TYPE
+        assert cache.get_stats()["entries"] == 0
+        release.set()
+        deadline = time.monotonic() + 5
+        while cache.get_stats()["entries"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        # the preview which finished late is served from disk next time
+        assert DataNodeMetadata(data_node=example_data_node).preview == {"data": [1]}
+        preview.assert_called_once()
+        assert cache.get_stats()["misses"] == 2
+        assert cache.get_stats()["hits"] == 1
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_failed_late_preview_is_not_cached(
+        self, example_data_node, cache_dir, mocker, monkeypatch
+    ):
+        cache = PreviewCache(cache_dir)
+        mocker.patch(
+            "kedro_viz.models.flowchart.node_metadata.preview_cache", new=cache
+        )
+        monkeypatch.setenv("KEDRO_VIZ_PREVIEW_TIMEOUT", "0.05")
+        release = threading.Event()
+
+        def fail_late(**_):
+            release.wait(5)
+            raise OSError("connection lost")
+
+        mocker.patch.object(CSVDataset, "preview", side_effect=fail_late)
+        write = mocker.spy(cache, "_write_late")
+
+        DataNodeMetadata(data_node=example_data_node)
+        release.set()
+        deadline = time.monotonic() + 5
+        while not write.call_count and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        assert cache.get_stats()["entries"] == 0
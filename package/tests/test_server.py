@@ -30,6 +30,18 @@ def patched_create_api_app_from_file(mocker):
     yield mocker.patch("kedro_viz.api.apps.create_api_app_from_file")
 
 
+@pytest.fixture(autouse=True)
+def patched_warm_up_pipeline_response_cache(mocker):
+    yield mocker.patch(
+        "kedro_viz.api.rest.responses.pipelines.warm_up_pipeline_response_cache"
+    )
+
+
+@pytest.fixture(autouse=True)
+def patched_preview_cache(mocker):
+    yield mocker.patch("kedro_viz.server.preview_cache")
+
+
 @pytest.fixture(autouse=True)
 def patched_load_data(
     mocker, example_catalog, example_pipelines, example_node_extras_dict
@@ -50,6 +62,7 @@ class TestServer:
         patched_create_api_app_from_project,
         patched_data_access_manager,
         patched_uvicorn_run,
+        patched_warm_up_pipeline_response_cache,
         example_catalog,
         example_pipelines,
     ):
@@ -58,15 +71,23 @@ class TestServer:
             example_catalog, example_pipelines
         )
         patched_data_access_manager.add_pipelines.assert_called_once_with(
-            example_pipelines
+            example_pipelines, False
         )
 
+        # pipeline responses are precomputed in the background
+        patched_warm_up_pipeline_response_cache.assert_called_once()
+
         # correct api app is created
         patched_create_api_app_from_project.assert_called_once()
 
         # an uvicorn server is launched
         patched_uvicorn_run.assert_called_once()
 
+    def test_preview_cache_directory(self, patched_preview_cache, tmp_path):
+        run_server(project_path=str(tmp_path))
+
+        patched_preview_cache.configure_from_env.assert_called_once_with(tmp_path)
+
     def test_specific_pipeline(
         self,
         patched_data_access_manager,
@@ -76,9 +97,28 @@ class TestServer:
 
         # assert that when running server, data are added correctly to the data access manager
         patched_data_access_manager.add_pipelines.assert_called_once_with(
-            {"data_science": example_pipelines["data_science"]}
+            {"data_science": example_pipelines["data_science"]}, False
+        )
+
+    def test_lazy_population(self, patched_data_access_manager, example_pipelines):
+        run_server(lazy=True)
+        patched_data_access_manager.add_pipelines.assert_called_once_with(
+            example_pipelines, True
         )
 
+    def test_invalid_limits_fail_before_loading_the_project(
+        self, patched_load_data, patched_uvicorn_run, monkeypatch
+    ):
+        monkeypatch.setenv("KEDRO_VIZ_ENDPOINT_LIMITS", "nodes=0")
+
+        with pytest.raises(
+            ValueError, match="The limit of 'nodes' must be a positive integer"
+        ):
+            run_server()
+
+        patched_load_data.assert_not_called()
+        patched_uvicorn_run.assert_not_called()
+
     def test_load_file(self, patched_create_api_app_from_file, tmp_path):
         file_path = "test.json"
         json_file_path = tmp_path / file_path
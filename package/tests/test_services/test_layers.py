@@ -1,3 +1,6 @@
+from collections import defaultdict
+from graphlib import TopologicalSorter
+
 import pytest
 
 from kedro_viz.models.flowchart.nodes import GraphNode
@@ -234,3 +237,176 @@ def test_sort_layers_should_return_empty_list_on_cyclic_layers(mocker):
         "Please check the `layer` configuration in your catalog for the datasets to avoid circular references. "
     )
     assert call_args[0] == expected_message
+
+
+def test_sort_layers_on_long_chain():
+    # node_0(layer=layer_0) -> node_1 -> ... -> node_N(layer=layer_1),
+    # much deeper than the recursion limit
+    num_nodes = 20000
+    nodes = {
+        f"node_{i}": GraphNode.create_data_node(
+            dataset_id=f"node_{i}",
+            dataset_name=f"node_{i}",
+            layer={0: "b", num_nodes - 1: "a"}.get(i),
+            tags=set(),
+            dataset=None,
+            node_extras=None,
+            modular_pipelines=None,
+        )
+        for i in range(num_nodes)
+    }
+    node_dependencies = {f"node_{i}": {f"node_{i + 1}"} for i in range(num_nodes - 1)}
+    assert sort_layers(nodes, node_dependencies) == ["b", "a"]
+
+
+def test_sort_layers_through_dependencies_outside_nodes():
+    # node_1(layer=raw) -> node_2 (not in nodes) -> node_3(layer=int)
+    nodes = {
+        node_id: GraphNode.create_data_node(
+            dataset_id=node_id,
+            dataset_name=node_id,
+            layer=layer,
+            tags=set(),
+            dataset=None,
+            node_extras=None,
+            modular_pipelines=None,
+        )
+        for node_id, layer in [("node_1", "raw"), ("node_3", "int")]
+    }
+    node_dependencies = {"node_1": {"node_2"}, "node_2": {"node_3"}}
+    assert sort_layers(nodes, node_dependencies) == ["raw", "int"]
+
+
+def _sort_layers_recursively(nodes, dependencies):
+    """The recursive implementation of ``sort_layers`` before it was rewritten,
+    kept to check that the rewrite sorts layers in the same order."""
+    node_layers = {}
+
+    def find_child_layers(node_id):
+        if node_id in node_layers:
+            return node_layers[node_id]
+
+        node_layers[node_id] = set()
+        node_layer = getattr(nodes[node_id], "layer", None)
+        if node_layer is not None:
+            node_layers[node_id].add(node_layer)
+
+        for child_node_id in dependencies[node_id]:
+            child_layer = getattr(nodes[child_node_id], "layer", None)
+            if child_layer is not None:
+                node_layers[node_id].add(child_layer)
+            node_layers[node_id].update(find_child_layers(child_node_id))
+
+        return node_layers[node_id]
+
+    for node_id in sorted(nodes):
+        find_child_layers(node_id)
+
+    layer_dependencies = defaultdict(set)
+    all_layers = set()
+    for node_id, child_layers in node_layers.items():
+        node_layer = getattr(nodes[node_id], "layer", None)
+        if node_layer is not None:
+            all_layers.add(node_layer)
+            for layer in child_layers:
+                all_layers.add(layer)
+                if layer != node_layer:
+                    layer_dependencies[layer].add(node_layer)
+
+    for layer in all_layers:
+        if layer not in layer_dependencies:
+            layer_dependencies[layer] = set()
+
+    layer_dependencies = defaultdict(
+        set, {k: layer_dependencies[k] for k in sorted(layer_dependencies)}
+    )
+    sorted_layers = list(TopologicalSorter(layer_dependencies).static_order())
+    return sorted(sorted_layers, key=lambda layer: (sorted_layers.index(layer), layer))
+
+
+@pytest.mark.parametrize(
+    "edges,node_layers",
+    [
+        (
+            # independent branches of layers merging into one layer
+            [
+                ("a", "b"),
+                ("b", "c"),
+                ("c", "g"),
+                ("d", "e"),
+                ("e", "g"),
+                ("f", "g"),
+                ("g", "h"),
+            ],
+            {
+                "a": "raw",
+                "b": "intermediate",
+                "c": "primary",
+                "d": "external",
+                "e": "feature",
+                "f": "parameters",
+                "g": "model_input",
+                "h": "models",
+            },
+        ),
+        (
+            # a diamond of layers through nodes without a layer
+            [
+                ("a", "b"),
+                ("a", "c"),
+                ("b", "d"),
+                ("c", "e"),
+                ("d", "f"),
+                ("e", "f"),
+                ("f", "g"),
+            ],
+            {
+                "a": "raw",
+                "b": "zeta",
+                "d": "alpha",
+                "e": "beta",
+                "f": "model_input",
+                "g": "reporting",
+            },
+        ),
+        (
+            # disjoint nodes and several nodes in the same layer
+            [("a", "b"), ("b", "c"), ("d", "e"), ("f", "g")],
+            {
+                "a": "raw",
+                "b": "primary",
+                "c": "reporting",
+                "d": "raw",
+                "e": "feature",
+                "g": "models",
+                "h": "intermediate",
+                "i": "external",
+            },
+        ),
+    ],
+)
+def test_sort_layers_keeps_the_order_of_the_recursive_implementation(
+    edges, node_layers
+):
+    node_ids = sorted(
+        {node_id for edge in edges for node_id in edge} | set(node_layers)
+    )
+    nodes = {
+        node_id: GraphNode.create_data_node(
+            dataset_id=node_id,
+            dataset_name=node_id,
+            layer=node_layers.get(node_id),
+            tags=set(),
+            dataset=None,
+            node_extras=None,
+            modular_pipelines=None,
+        )
+        for node_id in node_ids
+    }
+    node_dependencies = {node_id: set() for node_id in node_ids}
+    for parent_node_id, child_node_id in edges:
+        node_dependencies[parent_node_id].add(child_node_id)
+
+    assert sort_layers(nodes, node_dependencies) == _sort_layers_recursively(
+        nodes, node_dependencies
+    )
@@ -0,0 +1,194 @@
+import logging
+import random
+
+import networkx as nx
+import pytest
+
+from kedro_viz.models.flowchart.edge import GraphEdge
+from kedro_viz.services.lineage import (
+    IndexTooLargeError,
+    LineageIndex,
+    ReachabilityIndex,
+    ReachabilitySearch,
+)
+from kedro_viz.services.reachability import IndexedGraph
+
+
+def _edges(*pairs):
+    return [GraphEdge(source=source, target=target) for source, target in pairs]
+
+
+class TestReachabilityIndex:
+    def test_reachable_node_ids(self):
+        # b and c both reach d, which is only reached through the spanning tree once
+        index = ReachabilityIndex(
+            IndexedGraph(_edges(("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")))
+        )
+
+        assert sorted(index.get_reachable_node_ids("a")) == ["b", "c", "d"]
+        assert sorted(index.get_reachable_node_ids("c")) == ["d"]
+        assert index.get_reachable_node_ids("d") == []
+        assert index.get_reachable_node_ids("unknown") == []
+
+    def test_is_reachable(self):
+        index = ReachabilityIndex(
+            IndexedGraph(_edges(("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")))
+        )
+
+        assert index.is_reachable("a", "d")
+        assert index.is_reachable("c", "d")
+        assert index.is_reachable("b", "b")
+        assert not index.is_reachable("b", "c")
+        assert not index.is_reachable("d", "a")
+        assert index.is_reachable("unknown", "unknown")
+        assert not index.is_reachable("a", "unknown")
+
+    def test_cycle(self):
+        # a -> b -> c -> a forms a cycle, d is only reachable from it
+        index = ReachabilityIndex(
+            IndexedGraph(_edges(("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")))
+        )
+
+        assert sorted(index.get_reachable_node_ids("b")) == ["a", "c", "d"]
+        assert index.is_reachable("c", "b")
+        assert not index.is_reachable("d", "a")
+
+    def test_long_chain(self):
+        num_nodes = 10000
+        index = ReachabilityIndex(
+            IndexedGraph(
+                _edges(*[(f"node_{i}", f"node_{i + 1}") for i in range(num_nodes - 1)])
+            )
+        )
+
+        assert len(index.get_reachable_node_ids("node_0")) == num_nodes - 1
+        assert index._intervals[-1] == [(0, num_nodes - 1)]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_same_result_as_descendants_search(self, seed):
+        rng = random.Random(seed)
+        num_nodes = 60
+        pairs = {
+            (f"node_{rng.randrange(num_nodes)}", f"node_{rng.randrange(num_nodes)}")
+            for _ in range(90)
+        }
+        index = ReachabilityIndex(IndexedGraph(_edges(*sorted(pairs))))
+        digraph = nx.DiGraph(sorted(pairs))
+
+        for node_id in digraph.nodes:
+            descendants = nx.descendants(digraph, node_id)
+            descendants.discard(node_id)
+            assert set(index.get_reachable_node_ids(node_id)) == descendants
+            for other_node_id in digraph.nodes:
+                assert index.is_reachable(node_id, other_node_id) == (
+                    node_id == other_node_id or other_node_id in descendants
+                )
+
+    def test_too_many_intervals(self):
+        # every node of the second layer reaches a different half of the third layer,
+        # which can't be covered by a single interval each
+        pairs = [(f"a_{i}", f"b_{j}") for i in range(4) for j in range(4)] + [
+            (f"b_{i}", f"c_{j}") for i in range(4) for j in range(8) if (i + j) % 2
+        ]
+        graph = IndexedGraph(_edges(*pairs))
+
+        with pytest.raises(
+            IndexTooLargeError,
+            match="The reachability index needs more than 16 intervals.",
+        ):
+            ReachabilityIndex(graph, max_intervals=16)
+        assert ReachabilityIndex(graph, max_intervals=1000)._intervals
+
+
+class TestReachabilitySearch:
+    def test_reachable_node_ids(self):
+        search = ReachabilitySearch(
+            IndexedGraph(_edges(("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")))
+        )
+
+        assert search.get_reachable_node_ids("a") == ["b", "c", "d"]
+        assert search.get_reachable_node_ids("d") == []
+        assert search.get_reachable_node_ids("unknown") == []
+
+    def test_is_reachable(self):
+        search = ReachabilitySearch(
+            IndexedGraph(_edges(("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")))
+        )
+
+        assert search.is_reachable("a", "d")
+        assert search.is_reachable("c", "b")
+        assert search.is_reachable("b", "b")
+        assert not search.is_reachable("d", "a")
+        assert search.is_reachable("unknown", "unknown")
+        assert not search.is_reachable("a", "unknown")
+        # a node of a cycle doesn't reach itself through the cycle
+        assert "a" not in search.get_reachable_node_ids("a")
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_result_as_reachability_index(self, seed):
+        rng = random.Random(seed)
+        num_nodes = 60
+        pairs = {
+            (f"node_{rng.randrange(num_nodes)}", f"node_{rng.randrange(num_nodes)}")
+            for _ in range(90)
+        }
+        graph = IndexedGraph(_edges(*sorted(pairs)))
+        index = ReachabilityIndex(graph)
+        search = ReachabilitySearch(graph)
+
+        for node_id in graph.node_ids:
+            assert sorted(search.get_reachable_node_ids(node_id)) == sorted(
+                index.get_reachable_node_ids(node_id)
+            )
+            for other_node_id in graph.node_ids:
+                assert search.is_reachable(
+                    node_id, other_node_id
+                ) == index.is_reachable(node_id, other_node_id)
+
+
+class TestLineageIndex:
+    def test_lineage(self):
+        index = LineageIndex(
+            _edges(("raw", "clean"), ("clean", "model"), ("params", "model"))
+        )
+
+        assert sorted(index.get_ancestor_ids("model")) == ["clean", "params", "raw"]
+        assert index.get_descendant_ids("model") == []
+        assert sorted(index.get_descendant_ids("raw")) == ["clean", "model"]
+        assert index.get_ancestor_ids("raw") == []
+
+    def test_is_ancestor(self):
+        index = LineageIndex(_edges(("raw", "clean"), ("clean", "model")))
+
+        assert index.is_ancestor("raw", "model")
+        assert not index.is_ancestor("model", "raw")
+        assert not index.is_ancestor("raw", "raw")
+
+    def test_empty_graph(self):
+        index = LineageIndex([])
+
+        assert index.get_ancestor_ids("node") == []
+        assert index.get_descendant_ids("node") == []
+
+    def test_densely_connected_graph_is_searched(self, caplog):
+        edges = _edges(
+            *[(f"a_{i}", f"b_{j}") for i in range(4) for j in range(4)],
+            *[(f"b_{i}", f"c_{j}") for i in range(4) for j in range(8) if (i + j) % 2],
+        )
+        caplog.set_level(logging.INFO)
+        index = LineageIndex(edges, max_intervals_per_node=1)
+
+        assert isinstance(index._descendants_index, ReachabilitySearch)
+        assert isinstance(index._ancestors_index, ReachabilitySearch)
+        assert "too densely connected to index" in caplog.text
+        assert sorted(index.get_descendant_ids("b_0")) == ["c_1", "c_3", "c_5", "c_7"]
+        assert sorted(index.get_ancestor_ids("c_0")) == [
+            "a_0",
+            "a_1",
+            "a_2",
+            "a_3",
+            "b_1",
+            "b_3",
+        ]
+        assert index.is_ancestor("a_0", "c_0")
+        assert isinstance(LineageIndex(edges)._descendants_index, ReachabilityIndex)
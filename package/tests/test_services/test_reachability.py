@@ -0,0 +1,149 @@
+import random
+
+import networkx as nx
+import pytest
+
+from kedro_viz.models.flowchart.edge import GraphEdge
+from kedro_viz.services.reachability import (
+    IndexedGraph,
+    find_bad_modular_pipeline_inputs,
+)
+
+
+def _edges(*pairs):
+    return [GraphEdge(source=source, target=target) for source, target in pairs]
+
+
+def _find_bad_modular_pipeline_inputs_with_networkx(edges, modular_pipelines_inputs):
+    """Reference implementation searching the descendants of each modular pipeline."""
+    digraph = nx.DiGraph()
+    for edge in edges:
+        digraph.add_edge(edge.source, edge.target)
+
+    bad_input_edges = []
+    for modular_pipeline_id, inputs in modular_pipelines_inputs.items():
+        if not digraph.has_node(modular_pipeline_id):
+            continue
+        descendants = nx.descendants(digraph, modular_pipeline_id)
+        for bad_input in sorted(inputs.intersection(descendants)):
+            digraph.remove_edge(bad_input, modular_pipeline_id)
+            bad_input_edges.append(
+                GraphEdge(source=bad_input, target=modular_pipeline_id)
+            )
+    return bad_input_edges
+
+
+class TestIndexedGraph:
+    def test_indexed_graph(self):
+        graph = IndexedGraph(_edges(("a", "b"), ("b", "c"), ("a", "c")))
+        assert graph.node_ids == ["a", "b", "c"]
+        assert graph.node_indexes == {"a": 0, "b": 1, "c": 2}
+        assert graph.successors == [[1, 2], [2], []]
+
+    def test_reverse(self):
+        graph = IndexedGraph(_edges(("a", "b"), ("b", "c"), ("a", "c")))
+        reversed_graph = graph.reverse()
+
+        assert reversed_graph.node_ids == graph.node_ids
+        assert reversed_graph.node_indexes == graph.node_indexes
+        assert reversed_graph.successors == [[], [0], [0, 1]]
+
+    def test_strongly_connected_components(self):
+        # a -> b -> c -> a forms a cycle, d is only reachable from it
+        graph = IndexedGraph(_edges(("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")))
+        components = graph.find_strongly_connected_components()
+        a, b, c, d = (graph.node_indexes[node_id] for node_id in "abcd")
+
+        assert components[a] == components[b] == components[c]
+        # components are numbered in reverse topological order
+        assert components[d] < components[a]
+
+    def test_strongly_connected_components_on_long_chain(self):
+        num_nodes = 10000
+        graph = IndexedGraph(
+            _edges(*[(f"node_{i}", f"node_{i + 1}") for i in range(num_nodes - 1)])
+        )
+        components = graph.find_strongly_connected_components()
+        assert len(set(components)) == num_nodes
+
+
+class TestFindBadModularPipelineInputs:
+    @pytest.mark.parametrize(
+        "edges,modular_pipelines_inputs,expected",
+        [
+            (
+                # no cycle
+                _edges(("a", "pipeline"), ("pipeline", "b")),
+                {"pipeline": {"a"}},
+                [],
+            ),
+            (
+                # the input is a descendant of the modular pipeline
+                _edges(("a", "pipeline"), ("pipeline", "b"), ("b", "a")),
+                {"pipeline": {"a"}},
+                _edges(("a", "pipeline")),
+            ),
+            (
+                # cycle through two modular pipelines,
+                # only broken once for the first modular pipeline
+                _edges(
+                    ("a", "internal"),
+                    ("internal", "b"),
+                    ("b", "external"),
+                    ("external", "a"),
+                ),
+                {"internal": {"a"}, "external": {"b"}},
+                _edges(("a", "internal")),
+            ),
+            (
+                # modular pipeline not in the graph
+                _edges(("a", "b")),
+                {"pipeline": {"a"}},
+                [],
+            ),
+        ],
+    )
+    def test_find_bad_modular_pipeline_inputs(
+        self, edges, modular_pipelines_inputs, expected
+    ):
+        assert (
+            find_bad_modular_pipeline_inputs(edges, modular_pipelines_inputs)
+            == expected
+        )
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_same_result_as_descendants_search(self, seed):
+        rng = random.Random(seed)
+        num_nodes = 40
+        # a random DAG of datasets and tasks ...
+        pairs = {
+            (f"node_{source}", f"node_{target}")
+            for source in range(num_nodes)
+            for target in range(source + 1, num_nodes)
+            if rng.random() < 0.05
+        }
+        # ... with modular pipelines randomly taking some nodes as inputs and outputs
+        modular_pipelines_inputs = {}
+        for modular_pipeline in range(5):
+            modular_pipeline_id = f"pipeline_{modular_pipeline}"
+            inputs = {f"node_{rng.randrange(num_nodes)}" for _ in range(3)}
+            outputs = {f"node_{rng.randrange(num_nodes)}" for _ in range(3)}
+            pairs.update((input_id, modular_pipeline_id) for input_id in inputs)
+            pairs.update((modular_pipeline_id, output_id) for output_id in outputs)
+            modular_pipelines_inputs[modular_pipeline_id] = inputs
+        edges = _edges(*sorted(pairs))
+
+        bad_input_edges = find_bad_modular_pipeline_inputs(
+            edges, modular_pipelines_inputs
+        )
+
+        assert bad_input_edges == _find_bad_modular_pipeline_inputs_with_networkx(
+            edges, modular_pipelines_inputs
+        )
+        digraph = nx.DiGraph()
+        digraph.add_edges_from(
+            (edge.source, edge.target)
+            for edge in edges
+            if edge not in set(bad_input_edges)
+        )
+        assert nx.is_directed_acyclic_graph(digraph)
@@ -1,8 +1,16 @@
+import gc
 import time
+import weakref
 from unittest.mock import patch
 
+from kedro.pipeline import node
+
 from kedro_viz.utils import (
+    ID_LENGTH,
+    IdRegistry,
     Spinner,
+    _hash,
+    _hash_input_output,
     merge_dicts,
 )
 
@@ -85,3 +93,167 @@ class TestUtils:
 
         assert spinner._spinner_thread is not None
         assert not spinner._spinner_thread.is_alive()
+
+
+def identity(x):
+    return x
+
+
+class TestIdRegistry:
+    def test_get_node_id(self):
+        registry = IdRegistry()
+        kedro_node = node(identity, inputs="x", outputs="y", name="identity_node")
+
+        node_id = registry.get_node_id(kedro_node)
+
+        assert node_id == _hash(str(kedro_node))
+        assert registry.get_node_id(kedro_node) is node_id
+
+    def test_get_node_id_is_keyed_by_string_representation(self):
+        registry = IdRegistry()
+        # equal Kedro nodes with a different string representation
+        kedro_node = node(identity, inputs="x", outputs="y", name="node")
+        other_node = node(lambda x: x, inputs="x", outputs="y", name="node")
+        assert kedro_node == other_node
+
+        assert registry.get_node_id(kedro_node) == _hash(str(kedro_node))
+        assert registry.get_node_id(other_node) == _hash(str(other_node))
+        assert registry.get_node_id(kedro_node) != registry.get_node_id(other_node)
+
+    def test_get_node_id_keeps_no_reference_to_nodes(self):
+        registry = IdRegistry()
+        kedro_node = node(identity, inputs="x", outputs="y", name="identity_node")
+        node_ref = weakref.ref(kedro_node)
+
+        node_id = registry.get_node_id(kedro_node)
+        del kedro_node
+        gc.collect()
+
+        assert node_ref() is None
+        # a new node with the same string representation gets the same ID
+        new_node = node(identity, inputs="x", outputs="y", name="identity_node")
+        assert registry.get_node_id(new_node) is node_id
+
+    def test_get_dataset_id(self):
+        registry = IdRegistry()
+
+        dataset_id = registry.get_dataset_id("model_inputs@pandas")
+
+        assert dataset_id == _hash_input_output("model_inputs")
+        assert registry.get_dataset_id("model_inputs") is dataset_id
+
+    def test_ids_are_hashed_once(self, mocker):
+        registry = IdRegistry()
+        kedro_node = node(identity, inputs="x", outputs="y", name="identity_node")
+        hash_ = mocker.patch("kedro_viz.utils._hash", side_effect=_hash)
+
+        for _ in range(2):
+            registry.get_node_id(kedro_node)
+            registry.get_dataset_id("x")
+            registry.get_dataset_id("x@pandas")
+
+        assert hash_.call_count == 2
+
+    def test_clear(self, mocker):
+        registry = IdRegistry()
+        kedro_node = node(identity, inputs="x", outputs="y", name="identity_node")
+        registry.get_node_id(kedro_node)
+        registry.get_dataset_id("x")
+        hash_ = mocker.patch("kedro_viz.utils._hash", side_effect=_hash)
+
+        registry.clear()
+        registry.get_node_id(kedro_node)
+        registry.get_dataset_id("x")
+
+        assert hash_.call_count == 2
+
+    def test_colliding_ids_are_widened(self, mocker):
+        registry = IdRegistry()
+        # every value collides on its first 8 characters
+        mocker.patch(
+            "kedro_viz.utils._hash",
+            side_effect=lambda value, length=8: (
+                "0" * length if length == 8 else _hash(value, length)
+            ),
+        )
+
+        assert registry.get_dataset_id("a") == "00000000"
+        assert registry.get_dataset_id("b") == _hash("b", 9)
+        assert registry.get_dataset_id("a@pandas") == "00000000"
+
+    def test_colliding_ids_are_looked_up_again(self, mocker):
+        registry = IdRegistry()
+        mocker.patch(
+            "kedro_viz.utils._hash",
+            side_effect=lambda value, length=8: (
+                "0" * length if length == 8 else _hash(value, length)
+            ),
+        )
+        ids = [registry.get_dataset_id(name) for name in ["a", "b", "c"]]
+
+        # not allocated again
+        assert [registry.get_dataset_id(name) for name in ["a", "b", "c"]] == ids
+        assert len(set(ids)) == 3
+        assert len(registry._id_owners) == 3
+
+    def test_allocate_ids_is_independent_of_lookup_order(self, mocker):
+        mocker.patch(
+            "kedro_viz.utils._hash",
+            side_effect=lambda value, length=8: (
+                "0" * length if length == 8 else _hash(value, length)
+            ),
+        )
+        kedro_node = node(identity, inputs="x", outputs="y", name="identity_node")
+
+        registry = IdRegistry()
+        registry.allocate_ids([kedro_node], ["x", "y@pandas"])
+        ids = (
+            registry.get_dataset_id("y"),
+            registry.get_node_id(kedro_node),
+            registry.get_dataset_id("x"),
+        )
+
+        registry.clear()
+        registry.allocate_ids([kedro_node], ["y", "x"])
+        assert ids == (
+            registry.get_dataset_id("y"),
+            registry.get_node_id(kedro_node),
+            registry.get_dataset_id("x"),
+        )
+        # the smallest value keeps the unwidened ID
+        assert registry.get_node_id(kedro_node) == "00000000"
+
+    def test_ids_are_unique_and_stable_at_scale(self):
+        # a synthetic pipeline of 200 chained nodes with 1,000 outputs each,
+        # i.e. 200,201 graph nodes, whose truncated hashes do collide
+        kedro_nodes = [
+            node(
+                identity,
+                f"dataset_{i - 1}_0" if i else "raw",
+                [f"dataset_{i}_{j}" for j in range(1000)],
+                name=f"node_{i}",
+            )
+            for i in range(200)
+        ]
+        dataset_names = ["raw"] + [
+            output for kedro_node in kedro_nodes for output in kedro_node.outputs
+        ]
+        registry = IdRegistry()
+
+        registry.allocate_ids(kedro_nodes, dataset_names)
+        ids = [registry.get_node_id(kedro_node) for kedro_node in kedro_nodes] + [
+            registry.get_dataset_id(dataset_name) for dataset_name in dataset_names
+        ]
+        values = [str(kedro_node) for kedro_node in kedro_nodes] + dataset_names
+
+        assert len(set(ids)) == len(ids) == 200201
+        widened = [
+            (value, value_id)
+            for value, value_id in zip(values, ids)
+            if len(value_id) > ID_LENGTH
+        ]
+        assert len(widened) == 6
+        for value, value_id in widened:
+            assert value_id == _hash(value, ID_LENGTH + 1)
+        # IDs without collisions are unaffected
+        assert ids[:100] == [_hash(value) for value in values[:100]]